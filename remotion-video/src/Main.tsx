@@ -67,6 +67,17 @@ export const Main: React.FC<MainProps> = ({ totalScenes }) => {
         return map;
     }, []);
 
+    // Normalized asset names from the pipeline's pre-render stage, e.g.
+    // "Scene_01_01.png" -> "Scene_01_01.jpg" (resized to output resolution).
+    const assetFiles = useMemo(() => {
+        try {
+            const inputProps = getInputProps() as Record<string, unknown>;
+            return (inputProps?.assetFiles ?? {}) as Record<string, string>;
+        } catch {
+            return {} as Record<string, string>;
+        }
+    }, []);
+
     // Get actual scene numbers from render_config.json.
     // When totalScenes is passed (e.g. Scene1Only preview), use sequential 1..N.
     // Otherwise use the real scene numbers — they may not be sequential if
@@ -92,9 +103,10 @@ export const Main: React.FC<MainProps> = ({ totalScenes }) => {
                 images: Array.from({ length: imageCount }, (_, j) => {
                     const imgIndex = j + 1;
                     const sfxData = sceneSfx[imgIndex];
+                    const file = `Scene_${String(sceneNumber).padStart(2, "0")}_${String(imgIndex).padStart(2, "0")}.png`;
                     return {
                         index: imgIndex,
-                        file: `Scene_${String(sceneNumber).padStart(2, "0")}_${String(imgIndex).padStart(2, "0")}.png`,
+                        file: assetFiles[file] ?? file,
                         sfx: sfxData?.sfx,
                         sfxVolume: sfxData?.sfxVolume,
                     };
@@ -104,7 +116,7 @@ export const Main: React.FC<MainProps> = ({ totalScenes }) => {
                 },
             };
         });
-    }, [sceneNumberList, sfxByScene]);
+    }, [sceneNumberList, sfxByScene, assetFiles]);
 
     // Calculate cumulative start frames using actual audio durations per scene.
     // Scenes missing from render_config are skipped (they had no audio data).
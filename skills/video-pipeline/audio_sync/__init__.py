@@ -26,6 +26,14 @@ from .transcriber import (
     save_whisper_raw,
     load_whisper_raw,
 )
+from .audio_metadata import (
+    probe_audio,
+    probe_duration,
+)
+from .backends import (
+    TranscriptionBackend,
+    get_backend,
+)
 from .aligner import (
     align_scenes_to_timestamps,
     validate_alignment,
@@ -38,6 +46,11 @@ from .render_config_writer import (
     write_render_config,
     save_scene_timing,
 )
+from .timeline import (
+    TimelineWriter,
+    read_timeline,
+    load_render_config,
+)
 class AudioSyncPipeline:
     """
     End-to-end orchestrator for the audio-sync pipeline.
@@ -46,11 +59,12 @@ class AudioSyncPipeline:
     assignment, Ken Burns calculation, and render config generation
     into a simple procedural API.
 
-    Transcription always uses the OpenAI Whisper API (no local model).
+    Transcription uses the OpenAI Whisper API unless *backend* (or the
+    ``AUDIO_SYNC_BACKEND`` env var) selects the local CPU engine.
     """
 
-    def __init__(self, **_kwargs) -> None:
-        pass
+    def __init__(self, backend: str | None = None, **_kwargs) -> None:
+        self.backend = backend
 
     # ------------------------------------------------------------------
     # Step 1 — Transcribe
@@ -61,8 +75,8 @@ class AudioSyncPipeline:
         audio_path: str,
         cache_dir: str | Path | None = None,
     ) -> list[WordTimestamp]:
-        """Run Whisper API on *audio_path* and return word timestamps."""
-        return transcribe(audio_path, cache_dir=cache_dir)
+        """Run Whisper on *audio_path* and return word timestamps."""
+        return transcribe(audio_path, cache_dir=cache_dir, backend=self.backend)
 
     # ------------------------------------------------------------------
     # Step 2 — Align
@@ -183,6 +197,10 @@ __all__ = [
     "extract_words",
     "save_whisper_raw",
     "load_whisper_raw",
+    "probe_audio",
+    "probe_duration",
+    "TranscriptionBackend",
+    "get_backend",
     "align_scenes_to_timestamps",
     "validate_alignment",
     "adjust_timing",
@@ -191,4 +209,7 @@ __all__ = [
     "build_render_config",
     "write_render_config",
     "save_scene_timing",
+    "TimelineWriter",
+    "read_timeline",
+    "load_render_config",
 ]
@@ -0,0 +1,358 @@
+"""
+In-process audio duration probing.
+
+Reads MP3 (Xing/Info/VBRI or CBR) and WAV headers directly instead of
+spawning ``ffprobe`` per scene or downloading whole files for mutagen.
+
+Sources accepted by :func:`probe_audio` / :func:`probe_duration`:
+
+* a local path (``str`` or ``Path``)
+* a ``bytes`` buffer (the first few KB are enough)
+* an ``http(s)://`` URL — only the first few KB are fetched with an HTTP
+  Range request; the total size comes from ``Content-Range``.
+
+Results are memoised — local files by header bytes, size and mtime, URLs
+by the URL — so re-probing the same scene audio (incremental syncs,
+retries) costs a dictionary lookup and no read or request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import threading
+from pathlib import Path
+from typing import Any
+
+HEADER_PROBE_BYTES = 64 * 1024
+"""Bytes read from the start of a file/URL — covers typical ID3 tags."""
+
+# ---------------------------------------------------------------------------
+# MPEG audio tables
+# ---------------------------------------------------------------------------
+
+# (version_id, layer_id) -> kbps table indexed by the 4-bit bitrate index.
+# version_id: 3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5.  layer_id: 3 = L1, 2 = L2, 1 = L3.
+_V1_L1 = (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448)
+_V1_L2 = (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384)
+_V1_L3 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_V2_L1 = (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256)
+_V2_L23 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def _bitrate_table(version_id: int, layer_id: int) -> tuple[int, ...]:
+    if version_id == 3:
+        return {3: _V1_L1, 2: _V1_L2, 1: _V1_L3}[layer_id]
+    return _V2_L1 if layer_id == 3 else _V2_L23
+
+
+def _samples_per_frame(version_id: int, layer_id: int) -> int:
+    if layer_id == 3:
+        return 384
+    if layer_id == 2:
+        return 1152
+    return 1152 if version_id == 3 else 576
+
+
+def _parse_frame_header(data: bytes, pos: int) -> dict[str, Any] | None:
+    """Decode the 4-byte MPEG frame header at *pos*, or None if invalid."""
+    if pos + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[pos], data[pos + 1], data[pos + 2], data[pos + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version_id = (b1 >> 3) & 0x03
+    layer_id = (b1 >> 1) & 0x03
+    bitrate_idx = b2 >> 4
+    sr_idx = (b2 >> 2) & 0x03
+    if version_id == 1 or layer_id == 0 or bitrate_idx in (0, 15) or sr_idx == 3:
+        return None
+
+    bitrate = _bitrate_table(version_id, layer_id)[bitrate_idx] * 1000
+    sample_rate = _SAMPLE_RATES[version_id][sr_idx]
+    padding = (b2 >> 1) & 0x01
+    spf = _samples_per_frame(version_id, layer_id)
+
+    if layer_id == 3:
+        frame_len = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        frame_len = spf // 8 * bitrate // sample_rate + padding
+
+    return {
+        "version_id": version_id,
+        "layer_id": layer_id,
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "channels": 1 if (b3 >> 6) == 3 else 2,
+        "samples_per_frame": spf,
+        "frame_length": frame_len,
+    }
+
+
+def _id3v2_size(data: bytes) -> int:
+    """Total size of a leading ID3v2 tag (0 if none)."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (
+        (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14
+        | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+    )
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _find_first_frame(data: bytes, start: int) -> tuple[int, dict[str, Any]] | None:
+    """Locate the first frame whose successor is also a valid frame header."""
+    pos = start
+    end = len(data) - 4
+    while pos <= end:
+        pos = data.find(b"\xff", pos)
+        if pos < 0 or pos > end:
+            return None
+        header = _parse_frame_header(data, pos)
+        if header:
+            nxt = pos + header["frame_length"]
+            # Require a second header when the buffer reaches that far — a
+            # lone 0xFFEx byte pair inside album art is a common false sync.
+            if nxt + 4 > len(data) or _parse_frame_header(data, nxt):
+                return pos, header
+        pos += 1
+    return None
+
+
+def _parse_mp3(data: bytes, total_size: int | None) -> dict[str, Any] | None:
+    audio_start = _id3v2_size(data)
+    found = _find_first_frame(data, audio_start)
+    if not found:
+        return None
+    pos, header = found
+
+    spf = header["samples_per_frame"]
+    sr = header["sample_rate"]
+    info: dict[str, Any] = {
+        "format": "mp3",
+        "sample_rate": sr,
+        "channels": header["channels"],
+        "bitrate": header["bitrate"],
+        "audio_start": pos,
+    }
+
+    # Xing / Info header (LAME VBR and CBR) sits after the side info
+    if header["version_id"] == 3:
+        side_info = 17 if header["channels"] == 1 else 32
+    else:
+        side_info = 9 if header["channels"] == 1 else 17
+    xing_pos = pos + 4 + side_info
+    tag = data[xing_pos:xing_pos + 4]
+    if tag in (b"Xing", b"Info") and xing_pos + 12 <= len(data):
+        flags = struct.unpack(">I", data[xing_pos + 4:xing_pos + 8])[0]
+        if flags & 0x01:
+            frames = struct.unpack(">I", data[xing_pos + 8:xing_pos + 12])[0]
+            info["frames"] = frames
+            info["duration"] = frames * spf / sr
+            info["method"] = "xing"
+            return info
+
+    # VBRI (Fraunhofer) header — fixed 32 bytes after the frame header
+    vbri_pos = pos + 4 + 32
+    if data[vbri_pos:vbri_pos + 4] == b"VBRI" and vbri_pos + 18 <= len(data):
+        frames = struct.unpack(">I", data[vbri_pos + 14:vbri_pos + 18])[0]
+        info["frames"] = frames
+        info["duration"] = frames * spf / sr
+        info["method"] = "vbri"
+        return info
+
+    # Constant bitrate — duration from byte count
+    size = total_size if total_size is not None else len(data)
+    audio_bytes = max(0, size - pos)
+    if size == len(data) and data[-128:-125] == b"TAG":
+        audio_bytes -= 128  # trailing ID3v1 tag
+    info["duration"] = audio_bytes * 8 / header["bitrate"]
+    info["method"] = "cbr"
+    return info
+
+
+def _parse_wav(data: bytes, total_size: int | None) -> dict[str, Any] | None:
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+
+    pos = 12
+    byte_rate = 0
+    fmt: dict[str, Any] = {}
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        chunk_size = struct.unpack("<I", data[pos + 4:pos + 8])[0]
+        body = pos + 8
+        if chunk_id == b"fmt " and body + 16 <= len(data):
+            _fmt_tag, channels, sample_rate, byte_rate, _align, bits = struct.unpack(
+                "<HHIIHH", data[body:body + 16],
+            )
+            fmt = {"channels": channels, "sample_rate": sample_rate, "bits": bits}
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            if total_size is not None:
+                # Streaming writers leave 0/0xFFFFFFFF placeholders
+                chunk_size = min(chunk_size or total_size, total_size - body)
+            return {
+                "format": "wav",
+                "sample_rate": fmt.get("sample_rate"),
+                "channels": fmt.get("channels"),
+                "bitrate": byte_rate * 8,
+                "audio_start": body,
+                "duration": chunk_size / byte_rate,
+                "method": "riff",
+            }
+        pos = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def parse_audio_header(data: bytes, total_size: int | None = None) -> dict[str, Any] | None:
+    """
+    Parse audio metadata from the leading bytes of a file.
+
+    Args:
+        data: The first bytes of the file (or the whole file).
+        total_size: Full file size in bytes when *data* is only a prefix.
+            Needed for CBR MP3 and placeholder WAV sizes.
+
+    Returns:
+        Dict with ``format``, ``duration`` (seconds), ``sample_rate``,
+        ``channels``, ``bitrate`` and ``method``; or None if unrecognised.
+    """
+    if data[:4] == b"RIFF":
+        return _parse_wav(data, total_size)
+    return _parse_mp3(data, total_size)
+
+
+# ---------------------------------------------------------------------------
+# Memoised probing
+# ---------------------------------------------------------------------------
+
+_CACHE: dict[str, dict[str, Any] | None] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _content_key(*parts: bytes) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+    return h.hexdigest()
+
+
+def _memoised(key: str, compute) -> dict[str, Any] | None:
+    with _CACHE_LOCK:
+        if key in _CACHE:
+            return _CACHE[key]
+    result = compute()
+    with _CACHE_LOCK:
+        _CACHE[key] = result
+    return result
+
+
+def clear_cache() -> None:
+    """Forget all memoised probe results."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def _fetch_range(client, url: str, start: int, length: int) -> tuple[bytes, int | None]:
+    """GET ``bytes=start-(start+length-1)``; return (body, total_size)."""
+    headers = {"Range": f"bytes={start}-{start + length - 1}"}
+    with client.stream("GET", url, headers=headers) as resp:
+        resp.raise_for_status()
+        total: int | None = None
+        content_range = resp.headers.get("content-range", "")
+        if "/" in content_range and not content_range.endswith("/*"):
+            total = int(content_range.rsplit("/", 1)[1])
+        elif resp.status_code == 200 and resp.headers.get("content-length"):
+            # Server ignored the Range header — the body is the whole file
+            total = int(resp.headers["content-length"])
+
+        chunks: list[bytes] = []
+        received = 0
+        for chunk in resp.iter_bytes():
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= length:
+                break
+    return b"".join(chunks)[:length], total
+
+
+def _probe_url(url: str) -> dict[str, Any] | None:
+    def compute() -> dict[str, Any] | None:
+        import httpx
+
+        with httpx.Client(follow_redirects=True, timeout=30.0) as client:
+            data, total = _fetch_range(client, url, 0, HEADER_PROBE_BYTES)
+            id3 = _id3v2_size(data)
+            if id3 and id3 + 4096 > len(data):
+                # Oversized ID3 tag (embedded artwork) — fetch just past it
+                tail, _ = _fetch_range(client, url, id3, 16 * 1024)
+                data = data[:10] + b"\x00" * (id3 - 10) + tail
+        return parse_audio_header(data, total)
+
+    # Keyed on the URL itself so a repeat probe skips the Range request;
+    # attachment URLs change whenever their file does.
+    return _memoised(_content_key(b"url:", url.encode()), compute)
+
+
+def _probe_path(path: Path) -> dict[str, Any] | None:
+    stat = path.stat()
+    with open(path, "rb") as f:
+        head = f.read(HEADER_PROBE_BYTES)
+
+        def compute() -> dict[str, Any] | None:
+            data = head
+            id3 = _id3v2_size(data)
+            if id3 and id3 + 4096 > len(data):
+                f.seek(id3)
+                data = data[:10] + b"\x00" * (id3 - 10) + f.read(16 * 1024)
+            return parse_audio_header(data, stat.st_size)
+
+        # Header bytes + size + mtime: a re-encode of the same length still
+        # differs in its first frames, and nothing past the header is read.
+        return _memoised(
+            _content_key(head, f"{stat.st_size}:{stat.st_mtime_ns}".encode()),
+            compute,
+        )
+
+
+def probe_audio(source: str | Path | bytes) -> dict[str, Any] | None:
+    """
+    Read audio metadata from a path, byte buffer, or HTTP(S) URL.
+
+    Returns:
+        Metadata dict (see :func:`parse_audio_header`) or None if the
+        format is not recognised or the source cannot be read.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        data = bytes(source)
+        return _memoised(
+            _content_key(data),
+            lambda: parse_audio_header(data, len(data)),
+        )
+
+    src = str(source)
+    if src.startswith(("http://", "https://")):
+        return _probe_url(src)
+
+    path = Path(src)
+    if not path.exists():
+        return None
+    return _probe_path(path)
+
+
+def probe_duration(source: str | Path | bytes) -> float | None:
+    """Duration in seconds, or None if it cannot be determined."""
+    info = probe_audio(source)
+    if not info or not info.get("duration"):
+        return None
+    return float(info["duration"])
@@ -0,0 +1,287 @@
+"""
+Pluggable transcription backends.
+
+Every backend returns the same raw dict shape as the OpenAI Whisper API
+(``{"text": ..., "words": [{word, start, end}, ...]}``) so the result can
+be cached with :func:`save_whisper_raw` and normalised with
+:func:`extract_words` exactly like an API response.
+
+Backends:
+    ``openai`` — hosted Whisper API (default, see ``transcribe_api``).
+    ``local``  — faster-whisper on CPU.  The CTranslate2 int8 model is
+                 loaded lazily once per process and kept warm across
+                 scenes; long audio is split at quiet points and decoded
+                 in parallel across the VPS's vCPUs.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .config import (
+    DEFAULT_TRANSCRIPTION_BACKEND,
+    LOCAL_WHISPER_MODEL,
+    LOCAL_WHISPER_COMPUTE_TYPE,
+    LOCAL_WHISPER_WORKERS,
+    LOCAL_WHISPER_CHUNK_SECONDS,
+    LOCAL_WHISPER_SPLIT_SEARCH_SECONDS,
+)
+
+SAMPLE_RATE = 16000
+"""faster-whisper decodes everything to 16 kHz mono float32."""
+
+
+class TranscriptionBackend:
+    """Base class — subclasses implement :meth:`transcribe_raw`."""
+
+    name: str = ""
+
+    def transcribe_raw(self, audio_path: str) -> dict[str, Any]:
+        """Transcribe *audio_path* and return a Whisper-API-shaped dict."""
+        raise NotImplementedError
+
+
+# ---------------------------------------------------------------------------
+# OpenAI Whisper API
+# ---------------------------------------------------------------------------
+
+class OpenAIWhisperBackend(TranscriptionBackend):
+    """Hosted Whisper API (~$0.006/min, requires ``OPENAI_API_KEY``)."""
+
+    name = "openai"
+
+    def transcribe_raw(self, audio_path: str) -> dict[str, Any]:
+        from .transcriber import transcribe_api
+        return transcribe_api(audio_path)
+
+
+# ---------------------------------------------------------------------------
+# Local faster-whisper (CTranslate2)
+# ---------------------------------------------------------------------------
+
+# Warm pool: one loaded model per (model, compute_type, workers) per process.
+# Loading small.en takes a few seconds; every scene after the first reuses it.
+_MODEL_POOL: dict[tuple[str, str, int], Any] = {}
+_MODEL_POOL_LOCK = threading.Lock()
+
+
+def get_local_model(
+    model_name: str = LOCAL_WHISPER_MODEL,
+    compute_type: str = LOCAL_WHISPER_COMPUTE_TYPE,
+    workers: int = LOCAL_WHISPER_WORKERS,
+):
+    """Return a warm ``faster_whisper.WhisperModel``, loading it on first use."""
+    key = (model_name, compute_type, workers)
+    with _MODEL_POOL_LOCK:
+        model = _MODEL_POOL.get(key)
+        if model is not None:
+            return model
+
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as exc:
+            raise RuntimeError(
+                "faster-whisper not installed. Run `pip install faster-whisper` "
+                "or set AUDIO_SYNC_BACKEND=openai."
+            ) from exc
+
+        cpu_count = os.cpu_count() or workers
+        model = WhisperModel(
+            model_name,
+            device="cpu",
+            compute_type=compute_type,
+            # Split the cores between workers so parallel chunks don't
+            # oversubscribe the CPU.
+            cpu_threads=max(1, cpu_count // max(1, workers)),
+            num_workers=max(1, workers),
+        )
+        _MODEL_POOL[key] = model
+        return model
+
+
+def clear_model_pool() -> None:
+    """Drop all warm models (frees RAM before a render)."""
+    with _MODEL_POOL_LOCK:
+        _MODEL_POOL.clear()
+
+
+def plan_chunks(
+    samples,
+    sample_rate: int = SAMPLE_RATE,
+    chunk_seconds: float = LOCAL_WHISPER_CHUNK_SECONDS,
+    search_seconds: float = LOCAL_WHISPER_SPLIT_SEARCH_SECONDS,
+) -> list[tuple[int, int]]:
+    """
+    Split *samples* into ``(start, end)`` sample ranges of ~*chunk_seconds*.
+
+    Each cut is moved to the quietest 20 ms frame within *search_seconds*
+    of the nominal boundary so that no word straddles two chunks.  Audio
+    shorter than two chunks is returned as a single range.
+    """
+    import numpy as np
+
+    total = len(samples)
+    chunk_len = int(chunk_seconds * sample_rate)
+    if chunk_len <= 0 or total < 2 * chunk_len:
+        return [(0, total)]
+
+    frame = max(1, int(0.02 * sample_rate))
+    search = int(search_seconds * sample_rate)
+
+    cuts = [0]
+    target = chunk_len
+    while target < total - chunk_len // 2:
+        lo = max(cuts[-1] + frame, target - search)
+        hi = min(total - frame, target + search)
+        window = np.asarray(samples[lo:hi], dtype=np.float32)
+        n_frames = len(window) // frame
+        if n_frames > 0:
+            energy = np.square(window[: n_frames * frame]).reshape(n_frames, frame).mean(axis=1)
+            cut = lo + int(np.argmin(energy)) * frame
+        else:
+            cut = target
+        cuts.append(cut)
+        target = cut + chunk_len
+    cuts.append(total)
+
+    return [(cuts[i], cuts[i + 1]) for i in range(len(cuts) - 1)]
+
+
+def merge_chunk_words(
+    chunk_results: list[tuple[float, list[dict[str, Any]]]],
+) -> list[dict[str, Any]]:
+    """
+    Merge per-chunk word lists into one timeline.
+
+    Args:
+        chunk_results: ``(offset_seconds, words)`` per chunk, where word
+            timestamps are relative to the chunk start.
+
+    Returns:
+        Flat, time-ordered list of ``{word, start, end}`` dicts with
+        absolute timestamps.
+    """
+    merged: list[dict[str, Any]] = []
+    for offset, words in sorted(chunk_results, key=lambda r: r[0]):
+        for w in words:
+            merged.append({
+                "word": w["word"],
+                "start": round(float(w["start"]) + offset, 3),
+                "end": round(float(w["end"]) + offset, 3),
+                "probability": w.get("probability", 1.0),
+            })
+    return merged
+
+
+class LocalWhisperBackend(TranscriptionBackend):
+    """faster-whisper on CPU with a per-process warm model."""
+
+    name = "local"
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        compute_type: str = LOCAL_WHISPER_COMPUTE_TYPE,
+        workers: int = LOCAL_WHISPER_WORKERS,
+        chunk_seconds: float = LOCAL_WHISPER_CHUNK_SECONDS,
+    ) -> None:
+        self.model_name = model_name or os.environ.get(
+            "LOCAL_WHISPER_MODEL", LOCAL_WHISPER_MODEL,
+        )
+        self.compute_type = compute_type
+        self.workers = max(1, workers)
+        self.chunk_seconds = chunk_seconds
+
+    def _decode_chunk(self, model, samples) -> list[dict[str, Any]]:
+        segments, _info = model.transcribe(
+            samples,
+            language="en",
+            beam_size=1,
+            word_timestamps=True,
+            condition_on_previous_text=False,
+            vad_filter=False,
+        )
+        words: list[dict[str, Any]] = []
+        for seg in segments:
+            for w in seg.words or []:
+                words.append({
+                    "word": w.word.strip(),
+                    "start": w.start,
+                    "end": w.end,
+                    "probability": w.probability,
+                })
+        return words
+
+    def transcribe_raw(self, audio_path: str) -> dict[str, Any]:
+        try:
+            from faster_whisper import decode_audio
+        except ImportError as exc:
+            raise RuntimeError(
+                "faster-whisper not installed. Run `pip install faster-whisper` "
+                "or set AUDIO_SYNC_BACKEND=openai."
+            ) from exc
+
+        model = get_local_model(self.model_name, self.compute_type, self.workers)
+        samples = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+        ranges = plan_chunks(samples, chunk_seconds=self.chunk_seconds)
+
+        def _run(rng: tuple[int, int]) -> tuple[float, list[dict[str, Any]]]:
+            start, end = rng
+            return start / SAMPLE_RATE, self._decode_chunk(model, samples[start:end])
+
+        if len(ranges) == 1:
+            results = [_run(ranges[0])]
+        else:
+            # CTranslate2 releases the GIL and serves up to num_workers
+            # concurrent calls, so threads give real parallelism here.
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(_run, ranges))
+
+        words = merge_chunk_words(results)
+        return {
+            "text": " ".join(w["word"] for w in words),
+            "duration": round(len(samples) / SAMPLE_RATE, 3),
+            "words": words,
+            "backend": self.name,
+            "model": self.model_name,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+BACKENDS: dict[str, type[TranscriptionBackend]] = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    LocalWhisperBackend.name: LocalWhisperBackend,
+}
+
+_INSTANCES: dict[str, TranscriptionBackend] = {}
+
+
+def resolve_backend_name(name: str | None = None) -> str:
+    """Explicit *name*, else ``AUDIO_SYNC_BACKEND``, else the default."""
+    resolved = (
+        name
+        or os.environ.get("AUDIO_SYNC_BACKEND")
+        or DEFAULT_TRANSCRIPTION_BACKEND
+    ).strip().lower()
+    if resolved not in BACKENDS:
+        raise ValueError(
+            f"Unknown transcription backend '{resolved}'. "
+            f"Choose one of: {', '.join(sorted(BACKENDS))}"
+        )
+    return resolved
+
+
+def get_backend(name: str | None = None) -> TranscriptionBackend:
+    """Return the (process-wide) backend instance for *name*."""
+    resolved = resolve_backend_name(name)
+    backend = _INSTANCES.get(resolved)
+    if backend is None:
+        backend = BACKENDS[resolved]()
+        _INSTANCES[resolved] = backend
+    return backend
@@ -0,0 +1,89 @@
+"""
+Benchmark: per-dict vs NumPy ``adjust_timing`` on long-form timelines.
+
+Usage:
+    python -m audio_sync.benchmark                      # 1k, 2.5k, 5k, 10k images
+    python -m audio_sync.benchmark --images 1000 --repeat 20
+
+Timelines are synthetic but shaped like real syncs: sentence-level images
+of 3-12 s with ~25% short sentences (< MIN_DISPLAY_SECONDS) that trigger
+minimum-display pushes, and the occasional nested image that forces an
+overlap fix.  Each run also checks both implementations agree exactly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import time
+from typing import Any
+
+from .timing_adjuster import adjust_timing, adjust_timing_vectorized
+
+
+def synthetic_timeline(n_images: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Build *n_images* sentence-level scene dicts with narration times."""
+    rng = random.Random(seed)
+    scenes: list[dict[str, Any]] = []
+    t = 0.4
+    for i in range(n_images):
+        dur = rng.uniform(0.8, 2.9) if rng.random() < 0.25 else rng.uniform(3.0, 12.0)
+        start, end = t, t + dur
+        if i and rng.random() < 0.01:
+            start = scenes[-1]["start_time"] + 0.2
+            end = start + 0.6
+        scenes.append({"scene_number": i // 8 + 1, "image_index": i % 8 + 1,
+                       "start_time": start, "end_time": end})
+        t += dur + rng.uniform(0.05, 0.6)
+    return scenes
+
+
+def _time(fn, scenes: list[dict[str, Any]], repeat: int) -> tuple[float, list]:
+    best = float("inf")
+    result: list = []
+    for _ in range(repeat):
+        work = copy.deepcopy(scenes)
+        t0 = time.perf_counter()
+        result = fn(work)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def run(sizes: list[int], repeat: int = 5) -> list[dict[str, Any]]:
+    """Time both implementations for each timeline size."""
+    rows = []
+    for n in sizes:
+        scenes = synthetic_timeline(n)
+        seq_s, seq = _time(lambda s: adjust_timing(s, vectorized=False), scenes, repeat)
+        vec_s, vec = _time(adjust_timing_vectorized, scenes, repeat)
+        identical = all(
+            (a["display_start"], a["display_end"], a["display_duration"])
+            == (b["display_start"], b["display_end"], b["display_duration"])
+            for a, b in zip(seq, vec)
+        )
+        rows.append({
+            "images": n,
+            "sequential_ms": seq_s * 1000,
+            "vectorized_ms": vec_s * 1000,
+            "speedup": seq_s / vec_s if vec_s else float("inf"),
+            "identical": identical,
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--images", type=int, nargs="+", default=[1000, 2500, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'images':>8} {'sequential':>12} {'vectorized':>12} {'speedup':>8}  identical")
+    for row in run(args.images, args.repeat):
+        print(f"{row['images']:>8} {row['sequential_ms']:>10.2f}ms "
+              f"{row['vectorized_ms']:>10.2f}ms {row['speedup']:>7.2f}x  "
+              f"{'✅' if row['identical'] else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
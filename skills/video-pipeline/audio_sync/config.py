@@ -20,6 +20,10 @@ PRE_ROLL_SECONDS: float = 0.3
 POST_HOLD_SECONDS: float = 0.5
 """Image stays 0.5 s AFTER its narration ends."""
 
+VECTORIZED_TIMING_MIN_SCENES: int = 200
+"""``adjust_timing`` switches to the NumPy implementation at this many
+images (long-form timelines); below it the per-dict passes are faster."""
+
 CROSSFADE_DURATION: float = 0.4
 """Default crossfade transition between images (seconds)."""
 
@@ -74,5 +78,90 @@ DEFAULT_HEIGHT: int = 1080
 # ---------------------------------------------------------------------------
 # Whisper
 # ---------------------------------------------------------------------------
-# Transcription uses the OpenAI Whisper API exclusively (model: whisper-1).
-# No local model support — requires OPENAI_API_KEY in .env.
+# Two transcription backends are available (see audio_sync/backends.py):
+#   "openai" — hosted Whisper API (model: whisper-1), requires OPENAI_API_KEY.
+#   "local"  — faster-whisper (CTranslate2 int8) on CPU, no API cost.
+# Select with the AUDIO_SYNC_BACKEND env var or the ``backend=`` argument.
+DEFAULT_TRANSCRIPTION_BACKEND: str = "openai"
+
+LOCAL_WHISPER_MODEL: str = "small.en"
+"""faster-whisper model name — small.en is the accuracy/speed sweet spot
+on a 4 vCPU VPS (~250 MB on disk, no PyTorch)."""
+
+LOCAL_WHISPER_COMPUTE_TYPE: str = "int8"
+"""CTranslate2 quantisation — int8 keeps RAM low and is fastest on CPU."""
+
+LOCAL_WHISPER_WORKERS: int = 4
+"""Parallel decode workers (one per vCPU)."""
+
+LOCAL_WHISPER_CHUNK_SECONDS: float = 45.0
+"""Target chunk length for parallel decoding.  Audio shorter than two
+chunks is decoded in a single pass."""
+
+LOCAL_WHISPER_SPLIT_SEARCH_SECONDS: float = 2.0
+"""Chunk boundaries are moved to the quietest 20 ms frame within this
+many seconds of the target cut, so words are not split across chunks."""
+
+# ---------------------------------------------------------------------------
+# Audio stitching (long voice overs synthesized in chunks)
+# ---------------------------------------------------------------------------
+STITCH_SAMPLE_RATE: int = 44100
+"""Chunks are decoded to mono PCM at this rate before concatenation —
+ElevenLabs' own output rate, so no resampling in the common case."""
+
+STITCH_MP3_BITRATE: str = "128k"
+"""Bitrate of the re-encoded, stitched MP3 (matches the voice bot's MP3s)."""
+
+LOUDNESS_MATCH_MAX_GAIN_DB: float = 6.0
+"""Per-chunk gain used to match loudness is clamped to ± this many dB, so
+a near-silent chunk is not blown up."""
+
+CHUNK_ANCHOR_WORD_TOLERANCE: float = 0.15
+"""Whisper words are only anchored to voice chunk offsets when the
+transcript's word count is within this fraction of the script's."""
+
+# ---------------------------------------------------------------------------
+# Loudness normalization of voice and SFX assets (applied at render)
+# ---------------------------------------------------------------------------
+VOICE_TARGET_LUFS: float = -16.0
+"""Integrated loudness every ``Scene N.mp3`` is brought to."""
+
+SFX_TARGET_LUFS: float = -20.0
+"""Integrated loudness every SFX is brought to before its ``sfxVolume`` /
+sound-layer volume applies, so those volumes mean the same on every
+video."""
+
+TRUE_PEAK_CEILING_DB: float = -1.0
+"""A normalizing gain never lifts an asset's true peak above this."""
+
+NORMALIZE_MAX_GAIN_DB: float = 12.0
+"""Normalizing gains are clamped to ± this many dB."""
+
+LOUDNESS_CACHE_FILE: str = "timing/loudness_cache.json"
+"""Under ``skills/video-pipeline/``: measurements keyed by the SHA-256 of
+the asset, shared by every video and render."""
+
+# ---------------------------------------------------------------------------
+# Silence-aware image boundaries
+# ---------------------------------------------------------------------------
+SILENCE_SNAP_TOLERANCE_SECONDS: float = 0.4
+"""An image boundary placed from Whisper words moves to the nearest pause
+in the scene's audio only if that pause is within this many seconds."""
+
+SILENCE_FRAME_SECONDS: float = 0.01
+"""Frame length of the short-time energy envelope."""
+
+SILENCE_THRESHOLD_DB: float = 30.0
+"""A frame is silent when it is this many dB below the scene's speech
+level (the envelope's 95th percentile) — relative, so a quiet take and a
+hot one find the same breaths."""
+
+SILENCE_MIN_PAUSE_SECONDS: float = 0.08
+"""Shorter runs of silent frames (stop consonants) are not pauses."""
+
+ENVELOPE_SAMPLE_RATE: int = 16000
+"""Scenes are decoded to mono PCM at this rate for the envelope."""
+
+ENVELOPE_CACHE_DIR: str = "timing/envelope_cache"
+"""Under ``skills/video-pipeline/``: one ``.npy`` envelope per scene audio
+SHA-256, shared by every video and re-sync."""
@@ -0,0 +1,158 @@
+"""
+Incremental re-sync support.
+
+Each scene is fingerprinted by its audio content hash plus its ordered
+``(Image Index, Sentence Text)`` list.  Fingerprints and the resulting
+per-image durations are persisted in ``timing/{video_id}/sync_state.json``
+so that a later sync only re-transcribes, re-matches and re-writes the
+scenes whose audio or sentences actually changed.
+
+The render config itself is still rebuilt from every scene: unchanged
+scenes reuse their stored durations, and :func:`retime_images` lays the
+whole video back out end-to-end so downstream scenes shift with any
+change in length before them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+SYNC_STATE_FILE = "sync_state.json"
+SYNC_STATE_VERSION = 1
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+def audio_content_hash(audio_path: str | Path, algorithm: str = "sha256") -> str:
+    """
+    Hex digest of the audio file's bytes (streamed, 1 MB at a time).
+
+    ``algorithm="md5"`` matches Drive's ``md5Checksum``.
+    """
+    h = hashlib.new(algorithm)
+    with open(audio_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def scene_fingerprint(
+    audio_hash: str,
+    images: list[dict[str, Any]],
+) -> str:
+    """
+    Fingerprint a scene from its audio hash and ordered sentence list.
+
+    Args:
+        audio_hash: :func:`audio_content_hash` of the scene's MP3.
+        images: Airtable image records for the scene, sorted by
+            ``Image Index``.
+    """
+    sentences = [
+        [img.get("Image Index", i + 1), (img.get("Sentence Text") or "").strip()]
+        for i, img in enumerate(images)
+    ]
+    payload = json.dumps([audio_hash, sentences], separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Persisted state
+# ---------------------------------------------------------------------------
+
+def new_sync_state() -> dict[str, Any]:
+    """An empty sync state (every scene is dirty)."""
+    return {"version": SYNC_STATE_VERSION, "scenes": {}}
+
+
+def load_sync_state(timing_dir: str | Path) -> dict[str, Any]:
+    """Load ``sync_state.json`` (empty state if missing or unreadable)."""
+    path = Path(timing_dir) / SYNC_STATE_FILE
+    try:
+        state = json.loads(path.read_text())
+        if state.get("version") == SYNC_STATE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return new_sync_state()
+
+
+def save_sync_state(state: dict[str, Any], timing_dir: str | Path) -> Path:
+    """Write ``sync_state.json`` atomically."""
+    path = Path(timing_dir) / SYNC_STATE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(state, separators=(",", ":")))
+    tmp.replace(path)
+    return path
+
+
+def get_clean_scene(
+    state: dict[str, Any],
+    scene_number: int,
+    fingerprint: str,
+) -> dict[str, Any] | None:
+    """Return the stored scene entry if its fingerprint still matches."""
+    entry = state.get("scenes", {}).get(str(scene_number))
+    if entry and entry.get("fingerprint") == fingerprint and entry.get("images"):
+        return entry
+    return None
+
+
+def record_scene(
+    state: dict[str, Any],
+    scene_number: int,
+    fingerprint: str,
+    images: list[dict[str, Any]],
+) -> None:
+    """
+    Store a freshly synced scene.
+
+    Args:
+        images: One dict per image with ``image_index``, ``duration`` and
+            ``sentence_text``.
+    """
+    state.setdefault("scenes", {})[str(scene_number)] = {
+        "fingerprint": fingerprint,
+        "images": [
+            {
+                "image_index": img["image_index"],
+                "duration": img["duration"],
+                "sentence_text": img.get("sentence_text", ""),
+            }
+            for img in images
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Retiming
+# ---------------------------------------------------------------------------
+
+def retime_images(images: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Lay *images* end-to-end on one timeline from their ``duration``.
+
+    Sets ``start_time`` / ``end_time`` / ``display_*`` in place, so the
+    scenes passed in order form one contiguous timeline.
+    """
+    running = 0.0
+    for img in images:
+        dur = float(img["duration"])
+        img.update({
+            "start_time": round(running, 4),
+            "end_time": round(running + dur, 4),
+            "duration": round(dur, 4),
+            "display_start": round(running, 4),
+            "display_end": round(running + dur, 4),
+            "display_duration": round(dur, 4),
+            "alignment_method": img.get("alignment_method", "sentence_match"),
+        })
+        running += dur
+    return images
+
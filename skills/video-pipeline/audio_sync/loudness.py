@@ -0,0 +1,166 @@
+"""
+Loudness analysis and normalizing gains for voice and SFX assets.
+
+Voice overs and sound effects used to be mixed at static volumes
+(``sfxVolume`` 0.15, the Images table's ``Sound Volume``), so a quiet
+ElevenLabs take or a hot Kie.ai effect meant re-rendering with hand-tuned
+levels.  Before a render, every ``Scene N.mp3`` and ``sfx/*.mp3`` in
+``public/`` is measured in one process-pool pass with ffmpeg's
+``ebur128`` filter:
+
+* integrated loudness (LUFS), true peak (dBTP) and duration;
+* a gain that brings the asset to :data:`VOICE_TARGET_LUFS` or
+  :data:`SFX_TARGET_LUFS`, clamped to ±:data:`NORMALIZE_MAX_GAIN_DB` and
+  so that the true peak stays under :data:`TRUE_PEAK_CEILING_DB`.
+
+Measurements are cached by the SHA-256 of the file (the same SFX or an
+unchanged voice over is never measured twice) and written into the
+video's timeline (:func:`~audio_sync.timeline.write_timeline_loudness`).
+The render's audio mix applies the gains (:mod:`render.audio_bed`); the
+static volumes still set each SFX's level relative to the narration.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .config import (
+    LOUDNESS_CACHE_FILE,
+    NORMALIZE_MAX_GAIN_DB,
+    SFX_TARGET_LUFS,
+    TRUE_PEAK_CEILING_DB,
+    VOICE_TARGET_LUFS,
+)
+from .stitch import SILENT_LUFS, _run_ffmpeg
+from .timeline import file_sha256
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / LOUDNESS_CACHE_FILE
+
+_INTEGRATED = re.compile(r"I:\s+(-?[\d.]+) LUFS")
+_PEAK = re.compile(r"Peak:\s+(-?[\d.]+|-inf) dBFS")
+_DURATION = re.compile(r"Duration:\s+(\d+):(\d+):([\d.]+)")
+
+
+def audio_assets(public_dir: str | Path) -> list[str]:
+    """Voice overs and SFX in *public_dir*, as paths relative to it."""
+    public_dir = Path(public_dir)
+    names = [p.name for p in public_dir.glob("Scene *.mp3")]
+    names += [f"sfx/{p.name}" for p in (public_dir / "sfx").glob("*.mp3")]
+    return sorted(names)
+
+
+def measure(path: str) -> dict[str, Any]:
+    """
+    Integrated loudness, true peak and duration of one file.
+
+    Returns:
+        ``{lufs, peak_db, duration}`` — ``lufs`` is None for silence,
+        ``peak_db`` None for digital silence — or ``{error}``.
+    """
+    try:
+        stderr = _run_ffmpeg([
+            "ffmpeg", "-hide_banner", "-nostats", "-i", path,
+            "-af", "ebur128=peak=true", "-f", "null", "-",
+        ])
+    except RuntimeError as e:
+        return {"error": str(e)}
+    loudness = _INTEGRATED.findall(stderr)
+    peak = _PEAK.findall(stderr)
+    duration = _DURATION.search(stderr)
+    lufs = float(loudness[-1]) if loudness else None
+    return {
+        "lufs": None if lufs is None or lufs <= SILENT_LUFS else lufs,
+        "peak_db": float(peak[-1]) if peak and peak[-1] != "-inf" else None,
+        "duration": (
+            round(int(duration[1]) * 3600 + int(duration[2]) * 60 + float(duration[3]), 3)
+            if duration else None
+        ),
+    }
+
+
+def normalizing_gain(entry: dict[str, Any], target_lufs: float) -> float:
+    """Gain in dB that brings a measured asset to *target_lufs* (0 if unmeasured)."""
+    if entry.get("lufs") is None:
+        return 0.0
+    gain = max(-NORMALIZE_MAX_GAIN_DB, min(NORMALIZE_MAX_GAIN_DB, target_lufs - entry["lufs"]))
+    if entry.get("peak_db") is not None:
+        gain = min(gain, TRUE_PEAK_CEILING_DB - entry["peak_db"])
+    return round(gain, 2)
+
+
+def _load_cache(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def analyze_assets(
+    public_dir: str | Path,
+    names: list[str] | None = None,
+    *,
+    cache_path: str | Path | None = None,
+    workers: int | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Measure voice and SFX assets and derive their normalizing gains.
+
+    Args:
+        public_dir: Directory the asset names are relative to.
+        names: Assets to analyze; ``None`` = :func:`audio_assets`.
+        cache_path: Measurement cache keyed by content SHA-256.
+        workers: Process pool size; ``None`` = one per CPU, ``1`` = inline.
+
+    Returns:
+        ``{name: {sha256, lufs, peak_db, duration, gain_db}}`` — an asset
+        that could not be measured carries ``error`` and a 0 dB gain.
+    """
+    public_dir = Path(public_dir)
+    cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+    names = audio_assets(public_dir) if names is None else names
+    hashes = {name: file_sha256(public_dir / name) for name in names}
+    cache = _load_cache(cache_path)
+
+    pending = sorted({sha for sha in hashes.values() if sha not in cache})
+    measured: dict[str, dict[str, Any]] = {}
+    if pending:
+        sources = {sha: str(public_dir / name) for name, sha in hashes.items()}
+        paths = [sources[sha] for sha in pending]
+        workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+        if workers == 1:
+            results = [measure(p) for p in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(measure, paths))
+        measured = dict(zip(pending, results))
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path.with_suffix(".lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            cache = _load_cache(cache_path)
+            cache.update({sha: m for sha, m in measured.items() if "error" not in m})
+            tmp = cache_path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(cache, separators=(",", ":")))
+            tmp.replace(cache_path)
+
+    analysis = {}
+    for name, sha in hashes.items():
+        entry = {"sha256": sha, **(cache.get(sha) or measured.get(sha) or {})}
+        target = SFX_TARGET_LUFS if name.startswith("sfx/") else VOICE_TARGET_LUFS
+        entry["gain_db"] = 0.0 if "error" in entry else normalizing_gain(entry, target)
+        analysis[name] = entry
+    return analysis
+
+
+def asset_gains(loudness: dict[str, dict[str, Any]] | None) -> dict[str, float]:
+    """``{name: gain_db}`` of the assets that need a gain."""
+    return {
+        name: entry["gain_db"]
+        for name, entry in (loudness or {}).items()
+        if entry.get("gain_db")
+    }
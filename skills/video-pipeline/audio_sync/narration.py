@@ -0,0 +1,135 @@
+"""
+One narration track with sample-accurate scene offsets.
+
+The voice bot delivers one ``Scene N.mp3`` per scene.  Joining them with
+ffmpeg's concat demuxer (``-c copy``) keeps every file's encoder delay and
+padding, so the scene boundaries drift by a few milliseconds each — and
+nothing recorded where a scene actually starts in the joined file.
+
+Instead each scene is decoded to mono PCM at :data:`STITCH_SAMPLE_RATE`
+(:func:`~audio_sync.stitch.decode_chunk` trims the encoder delay/padding)
+and the PCM is appended into one WAV.  Because every scene is decoded at
+the same rate, each scene's offset is an exact sample index into the
+track.  The offsets go into the video's timeline as its NARRATION record
+(:meth:`~audio_sync.timeline.TimelineWriter.write_narration`):
+
+    ``{file, bytes, sample_rate, samples,
+    scenes: [{scene_number, source, sha256, offset_samples, samples,
+    start, end}]}``
+
+The render's audio mix (:mod:`render.audio_bed`) then opens this one
+file and cuts each scene out of it by sample, instead of opening and
+decoding N MP3s.  A ``.json`` copy of the record next to the track lets
+an unchanged set of scenes reuse it without decoding again.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .config import STITCH_SAMPLE_RATE
+from .stitch import decode_chunk
+from .timeline import TICKS_PER_SECOND, file_sha256
+
+NARRATION_FILE = "narration.wav"
+
+
+def _seconds(samples: int, sample_rate: int) -> float:
+    return round(samples / sample_rate * TICKS_PER_SECOND) / TICKS_PER_SECOND
+
+
+def _load_record(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def concat_narration(
+    scene_audio: dict[int, str | Path],
+    output: str | Path,
+    *,
+    sample_rate: int = STITCH_SAMPLE_RATE,
+) -> dict[str, Any]:
+    """
+    Join the scenes' voice overs into one PCM WAV *output*.
+
+    Args:
+        scene_audio: ``{scene_number: path to the scene's MP3}``.
+        output: The narration track, e.g.
+            ``timing/{video_id}/narration.wav``; a ``.json`` copy of the
+            record is kept next to it.
+        sample_rate: Rate every scene is decoded at.
+
+    Returns:
+        The narration record (see the module docstring); scenes are in
+        scene-number order, ``start``/``end`` are seconds.
+
+    Raises:
+        RuntimeError: ffmpeg is missing or failed.
+        ValueError: *scene_audio* is empty.
+    """
+    if not scene_audio:
+        raise ValueError("no scene audio to concatenate")
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    scenes = sorted((sn, Path(p)) for sn, p in scene_audio.items())
+    hashes = [file_sha256(p) for _, p in scenes]
+
+    key_file = output.with_suffix(".json")
+    previous = _load_record(key_file)
+    if (
+        previous
+        and previous.get("sample_rate") == sample_rate
+        and [(s["scene_number"], s["sha256"]) for s in previous.get("scenes", [])]
+        == [(sn, sha) for (sn, _), sha in zip(scenes, hashes)]
+        and output.is_file()
+        and output.stat().st_size == previous.get("bytes")
+    ):
+        return previous
+
+    with tempfile.TemporaryDirectory(prefix="narration_") as tmp:
+        wavs = [Path(tmp) / f"scene_{sn:03d}.wav" for sn, _ in scenes]
+        with ThreadPoolExecutor(max_workers=min(4, len(scenes))) as pool:
+            list(pool.map(
+                lambda pair: decode_chunk(*pair, sample_rate=sample_rate),
+                zip((p for _, p in scenes), wavs),
+            ))
+
+        part = output.with_name(output.stem + ".part" + output.suffix)
+        entries: list[dict[str, Any]] = []
+        offset = 0
+        with wave.open(str(part), "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(sample_rate)
+            for (sn, src), sha, wav in zip(scenes, hashes, wavs):
+                with wave.open(str(wav)) as w:
+                    samples = w.getnframes()
+                    out.writeframes(w.readframes(samples))
+                entries.append({
+                    "scene_number": sn,
+                    "source": src.name,
+                    "sha256": sha,
+                    "offset_samples": offset,
+                    "samples": samples,
+                    "start": _seconds(offset, sample_rate),
+                    "end": _seconds(offset + samples, sample_rate),
+                })
+                offset += samples
+        part.replace(output)
+
+    record = {
+        "file": str(output.resolve()),
+        "bytes": output.stat().st_size,
+        "sample_rate": sample_rate,
+        "samples": offset,
+        "scenes": entries,
+    }
+    key_file.write_text(json.dumps(record, separators=(",", ":")))
+    return record
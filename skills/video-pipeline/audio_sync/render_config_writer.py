@@ -122,11 +122,11 @@ def write_render_config(
     config: dict[str, Any],
     output_path: str | Path,
 ) -> Path:
-    """Serialise *config* to JSON on disk."""
+    """Serialise *config* to compact JSON on disk."""
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w") as f:
-        json.dump(config, f, indent=2)
+        json.dump(config, f, separators=(",", ":"))
     return output_path
 
 
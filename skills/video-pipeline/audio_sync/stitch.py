@@ -0,0 +1,143 @@
+"""
+Gapless, loudness-matched concatenation of MP3 chunks.
+
+Long voice overs are synthesized as several sentence-aligned chunks
+(``ElevenLabsClient.synthesize_many``).  Joining the MP3 bytes end to end
+would leave each chunk's encoder delay and padding in the middle of the
+narration as audible clicks and gaps, and each chunk comes back from the
+TTS at a slightly different level.  Instead every chunk is decoded to PCM
+(ffmpeg trims the encoder delay/padding using the LAME header) while its
+integrated loudness is measured with the ``ebur128`` filter; the PCM
+chunks are then gain-matched and concatenated in one filter graph and
+encoded once.
+
+Because all chunks are decoded at the same sample rate, the chunk spans
+returned with the audio are sample-accurate offsets into the stitched
+track — ``audio_sync`` uses them to anchor Whisper's word timestamps.
+"""
+
+from __future__ import annotations
+
+import re
+import statistics
+import subprocess
+import tempfile
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .config import LOUDNESS_MATCH_MAX_GAIN_DB, STITCH_MP3_BITRATE, STITCH_SAMPLE_RATE
+
+_INTEGRATED = re.compile(r"I:\s+(-?[\d.]+) LUFS")
+
+SILENT_LUFS = -70.0
+"""``ebur128`` reports this (its gate) for silent input."""
+
+
+def _run_ffmpeg(cmd: list[str]) -> str:
+    """Run ffmpeg; return its stderr.  Raises RuntimeError on failure."""
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not installed")
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip()[-300:] or f"ffmpeg exited {result.returncode}")
+    return result.stderr
+
+
+def decode_chunk(src: Path, wav: Path, sample_rate: int = STITCH_SAMPLE_RATE) -> tuple[float, float | None]:
+    """
+    Decode *src* to mono 16-bit PCM *wav* and measure it in the same pass.
+
+    Returns:
+        ``(duration in seconds, integrated loudness in LUFS or None if silent)``
+    """
+    stderr = _run_ffmpeg([
+        "ffmpeg", "-y", "-hide_banner", "-nostats", "-i", str(src),
+        "-af", "ebur128", "-ar", str(sample_rate), "-ac", "1", "-c:a", "pcm_s16le", str(wav),
+    ])
+    with wave.open(str(wav)) as w:
+        duration = w.getnframes() / w.getframerate()
+    found = _INTEGRATED.findall(stderr)
+    loudness = float(found[-1]) if found else None
+    if loudness is not None and loudness <= SILENT_LUFS:
+        loudness = None
+    return duration, loudness
+
+
+def loudness_gains(
+    loudness: list[float | None],
+    max_gain_db: float = LOUDNESS_MATCH_MAX_GAIN_DB,
+) -> list[float]:
+    """
+    Gain in dB that brings each chunk to the median loudness.
+
+    Silent or unmeasured chunks (None) are left alone; gains are clamped
+    to ±*max_gain_db*.
+    """
+    measured = [l for l in loudness if l is not None]
+    if not measured:
+        return [0.0] * len(loudness)
+    target = statistics.median(measured)
+    return [
+        0.0 if l is None else round(max(-max_gain_db, min(max_gain_db, target - l)), 2)
+        for l in loudness
+    ]
+
+
+def stitch_audio(
+    chunks: list[bytes],
+    *,
+    match_loudness: bool = True,
+    sample_rate: int = STITCH_SAMPLE_RATE,
+    bitrate: str = STITCH_MP3_BITRATE,
+) -> tuple[bytes, list[tuple[float, float]]]:
+    """
+    Join MP3 *chunks* into one gapless MP3.
+
+    Returns:
+        ``(mp3 bytes, [(start, end) seconds of each chunk in the result])``
+
+    Raises:
+        RuntimeError: ffmpeg is missing or failed.
+    """
+    if not chunks:
+        raise ValueError("nothing to stitch")
+    with tempfile.TemporaryDirectory(prefix="stitch_") as tmp:
+        tmp_dir = Path(tmp)
+        sources, wavs = [], []
+        for i, data in enumerate(chunks):
+            src = tmp_dir / f"chunk_{i:03d}.mp3"
+            src.write_bytes(data)
+            sources.append(src)
+            wavs.append(tmp_dir / f"chunk_{i:03d}.wav")
+
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+            measured = list(pool.map(
+                lambda pair: decode_chunk(*pair, sample_rate=sample_rate), zip(sources, wavs),
+            ))
+        durations = [duration for duration, _ in measured]
+        gains = (loudness_gains([l for _, l in measured]) if match_loudness
+                 else [0.0] * len(chunks))
+
+        inputs: list[str] = []
+        graph = ""
+        for i, (wav, gain) in enumerate(zip(wavs, gains)):
+            inputs += ["-i", str(wav)]
+            graph += f"[{i}:a]volume={gain}dB[a{i}];"
+        graph += "".join(f"[a{i}]" for i in range(len(wavs)))
+        graph += f"concat=n={len(wavs)}:v=0:a=1[out]"
+        out = tmp_dir / "stitched.mp3"
+        _run_ffmpeg([
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error", *inputs,
+            "-filter_complex", graph, "-map", "[out]",
+            "-c:a", "libmp3lame", "-b:a", bitrate, str(out),
+        ])
+        content = out.read_bytes()
+
+    spans: list[tuple[float, float]] = []
+    position = 0.0
+    for duration in durations:
+        spans.append((round(position, 4), round(position + duration, 4)))
+        position += duration
+    return content, spans
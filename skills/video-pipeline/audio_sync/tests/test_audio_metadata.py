@@ -0,0 +1,165 @@
+"""Tests for audio_sync.audio_metadata — header-only duration probing."""
+
+import io
+import os
+import struct
+import wave
+
+import pytest
+
+from audio_sync.audio_metadata import (
+    clear_cache,
+    parse_audio_header,
+    probe_audio,
+    probe_duration,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+# MPEG1 Layer III, 128 kbps, 44.1 kHz, stereo, no padding -> 417-byte frames
+_HEADER = b"\xff\xfb\x90\x00"
+_FRAME_LEN = 417
+
+
+def _frame(payload: bytes = b"") -> bytes:
+    body = payload + b"\x00" * (_FRAME_LEN - 4 - len(payload))
+    return _HEADER + body
+
+
+def _id3(size: int) -> bytes:
+    syncsafe = bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+    return b"ID3\x04\x00\x00" + syncsafe + b"\x00" * size
+
+
+def _cbr_mp3(frames: int) -> bytes:
+    return b"".join(_frame() for _ in range(frames))
+
+
+def _xing_mp3(frames: int) -> bytes:
+    # Side info for MPEG1 stereo is 32 bytes; Xing tag follows it
+    xing = b"\x00" * 32 + b"Xing" + struct.pack(">II", 0x01, frames)
+    return _frame(xing) + _cbr_mp3(3)
+
+
+def _wav(seconds: float, rate: int = 16000) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\x00\x00" * int(seconds * rate))
+    return buf.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+# ---------------------------------------------------------------------------
+# MP3
+# ---------------------------------------------------------------------------
+
+class TestMp3:
+    def test_xing_frame_count(self):
+        info = parse_audio_header(_xing_mp3(frames=2500))
+        assert info["method"] == "xing"
+        assert info["sample_rate"] == 44100
+        assert info["duration"] == pytest.approx(2500 * 1152 / 44100)
+
+    def test_cbr_uses_total_size(self):
+        data = _cbr_mp3(10)
+        info = parse_audio_header(data[:2048], total_size=len(data))
+        assert info["method"] == "cbr"
+        assert info["duration"] == pytest.approx(len(data) * 8 / 128000)
+
+    def test_skips_id3v2_tag(self):
+        data = _id3(5000) + _xing_mp3(frames=100)
+        info = parse_audio_header(data)
+        assert info["audio_start"] == 5010
+        assert info["duration"] == pytest.approx(100 * 1152 / 44100)
+
+    def test_vbri_header(self):
+        vbri = b"\x00" * 32 + b"VBRI" + b"\x00" * 10 + struct.pack(">I", 400)
+        data = _frame(vbri) + _cbr_mp3(2)
+        info = parse_audio_header(data)
+        assert info["method"] == "vbri"
+        assert info["duration"] == pytest.approx(400 * 1152 / 44100)
+
+    def test_garbage_returns_none(self):
+        assert parse_audio_header(b"not audio at all" * 10) is None
+
+
+# ---------------------------------------------------------------------------
+# WAV
+# ---------------------------------------------------------------------------
+
+class TestWav:
+    def test_duration_from_data_chunk(self):
+        info = parse_audio_header(_wav(2.5))
+        assert info["format"] == "wav"
+        assert info["duration"] == pytest.approx(2.5)
+
+
+# ---------------------------------------------------------------------------
+# probe_* entry points
+# ---------------------------------------------------------------------------
+
+class TestProbe:
+    def test_probe_path(self, tmp_path):
+        path = tmp_path / "Scene 1.mp3"
+        path.write_bytes(_xing_mp3(frames=1000))
+        assert probe_duration(path) == pytest.approx(1000 * 1152 / 44100)
+
+    def test_probe_bytes(self):
+        assert probe_duration(_wav(1.0)) == pytest.approx(1.0)
+
+    def test_missing_path_returns_none(self, tmp_path):
+        assert probe_duration(tmp_path / "nope.mp3") is None
+
+    def test_memoised_by_content(self, tmp_path, monkeypatch):
+        a = tmp_path / "a.mp3"
+        b = tmp_path / "b.mp3"
+        a.write_bytes(_xing_mp3(frames=10))
+        b.write_bytes(_xing_mp3(frames=10))
+        os.utime(b, ns=(a.stat().st_mtime_ns, a.stat().st_mtime_ns))
+
+        calls = []
+        import audio_sync.audio_metadata as am
+        real = am.parse_audio_header
+        monkeypatch.setattr(am, "parse_audio_header", lambda *a, **k: calls.append(1) or real(*a, **k))
+
+        probe_audio(a)
+        probe_audio(b)  # identical content -> cache hit
+        assert len(calls) == 1
+
+    def test_rewritten_file_reprobed(self, tmp_path):
+        path = tmp_path / "Scene 1.mp3"
+        path.write_bytes(_cbr_mp3(frames=100))
+        first = probe_duration(path)
+        path.write_bytes(_cbr_mp3(frames=200))
+        assert probe_duration(path) == pytest.approx(2 * first)
+
+    def test_url_memo_skips_request(self, monkeypatch):
+        import httpx
+
+        import audio_sync.audio_metadata as am
+        body = _xing_mp3(frames=100)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(206, content=body[:am.HEADER_PROBE_BYTES],
+                                  headers={"content-range": f"bytes 0-{len(body) - 1}/{len(body)}"})
+
+        real_client = httpx.Client
+        monkeypatch.setattr(httpx, "Client",
+                            lambda **kw: real_client(transport=httpx.MockTransport(handler)))
+        url = "https://example.com/Scene%201.mp3"
+        assert probe_duration(url) == probe_duration(url)
+        assert len(requests) == 1
@@ -0,0 +1,121 @@
+"""Tests for audio_sync.backends — backend selection and chunked decoding."""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from audio_sync import backends
+from audio_sync.backends import (
+    SAMPLE_RATE,
+    TranscriptionBackend,
+    get_backend,
+    merge_chunk_words,
+    plan_chunks,
+    resolve_backend_name,
+)
+from audio_sync.transcriber import transcribe
+
+
+# ---------------------------------------------------------------------------
+# Backend selection
+# ---------------------------------------------------------------------------
+
+class TestResolveBackend:
+    def test_default_is_openai(self, monkeypatch):
+        monkeypatch.delenv("AUDIO_SYNC_BACKEND", raising=False)
+        assert resolve_backend_name() == "openai"
+
+    def test_env_selects_local(self, monkeypatch):
+        monkeypatch.setenv("AUDIO_SYNC_BACKEND", "LOCAL")
+        assert resolve_backend_name() == "local"
+
+    def test_explicit_name_wins(self, monkeypatch):
+        monkeypatch.setenv("AUDIO_SYNC_BACKEND", "local")
+        assert resolve_backend_name("openai") == "openai"
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            resolve_backend_name("gpu")
+
+    def test_instances_are_reused(self):
+        assert get_backend("local") is get_backend("local")
+
+
+# ---------------------------------------------------------------------------
+# Chunk planning
+# ---------------------------------------------------------------------------
+
+class TestPlanChunks:
+    def test_short_audio_single_chunk(self):
+        samples = np.zeros(SAMPLE_RATE * 30, dtype=np.float32)
+        assert plan_chunks(samples, chunk_seconds=45.0) == [(0, len(samples))]
+
+    def test_chunks_cover_audio_contiguously(self):
+        samples = np.random.default_rng(0).normal(size=SAMPLE_RATE * 200).astype(np.float32)
+        ranges = plan_chunks(samples, chunk_seconds=45.0)
+        assert len(ranges) >= 3
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(samples)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+
+    def test_cut_snaps_to_silence(self):
+        rng = np.random.default_rng(1)
+        samples = rng.normal(size=SAMPLE_RATE * 100).astype(np.float32)
+        # Silent gap 1 s after the nominal 45 s boundary
+        gap_start = int(46.0 * SAMPLE_RATE)
+        samples[gap_start:gap_start + SAMPLE_RATE // 5] = 0.0
+        ranges = plan_chunks(samples, chunk_seconds=45.0, search_seconds=2.0)
+        first_cut = ranges[0][1]
+        assert gap_start <= first_cut < gap_start + SAMPLE_RATE // 5
+
+
+# ---------------------------------------------------------------------------
+# Merge
+# ---------------------------------------------------------------------------
+
+class TestMergeChunkWords:
+    def test_offsets_applied_and_ordered(self):
+        merged = merge_chunk_words([
+            (45.0, [{"word": "later", "start": 0.5, "end": 0.9}]),
+            (0.0, [{"word": "first", "start": 0.1, "end": 0.4}]),
+        ])
+        assert [w["word"] for w in merged] == ["first", "later"]
+        assert merged[1]["start"] == 45.5
+        assert merged[1]["end"] == 45.9
+
+
+# ---------------------------------------------------------------------------
+# transcribe() integration with a fake backend
+# ---------------------------------------------------------------------------
+
+class _FakeBackend(TranscriptionBackend):
+    name = "local"
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe_raw(self, audio_path):
+        self.calls += 1
+        return {"words": [{"word": "hello", "start": 0.0, "end": 0.4}]}
+
+
+class TestTranscribeWithBackend:
+    def test_local_backend_needs_no_api_key_and_caches(self, tmp_path, monkeypatch):
+        fake = _FakeBackend()
+        monkeypatch.setitem(backends._INSTANCES, "local", fake)
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setattr("audio_sync.transcriber._load_openai_key", lambda: None)
+
+        audio = tmp_path / "Scene 1.mp3"
+        audio.write_bytes(b"\x00" * 64)
+
+        words = transcribe(str(audio), cache_dir=tmp_path, backend="local")
+        assert [w.word for w in words] == ["hello"]
+        transcribe(str(audio), cache_dir=tmp_path, backend="local")
+        assert fake.calls == 1
+
+        meta = json.loads((tmp_path / "whisper_cache_meta.json").read_text())
+        assert meta["backend"] == "local"
@@ -0,0 +1,86 @@
+"""Tests for audio_sync.incremental — fingerprints, sync state, retiming."""
+
+from audio_sync.incremental import (
+    audio_content_hash,
+    get_clean_scene,
+    load_sync_state,
+    record_scene,
+    retime_images,
+    save_sync_state,
+    scene_fingerprint,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _images(*sentences):
+    return [
+        {"Image Index": i + 1, "Sentence Text": s}
+        for i, s in enumerate(sentences)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+class TestFingerprint:
+    def test_audio_hash_tracks_content(self, tmp_path):
+        a = tmp_path / "Scene 1.mp3"
+        a.write_bytes(b"voice-v1")
+        h1 = audio_content_hash(a)
+        a.write_bytes(b"voice-v2")
+        assert audio_content_hash(a) != h1
+
+    def test_sentence_edit_changes_fingerprint(self):
+        base = scene_fingerprint("abc", _images("One.", "Two."))
+        assert scene_fingerprint("abc", _images("One.", "Two.")) == base
+        assert scene_fingerprint("abc", _images("One.", "Two!")) != base
+        assert scene_fingerprint("abd", _images("One.", "Two.")) != base
+
+    def test_sentence_order_matters(self):
+        assert scene_fingerprint("a", _images("X.", "Y.")) != scene_fingerprint("a", _images("Y.", "X."))
+
+
+# ---------------------------------------------------------------------------
+# Sync state
+# ---------------------------------------------------------------------------
+
+class TestSyncState:
+    def test_round_trip_and_clean_lookup(self, tmp_path):
+        state = load_sync_state(tmp_path)
+        assert state["scenes"] == {}
+
+        record_scene(state, 3, "fp3", [
+            {"image_index": 1, "duration": 4.2, "sentence_text": "Hi."},
+        ])
+        save_sync_state(state, tmp_path)
+
+        loaded = load_sync_state(tmp_path)
+        assert get_clean_scene(loaded, 3, "fp3")["images"][0]["duration"] == 4.2
+        assert get_clean_scene(loaded, 3, "other") is None
+        assert get_clean_scene(loaded, 4, "fp3") is None
+
+    def test_corrupt_state_is_empty(self, tmp_path):
+        (tmp_path / "sync_state.json").write_text("{not json")
+        assert load_sync_state(tmp_path)["scenes"] == {}
+
+
+# ---------------------------------------------------------------------------
+# Retiming
+# ---------------------------------------------------------------------------
+
+class TestRetime:
+    def test_lays_images_end_to_end(self):
+        timed = retime_images([
+            {"image_index": 1, "duration": 3.0},
+            {"image_index": 2, "duration": 2.5},
+            {"image_index": 1, "duration": 4.0, "alignment_method": "fallback"},
+        ])
+        assert [(t["display_start"], t["display_end"]) for t in timed] == [
+            (0.0, 3.0), (3.0, 5.5), (5.5, 9.5),
+        ]
+        assert timed[0]["alignment_method"] == "sentence_match"
+        assert timed[2]["alignment_method"] == "fallback"
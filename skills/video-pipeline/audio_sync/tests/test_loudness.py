@@ -0,0 +1,82 @@
+"""Tests for audio_sync.loudness — asset measurement and normalizing gains (no ffmpeg)."""
+
+import pytest
+
+from audio_sync import loudness
+from audio_sync.loudness import analyze_assets, asset_gains, audio_assets, measure, normalizing_gain
+
+
+def _stderr(lufs, peak, duration="00:00:08.02"):
+    return (
+        f"  Duration: {duration}, start: 0.025057, bitrate: 128 kb/s\n"
+        "[Parsed_ebur128_0 @ 0x1] Summary:\n\n"
+        f"  Integrated loudness:\n    I:         {lufs} LUFS\n    Threshold: -33.0 LUFS\n\n"
+        f"  True peak:\n    Peak:       {peak} dBFS\n"
+    )
+
+
+_LEVELS = {"Scene 1.mp3": (-22.0, -6.0), "Scene 2.mp3": (-12.5, -0.3), "sfx_1_1.mp3": (-30.0, -20.0)}
+
+
+@pytest.fixture
+def public(tmp_path, monkeypatch):
+    public = tmp_path / "public"
+    (public / "sfx").mkdir(parents=True)
+    (public / "Scene 1.mp3").write_bytes(b"voice one")
+    (public / "Scene 2.mp3").write_bytes(b"voice two")
+    (public / "sfx" / "sfx_1_1.mp3").write_bytes(b"sfx")
+    (public / "Scene_01_01.png").write_bytes(b"png")
+    calls = []
+
+    def _run(cmd):
+        name = cmd[cmd.index("-i") + 1].rsplit("/", 1)[-1]
+        calls.append(name)
+        return _stderr(*_LEVELS[name])
+
+    monkeypatch.setattr(loudness, "_run_ffmpeg", _run)
+    return public, calls
+
+
+class TestMeasure:
+    def test_parses_summary(self, public):
+        path, _ = public
+        assert measure(str(path / "Scene 1.mp3")) == {"lufs": -22.0, "peak_db": -6.0, "duration": 8.02}
+
+    def test_failure_and_silence(self, monkeypatch):
+        def _fail(cmd):
+            raise RuntimeError("Invalid data found")
+        monkeypatch.setattr(loudness, "_run_ffmpeg", _fail)
+        assert measure("x.mp3") == {"error": "Invalid data found"}
+        monkeypatch.setattr(loudness, "_run_ffmpeg", lambda cmd: _stderr(-70.0, "-inf"))
+        assert measure("x.mp3")["lufs"] is None and measure("x.mp3")["peak_db"] is None
+
+
+class TestGain:
+    def test_target_clamp_and_peak_ceiling(self):
+        assert normalizing_gain({"lufs": -22.0, "peak_db": -6.0}, -16.0) == 5.0
+        assert normalizing_gain({"lufs": -40.0, "peak_db": -30.0}, -16.0) == 12.0
+        # +4 dB would push a -3 dBTP peak over the -1 dBTP ceiling
+        assert normalizing_gain({"lufs": -20.0, "peak_db": -3.0}, -16.0) == 2.0
+        assert normalizing_gain({"lufs": None, "peak_db": None}, -16.0) == 0.0
+
+
+class TestAnalyzeAssets:
+    def test_measures_once_per_content(self, public, tmp_path):
+        path, calls = public
+        cache = tmp_path / "loudness_cache.json"
+        assert audio_assets(path) == ["Scene 1.mp3", "Scene 2.mp3", "sfx/sfx_1_1.mp3"]
+
+        first = analyze_assets(path, cache_path=cache, workers=1)
+        assert sorted(calls) == ["Scene 1.mp3", "Scene 2.mp3", "sfx_1_1.mp3"]
+        assert first["Scene 1.mp3"]["gain_db"] == 5.0
+        assert first["Scene 2.mp3"]["gain_db"] == -3.5
+        assert first["sfx/sfx_1_1.mp3"]["gain_db"] == 10.0  # SFX target -20 LUFS
+        assert first["Scene 1.mp3"]["sha256"]
+
+        # Another video with the same SFX: only its new voice over is measured
+        calls.clear()
+        (path / "Scene 2.mp3").unlink()
+        second = analyze_assets(path, cache_path=cache, workers=1)
+        assert calls == []
+        assert second["sfx/sfx_1_1.mp3"] == first["sfx/sfx_1_1.mp3"]
+        assert asset_gains(second) == {"Scene 1.mp3": 5.0, "sfx/sfx_1_1.mp3": 10.0}
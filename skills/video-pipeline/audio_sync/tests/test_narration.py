@@ -0,0 +1,67 @@
+"""Tests for audio_sync.narration — the single narration track (no ffmpeg)."""
+
+import wave
+
+import pytest
+
+from audio_sync import narration
+from audio_sync.narration import concat_narration
+
+
+@pytest.fixture
+def scenes(tmp_path, monkeypatch):
+    """Scene N.mp3 decodes to N * 1000 samples of value N."""
+    audio = {}
+    for sn in (2, 1, 3):
+        path = tmp_path / f"Scene {sn}.mp3"
+        path.write_bytes(f"voice {sn}".encode())
+        audio[sn] = path
+    decoded = []
+
+    def _decode(src, wav, sample_rate):
+        sn = int(src.stem.split()[-1])
+        decoded.append(sn)
+        with wave.open(str(wav), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(sample_rate)
+            w.writeframes(sn.to_bytes(2, "little") * (sn * 1000))
+        return sn * 1000 / sample_rate, -16.0
+
+    monkeypatch.setattr(narration, "decode_chunk", _decode)
+    return audio, decoded
+
+
+class TestConcat:
+    def test_offsets_are_sample_exact(self, tmp_path, scenes):
+        audio, _ = scenes
+        out = tmp_path / "timing" / "narration.wav"
+        record = concat_narration(audio, out, sample_rate=8000)
+        assert [s["scene_number"] for s in record["scenes"]] == [1, 2, 3]
+        assert [s["offset_samples"] for s in record["scenes"]] == [0, 1000, 3000]
+        assert record["samples"] == 6000
+        assert record["scenes"][1]["start"] == 0.125 and record["scenes"][2]["end"] == 0.75
+        assert record["scenes"][0]["source"] == "Scene 1.mp3"
+
+        with wave.open(str(out)) as w:
+            assert w.getnframes() == 6000
+            w.setpos(3000)
+            assert w.readframes(1) == (3).to_bytes(2, "little")
+        assert record["bytes"] == out.stat().st_size
+        assert not list(out.parent.glob("*.part*"))
+
+    def test_unchanged_scenes_reuse_the_track(self, tmp_path, scenes):
+        audio, decoded = scenes
+        out = tmp_path / "narration.wav"
+        first = concat_narration(audio, out, sample_rate=8000)
+        assert concat_narration(audio, out, sample_rate=8000) == first
+        assert len(decoded) == 3
+
+        audio[2].write_bytes(b"regenerated voice 2")
+        second = concat_narration(audio, out, sample_rate=8000)
+        assert len(decoded) == 6
+        assert second["scenes"][1]["sha256"] != first["scenes"][1]["sha256"]
+
+    def test_nothing_to_join(self, tmp_path):
+        with pytest.raises(ValueError):
+            concat_narration({}, tmp_path / "narration.wav")
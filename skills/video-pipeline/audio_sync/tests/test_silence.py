@@ -0,0 +1,104 @@
+"""Tests for audio_sync.silence — pause detection and boundary snapping (no ffmpeg)."""
+
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from audio_sync import silence
+from audio_sync.silence import energy_envelope, find_pauses, snap_boundaries, snap_to_silence
+
+RATE = 16000
+
+
+def _speech(*segments):
+    """Concatenate ``(seconds, loud)`` segments: a 200 Hz tone or near-silence."""
+    parts = []
+    rng = np.random.default_rng(0)
+    for seconds, loud in segments:
+        n = int(seconds * RATE)
+        if loud:
+            parts.append(0.3 * np.sin(2 * np.pi * 200 * np.arange(n) / RATE))
+        else:
+            parts.append(0.0005 * rng.standard_normal(n))
+    return np.concatenate(parts).astype(np.float32)
+
+
+# ---------------------------------------------------------------------------
+# Envelope / pauses
+# ---------------------------------------------------------------------------
+
+class TestPauses:
+    def test_pauses_found_between_words(self):
+        audio = _speech((1.0, True), (0.3, False), (1.0, True), (0.05, False), (0.5, True))
+        env = energy_envelope(audio, RATE)
+        assert len(env) == 285
+        pauses = find_pauses(env)
+        # The 50 ms dip is too short to be a pause
+        assert pauses == [(1.0, 1.3)]
+
+    def test_level_is_relative(self):
+        quiet = _speech((1.0, True), (0.3, False), (1.0, True)) * 0.05
+        assert find_pauses(energy_envelope(quiet, RATE)) == [(1.0, 1.3)]
+        assert find_pauses(energy_envelope(np.zeros(0), RATE)) == []
+
+    def test_fast_enough_for_a_long_scene(self):
+        audio = _speech(*[(4.0, True), (0.4, False)] * 40)  # ~3 minutes
+        start = time.perf_counter()
+        pauses = find_pauses(energy_envelope(audio, RATE))
+        assert time.perf_counter() - start < 1.0
+        assert len(pauses) == 40
+
+
+# ---------------------------------------------------------------------------
+# Snapping
+# ---------------------------------------------------------------------------
+
+class TestSnap:
+    def test_moves_to_pause_midpoint_within_tolerance(self):
+        pauses = [(1.0, 1.3), (5.0, 5.2)]
+        assert snap_boundaries([1.32, 3.0, 4.8], pauses, tolerance=0.4) == [1.15, 3.0, 5.1]
+
+    def test_long_pause_only_within_reach(self):
+        assert snap_boundaries([2.0], [(2.1, 6.0)], tolerance=0.4) == [2.4]
+
+    def test_order_kept(self):
+        # Both boundaries reach the same pause; neither may move backwards
+        assert snap_boundaries([1.1, 1.1], [(1.0, 1.3)], tolerance=0.4) == [1.15, 1.15]
+        assert snap_boundaries([2.0, 1.9], [(2.2, 2.4)], tolerance=0.4) == [2.3, 2.3]
+
+
+# ---------------------------------------------------------------------------
+# Scene envelope cache
+# ---------------------------------------------------------------------------
+
+class TestSceneEnvelope:
+    def test_decoded_once_per_audio_hash(self, tmp_path, monkeypatch):
+        audio = _speech((1.0, True), (0.3, False), (1.0, True))
+        calls = []
+
+        def _decode(cmd):
+            calls.append(cmd)
+            with wave.open(cmd[-1], "wb") as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(RATE)
+                w.writeframes((audio * 32767).astype("<i2").tobytes())
+            return ""
+
+        monkeypatch.setattr(silence, "_run_ffmpeg", _decode)
+        cache = tmp_path / "envelopes"
+        assert snap_to_silence("Scene 1.mp3", "abc", [0.9], cache_dir=cache) == [1.15]
+        assert snap_to_silence("Scene 1.mp3", "abc", [1.4], cache_dir=cache) == [1.15]
+        assert len(calls) == 1
+        assert [p.name for p in cache.iterdir()] == ["abc-10ms.npy"]
+
+    def test_decode_failure_raises(self, tmp_path, monkeypatch):
+        def _fail(cmd):
+            raise RuntimeError("ffmpeg not installed")
+
+        monkeypatch.setattr(silence, "_run_ffmpeg", _fail)
+        with pytest.raises(RuntimeError):
+            snap_to_silence("Scene 1.mp3", "abc", [1.0], cache_dir=tmp_path)
+        assert snap_to_silence("Scene 1.mp3", "abc", [], cache_dir=tmp_path) == []
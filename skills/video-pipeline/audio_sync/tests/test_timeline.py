@@ -0,0 +1,149 @@
+"""Tests for audio_sync.timeline — binary-packed timeline artifact."""
+
+import json
+
+import pytest
+
+from audio_sync.timeline import (
+    TIMELINE_FILE,
+    TimelineWriter,
+    load_render_config,
+    read_timeline,
+    timeline_ref,
+    verify_timeline_ref,
+    write_timeline_loudness,
+)
+from audio_sync.transcriber import WordTimestamp
+
+
+_CONFIG = {
+    "video_id": "rec123",
+    "total_duration_seconds": 7.5,
+    "scenes": [{"scene_number": 1, "display_start": 0.0, "display_end": 7.5}],
+}
+
+
+def _write(path, scenes=None, config=_CONFIG):
+    with TimelineWriter(path) as tw:
+        for scene, words in (scenes or {}).items():
+            tw.add_scene_words(scene, words)
+        if config is not None:
+            tw.write_config(config)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Round trip
+# ---------------------------------------------------------------------------
+
+class TestRoundTrip:
+    def test_words_and_config(self, tmp_path):
+        path = _write(tmp_path / TIMELINE_FILE, {
+            1: [WordTimestamp(" Hello", 0.0, 0.4213), WordTimestamp("world.", 0.4213, 0.9)],
+            2: [{"word": "Next", "start": 1000.1234, "end": 1000.5}],
+        })
+        data = read_timeline(path)
+        assert data["config"] == _CONFIG
+        assert data["words"][1] == [
+            {"word": "Hello", "start": 0.0, "end": 0.4213},
+            {"word": "world.", "start": 0.4213, "end": 0.9},
+        ]
+        assert data["words"][2][0]["start"] == pytest.approx(1000.1234)
+
+    def test_empty_scene(self, tmp_path):
+        path = _write(tmp_path / TIMELINE_FILE, {3: []})
+        assert read_timeline(path)["words"][3] == []
+
+    def test_smaller_than_pretty_json(self, tmp_path):
+        words = [WordTimestamp(f"word{i}", i * 0.3, i * 0.3 + 0.25) for i in range(500)]
+        path = _write(tmp_path / TIMELINE_FILE, {1: words})
+        pretty = json.dumps([w.to_dict() for w in words], indent=2)
+        assert path.stat().st_size < len(pretty) / 3
+
+
+# ---------------------------------------------------------------------------
+# Atomicity / integrity
+# ---------------------------------------------------------------------------
+
+class TestIntegrity:
+    def test_abort_keeps_previous_timeline(self, tmp_path):
+        path = _write(tmp_path / TIMELINE_FILE)
+        with pytest.raises(RuntimeError):
+            with TimelineWriter(path) as tw:
+                tw.write_config({"video_id": "new"})
+                raise RuntimeError("sync crashed")
+        assert read_timeline(path)["config"] == _CONFIG
+        assert not (tmp_path / (TIMELINE_FILE + ".tmp")).exists()
+
+    def test_truncated_file_rejected(self, tmp_path):
+        path = _write(tmp_path / TIMELINE_FILE)
+        path.write_bytes(path.read_bytes()[:-5])
+        with pytest.raises(ValueError):
+            read_timeline(path)
+
+    def test_ref_checksum(self, tmp_path):
+        path = tmp_path / TIMELINE_FILE
+        with TimelineWriter(path) as tw:
+            tw.write_config(_CONFIG)
+        ref = tw.close()
+        assert ref == timeline_ref(path)
+        assert verify_timeline_ref(ref)
+
+        _write(path, config={"video_id": "changed"})
+        assert not verify_timeline_ref(ref)
+
+
+class TestLoudnessRecord:
+    def test_replaced_without_touching_words_or_config(self, tmp_path):
+        path = _write(tmp_path / TIMELINE_FILE, {1: [WordTimestamp("Hi", 0.0, 0.3)]})
+        assert read_timeline(path)["loudness"] is None
+
+        write_timeline_loudness(path, {"Scene 1.mp3": {"lufs": -20.0, "gain_db": 4.0}})
+        ref = write_timeline_loudness(path, {"Scene 1.mp3": {"lufs": -18.0, "gain_db": 2.0}})
+        data = read_timeline(path)
+        assert data["loudness"] == {"Scene 1.mp3": {"lufs": -18.0, "gain_db": 2.0}}
+        assert data["config"] == _CONFIG
+        assert data["words"][1] == [{"word": "Hi", "start": 0.0, "end": 0.3}]
+        assert verify_timeline_ref(ref)
+
+    def test_incomplete_timeline_rejected(self, tmp_path):
+        path = _write(tmp_path / TIMELINE_FILE)
+        path.write_bytes(path.read_bytes()[:-5])
+        with pytest.raises(ValueError):
+            write_timeline_loudness(path, {})
+
+
+class TestNarrationRecord:
+    _NARRATION = {"file": "/t/narration.wav", "sample_rate": 44100, "samples": 88200,
+                  "scenes": [{"scene_number": 1, "offset_samples": 0, "samples": 88200}]}
+
+    def test_round_trip_and_kept_by_loudness_rewrite(self, tmp_path):
+        path = tmp_path / TIMELINE_FILE
+        with TimelineWriter(path) as tw:
+            tw.write_narration(self._NARRATION)
+            tw.write_config(_CONFIG)
+        assert read_timeline(path)["narration"] == self._NARRATION
+
+        write_timeline_loudness(path, {"Scene 1.mp3": {"gain_db": 1.0}})
+        assert read_timeline(path)["narration"] == self._NARRATION
+        assert read_timeline(_write(tmp_path / "other.eftl"))["narration"] is None
+
+
+# ---------------------------------------------------------------------------
+# load_render_config
+# ---------------------------------------------------------------------------
+
+class TestLoadRenderConfig:
+    def test_prefers_timeline(self, tmp_path):
+        _write(tmp_path / TIMELINE_FILE)
+        (tmp_path / "render_config.json").write_text(json.dumps({"video_id": "old"}))
+        config, ref = load_render_config(tmp_path)
+        assert config == _CONFIG
+        assert ref["sha256"]
+
+    def test_falls_back_to_json(self, tmp_path):
+        (tmp_path / "render_config.json").write_text(json.dumps(_CONFIG))
+        assert load_render_config(tmp_path) == (_CONFIG, None)
+
+    def test_nothing_found(self, tmp_path):
+        assert load_render_config(tmp_path) == (None, None)
@@ -10,6 +10,7 @@ from audio_sync.timing_adjuster import (
     resolve_overlaps,
     compute_display_durations,
     adjust_timing,
+    adjust_timing_vectorized,
 )
 
 
@@ -161,3 +162,82 @@ class TestAdjustTiming:
         # No overlaps
         for i in range(len(result) - 1):
             assert result[i]["display_end"] <= result[i + 1]["display_start"] + 0.001
+
+
+# ---------------------------------------------------------------------------
+# Vectorized implementation — must match the per-dict passes exactly
+# ---------------------------------------------------------------------------
+
+def _random_timeline(seed, n, short_bias=0.3):
+    import random
+
+    rng = random.Random(seed)
+    scenes, t = [], rng.uniform(0.0, 1.0)
+    for i in range(n):
+        dur = rng.uniform(0.2, 2.9) if rng.random() < short_bias else rng.uniform(3.0, 12.0)
+        start, end = t, t + dur
+        if rng.random() < 0.05:
+            start = None
+        if rng.random() < 0.05:
+            end = None
+        if rng.random() < 0.05 and i:
+            # Nested inside the previous image (forces an overlap fix)
+            prev = scenes[-1]
+            start = (prev["start_time"] or 0.0) + 0.1
+            end = start + 0.5
+        scenes.append({"scene_number": i + 1, "start_time": start, "end_time": end})
+        t += dur + rng.uniform(0.0, 0.8)
+    return scenes
+
+
+def _fields(scenes):
+    return [(s["display_start"], s["display_end"], s["display_duration"]) for s in scenes]
+
+
+class TestAdjustTimingVectorized:
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_sequential(self, seed):
+        import copy
+
+        scenes = _random_timeline(seed, n=300)
+        expected = adjust_timing(copy.deepcopy(scenes), vectorized=False)
+        actual = adjust_timing_vectorized(copy.deepcopy(scenes))
+        assert _fields(actual) == _fields(expected)
+
+    def test_long_cascade_matches_sequential(self):
+        import copy
+
+        # Every image shorter than the minimum and back-to-back: one
+        # push cascades through the whole timeline.
+        scenes = [
+            {"scene_number": i + 1, "start_time": i * 1.1, "end_time": i * 1.1 + 1.0}
+            for i in range(200)
+        ]
+        expected = adjust_timing(copy.deepcopy(scenes), vectorized=False)
+        actual = adjust_timing_vectorized(copy.deepcopy(scenes))
+        assert _fields(actual) == _fields(expected)
+
+    def test_custom_limits(self):
+        import copy
+
+        scenes = _random_timeline(7, n=120, short_bias=0.6)
+        kwargs = dict(pre_roll=0.1, post_hold=0.9, min_display=4.0, max_display=8.0)
+        expected = adjust_timing(copy.deepcopy(scenes), vectorized=False, **kwargs)
+        actual = adjust_timing_vectorized(copy.deepcopy(scenes), **kwargs)
+        assert _fields(actual) == _fields(expected)
+
+    def test_full_pipeline_example(self):
+        scenes = [
+            {"scene_number": 1, "start_time": 0.5, "end_time": 5.0},
+            {"scene_number": 2, "start_time": 5.2, "end_time": 12.0},
+            {"scene_number": 3, "start_time": 12.5, "end_time": 14.0},
+        ]
+        result = adjust_timing(scenes, vectorized=True)
+        assert [s["display_duration"] for s in result] == pytest.approx([4.7, 7.3, 3.0])
+
+    def test_empty(self):
+        assert adjust_timing_vectorized([]) == []
@@ -0,0 +1,119 @@
+"""Tests for audio_sync.voice_chunks and audio_sync.stitch."""
+
+import wave
+
+import pytest
+
+from audio_sync import stitch
+from audio_sync.stitch import loudness_gains, stitch_audio
+from audio_sync.transcriber import WordTimestamp
+from audio_sync.voice_chunks import (
+    anchor_words_to_chunks,
+    load_voice_chunks,
+    record_voice_chunks,
+    words_from_chunks,
+)
+
+CHUNKS = [
+    {"text": "One two three four.", "start": 0.0, "end": 2.0},
+    {"text": "Five six seven eight.", "start": 2.0, "end": 4.5},
+]
+
+
+def _words(times):
+    return [WordTimestamp(f"w{i}", s, e) for i, (s, e) in enumerate(times)]
+
+
+# ---------------------------------------------------------------------------
+# Offsets file
+# ---------------------------------------------------------------------------
+
+class TestVoiceChunksFile:
+    def test_round_trip_keyed_by_audio(self, tmp_path):
+        record_voice_chunks(tmp_path, 3, "abc", CHUNKS)
+        record_voice_chunks(tmp_path, 4, "def", CHUNKS[:1])
+        assert load_voice_chunks(tmp_path, 3, "abc") == CHUNKS
+        assert load_voice_chunks(tmp_path, 4, "def") == CHUNKS[:1]
+        assert load_voice_chunks(tmp_path, 3, "regenerated") is None
+        assert load_voice_chunks(tmp_path / "missing", 3, "abc") is None
+
+
+# ---------------------------------------------------------------------------
+# Word timing
+# ---------------------------------------------------------------------------
+
+class TestWordsFromChunks:
+    def test_words_stay_inside_their_chunk(self):
+        words = words_from_chunks(CHUNKS)
+        assert [w.word for w in words][:2] == ["One", "two"]
+        assert len(words) == 8
+        assert words[0].start == 0.0
+        assert all(w.end <= 2.0 for w in words[:4])
+        assert words[4].start == pytest.approx(2.0)
+        assert words[-1].end <= 4.5
+        assert all(a.start < b.start for a, b in zip(words, words[1:]))
+
+
+class TestAnchorWords:
+    def test_boundary_pinned_to_chunk_start(self):
+        # Whisper drifted: the pause between chunks shows up at ~2.6 s
+        words = _words([(0.1, 0.5), (0.6, 1.0), (1.1, 1.5), (1.6, 2.2),
+                        (3.0, 3.3), (3.4, 3.7), (3.8, 4.1), (4.2, 4.6)])
+        anchored = anchor_words_to_chunks(words, CHUNKS)
+        assert anchored[3].end < 2.0 < anchored[4].start
+        assert anchored[4].start == pytest.approx(2.0 + 0.4, abs=0.01)  # slope 1 after the last anchor
+        assert anchored[-1].end <= 4.5
+
+    def test_snaps_to_longest_pause(self):
+        # Word counts say the boundary is before word 4; the real pause is before word 5
+        chunks = [{"text": "a b c d", "start": 0.0, "end": 2.5},
+                  {"text": "e f g h", "start": 2.5, "end": 5.0}]
+        words = _words([(0.0, 0.4), (0.5, 0.9), (1.0, 1.4), (1.5, 1.9), (2.0, 2.3),
+                        (3.0, 3.4), (3.5, 3.9), (4.0, 4.4)])
+        anchored = anchor_words_to_chunks(words, chunks)
+        assert anchored[4].end <= 2.5 <= anchored[5].start
+
+    def test_mismatched_transcript_untouched(self):
+        words = _words([(0.0, 0.5), (0.6, 1.0)])
+        assert anchor_words_to_chunks(words, CHUNKS) is words
+
+
+# ---------------------------------------------------------------------------
+# Stitching
+# ---------------------------------------------------------------------------
+
+class TestLoudnessGains:
+    def test_matched_to_median_and_clamped(self):
+        assert loudness_gains([-20.0, -18.0, -22.0]) == [0.0, -2.0, 2.0]
+        assert loudness_gains([-20.0, -20.0, -40.0, None], max_gain_db=6.0) == [0.0, 0.0, 6.0, 0.0]
+        assert loudness_gains([None, None]) == [0.0, 0.0]
+
+
+class TestStitchAudio:
+    def test_spans_and_gain_graph(self, monkeypatch):
+        calls = []
+        seconds = {"chunk_000": 1.5, "chunk_001": 2.25}
+        loudness = {"chunk_000": -18.0, "chunk_001": -22.0}
+
+        def fake_ffmpeg(cmd):
+            calls.append(cmd)
+            out = cmd[-1]
+            if out.endswith(".wav"):
+                name = out.rsplit("/", 1)[1][:-4]
+                with wave.open(out, "wb") as w:
+                    w.setnchannels(1)
+                    w.setsampwidth(2)
+                    w.setframerate(44100)
+                    w.writeframes(b"\0\0" * int(seconds[name] * 44100))
+                return f"Summary:\n  Integrated loudness:\n    I:  {loudness[name]} LUFS\n"
+            with open(out, "wb") as fh:
+                fh.write(b"ID3stitched")
+            return ""
+
+        monkeypatch.setattr(stitch, "_run_ffmpeg", fake_ffmpeg)
+        content, spans = stitch_audio([b"a", b"b"])
+        assert content == b"ID3stitched"
+        assert spans == [(0.0, 1.5), (1.5, 3.75)]
+        graph = calls[-1][calls[-1].index("-filter_complex") + 1]
+        assert "[0:a]volume=-2.0dB[a0]" in graph and "[1:a]volume=2.0dB[a1]" in graph
+        assert graph.endswith("concat=n=2:v=0:a=1[out]")
@@ -0,0 +1,279 @@
+"""
+Single binary-packed timeline artifact (``timing/{video_id}/timeline.eftl``).
+
+Replaces the per-scene pretty-printed caption JSON files and
+``render_config.json`` (still written, but only when the timeline write
+fails).  One file holds everything a render needs:
+
+* word timestamps per scene, streamed in as each scene is transcribed
+* the render config (image spans, Ken Burns, transitions), written once
+  at the end of the sync
+
+Layout::
+
+    b"EFTL" | u16 version
+    record* : u8 kind | u32 payload length | payload
+        WORDS  (1): u16 scene | u32 n | n x (u32 start, u32 end) | words
+                    joined by "\\n" (UTF-8).  Times are in 0.1 ms ticks,
+                    so 4-decimal second values round-trip exactly.
+        CONFIG (2): compact JSON render config
+        LOUDNESS (3): compact JSON ``{asset: measurement}`` — added at
+                    render time by :func:`write_timeline_loudness`
+        NARRATION (4): compact JSON narration track with each scene's
+                    sample offset (:mod:`audio_sync.narration`)
+        END    (0): empty — a file without it is incomplete
+
+The writer streams to ``<path>.tmp`` and renames on close, so readers never
+see a half-written timeline.  Props still embed the render config, since
+Remotion reads it synchronously from its input props; the timeline is
+referenced next to it by path + SHA-256 (:func:`timeline_ref`) so a render
+can tell when a re-sync replaced the file under it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Iterator
+
+TIMELINE_FILE = "timeline.eftl"
+TIMELINE_MAGIC = b"EFTL"
+TIMELINE_VERSION = 1
+
+KIND_END = 0
+KIND_WORDS = 1
+KIND_CONFIG = 2
+KIND_LOUDNESS = 3
+KIND_NARRATION = 4
+
+TICKS_PER_SECOND = 10_000
+
+_RECORD = struct.Struct("<BI")
+_WORDS_HEAD = struct.Struct("<HI")
+
+
+def _ticks(seconds: float) -> int:
+    return max(0, int(round(float(seconds) * TICKS_PER_SECOND)))
+
+
+def _word_fields(w: Any) -> tuple[str, float, float]:
+    if isinstance(w, dict):
+        return w["word"], w["start"], w["end"]
+    return w.word, w.start, w.end
+
+
+class TimelineWriter:
+    """Append-only writer; use as a context manager or call :meth:`close`."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._fh = open(self._tmp, "wb")
+        self._sha = hashlib.sha256()
+        self._size = 0
+        self._closed = False
+        self._write(TIMELINE_MAGIC + struct.pack("<H", TIMELINE_VERSION))
+
+    def _write(self, data: bytes) -> None:
+        self._fh.write(data)
+        self._sha.update(data)
+        self._size += len(data)
+
+    def _record(self, kind: int, payload: bytes) -> None:
+        self._write(_RECORD.pack(kind, len(payload)) + payload)
+        self._fh.flush()
+
+    def add_scene_words(self, scene_number: int, words: list[Any]) -> None:
+        """Stream one scene's word timestamps (``WordTimestamp`` or dicts)."""
+        fields = [_word_fields(w) for w in words]
+        times = struct.pack(
+            f"<{2 * len(fields)}I",
+            *(t for _, start, end in fields for t in (_ticks(start), _ticks(end))),
+        )
+        text = "\n".join(word.strip().replace("\n", " ") for word, _, _ in fields)
+        self._record(
+            KIND_WORDS,
+            _WORDS_HEAD.pack(scene_number, len(fields)) + times + text.encode("utf-8"),
+        )
+
+    def write_config(self, config: dict[str, Any]) -> None:
+        """Write the render config (compact JSON) — once, at the end."""
+        self._record(KIND_CONFIG, json.dumps(config, separators=(",", ":")).encode("utf-8"))
+
+    def write_loudness(self, loudness: dict[str, Any]) -> None:
+        """Write per-asset loudness measurements and gains (compact JSON)."""
+        self._record(KIND_LOUDNESS, json.dumps(loudness, separators=(",", ":")).encode("utf-8"))
+
+    def write_narration(self, narration: dict[str, Any]) -> None:
+        """Write the narration track record (file, per-scene sample offsets)."""
+        self._record(KIND_NARRATION, json.dumps(narration, separators=(",", ":")).encode("utf-8"))
+
+    def close(self) -> dict[str, Any]:
+        """Finish the file and return its :func:`timeline_ref`."""
+        if not self._closed:
+            self._record(KIND_END, b"")
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+            self._tmp.replace(self.path)
+            self._closed = True
+        return {"path": str(self.path), "sha256": self._sha.hexdigest(), "bytes": self._size}
+
+    def abort(self) -> None:
+        """Discard the partial file, leaving any previous timeline intact."""
+        if not self._closed:
+            self._fh.close()
+            self._tmp.unlink(missing_ok=True)
+            self._closed = True
+
+    def __enter__(self) -> "TimelineWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def read_timeline(path: str | Path) -> dict[str, Any]:
+    """
+    Parse a timeline file.
+
+    Returns:
+        ``{"words": {scene: [{word, start, end}, ...]}, "config": dict | None,
+        "loudness": dict | None, "narration": dict | None}``
+
+    Raises:
+        ValueError: Bad magic/version or the file is truncated.
+    """
+    data = Path(path).read_bytes()
+    words: dict[int, list[dict[str, Any]]] = {}
+    config = None
+    loudness = None
+    narration = None
+    for kind, payload in _records(data, path):
+        if kind == KIND_END:
+            return {"words": words, "config": config, "loudness": loudness,
+                    "narration": narration}
+        if kind == KIND_WORDS:
+            scene, n = _WORDS_HEAD.unpack_from(payload, 0)
+            ticks = struct.unpack_from(f"<{2 * n}I", payload, _WORDS_HEAD.size)
+            text = payload[_WORDS_HEAD.size + 8 * n:].decode("utf-8")
+            tokens = text.split("\n") if n else []
+            words[scene] = [
+                {
+                    "word": tokens[i],
+                    "start": ticks[2 * i] / TICKS_PER_SECOND,
+                    "end": ticks[2 * i + 1] / TICKS_PER_SECOND,
+                }
+                for i in range(n)
+            ]
+        elif kind == KIND_CONFIG:
+            config = json.loads(payload)
+        elif kind == KIND_LOUDNESS:
+            loudness = json.loads(payload)
+        elif kind == KIND_NARRATION:
+            narration = json.loads(payload)
+    raise ValueError(f"Timeline is incomplete (no END record): {path}")
+
+
+def _records(data: bytes, path: str | Path) -> Iterator[tuple[int, bytes]]:
+    """``(kind, payload)`` of every complete record after the header."""
+    if data[:4] != TIMELINE_MAGIC:
+        raise ValueError(f"Not a timeline file: {path}")
+    (version,) = struct.unpack_from("<H", data, 4)
+    if version != TIMELINE_VERSION:
+        raise ValueError(f"Unsupported timeline version {version}: {path}")
+    pos = 6
+    while pos + _RECORD.size <= len(data):
+        kind, length = _RECORD.unpack_from(data, pos)
+        pos += _RECORD.size
+        payload = data[pos:pos + length]
+        pos += length
+        if len(payload) != length:
+            return
+        yield kind, payload
+
+
+def write_timeline_loudness(path: str | Path, loudness: dict[str, Any]) -> dict[str, Any]:
+    """
+    Replace the loudness record of a finished timeline.
+
+    The other records are copied unchanged into a new file,
+    which is renamed into place like any timeline write.
+
+    Returns:
+        The new :func:`timeline_ref`.
+
+    Raises:
+        ValueError: The timeline is not a complete timeline file.
+    """
+    path = Path(path)
+    records = []
+    for kind, payload in _records(path.read_bytes(), path):
+        if kind == KIND_END:
+            break
+        if kind != KIND_LOUDNESS:
+            records.append((kind, payload))
+    else:
+        raise ValueError(f"Timeline is incomplete (no END record): {path}")
+    with TimelineWriter(path) as writer:
+        for kind, payload in records:
+            writer._record(kind, payload)
+        writer.write_loudness(loudness)
+    return writer.close()
+
+
+def file_sha256(path: str | Path) -> str:
+    """SHA-256 of a file, streamed."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def timeline_ref(path: str | Path) -> dict[str, Any]:
+    """``{path, sha256, bytes}`` reference for embedding in props."""
+    path = Path(path)
+    return {"path": str(path), "sha256": file_sha256(path), "bytes": path.stat().st_size}
+
+
+def verify_timeline_ref(ref: dict[str, Any]) -> bool:
+    """True if the referenced file exists and matches its checksum."""
+    path = Path(ref.get("path", ""))
+    return path.is_file() and file_sha256(path) == ref.get("sha256")
+
+
+def load_render_config(
+    timing_dir: str | Path,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """
+    Load the render config for a video's timing directory.
+
+    Prefers ``timeline.eftl`` and falls back to ``render_config.json``
+    (syncs that predate the timeline).
+
+    Returns:
+        ``(config, ref)`` — *ref* is the :func:`timeline_ref` when the config
+        came from a timeline, else ``None``.  ``(None, None)`` if neither
+        file is usable.
+    """
+    timing_dir = Path(timing_dir)
+    timeline_path = timing_dir / TIMELINE_FILE
+    if timeline_path.exists():
+        try:
+            config = read_timeline(timeline_path)["config"]
+            if config:
+                return config, timeline_ref(timeline_path)
+        except (OSError, ValueError) as e:
+            print(f"  ⚠️ Timeline unreadable ({e}), falling back to render_config.json")
+
+    config_path = timing_dir / "render_config.json"
+    if config_path.exists():
+        return json.loads(config_path.read_text()), None
+    return None, None
@@ -14,6 +14,7 @@ from .config import (
     MAX_DISPLAY_SECONDS,
     PRE_ROLL_SECONDS,
     POST_HOLD_SECONDS,
+    VECTORIZED_TIMING_MIN_SCENES,
 )
 
 
@@ -156,6 +157,150 @@ def compute_display_durations(
     return scenes
 
 
+# ---------------------------------------------------------------------------
+# Vectorized implementation
+# ---------------------------------------------------------------------------
+
+_MAX_VECTOR_PASSES = 16
+
+
+def _causal_fixed_point(step, seed, scalar_next):
+    """
+    Iterate ``x = step(x)`` from *seed* until it stops changing.
+
+    Every recurrence below is causal — element ``i`` depends only on
+    element ``i - 1`` — so the system has exactly one fixed point (the
+    result of the sequential loop), and once elements ``0..k-1`` stop
+    changing they are final.  Cascades are usually a few images long and
+    this converges in 2-3 array passes; if a long cascade is still moving
+    after ``_MAX_VECTOR_PASSES``, the unsettled tail is finished with the
+    scalar recurrence ``scalar_next(prev, i)``.
+    """
+    import numpy as np
+
+    x = seed
+    for _ in range(_MAX_VECTOR_PASSES):
+        nxt = step(x)
+        changed = np.flatnonzero(nxt != x)
+        if not changed.size:
+            return nxt
+        x = nxt
+
+    # x[:i0] agreed with step(x) on the last pass, so it's final
+    i0 = max(1, int(changed[0]))
+    values = x.tolist()
+    for i in range(i0, len(values)):
+        values[i] = scalar_next(values[i - 1], i)
+    return np.array(values, dtype=np.float64)
+
+
+def adjust_timing_vectorized(
+    scenes: list[dict[str, Any]],
+    *,
+    pre_roll: float = PRE_ROLL_SECONDS,
+    post_hold: float = POST_HOLD_SECONDS,
+    min_display: float = MIN_DISPLAY_SECONDS,
+    max_display: float = MAX_DISPLAY_SECONDS,
+) -> list[dict[str, Any]]:
+    """
+    NumPy version of :func:`adjust_timing` — identical results.
+
+    ``start_time`` / ``end_time`` are loaded into arrays once and every
+    rule runs as whole-array operations.  The two rules with a carried
+    dependency (a minimum-display extension pushing the next image, and
+    overlap resolution) are solved as causal fixed points — the overlap
+    pass is seeded with a cumulative-max scan of the ends — using the same
+    float operations as the per-dict passes, so the output matches bit
+    for bit.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise RuntimeError(
+            "numpy not installed. Run `pip install numpy` or use adjust_timing()."
+        ) from exc
+
+    n = len(scenes)
+    if n == 0:
+        return scenes
+
+    # One pass over the dicts; NumPy turns None into NaN for float64
+    times = np.array(
+        [(s.get("start_time"), s.get("end_time")) for s in scenes],
+        dtype=np.float64,
+    )
+    start, end = times[:, 0], times[:, 1]
+    no_start = np.isnan(start)
+    no_end = np.isnan(end)
+
+    # 1. Pre-roll
+    ds = np.where(no_start, 0.0, np.maximum(0.0, start - pre_roll))
+
+    # 2. Post-hold, clamped to the next image's display_start
+    de = end + post_hold
+    de[:-1] = np.minimum(de[:-1], ds[1:])
+    de = np.where(no_end, ds + MIN_DISPLAY_SECONDS, de)
+
+    # 3. Minimum display — an extended image pushes the next one's start
+    def _min_step(cur_ds):
+        short = (de[:-1] - cur_ds[:-1]) < min_display
+        pushed = cur_ds[:-1] + min_display
+        nxt = ds.copy()
+        nxt[1:] = np.where(short & (pushed > ds[1:]), pushed, ds[1:])
+        return nxt
+
+    ds_list, de_list = ds.tolist(), de.tolist()
+
+    def _min_next(prev_ds, i):
+        pushed = prev_ds + min_display
+        if (de_list[i - 1] - prev_ds) < min_display and pushed > ds_list[i]:
+            return pushed
+        return ds_list[i]
+
+    ds = _causal_fixed_point(_min_step, ds, _min_next)
+    de = np.where((de - ds) < min_display, ds + min_display, de)
+
+    # 4. Maximum display
+    de = np.where((de - ds) > max_display, ds + max_display, de)
+
+    # 5. Overlaps — start at the previous (possibly fixed) end; an image
+    #    swallowed by its predecessor gets MIN_DISPLAY_SECONDS after it
+    def _fix_ends(prev_end):
+        new_ds = ds.copy()
+        new_ds[1:] = np.where(ds[1:] < prev_end[:-1], prev_end[:-1], ds[1:])
+        new_de = de.copy()
+        new_de[1:] = np.where(de[1:] < new_ds[1:], new_ds[1:] + MIN_DISPLAY_SECONDS, de[1:])
+        return new_de
+
+    starts, ends = ds.tolist(), de.tolist()
+
+    def _end_next(prev_end, i):
+        start_i = prev_end if starts[i] < prev_end else starts[i]
+        return start_i + MIN_DISPLAY_SECONDS if ends[i] < start_i else ends[i]
+
+    de_final = _causal_fixed_point(_fix_ends, np.maximum.accumulate(de), _end_next)
+    ds_final = ds.copy()
+    ds_final[1:] = np.where(ds[1:] < de_final[:-1], de_final[:-1], ds[1:])
+
+    # 6. Durations.  np.round matches Python's correctly-rounded round()
+    #    except within a hair of a half tick, so only those go through round().
+    raw = de_final - ds_final
+    durations = np.round(raw, 4)
+    frac = np.abs(raw * 1e4 - np.floor(raw * 1e4) - 0.5)
+    durations_list = durations.tolist()
+    raw_list = raw.tolist()
+    for i in np.flatnonzero(frac < 1e-6).tolist():
+        durations_list[i] = round(raw_list[i], 4)
+
+    for scene, d_start, d_end, dur in zip(
+        scenes, ds_final.tolist(), de_final.tolist(), durations_list,
+    ):
+        scene["display_start"] = d_start
+        scene["display_end"] = d_end
+        scene["display_duration"] = dur
+    return scenes
+
+
 # ---------------------------------------------------------------------------
 # Main entry-point
 # ---------------------------------------------------------------------------
@@ -167,6 +312,7 @@ def adjust_timing(
     post_hold: float = POST_HOLD_SECONDS,
     min_display: float = MIN_DISPLAY_SECONDS,
     max_display: float = MAX_DISPLAY_SECONDS,
+    vectorized: bool | None = None,
 ) -> list[dict[str, Any]]:
     """
     Full timing-adjustment pipeline.
@@ -177,7 +323,22 @@ def adjust_timing(
     4. Maximum display enforcement
     5. Overlap resolution
     6. Duration computation
+
+    *vectorized* selects :func:`adjust_timing_vectorized`; ``None`` (the
+    default) uses it for timelines of ``VECTORIZED_TIMING_MIN_SCENES`` or
+    more images when NumPy is installed.
     """
+    if vectorized is None:
+        vectorized = len(scenes) >= VECTORIZED_TIMING_MIN_SCENES and _numpy_available()
+    if vectorized:
+        return adjust_timing_vectorized(
+            scenes,
+            pre_roll=pre_roll,
+            post_hold=post_hold,
+            min_display=min_display,
+            max_display=max_display,
+        )
+
     scenes = apply_pre_roll(scenes, pre_roll=pre_roll)
     scenes = apply_post_hold(scenes, post_hold=post_hold)
     scenes = enforce_minimum_display(scenes, min_seconds=min_display)
@@ -185,3 +346,11 @@ def adjust_timing(
     scenes = resolve_overlaps(scenes)
     scenes = compute_display_durations(scenes)
     return scenes
+
+
+def _numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
@@ -1,8 +1,10 @@
 """
-Whisper transcription via the OpenAI API.
+Whisper transcription.
 
 Produces word-level timestamps for the entire narration audio file.
-Uses the hosted OpenAI Whisper API exclusively — no local model.
+Uses the hosted OpenAI Whisper API by default; a local CPU engine
+(faster-whisper) is available via ``backend="local"`` or
+``AUDIO_SYNC_BACKEND=local`` — see :mod:`audio_sync.backends`.
 """
 
 from __future__ import annotations
@@ -196,14 +198,49 @@ def load_whisper_raw(path: str | Path) -> dict[str, Any]:
 # Main entry-point
 # ---------------------------------------------------------------------------
 
+def _require_openai_key() -> None:
+    """Raise a diagnostic RuntimeError if OPENAI_API_KEY is unusable."""
+    _load_openai_key()
+    api_key = os.environ.get("OPENAI_API_KEY", "")
+    if api_key and not api_key.startswith("sk-xxxxx"):
+        return
+
+    # Build diagnostic info
+    diag_lines = [
+        "OPENAI_API_KEY not found or still set to placeholder.",
+        f"  Searched from: {Path(__file__).resolve()}",
+        f"  Home dir: {Path.home()}",
+        f"  CWD: {Path.cwd()}",
+    ]
+    # Show which .env files exist and what they contain for this key
+    project_env = Path(__file__).resolve().parent.parent.parent.parent / ".env"
+    for p in [project_env, Path.home() / ".env"]:
+        if p.exists():
+            try:
+                for line in p.read_text().splitlines():
+                    if "OPENAI_API_KEY" in line and not line.strip().startswith("#"):
+                        val = line.partition("=")[2].strip()
+                        masked = val[:8] + "..." if len(val) > 8 else val
+                        diag_lines.append(f"  Found in {p}: {masked}")
+            except Exception:
+                pass
+    diag_lines.append("")
+    diag_lines.append("FIX: SSH into the VPS and run:")
+    diag_lines.append(f"  nano {project_env}")
+    diag_lines.append("  Replace 'OPENAI_API_KEY=sk-xxxxx' with your real OpenAI API key.")
+    diag_lines.append("  (Or set AUDIO_SYNC_BACKEND=local to transcribe on CPU.)")
+    raise RuntimeError("\n".join(diag_lines))
+
+
 def transcribe(
     audio_path: str,
     *,
     cache_dir: str | Path | None = None,
+    backend: str | None = None,
     **_kwargs,
 ) -> list[WordTimestamp]:
     """
-    Transcribe audio via the OpenAI Whisper API and return word timestamps.
+    Transcribe audio and return word timestamps.
 
     If *cache_dir* is provided, the raw Whisper JSON is saved there as
     ``whisper_raw.json`` and subsequent calls with the same *cache_dir*
@@ -212,38 +249,17 @@ def transcribe(
     Args:
         audio_path: Path to the narration audio file.
         cache_dir: Optional directory for caching Whisper output.
+        backend: ``"openai"`` or ``"local"``.  Defaults to the
+            ``AUDIO_SYNC_BACKEND`` env var, then ``"openai"``.
 
     Returns:
         Flat list of WordTimestamp objects.
     """
-    # Ensure API key is available
-    _load_openai_key()
-    api_key = os.environ.get("OPENAI_API_KEY", "")
-    if not api_key or api_key.startswith("sk-xxxxx"):
-        # Build diagnostic info
-        diag_lines = [
-            "OPENAI_API_KEY not found or still set to placeholder.",
-            f"  Searched from: {Path(__file__).resolve()}",
-            f"  Home dir: {Path.home()}",
-            f"  CWD: {Path.cwd()}",
-        ]
-        # Show which .env files exist and what they contain for this key
-        project_env = Path(__file__).resolve().parent.parent.parent.parent / ".env"
-        for p in [project_env, Path.home() / ".env"]:
-            if p.exists():
-                try:
-                    for line in p.read_text().splitlines():
-                        if "OPENAI_API_KEY" in line and not line.strip().startswith("#"):
-                            val = line.partition("=")[2].strip()
-                            masked = val[:8] + "..." if len(val) > 8 else val
-                            diag_lines.append(f"  Found in {p}: {masked}")
-                except Exception:
-                    pass
-        diag_lines.append("")
-        diag_lines.append("FIX: SSH into the VPS and run:")
-        diag_lines.append(f"  nano {project_env}")
-        diag_lines.append("  Replace 'OPENAI_API_KEY=sk-xxxxx' with your real OpenAI API key.")
-        raise RuntimeError("\n".join(diag_lines))
+    from .backends import get_backend
+
+    engine = get_backend(backend)
+    if engine.name == "openai":
+        _require_openai_key()
 
     # Check cache — but invalidate if the audio file has changed.
     # Without this check, regenerated voiceovers (new MP3 with same
@@ -262,7 +278,9 @@ def transcribe(
                 meta = json.loads(meta_file.read_text())
                 if (meta.get("audio_size") == audio_size
                         and meta.get("audio_mtime") == audio_mtime
-                        and meta.get("audio_path") == str(audio_p.resolve())):
+                        and meta.get("audio_path") == str(audio_p.resolve())
+                        # Caches written before backends existed are API output
+                        and meta.get("backend", "openai") == engine.name):
                     cache_valid = True
             except Exception:
                 pass
@@ -271,8 +289,7 @@ def transcribe(
             raw = load_whisper_raw(cache_file)
             return extract_words(raw)
 
-    # Transcribe via OpenAI Whisper API
-    raw = transcribe_api(audio_path)
+    raw = engine.transcribe_raw(audio_path)
 
     # Cache the result with metadata for invalidation
     if cache_dir is not None:
@@ -283,6 +300,7 @@ def transcribe(
             "audio_path": str(audio_p.resolve()),
             "audio_size": audio_p.stat().st_size if audio_p.exists() else 0,
             "audio_mtime": audio_p.stat().st_mtime if audio_p.exists() else 0,
+            "backend": engine.name,
         }
         meta_file.write_text(json.dumps(meta))
 
@@ -0,0 +1,135 @@
+"""
+Chunk offsets of stitched voice overs (``timing/{video_id}/voice_chunks.json``).
+
+When the voice bot synthesizes a long scene in sentence-aligned chunks it
+knows exactly where each chunk starts and ends in the stitched MP3
+(:func:`audio_sync.stitch.stitch_audio`).  Those spans are recorded here,
+keyed by scene number and the SHA-256 of the audio they describe, so the
+sync only trusts them for that exact file.  The sync then:
+
+* anchors Whisper's word timestamps to the chunk boundaries
+  (:func:`anchor_words_to_chunks`), which bounds drift on long scenes to
+  a single chunk instead of rescaling the whole scene, and
+* if Whisper fails, estimates word timings from the chunks alone
+  (:func:`words_from_chunks`) instead of skipping the scene.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+from pathlib import Path
+from typing import Any
+
+from .aligner import normalize_text
+from .config import CHUNK_ANCHOR_WORD_TOLERANCE
+from .transcriber import WordTimestamp
+
+VOICE_CHUNKS_FILE = "voice_chunks.json"
+
+
+def record_voice_chunks(
+    timing_dir: str | Path,
+    scene_number: int,
+    audio_sha256: str,
+    chunks: list[dict[str, Any]],
+) -> Path:
+    """Store *chunks* (``{"text", "start", "end"}``) for one scene's audio."""
+    path = Path(timing_dir) / VOICE_CHUNKS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        data = {}
+    data[str(scene_number)] = {"audio_sha256": audio_sha256, "chunks": chunks}
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(data, indent=1))
+    tmp.replace(path)
+    return path
+
+
+def load_voice_chunks(
+    timing_dir: str | Path,
+    scene_number: int,
+    audio_sha256: str,
+) -> list[dict[str, Any]] | None:
+    """The chunks recorded for this scene, if they describe this exact audio."""
+    try:
+        data = json.loads((Path(timing_dir) / VOICE_CHUNKS_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    entry = data.get(str(scene_number))
+    if not entry or entry.get("audio_sha256") != audio_sha256:
+        return None
+    return entry.get("chunks") or None
+
+
+def words_from_chunks(chunks: list[dict[str, Any]]) -> list[WordTimestamp]:
+    """
+    Estimated word timestamps: each chunk's words spread over its span.
+
+    Words get time in proportion to their length (plus one for the
+    following space), which is close enough to place image boundaries.
+    """
+    words: list[WordTimestamp] = []
+    for chunk in chunks:
+        tokens = chunk["text"].split()
+        if not tokens:
+            continue
+        weights = [len(t) + 1 for t in tokens]
+        per_unit = (chunk["end"] - chunk["start"]) / sum(weights)
+        t = chunk["start"]
+        for token, weight in zip(tokens, weights):
+            words.append(WordTimestamp(token, round(t, 4), round(t + (weight - 1) * per_unit, 4)))
+            t += weight * per_unit
+    return words
+
+
+def _boundary_index(words: list[WordTimestamp], nominal: int) -> int:
+    """Index of the first word of a chunk: the longest pause near *nominal*."""
+    lo, hi = max(1, nominal - 2), min(len(words) - 1, nominal + 2)
+    if lo > hi:
+        return min(max(nominal, 1), len(words) - 1)
+    return max(range(lo, hi + 1), key=lambda j: words[j].start - words[j - 1].end)
+
+
+def anchor_words_to_chunks(
+    words: list[WordTimestamp],
+    chunks: list[dict[str, Any]],
+    tolerance: float = CHUNK_ANCHOR_WORD_TOLERANCE,
+) -> list[WordTimestamp]:
+    """
+    Warp Whisper *words* so every chunk boundary lands where it really is.
+
+    Each boundary is located in the transcript by the script's word
+    counts, snapped to the longest pause within two words, and the gap
+    there is mapped onto the chunk's true start.  Times between anchors
+    are interpolated linearly; after the last anchor they are only
+    shifted.  Words are returned unchanged if the transcript's length is
+    more than *tolerance* off the script's (a misheard or partial
+    transcript would be anchored at the wrong words).
+    """
+    counts = [len(normalize_text(chunk["text"]).split()) for chunk in chunks]
+    total = sum(counts)
+    if len(chunks) < 2 or not words or not total or abs(len(words) - total) > tolerance * total:
+        return words
+
+    src, dst = [0.0], [0.0]
+    cumulative = 0
+    for chunk, count in zip(chunks, counts):
+        if cumulative:
+            j = _boundary_index(words, round(cumulative * len(words) / total))
+            gap = (words[j - 1].end + words[j].start) / 2
+            if gap > src[-1] and chunk["start"] > dst[-1]:
+                src.append(gap)
+                dst.append(chunk["start"])
+        cumulative += count
+
+    def warp(t: float) -> float:
+        i = bisect.bisect_right(src, t) - 1
+        if i >= len(src) - 1:
+            return min(t + dst[-1] - src[-1], chunks[-1]["end"])
+        ratio = (t - src[i]) / (src[i + 1] - src[i])
+        return dst[i] + ratio * (dst[i + 1] - dst[i])
+
+    return [WordTimestamp(w.word, round(warp(w.start), 4), round(warp(w.end), 4)) for w in words]
@@ -3,18 +3,23 @@
 For each image in the Images table that has a Sound Prompt but no Sound Effect,
 generates an 8-second MP3 via Kie.ai, uploads to Google Drive, and attaches
 to the image row. This replaces the old scene-level Sound Map approach.
+
+Before generating, each prompt is looked up in the local SFX library
+(clients/sfx_library.py); a close enough match from an earlier video is
+attached instead, and every new effect is added to the library.
 """
 
 import asyncio
 from typing import Optional
 
+from clients.sfx_library import SfxLibrary
 from clients.sound_client import SoundClient
 from clients.airtable_client import AirtableClient
 from clients.google_client import GoogleClient
 from clients.slack_client import SlackClient
 
 
-# Safety limit — max generations per video
+# Safety limit — max generations started per video
 MAX_GENERATIONS_PER_VIDEO = 200
 
 
@@ -30,11 +35,13 @@ class SoundBot:
         airtable: Optional[AirtableClient] = None,
         google: Optional[GoogleClient] = None,
         slack: Optional[SlackClient] = None,
+        library: Optional[SfxLibrary] = None,
     ):
         self.sound_client = sound_client or SoundClient()
         self.airtable = airtable or AirtableClient()
         self.google = google or GoogleClient()
         self.slack = slack
+        self.library = library if library is not None else SfxLibrary()
 
     async def process_video(
         self,
@@ -49,7 +56,7 @@ class SoundBot:
             video_title: Title of the video
             folder_id: Google Drive folder for uploads
             dry_run: If True, log prompts without generating audio
-            max_concurrent: Max concurrent generations
+            max_concurrent: Generations in flight at once (sliding window)
 
         Returns:
             Dict with processing results
@@ -92,36 +99,70 @@ class SoundBot:
             key=lambda i: (i.get("Scene", 0), i.get("Image Index", 0)),
         )
 
-        total_generated = 0
+        if dry_run:
+            for img in needs_generation:
+                print(f"    [DRY RUN] Scene {img.get('Scene', 0)} img {img.get('Image Index', 0)}: "
+                      f"{img.get('Sound Prompt', '')[:60]}...")
+            return {
+                "bot": "Sound Bot",
+                "video_title": video_title,
+                "total_generated": 0,
+                "total_images": len(needs_generation),
+                "estimated_cost": 0.0,
+                "dry_run": True,
+                "limit_reached": False,
+            }
+
+        # Sliding window: max_concurrent workers pull the next image as soon
+        # as their previous generation finishes, so one slow task no longer
+        # idles the other slots. Each finished sound is handed to a save task
+        # (download, Drive upload, Airtable attach) and the worker moves on.
+        # The Drive and Airtable clients are synchronous and the Drive one
+        # isn't thread-safe, so saves run one at a time off the event loop.
+        remaining = iter(needs_generation)
+        started = 0
+        reused_count = 0
         limit_reached = False
-
-        # Process in batches
-        for batch_start in range(0, len(needs_generation), max_concurrent):
-            if limit_reached:
-                break
-
-            batch = needs_generation[batch_start:batch_start + max_concurrent]
-            tasks = [
-                self._generate_for_image(img, folder_id, dry_run)
-                for img in batch
-            ]
-            results = await asyncio.gather(*tasks)
-
-            for success in results:
-                if success:
-                    total_generated += 1
-
-                if self.sound_client.generation_count >= MAX_GENERATIONS_PER_VIDEO:
-                    msg = f"Hit {MAX_GENERATIONS_PER_VIDEO} generation limit"
-                    print(f"    ⚠️ {msg}")
-                    if self.slack:
-                        self.slack.notify(f"⚠️ {msg}. Pausing sound generation.")
+        io_lock = asyncio.Lock()
+        saves: list[asyncio.Task] = []
+
+        async def worker() -> None:
+            nonlocal started, reused_count, limit_reached
+            for img in remaining:
+                if await self._reuse(img, folder_id, io_lock, video_title):
+                    reused_count += 1
+                    continue
+                # Reserve a generation before submitting it; the check and
+                # increment run without an await in between, so workers
+                # can't overshoot the budget together.
+                if started >= MAX_GENERATIONS_PER_VIDEO:
                     limit_reached = True
-                    break
+                    return
+                started += 1
+                audio_url = await self._generate(img)
+                if audio_url:
+                    saves.append(asyncio.create_task(
+                        self._save(img, audio_url, folder_id, io_lock, video_title)
+                    ))
+
+        print(f"  Generating {len(needs_generation)} sound effects, {max_concurrent} at a time...")
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, max_concurrent))))
+            results = await asyncio.gather(*saves)
+        finally:
+            await self.sound_client.aclose()
+        total_generated = sum(1 for success in results if success) + reused_count
+
+        if limit_reached:
+            msg = f"Hit {MAX_GENERATIONS_PER_VIDEO} generation limit"
+            print(f"    ⚠️ {msg}")
+            if self.slack:
+                self.slack.notify(f"⚠️ {msg}. Pausing sound generation.")
 
         estimated_cost = self.sound_client.estimated_total_cost
 
-        print(f"\n  Sound effects complete: {total_generated}/{len(needs_generation)} generated")
+        print(f"\n  Sound effects complete: {total_generated}/{len(needs_generation)} attached "
+              f"({reused_count} reused from the SFX library)")
         print(f"  Estimated cost: ~${estimated_cost:.2f}")
 
         return {
@@ -129,30 +170,18 @@ class SoundBot:
             "video_title": video_title,
             "total_generated": total_generated,
             "total_images": len(needs_generation),
+            "reused": reused_count,
             "estimated_cost": round(estimated_cost, 2),
             "dry_run": dry_run,
             "limit_reached": limit_reached,
         }
 
-    async def _generate_for_image(
-        self,
-        img: dict,
-        folder_id: str,
-        dry_run: bool = False,
-    ) -> bool:
-        """Generate a sound effect for a single image row.
-
-        Returns True if successful.
-        """
-        record_id = img["id"]
+    async def _generate(self, img: dict) -> Optional[str]:
+        """Generate a sound effect for a single image row; returns its URL."""
         scene = img.get("Scene", 0)
         idx = img.get("Image Index", 0)
         prompt = img.get("Sound Prompt", "")
 
-        if dry_run:
-            print(f"    [DRY RUN] Scene {scene} img {idx}: {prompt[:60]}...")
-            return False
-
         print(f"    Scene {scene} img {idx}: {prompt[:60]}...")
 
         audio_url = await self.sound_client.generate_sound_effect(
@@ -163,33 +192,108 @@ class SoundBot:
 
         if not audio_url:
             print(f"    ❌ Generation failed for scene {scene} img {idx}")
+        return audio_url
+
+    async def _reuse(
+        self,
+        img: dict,
+        folder_id: str,
+        io_lock: asyncio.Lock,
+        video_title: str,
+    ) -> bool:
+        """Attach a library effect matching this image's prompt, if any.
+
+        Returns True if one was attached.
+        """
+        if self.library is None:
             return False
+        prompt = img.get("Sound Prompt", "")
+        try:
+            match = await asyncio.to_thread(
+                self.library.find, prompt, self.DEFAULT_DURATION, False,
+            )
+            if not match:
+                return False
+            async with io_lock:
+                sound_url = match.get("drive_url")
+                if not sound_url:
+                    # Only the local copy is left; give it a public Drive URL
+                    content = self.library.read(match["id"])
+                    if content is None:
+                        return False
+                    filename = f"sfx_{img.get('Scene', 0)}_{img.get('Image Index', 0)}.mp3"
+                    drive_file = await asyncio.to_thread(
+                        self.google.upload_audio, content, filename, folder_id,
+                    )
+                    sound_url = await asyncio.to_thread(self.google.make_file_public, drive_file["id"])
+                    await asyncio.to_thread(
+                        self.library.set_drive_url, match["id"], drive_file["id"], sound_url,
+                    )
+                await asyncio.to_thread(
+                    self.airtable.update_image_sound_effect,
+                    record_id=img["id"],
+                    sound_url=sound_url,
+                    volume=self.DEFAULT_VOLUME,
+                )
+            await asyncio.to_thread(self.library.record_use, match["id"], video_title)
+        except Exception as e:
+            print(f"    ⚠️ SFX library reuse failed ({e}), generating instead")
+            return False
+        print(f"    ♻️ Scene {img.get('Scene', 0)} img {img.get('Image Index', 0)}: "
+              f"reused \"{match['prompt'][:50]}\" (score {match['score']:.2f})")
+        return True
 
-        # Download and upload to Google Drive
-        filename = f"sfx_{scene}_{idx}.mp3"
+    async def _save(
+        self,
+        img: dict,
+        audio_url: str,
+        folder_id: str,
+        io_lock: asyncio.Lock,
+        video_title: Optional[str] = None,
+    ) -> bool:
+        """Download a generated sound, upload it to Drive and attach it to its row.
+
+        Returns True if successful.
+        """
+        record_id = img["id"]
+        filename = f"sfx_{img.get('Scene', 0)}_{img.get('Image Index', 0)}.mp3"
         try:
             audio_content = await self.sound_client.download_audio(audio_url)
-            drive_file = self.google.upload_audio(audio_content, filename, folder_id)
-            drive_url = self.google.make_file_public(drive_file["id"])
-
-            # Attach to image row in Airtable
-            self.airtable.update_image_sound_effect(
-                record_id=record_id,
-                sound_url=drive_url,
-                volume=self.DEFAULT_VOLUME,
-            )
-            print(f"    ✅ {filename} uploaded")
-            return True
+            async with io_lock:
+                drive_file = await asyncio.to_thread(
+                    self.google.upload_audio, audio_content, filename, folder_id,
+                )
+                drive_url = await asyncio.to_thread(self.google.make_file_public, drive_file["id"])
 
+                # Attach to image row in Airtable
+                await asyncio.to_thread(
+                    self.airtable.update_image_sound_effect,
+                    record_id=record_id,
+                    sound_url=drive_url,
+                    volume=self.DEFAULT_VOLUME,
+                )
+            print(f"    ✅ {filename} uploaded")
         except Exception as e:
             print(f"    ❌ Upload/attach failed for {filename}: {e}")
             # Try attaching the raw URL as fallback
             try:
-                self.airtable.update_image_sound_effect(
-                    record_id=record_id,
-                    sound_url=audio_url,
-                    volume=self.DEFAULT_VOLUME,
-                )
+                async with io_lock:
+                    await asyncio.to_thread(
+                        self.airtable.update_image_sound_effect,
+                        record_id=record_id,
+                        sound_url=audio_url,
+                        volume=self.DEFAULT_VOLUME,
+                    )
                 return True
             except Exception:
                 return False
+
+        if self.library is not None:
+            try:
+                await asyncio.to_thread(
+                    self.library.add, img.get("Sound Prompt", ""), audio_content,
+                    self.DEFAULT_DURATION, False, drive_file["id"], drive_url, video_title,
+                )
+            except OSError as e:
+                print(f"    ⚠️ Could not add {filename} to the SFX library: {e}")
+        return True
@@ -5,8 +5,13 @@ Two-phase approach:
 2. Generation: Sound prompts generated only for selected images; skipped images get "SKIP"
 
 Selection bounds are percentage-based (default 25% min, 60% max of images per scene).
+
+Scenes are processed concurrently under a shared limit on Claude calls; each
+scene's prompts come from one batched call and go to Airtable in one batched
+update.
 """
 
+import asyncio
 import json
 import math
 from collections import defaultdict
@@ -37,9 +42,7 @@ Return ONLY a JSON array, one entry per image:
 [{"image_index": 1, "sound": true}, {"image_index": 2, "sound": false}]"""
 
 
-SOUND_PROMPT_SYSTEM = """\
-You are a cinematic sound designer. Given the narration text and visual description for one moment in a documentary, generate ONE specific sound effect.
-
+_SOUND_PROMPT_RULES = """\
 Rules:
 - Describe exactly ONE distinct, recognizable sound — not a mix or layers
 - Pick the single most impactful sound for the moment
@@ -47,12 +50,31 @@ Rules:
 - Good examples: 'crowd cheering in a stadium', 'thunder crack', 'cash register opening', 'helicopter rotor spinning up', 'glass shattering on concrete', 'courtroom gavel strike'
 - Bad examples: 'ambient tension with subtle undertones', 'eerie atmosphere', 'dystopian soundscape'
 - No music, no drones, no ambience, no 'atmospheric' anything
-- Max 15 words. Output ONLY the sound description, nothing else."""
+- Max 15 words."""
+
+SOUND_PROMPT_SYSTEM = (
+    "You are a cinematic sound designer. Given the narration text and visual "
+    "description for one moment in a documentary, generate ONE specific sound effect.\n\n"
+    + _SOUND_PROMPT_RULES
+    + " Output ONLY the sound description, nothing else."
+)
+
+SOUND_BATCH_PROMPT_SYSTEM = (
+    "You are a cinematic sound designer. You will receive several moments from "
+    "one documentary scene, each with its narration text, visual description and "
+    "shot type. For EACH moment, generate ONE specific sound effect.\n\n"
+    + _SOUND_PROMPT_RULES
+    + "\n\nReturn ONLY a JSON array, one entry per image:\n"
+    '[{"image_index": 1, "sound": "heavy steel door slamming shut"}]'
+)
 
 # Percentage bounds for sound selection per scene
 MIN_SOUND_PERCENT = 0.25
 MAX_SOUND_PERCENT = 0.60
 
+# Claude calls in flight at once while scenes are processed concurrently
+MAX_CONCURRENT_REQUESTS = 6
+
 
 class SoundPromptBot:
     """Selects which images get sound, then generates prompts for those images."""
@@ -63,11 +85,13 @@ class SoundPromptBot:
         airtable: Optional[AirtableClient] = None,
         min_sound_pct: float = MIN_SOUND_PERCENT,
         max_sound_pct: float = MAX_SOUND_PERCENT,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
     ):
         self.anthropic = anthropic or AnthropicClient()
         self.airtable = airtable or AirtableClient()
         self.min_sound_pct = min_sound_pct
         self.max_sound_pct = max_sound_pct
+        self.max_concurrent = max_concurrent
 
     def _compute_bounds(self, image_count: int) -> tuple[int, int]:
         """Compute min/max sound count for a scene based on percentage bounds.
@@ -137,12 +161,9 @@ class SoundPromptBot:
         selections = self._enforce_bounds(selections, min_sounds, max_sounds)
         return selections
 
-    def _parse_curation_response(
-        self,
-        response: str,
-        scene_images: list[dict],
-    ) -> list[dict]:
-        """Parse Claude's curation JSON response."""
+    @staticmethod
+    def _parse_json_array(response: str) -> list:
+        """Parse a JSON array from Claude, tolerating fences and chatter."""
         text = response.strip()
 
         # Strip markdown fences
@@ -166,7 +187,16 @@ class SoundPromptBot:
             else:
                 return []
 
-        if not isinstance(parsed, list):
+        return parsed if isinstance(parsed, list) else []
+
+    def _parse_curation_response(
+        self,
+        response: str,
+        scene_images: list[dict],
+    ) -> list[dict]:
+        """Parse Claude's curation JSON response."""
+        parsed = self._parse_json_array(response)
+        if not parsed:
             return []
 
         # Build index set from actual images
@@ -174,6 +204,8 @@ class SoundPromptBot:
 
         results = []
         for entry in parsed:
+            if not isinstance(entry, dict):
+                continue
             idx = entry.get("image_index")
             sound = entry.get("sound", False)
             if idx in valid_indices:
@@ -267,10 +299,14 @@ class SoundPromptBot:
             temperature=0.5,
         )
 
+        return self._clean_prompt(response)
+
+    @staticmethod
+    def _clean_prompt(response: Optional[str]) -> Optional[str]:
+        """Strip quotes and markdown and cap at 450 chars; None if too short."""
         if not response or len(response.strip()) < 10:
             return None
 
-        # Clean up — strip quotes, markdown, ensure under 450 chars
         prompt = response.strip().strip('"').strip("'")
         if prompt.startswith("```"):
             prompt = prompt.strip("`").strip()
@@ -279,12 +315,148 @@ class SoundPromptBot:
 
         return prompt
 
+    async def generate_scene_sound_prompts(self, scene_images: list[dict]) -> dict[int, str]:
+        """Generate sound prompts for several images of one scene in one call.
+
+        Args:
+            scene_images: Image dicts from Airtable (the ones selected for sound)
+
+        Returns:
+            ``{image_index: prompt}`` for every image Claude answered for;
+            missing or unusable entries are left out for the caller to retry
+            one at a time with :meth:`generate_sound_prompt`.
+        """
+        if not scene_images:
+            return {}
+
+        lines = []
+        for img in scene_images:
+            lines.append(
+                f"Image {img.get('Image Index', 0)}:\n"
+                f"  Narration: {img.get('Sentence Text', '')}\n"
+                f"  Visual: {img.get('Image Prompt', '')}\n"
+                f"  Shot type: {img.get('Shot Type', '')}"
+            )
+
+        response = await self.anthropic.generate(
+            prompt="\n\n".join(lines),
+            system_prompt=SOUND_BATCH_PROMPT_SYSTEM,
+            model="claude-haiku-4-5-20251001",
+            max_tokens=64 + 48 * len(scene_images),
+            temperature=0.5,
+        )
+        if not response:
+            return {}
+
+        valid_indices = {img.get("Image Index", 0) for img in scene_images}
+        prompts: dict[int, str] = {}
+        for entry in self._parse_json_array(response):
+            if not isinstance(entry, dict):
+                continue
+            idx = entry.get("image_index")
+            prompt = self._clean_prompt(entry.get("sound") if isinstance(entry.get("sound"), str) else None)
+            if idx in valid_indices and prompt:
+                prompts[idx] = prompt
+        return prompts
+
+    async def _process_scene(
+        self,
+        scene_num: int,
+        scene_images: list[dict],
+        limiter: asyncio.Semaphore,
+        write_lock: asyncio.Lock,
+    ) -> dict:
+        """Curate one scene, generate its prompts and write them in one batch.
+
+        Returns:
+            Dict with ``generated``, ``skipped`` and ``failed`` counts
+        """
+        min_s, max_s = self._compute_bounds(len(scene_images))
+        try:
+            async with limiter:
+                selections = await self.curate_scene_sounds(scene_images)
+        except Exception as e:
+            print(f"  Scene {scene_num}: ⚠️ Curation failed ({e}), using even spacing")
+            selections = self._fallback_selection(scene_images, min_s)
+
+        selected_count = sum(1 for s in selections if s["sound"])
+        print(f"  Scene {scene_num}: Selected {selected_count}/{len(scene_images)} for sound "
+              f"(bounds: {min_s}-{max_s})")
+
+        # Build lookup: image_index -> should have sound
+        sound_map = {s["image_index"]: s["sound"] for s in selections}
+
+        updates: dict[str, str] = {}
+        to_generate: list[dict] = []
+        failed = 0
+        for img in scene_images:
+            idx = img.get("Image Index", 0)
+            if not sound_map.get(idx, False):
+                updates[img["id"]] = "SKIP"
+            elif not img.get("Sentence Text") and not img.get("Image Prompt"):
+                print(f"    Scene {scene_num} img {idx}: No text or prompt, skipping")
+            else:
+                to_generate.append(img)
+        skipped = len(updates)
+
+        # Phase 2: one batched call for the scene, then single-image retries
+        # (concurrent, under the shared limiter) for anything it missed
+        prompts: dict[int, str] = {}
+        if to_generate:
+            try:
+                async with limiter:
+                    prompts = await self.generate_scene_sound_prompts(to_generate)
+            except Exception as e:
+                print(f"  Scene {scene_num}: ⚠️ Batched prompt generation failed ({e})")
+
+        async def generate_one(img: dict) -> tuple[int, Optional[str]]:
+            try:
+                async with limiter:
+                    prompt = await self.generate_sound_prompt(
+                        sentence_text=img.get("Sentence Text", ""),
+                        image_prompt=img.get("Image Prompt", ""),
+                        shot_type=img.get("Shot Type", ""),
+                    )
+            except Exception as e:
+                print(f"    ⚠️ Scene {scene_num} img {img.get('Image Index', 0)}: {e}")
+                prompt = None
+            return img.get("Image Index", 0), prompt
+
+        missing = [img for img in to_generate if img.get("Image Index", 0) not in prompts]
+        for idx, prompt in await asyncio.gather(*(generate_one(img) for img in missing)):
+            if prompt:
+                prompts[idx] = prompt
+
+        for img in to_generate:
+            idx = img.get("Image Index", 0)
+            if idx in prompts:
+                updates[img["id"]] = prompts[idx]
+                print(f"    Scene {scene_num} img {idx}: ✅ {prompts[idx][:60]}")
+            else:
+                failed += 1
+                print(f"    ❌ Generation failed for scene {scene_num} img {idx}")
+
+        # One batched Airtable write per scene (SKIPs included). The client
+        # is synchronous, so writes run one at a time off the event loop.
+        try:
+            async with write_lock:
+                await asyncio.to_thread(self.airtable.update_image_sound_prompts, updates)
+        except Exception as e:
+            print(f"  Scene {scene_num}: ❌ Failed to write {len(updates)} sound prompts: {e}")
+            return {"generated": 0, "skipped": 0, "failed": len(to_generate)}
+
+        return {"generated": len(updates) - skipped, "skipped": skipped, "failed": failed}
+
     async def process_video(self, video_title: str) -> dict:
         """Generate sound prompts for a video using intelligent scene-level curation.
 
         Phase 1: For each scene, Claude selects which images benefit from sound (25-60%)
         Phase 2: Generate prompts only for selected images; mark others as SKIP
 
+        Scenes are processed concurrently, with at most ``max_concurrent``
+        Claude calls in flight; each scene's prompts are generated in one
+        batched call and written to Airtable in one batched update.
+
         Args:
             video_title: Title of the video to process
 
@@ -311,7 +483,9 @@ class SoundPromptBot:
 
         total_generated = 0
         total_skipped_by_curation = 0
+        total_failed = 0
         already_existed = 0
+        pending: dict[int, list[dict]] = {}
 
         for scene_num in sorted(scenes.keys()):
             scene_images = scenes[scene_num]
@@ -334,59 +508,21 @@ class SoundPromptBot:
                 already_existed += already_done
                 total_generated += already_done
 
-            # Phase 1: Curate — which images get sound?
-            print(f"  Scene {scene_num}: Curating {len(needs_processing)} images...")
-            min_s, max_s = self._compute_bounds(len(needs_processing))
-            selections = await self.curate_scene_sounds(needs_processing)
-
-            selected_count = sum(1 for s in selections if s["sound"])
-            print(f"    Selected {selected_count}/{len(needs_processing)} for sound "
-                  f"(bounds: {min_s}-{max_s})")
-
-            # Build lookup: image_index -> should have sound
-            sound_map = {s["image_index"]: s["sound"] for s in selections}
-
-            # Phase 2: Generate prompts for selected, SKIP for others
-            for img in needs_processing:
-                record_id = img["id"]
-                idx = img.get("Image Index", 0)
-                should_sound = sound_map.get(idx, False)
-
-                if not should_sound:
-                    # Mark as SKIP
-                    try:
-                        self.airtable.update_image_sound_prompt(record_id, "SKIP")
-                        total_skipped_by_curation += 1
-                        print(f"    Scene {scene_num} img {idx}: SKIP")
-                    except Exception as e:
-                        print(f"    ❌ Failed to write SKIP: {e}")
-                    continue
-
-                sentence_text = img.get("Sentence Text", "")
-                image_prompt = img.get("Image Prompt", "")
-                shot_type = img.get("Shot Type", "")
-
-                if not sentence_text and not image_prompt:
-                    print(f"    Scene {scene_num} img {idx}: No text or prompt, skipping")
-                    continue
-
-                print(f"    Scene {scene_num} img {idx}: Generating sound prompt...")
-
-                prompt = await self.generate_sound_prompt(
-                    sentence_text=sentence_text,
-                    image_prompt=image_prompt,
-                    shot_type=shot_type,
-                )
-
-                if prompt:
-                    try:
-                        self.airtable.update_image_sound_prompt(record_id, prompt)
-                        total_generated += 1
-                        print(f"      ✅ {prompt[:60]}...")
-                    except Exception as e:
-                        print(f"      ❌ Failed to write Sound Prompt: {e}")
-                else:
-                    print(f"      ❌ Generation failed for scene {scene_num} img {idx}")
+            pending[scene_num] = needs_processing
+
+        if pending:
+            print(f"  Curating {len(pending)} scene(s), "
+                  f"{self.max_concurrent} Claude calls at a time...")
+            limiter = asyncio.Semaphore(self.max_concurrent)
+            write_lock = asyncio.Lock()
+            results = await asyncio.gather(*(
+                self._process_scene(scene_num, scene_images, limiter, write_lock)
+                for scene_num, scene_images in pending.items()
+            ))
+            for result in results:
+                total_generated += result["generated"]
+                total_skipped_by_curation += result["skipped"]
+                total_failed += result["failed"]
 
         total_images = len(images)
         print(f"\n  Sound prompts complete: {total_generated}/{total_images} generated, "
@@ -399,5 +535,6 @@ class SoundPromptBot:
             "total_images": total_images,
             "prompts_generated": total_generated,
             "skipped_by_curation": total_skipped_by_curation,
+            "prompts_failed": total_failed,
             "already_existed": already_existed,
         }
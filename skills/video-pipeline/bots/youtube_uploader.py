@@ -16,6 +16,7 @@ Quota:
 
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -40,6 +41,13 @@ SCOPES = [
 # Default category
 DEFAULT_CATEGORY_ID = "25"  # News & Politics
 
+# Resumable video upload endpoint
+VIDEO_UPLOAD_URL = (
+    "https://www.googleapis.com/upload/youtube/v3/videos"
+    "?uploadType=resumable&part=snippet,status"
+)
+UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024  # 10 MB chunks
+
 
 class YouTubeUploader:
     """Uploads videos to YouTube as unlisted drafts."""
@@ -124,6 +132,7 @@ class YouTubeUploader:
         tags: list[str],
         thumbnail_path: Optional[str] = None,
         category_id: Optional[str] = None,
+        source=None,
     ) -> dict:
         """Upload a video to YouTube as an unlisted draft.
 
@@ -134,6 +143,8 @@ class YouTubeUploader:
             tags: List of tags
             thumbnail_path: Optional local path to thumbnail image
             category_id: YouTube category ID (default: Education)
+            source: ``StreamingSource`` when video_path is still being
+                downloaded -- the upload follows the download
 
         Returns:
             dict with keys: video_id, video_url
@@ -154,28 +165,24 @@ class YouTubeUploader:
             },
         }
 
-        media = MediaFileUpload(
-            video_path,
-            mimetype="video/mp4",
-            resumable=True,
-            chunksize=10 * 1024 * 1024,  # 10 MB chunks
-        )
+        from clients.resumable_upload import ResumableUpload
 
         print(f"    Uploading to YouTube: {title}")
 
-        request = self.service.videos().insert(
-            part="snippet,status",
-            body=body,
-            media_body=media,
-        )
+        reported = {"pct": -10}
 
-        response = None
-        while response is None:
-            status, response = request.next_chunk()
-            if status:
-                pct = int(status.progress() * 100)
+        def _on_progress(done: int, total: int) -> None:
+            pct = int(done * 100 / total) if total else 100
+            if pct >= reported["pct"] + 10:
+                reported["pct"] = pct - pct % 10
                 print(f"    Upload progress: {pct}%")
 
+        uploader = ResumableUpload(self._get_credentials(), chunk_size=UPLOAD_CHUNK_SIZE)
+        response = uploader.run(
+            VIDEO_UPLOAD_URL, body, video_path, "video/mp4",
+            on_progress=_on_progress, source=source,
+        )
+
         video_id = response["id"]
         video_url = f"https://www.youtube.com/watch?v={video_id}"
         print(f"    Uploaded: {video_url}")
@@ -207,7 +214,7 @@ class YouTubeUploader:
         airtable_client,
         idea: dict,
     ) -> dict:
-        """Full upload flow: download from Drive, upload to YouTube, update Airtable.
+        """Full upload flow: stream from Drive into YouTube, update Airtable.
 
         Args:
             google_client: GoogleClient instance for downloading from Drive
@@ -249,22 +256,12 @@ class YouTubeUploader:
         # Mark as uploading
         airtable_client.update_idea_field(record_id, "Upload Status", "uploading")
 
-        # Download to temp file
+        # Temp file the download streams into while the upload reads it
         tmp_dir = tempfile.mkdtemp(prefix="yt_upload_")
         safe_title = re.sub(r'[^\w\s-]', '', title)
         safe_title = re.sub(r'[-\s]+', '_', safe_title)[:50]
         local_video = os.path.join(tmp_dir, f"{safe_title}.mp4")
 
-        try:
-            print(f"    Downloading from Drive: {file_id}")
-            google_client.download_file_to_local(file_id, local_video)
-            file_size_mb = os.path.getsize(local_video) / (1024 * 1024)
-            print(f"    Downloaded: {file_size_mb:.0f} MB")
-        except Exception as e:
-            airtable_client.update_idea_field(record_id, "Upload Status", "failed")
-            self._cleanup(local_video, tmp_dir)
-            return {"error": f"Drive download failed: {e}"}
-
         # Download thumbnail if available
         thumbnail_path = None
         thumbnail_url = idea.get("Thumbnail")
@@ -285,19 +282,46 @@ class YouTubeUploader:
                 except Exception as e:
                     print(f"    Warning: thumbnail download failed: {e}")
 
-        # Upload to YouTube
-        try:
-            result = self.upload(
-                video_path=local_video,
-                title=title,
-                description=description,
-                tags=tags,
-                thumbnail_path=thumbnail_path,
-            )
-        except Exception as e:
-            airtable_client.update_idea_field(record_id, "Upload Status", "failed")
-            self._cleanup(local_video, tmp_dir)
-            return {"error": f"YouTube upload failed: {e}"}
+        # Drive download and YouTube upload run concurrently: the download
+        # streams chunks to disk and the upload sends each chunk as soon as
+        # it is there, so the handoff takes ~max(download, upload) with at
+        # most one chunk of each in memory.
+        from clients.resumable_upload import StreamingSource
+
+        source = StreamingSource()
+
+        def _download():
+            try:
+                google_client.download_file_to_local(file_id, local_video, on_chunk=source.advance)
+            except BaseException as e:
+                source.finish(e)
+                raise
+            source.finish()
+
+        print(f"    Streaming from Drive: {file_id}")
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            download = pool.submit(_download)
+            try:
+                result = self.upload(
+                    video_path=local_video,
+                    title=title,
+                    description=description,
+                    tags=tags,
+                    thumbnail_path=thumbnail_path,
+                    source=source,
+                )
+            except Exception as e:
+                download_error = source.error
+                source.cancel()
+                download.exception()  # wait for the download to stop
+                airtable_client.update_idea_field(record_id, "Upload Status", "failed")
+                self._cleanup(local_video, tmp_dir)
+                if download_error is not None:
+                    return {"error": f"Drive download failed: {download_error}"}
+                return {"error": f"YouTube upload failed: {e}"}
+
+        file_size_mb = source.written / (1024 * 1024)
+        print(f"    Handed off {file_size_mb:.0f} MB from Drive to YouTube")
 
         # Update Airtable with YouTube info
         airtable_client.update_idea_fields(record_id, {
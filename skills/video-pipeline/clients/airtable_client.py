@@ -722,10 +722,33 @@ class AirtableClient:
             return {"id": record["id"], **record["fields"]}
         except Exception as e:
             if "UNKNOWN_FIELD_NAME" in str(e):
-                print(f"      ⚠️ 'Sound Prompt' field not found in Images table — add it in Airtable")
+                print("      ⚠️ 'Sound Prompt' field not found in Images table — add it in Airtable")
                 return {"id": record_id, "warning": "Sound Prompt field missing"}
             raise
 
+    def update_image_sound_prompts(self, sound_prompts: dict[str, str]) -> int:
+        """Write many sound prompts (``{record_id: prompt}``) in batched requests.
+
+        pyairtable sends at most 10 records per request, so a scene's worth
+        of prompts (including its SKIPs) is usually a single API call.
+
+        Returns:
+            Number of records updated
+        """
+        if not sound_prompts:
+            return 0
+        records = [
+            {"id": record_id, "fields": {"Sound Prompt": prompt}}
+            for record_id, prompt in sound_prompts.items()
+        ]
+        try:
+            return len(self.images_table.batch_update(records, typecast=True))
+        except Exception as e:
+            if "UNKNOWN_FIELD_NAME" in str(e):
+                print("      ⚠️ 'Sound Prompt' field not found in Images table — add it in Airtable")
+                return 0
+            raise
+
     def update_image_sound_effect(
         self,
         record_id: str,
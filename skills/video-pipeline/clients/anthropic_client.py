@@ -164,7 +164,9 @@ class AnthropicClient:
         if tools:
             kwargs["tools"] = tools
 
-        response = self.client.messages.create(**kwargs)
+        # The SDK client is synchronous; run it off the event loop so
+        # concurrent generate() calls (e.g. per-scene fan-out) overlap.
+        response = await _asyncio.to_thread(self.client.messages.create, **kwargs)
 
         text = self._extract_text(response)
         if text:
@@ -173,7 +175,7 @@ class AnthropicClient:
         # Empty content — retry once after a short delay
         print("    ⚠️ API returned empty content, retrying in 2s...")
         await _asyncio.sleep(2)
-        response = self.client.messages.create(**kwargs)
+        response = await _asyncio.to_thread(self.client.messages.create, **kwargs)
 
         text = self._extract_text(response)
         if text:
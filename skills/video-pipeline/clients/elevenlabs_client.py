@@ -2,55 +2,102 @@
 
 import os
 import httpx
-from typing import Optional
+from typing import Any, Awaitable, Callable, Hashable, Optional
 import asyncio
 
+from .voice_cache import VoiceCache, voice_key
+
 
 class ElevenLabsClient:
     """Client for voice synthesis via Wavespeed API (ElevenLabs turbo)."""
-    
+
     # Default voice ID from n8n workflow
     DEFAULT_VOICE_ID = "G17SuINrv2H9FC6nvetn"
-    
+
     # Wavespeed API endpoint (as used in n8n workflow)
     WAVESPEED_API_URL = "https://api.wavespeed.ai/api/v3/elevenlabs/turbo-v2.5"
-    
+
+    # Tasks in flight on Wavespeed at once (override with VOICE_MAX_CONCURRENT)
+    MAX_CONCURRENT = 4
+    POLL_INTERVAL = 5.0
+    MAX_POLL_ATTEMPTS = 30
+
+    DEFAULT_SIMILARITY = 1.0
+    DEFAULT_STABILITY = 0.5
+
+    # Texts longer than this are synthesized in sentence-aligned chunks of
+    # up to CHUNK_CHARS and stitched (see synthesize_many)
+    LONG_TEXT_CHARS = 1200
+    CHUNK_CHARS = 500
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         voice_id: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[VoiceCache] = None,
     ):
         self.api_key = api_key or os.getenv("WAVESPEED_API_KEY")
         if not self.api_key:
             raise ValueError("WAVESPEED_API_KEY not found in environment")
-        
+
         self.voice_id = voice_id or os.getenv("ELEVENLABS_VOICE_ID", self.DEFAULT_VOICE_ID)
-    
+        self.max_concurrent = max_concurrent or int(
+            os.getenv("VOICE_MAX_CONCURRENT", self.MAX_CONCURRENT)
+        )
+        self.cache = cache if cache is not None else VoiceCache()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Pooled client shared by every request on the running event loop.
+
+        Each ``asyncio.run`` (one per bot command) gets its own client —
+        pooled connections can't outlive the loop that opened them.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=self.max_concurrent * 2 + 2),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client of the running loop, if any."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+
     async def generate_voice(
         self,
         text: str,
         voice_id: Optional[str] = None,
-        similarity: float = 1.0,
-        stability: float = 0.5,
+        similarity: float = DEFAULT_SIMILARITY,
+        stability: float = DEFAULT_STABILITY,
     ) -> dict:
         """Generate voice audio from text.
-        
+
         Args:
             text: Text to convert to speech
             voice_id: Voice ID to use (uses default if not specified)
             similarity: Voice similarity (0-1)
             stability: Voice stability (0-1)
-            
+
         Returns:
             Dict with task ID and status URL for polling
         """
         target_voice = voice_id or self.voice_id
-        
+
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-        
+
         payload = {
             "text": text,
             "voice_id": target_voice,
@@ -58,17 +105,63 @@ class ElevenLabsClient:
             "stability": str(stability),
             "use_speaker_boost": True,
         }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.WAVESPEED_API_URL,
-                headers=headers,
-                json=payload,
-                timeout=60.0,
-            )
-            response.raise_for_status()
-            return response.json()
-    
+
+        response = await self._http().post(
+            self.WAVESPEED_API_URL,
+            headers=headers,
+            json=payload,
+            timeout=60.0,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def cache_key(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        similarity: float = DEFAULT_SIMILARITY,
+        stability: float = DEFAULT_STABILITY,
+    ) -> str:
+        """Voice cache key for a :meth:`generate_voice` call with these arguments."""
+        return voice_key(text, voice_id or self.voice_id, similarity, stability)
+
+    def cached_audio(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        fetch_drive: Optional[Callable[[str], bytes]] = None,
+    ) -> Optional[bytes]:
+        """MP3 previously synthesized for exactly this text and voice, or None.
+
+        Args:
+            fetch_drive: ``download(file_id) -> bytes`` for audio that is
+                only left on Drive (see :meth:`VoiceCache.get`).
+        """
+        return self.cache.get(self.cache_key(text, voice_id), fetch_drive)
+
+    def remember(
+        self,
+        text: str,
+        content: bytes,
+        audio_url: Optional[str] = None,
+        voice_id: Optional[str] = None,
+        chunks: Optional[list[dict]] = None,
+    ) -> str:
+        """Cache freshly synthesized *content* for *text*; returns its cache key."""
+        key = self.cache_key(text, voice_id)
+        self.cache.put(key, content, audio_url, chunks=chunks)
+        return key
+
+    async def _task_status(self, get_url: str) -> tuple[Optional[str], Optional[str]]:
+        """``(status, first output URL)`` of one Wavespeed task."""
+        response = await self._http().get(
+            get_url, headers={"Authorization": f"Bearer {self.api_key}"}, timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json().get("data", {})
+        outputs = data.get("outputs") or []
+        return data.get("status"), (outputs[0] if outputs else None)
+
     async def poll_for_completion(
         self,
         get_url: str,
@@ -76,69 +169,226 @@ class ElevenLabsClient:
         poll_interval: float = 5.0,
     ) -> Optional[str]:
         """Poll for voice generation completion.
-        
+
         Args:
             get_url: URL to poll for status
             max_attempts: Maximum polling attempts
             poll_interval: Seconds between polls
-            
+
         Returns:
             Audio URL when complete, or None if failed
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-        }
-        
-        async with httpx.AsyncClient() as client:
-            for _ in range(max_attempts):
-                response = await client.get(get_url, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                data = response.json()
-                
-                status = data.get("data", {}).get("status")
-                
-                if status == "completed":
-                    outputs = data.get("data", {}).get("outputs", [])
-                    return outputs[0] if outputs else None
-                elif status == "failed":
-                    return None
-                
-                await asyncio.sleep(poll_interval)
-        
+        for _ in range(max_attempts):
+            status, output = await self._task_status(get_url)
+
+            if status == "completed":
+                return output
+            elif status == "failed":
+                return None
+
+            await asyncio.sleep(poll_interval)
+
         return None
-    
+
     async def generate_and_wait(
         self,
         text: str,
         voice_id: Optional[str] = None,
     ) -> Optional[str]:
         """Generate voice audio and wait for completion.
-        
+
         Args:
             text: Text to convert to speech
             voice_id: Voice ID to use
-            
+
         Returns:
             Audio URL when complete, or None if failed
         """
-        result = await self.generate_voice(text, voice_id)
-        
-        get_url = result.get("data", {}).get("urls", {}).get("get")
-        if not get_url:
+        results = await self.generate_many({0: text}, voice_id)
+        return results[0]
+
+    async def generate_many(
+        self,
+        texts: dict[Hashable, str],
+        voice_id: Optional[str] = None,
+        on_ready: Optional[Callable[[Hashable, Optional[str]], Awaitable[Any]]] = None,
+    ) -> dict[Hashable, Optional[str]]:
+        """Generate several voice overs concurrently.
+
+        At most ``max_concurrent`` tasks are in flight on Wavespeed at once.
+        Instead of one polling loop per task, a single poller checks every
+        in-flight task each ``POLL_INTERVAL`` over the shared connection
+        pool, and a finished task's slot goes straight to the next text.
+
+        Args:
+            texts: ``{key: text}`` — e.g. Airtable record ID → scene text
+            voice_id: Voice ID to use
+            on_ready: ``await on_ready(key, audio_url)`` as soon as each task
+                finishes (``audio_url`` None on failure), outside the
+                concurrency slot — downloads and uploads overlap with the
+                remaining synthesis.
+
+        Returns:
+            ``{key: audio URL or None}``
+        """
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.max_concurrent)
+        in_flight: dict[str, tuple[asyncio.Future, list[int]]] = {}
+        results: dict[Hashable, Optional[str]] = {}
+
+        def _resolve(get_url: str, audio_url: Optional[str]) -> None:
+            future, _ = in_flight.pop(get_url)
+            if not future.done():
+                future.set_result(audio_url)
+
+        async def poller() -> None:
+            while True:
+                await asyncio.sleep(self.POLL_INTERVAL)
+                urls = list(in_flight)
+                statuses = await asyncio.gather(
+                    *(self._task_status(url) for url in urls), return_exceptions=True,
+                )
+                for url, status in zip(urls, statuses):
+                    attempts = in_flight[url][1]
+                    attempts[0] += 1
+                    if isinstance(status, Exception):
+                        # Transient poll errors only use up attempts
+                        if attempts[0] >= self.MAX_POLL_ATTEMPTS:
+                            print(f"    ⚠️ Voice task poll failed: {status}")
+                            _resolve(url, None)
+                    elif status[0] == "completed":
+                        _resolve(url, status[1])
+                    elif status[0] == "failed" or attempts[0] >= self.MAX_POLL_ATTEMPTS:
+                        _resolve(url, None)
+
+        async def synthesize(key: Hashable, text: str) -> None:
+            audio_url = None
+            async with slots:
+                try:
+                    task = await self.generate_voice(text, voice_id)
+                except httpx.HTTPError as e:
+                    print(f"    ⚠️ Voice task submit failed: {e}")
+                    task = {}
+                get_url = task.get("data", {}).get("urls", {}).get("get")
+                if get_url:
+                    future = loop.create_future()
+                    in_flight[get_url] = (future, [0])
+                    audio_url = await future
+            results[key] = audio_url
+            if on_ready:
+                await on_ready(key, audio_url)
+
+        poll_task = asyncio.create_task(poller())
+        try:
+            await asyncio.gather(*(synthesize(key, text) for key, text in texts.items()))
+        finally:
+            poll_task.cancel()
+        return results
+
+    def split_text(self, text: str) -> list[str]:
+        """Synthesis chunks of *text*: itself, or sentence groups if it's long."""
+        from .sentence_utils import chunk_sentences
+
+        if len(text) <= self.LONG_TEXT_CHARS:
+            return [text]
+        return chunk_sentences(text, self.CHUNK_CHARS) or [text]
+
+    async def synthesize_many(
+        self,
+        texts: dict[Hashable, str],
+        voice_id: Optional[str] = None,
+        on_ready: Optional[Callable[[Hashable, Optional[dict]], Awaitable[Any]]] = None,
+    ) -> dict[Hashable, Optional[dict]]:
+        """Generate and download several voice overs, chunking long texts.
+
+        Texts over ``LONG_TEXT_CHARS`` are split at sentence boundaries
+        (:meth:`split_text`); every chunk of every text goes through one
+        :meth:`generate_many` pool, so a long scene's chunks synthesize in
+        parallel with each other and with the short scenes.  Once all of a
+        text's chunks are downloaded they are stitched gaplessly with
+        matched loudness (:func:`audio_sync.stitch.stitch_audio`).
+
+        Args:
+            texts: ``{key: text}``
+            voice_id: Voice ID to use
+            on_ready: ``await on_ready(key, voice)`` as soon as each text's
+                audio is complete (``voice`` None on failure).
+
+        Returns:
+            ``{key: voice or None}``, where a voice is ``{"content": mp3
+            bytes, "audio_url": Wavespeed URL (None when stitched),
+            "chunks": [{"text", "start", "end"}, ...]}``
+        """
+        parts: dict[tuple[Hashable, int], str] = {}
+        chunk_texts: dict[Hashable, list[str]] = {}
+        for key, text in texts.items():
+            chunk_texts[key] = self.split_text(text)
+            for i, chunk in enumerate(chunk_texts[key]):
+                parts[(key, i)] = chunk
+        received: dict[Hashable, dict[int, tuple[Optional[str], Optional[bytes]]]] = {
+            key: {} for key in texts
+        }
+        results: dict[Hashable, Optional[dict]] = {}
+
+        async def part_ready(part: tuple[Hashable, int], audio_url: Optional[str]) -> None:
+            key, index = part
+            content = None
+            if audio_url:
+                try:
+                    content = await self.download_audio(audio_url)
+                except httpx.HTTPError as e:
+                    print(f"    ⚠️ Voice download failed: {e}")
+            received[key][index] = (audio_url, content)
+            if len(received[key]) < len(chunk_texts[key]):
+                return
+            results[key] = await self._assemble(chunk_texts[key], received[key])
+            if on_ready:
+                await on_ready(key, results[key])
+
+        await self.generate_many(parts, voice_id, on_ready=part_ready)
+        return results
+
+    async def _assemble(
+        self,
+        chunk_texts: list[str],
+        received: dict[int, tuple[Optional[str], Optional[bytes]]],
+    ) -> Optional[dict]:
+        """One voice from its downloaded chunks, or None if any is missing."""
+        from audio_sync.audio_metadata import probe_duration
+        from audio_sync.stitch import stitch_audio
+
+        contents = [received[i][1] for i in range(len(chunk_texts))]
+        if any(content is None for content in contents):
             return None
-        
-        return await self.poll_for_completion(get_url)
-    
+        if len(contents) == 1:
+            duration = probe_duration(contents[0])
+            return {
+                "content": contents[0],
+                "audio_url": received[0][0],
+                "chunks": [{"text": chunk_texts[0], "start": 0.0,
+                            "end": round(duration, 4) if duration else None}],
+            }
+        try:
+            content, spans = await asyncio.to_thread(stitch_audio, contents)
+        except RuntimeError as e:
+            print(f"    ⚠️ Stitching {len(contents)} voice chunks failed: {e}")
+            return None
+        return {
+            "content": content,
+            "audio_url": None,
+            "chunks": [{"text": text, "start": start, "end": end}
+                       for text, (start, end) in zip(chunk_texts, spans)],
+        }
+
     async def download_audio(self, audio_url: str) -> bytes:
         """Download audio file from URL.
-        
+
         Args:
             audio_url: URL of the audio file
-            
+
         Returns:
             Audio content as bytes
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(audio_url, timeout=60.0)
-            response.raise_for_status()
-            return response.content
+        response = await self._http().get(audio_url, timeout=60.0)
+        response.raise_for_status()
+        return response.content
@@ -7,7 +7,7 @@ from typing import Optional
 import httpx
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+from googleapiclient.http import MediaIoBaseUpload
 from googleapiclient.errors import HttpError
 
 
@@ -60,6 +60,9 @@ class GoogleClient:
     # Default folder ID from n8n workflow (Economy Fastforward folder)
     DEFAULT_PARENT_FOLDER_ID = "1zqsSvdyLWTRIt-Ri8VQELbYHhJihn6YD"
 
+    # Resumable media upload endpoint (upload_large_file)
+    DRIVE_UPLOAD_URL = "https://www.googleapis.com/upload/drive/v3/files"
+
     # Retry settings for transient errors
     MAX_RETRIES = 3
     INITIAL_BACKOFF = 1.0  # seconds
@@ -385,71 +388,66 @@ class GoogleClient:
         name: str,
         folder_id: str,
         mime_type: str = "video/mp4",
-        chunk_size_mb: int = 50,
+        chunk_size_mb: int = 32,
         check_existing: bool = True,
+        on_progress=None,
     ) -> dict:
-        """Upload a large file to Google Drive using chunked resumable upload.
+        """Upload a large file to Google Drive, streamed and resumable.
 
-        Unlike upload_file(), this reads from disk in chunks and never loads
-        the entire file into memory. Suitable for files >100 MB.
+        Unlike upload_file(), this reads from disk one chunk at a time and
+        never loads the entire file into memory. The resumable session is
+        saved next to the file (``<file>.upload.json``), so if the upload is
+        interrupted — even by a process restart — the next call for the same
+        file continues from the last byte Drive acknowledged.
 
         Args:
             file_path: Local path to the file
             name: File name in Google Drive
             folder_id: Target folder ID
             mime_type: MIME type of the file
-            chunk_size_mb: Chunk size in megabytes (must be multiple of 256 KB)
+            chunk_size_mb: Chunk size in megabytes (bounds memory use)
             check_existing: If True, update existing file instead of creating duplicate
+            on_progress: Optional ``callback(bytes_done, total_bytes)``;
+                defaults to printing every 10%
 
         Returns:
             Dict with file id, name, and mimeType
+
+        Raises:
+            UploadError: Upload rejected or still failing after retries
+                (the session is kept for the next attempt)
         """
-        chunk_size = chunk_size_mb * 1024 * 1024
+        from clients.resumable_upload import ResumableUpload
+
         file_size_bytes = os.path.getsize(file_path)
         file_size_mb = file_size_bytes / (1024 * 1024)
         print(f"    Uploading {name} ({file_size_mb:.1f} MB) in {chunk_size_mb} MB chunks...")
 
-        media = MediaFileUpload(
-            file_path,
-            mimetype=mime_type,
-            chunksize=chunk_size,
-            resumable=True,
-        )
-
         existing_file = None
         if check_existing:
             existing_file = self.search_file(name, folder_id)
 
+        fields = "fields=id,name,mimeType"
         if existing_file:
             file_id = existing_file["id"]
             print(f"      Found existing file: {name} ({file_id}), replacing content...")
-            request = self.drive_service.files().update(
-                fileId=file_id,
-                media_body=media,
-                fields="id, name, mimeType",
-            )
+            url = f"{self.DRIVE_UPLOAD_URL}/{file_id}?uploadType=resumable&{fields}"
+            method, metadata = "PATCH", {}
         else:
-            file_metadata = {"name": name, "parents": [folder_id]}
-            request = self.drive_service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields="id, name, mimeType",
-            )
+            url = f"{self.DRIVE_UPLOAD_URL}?uploadType=resumable&{fields}"
+            method, metadata = "POST", {"name": name, "parents": [folder_id]}
 
-        response = None
-        while response is None:
-            try:
-                status, response = request.next_chunk()
-                if status:
-                    pct = int(status.progress() * 100)
-                    print(f"      Uploaded {pct}%")
-            except HttpError as e:
-                if e.resp.status in (500, 502, 503, 504):
-                    wait = self.INITIAL_BACKOFF * 2
-                    print(f"      Transient error {e.resp.status}, retrying in {wait}s...")
-                    time.sleep(wait)
-                    continue
-                raise
+        if on_progress is None:
+            reported = {"pct": -10}
+
+            def on_progress(done: int, total: int) -> None:
+                pct = int(done * 100 / total) if total else 100
+                if pct >= reported["pct"] + 10:
+                    reported["pct"] = pct - pct % 10
+                    print(f"      Uploaded {pct}% ({done / (1024 * 1024):.0f}/{total / (1024 * 1024):.0f} MB)")
+
+        uploader = ResumableUpload(self.credentials, chunk_size=chunk_size_mb * 1024 * 1024)
+        response = uploader.run(url, metadata, file_path, mime_type, method=method, on_progress=on_progress)
 
         print(f"    Upload complete: {response['name']} ({response['id']})")
         return response
@@ -485,12 +483,26 @@ class GoogleClient:
         file["webViewLink"] = f"https://drive.google.com/file/d/{file['id']}/view"
         return file
 
-    def download_file_to_local(self, file_id: str, local_path: str) -> str:
+    def download_file_to_local(
+        self,
+        file_id: str,
+        local_path: str,
+        chunk_size_mb: int = 16,
+        on_chunk=None,
+    ) -> str:
         """Download a file from Google Drive to local filesystem.
 
+        Streams straight to disk one chunk at a time, so memory stays at one
+        chunk however large the file is. A failed chunk is retried from the
+        current offset rather than restarting the download.
+
         Args:
             file_id: Google Drive file ID
             local_path: Local file path to save to
+            chunk_size_mb: Download chunk size in megabytes
+            on_chunk: Optional ``callback(bytes_written, total_bytes)``, called
+                after each chunk is flushed to disk (lets a reader follow
+                the file while it is still downloading)
 
         Returns:
             The local_path on success
@@ -498,23 +510,22 @@ class GoogleClient:
         Raises:
             Exception on download failure
         """
-        import io as _io
         from googleapiclient.http import MediaIoBaseDownload
 
-        def _download():
-            request = self.drive_service.files().get_media(fileId=file_id)
-            fh = _io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        request = self.drive_service.files().get_media(fileId=file_id)
+        with open(local_path, "wb") as fh:
+            downloader = MediaIoBaseDownload(fh, request, chunksize=chunk_size_mb * 1024 * 1024)
             done = False
             while not done:
-                _, done = downloader.next_chunk()
-            return fh.getvalue()
-
-        content = self._retry_with_backoff(_download)
-
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        with open(local_path, "wb") as f:
-            f.write(content)
+                # next_chunk() retries 5xx/429/connection errors itself and
+                # only advances its offset once a chunk is written.
+                status, done = self._retry_with_backoff(
+                    downloader.next_chunk, num_retries=self.MAX_RETRIES
+                )
+                fh.flush()
+                if on_chunk:
+                    on_chunk(status.resumable_progress, status.total_size)
         return local_path
 
     def make_file_public(self, file_id: str) -> str:
@@ -601,7 +612,8 @@ class GoogleClient:
             folder_id: The folder ID to list files from
 
         Returns:
-            List of dicts with id, name, mimeType, and size
+            List of dicts with id, name, mimeType, size, and md5Checksum
+            (binary files only)
         """
         query = f"'{folder_id}' in parents and trashed = false"
         all_files = []
@@ -611,7 +623,7 @@ class GoogleClient:
             def _list(pt=page_token):
                 kwargs = {
                     "q": query,
-                    "fields": "nextPageToken, files(id, name, mimeType, size)",
+                    "fields": "nextPageToken, files(id, name, mimeType, size, md5Checksum)",
                     "pageSize": 1000,
                 }
                 if pt:
@@ -0,0 +1,301 @@
+"""Resumable uploads to Google APIs (Drive, YouTube) streamed from disk.
+
+Speaks the resumable-upload protocol directly over httpx instead of going
+through googleapiclient's ``MediaFileUpload`` so that:
+
+* the file is read one chunk at a time — memory stays at one chunk no
+  matter how big the video is;
+* the session URI is persisted in a sidecar next to the file
+  (``<file>.upload.json``): after a crash or bot restart the next attempt
+  asks the server how many bytes it already has and continues from there;
+* transient failures (5xx, 429, dropped connections) back off
+  exponentially with jitter and then resync from the server's
+  acknowledged offset instead of resending blindly;
+* progress is reported in bytes;
+* the file may still be being written (``StreamingSource``): the upload
+  only reads bytes the writer has flushed, so a download → upload
+  handoff overlaps both transfers instead of running them back to back.
+
+Protocol: https://developers.google.com/drive/api/guides/manage-uploads#resumable
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
+
+# Chunks must be multiples of 256 KiB (except the last one).
+CHUNK_ALIGN = 256 * 1024
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+
+MAX_RETRIES = 8          # consecutive failures before giving up (session kept)
+BACKOFF_BASE = 1.0       # seconds, doubled per consecutive failure
+BACKOFF_MAX = 60.0
+SESSION_MAX_AGE = 6 * 24 * 3600  # Google keeps sessions ~1 week
+
+_TRANSIENT_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class UploadError(RuntimeError):
+    """Upload failed. The session sidecar is kept so a later call resumes."""
+
+
+class _SessionExpired(Exception):
+    pass
+
+
+class _Transient(Exception):
+    pass
+
+
+class StreamingSource:
+    """Progress of a file another thread is still writing (e.g. a download).
+
+    The writer calls ``advance()`` after each chunk it has flushed to disk
+    and ``finish()`` at the end; ``ResumableUpload.run(source=...)`` blocks
+    until the bytes of its next chunk are there.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.written = 0
+        self.size: Optional[int] = None
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.cancelled = False
+
+    def advance(self, written: int, total: Optional[int] = None) -> None:
+        """Writer side: *written* bytes are on disk (raises once cancelled)."""
+        with self._cond:
+            if self.cancelled:
+                raise UploadError("Upload side gave up")
+            self.written = written
+            if total:
+                self.size = total
+            self._cond.notify_all()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Writer side: the file is complete, or the writer failed."""
+        with self._cond:
+            self.done, self.error = True, error
+            if error is None:
+                self.size = self.written
+            self._cond.notify_all()
+
+    def cancel(self) -> None:
+        """Reader side: stop the writer at its next ``advance()``."""
+        with self._cond:
+            self.cancelled = True
+
+    def _wait(self, ready: Callable[[], bool]) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: ready() or self.done)
+            if self.error is not None:
+                raise UploadError(f"Source failed: {self.error}")
+
+    def wait_size(self) -> int:
+        """Total size, once the writer knows it."""
+        self._wait(lambda: self.size is not None)
+        return self.size
+
+    def wait_for(self, n: int) -> None:
+        """Block until the first *n* bytes are on disk."""
+        self._wait(lambda: self.written >= n)
+        if self.written < n:
+            raise UploadError(f"Source ended at {self.written} of {n} bytes")
+
+
+def session_file(path: str) -> Path:
+    """Sidecar holding the resumable session of *path*."""
+    return Path(f"{path}.upload.json")
+
+
+def _identity(path: str) -> dict:
+    st = os.stat(path)
+    return {"path": os.path.abspath(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def pending_upload(path: str, state_file: Optional[Path] = None) -> Optional[dict]:
+    """The saved session for *path* if it is still usable, else None.
+
+    Usable means: written for this exact file (path, size, mtime) and
+    younger than ``SESSION_MAX_AGE``.
+    """
+    state_file = Path(state_file) if state_file else session_file(path)
+    try:
+        state = json.loads(state_file.read_text())
+        identity = _identity(path)
+    except (OSError, ValueError):
+        return None
+    if any(state.get(k) != v for k, v in identity.items()):
+        return None
+    if time.time() - state.get("created_at", 0) > SESSION_MAX_AGE:
+        return None
+    return state
+
+
+class ResumableUpload:
+    """Upload one file through a (persisted) resumable session."""
+
+    def __init__(
+        self,
+        credentials,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = MAX_RETRIES,
+        client: Optional[httpx.Client] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if chunk_size % CHUNK_ALIGN:
+            raise ValueError(f"chunk_size must be a multiple of {CHUNK_ALIGN} bytes")
+        self.credentials = credentials
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.client = client or httpx.Client(timeout=httpx.Timeout(300.0, connect=30.0))
+        self.sleep = sleep
+
+    # -- auth -----------------------------------------------------------------
+
+    def _headers(self, refresh: bool = False) -> dict:
+        if refresh or not self.credentials.valid:
+            from google.auth.transport.requests import Request
+            self.credentials.refresh(Request())
+        return {"Authorization": f"Bearer {self.credentials.token}"}
+
+    # -- protocol ---------------------------------------------------------------
+
+    def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        headers = {**self._headers(), **kwargs.pop("headers", {})}
+        try:
+            resp = self.client.request(method, url, headers=headers, **kwargs)
+        except httpx.TransportError as e:
+            raise _Transient(f"{type(e).__name__}: {e}")
+        if resp.status_code == 401:
+            self._headers(refresh=True)
+            raise _Transient("401 (token refreshed)")
+        if resp.status_code in _TRANSIENT_STATUS:
+            raise _Transient(f"HTTP {resp.status_code}")
+        return resp
+
+    def _start(self, url: str, method: str, metadata: dict, mime_type: str, size: int) -> str:
+        resp = self._send(method, url, json=metadata, headers={
+            "X-Upload-Content-Type": mime_type,
+            "X-Upload-Content-Length": str(size),
+        })
+        if resp.status_code != 200 or "location" not in resp.headers:
+            raise UploadError(f"Could not start upload session: HTTP {resp.status_code} {resp.text[:300]}")
+        return resp.headers["location"]
+
+    @staticmethod
+    def _result(resp: httpx.Response) -> tuple[int, Optional[dict]]:
+        """(acknowledged offset, final response body or None)."""
+        if resp.status_code in (200, 201):
+            return -1, resp.json() if resp.content else {}
+        if resp.status_code == 308:
+            rng = resp.headers.get("range")  # "bytes=0-12345"
+            return (int(rng.rsplit("-", 1)[1]) + 1 if rng else 0), None
+        if resp.status_code in (404, 410):
+            raise _SessionExpired()
+        raise UploadError(f"Upload rejected: HTTP {resp.status_code} {resp.text[:300]}")
+
+    def _query(self, uri: str, size: int) -> tuple[int, Optional[dict]]:
+        resp = self._send("PUT", uri, headers={"Content-Range": f"bytes */{size}"}, content=b"")
+        return self._result(resp)
+
+    def _put_chunk(self, uri: str, f, offset: int, size: int,
+                   source: Optional[StreamingSource] = None) -> tuple[int, Optional[dict]]:
+        if source is not None:
+            source.wait_for(min(offset + self.chunk_size, size))
+        f.seek(offset)
+        data = f.read(self.chunk_size)
+        if not data:
+            return self._query(uri, size)
+        end = offset + len(data) - 1
+        resp = self._send("PUT", uri, content=data,
+                          headers={"Content-Range": f"bytes {offset}-{end}/{size}"})
+        return self._result(resp)
+
+    # -- entry point ------------------------------------------------------------
+
+    def run(
+        self,
+        init_url: str,
+        metadata: dict,
+        path: str,
+        mime_type: str,
+        method: str = "POST",
+        state_file: Optional[Path] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        source: Optional[StreamingSource] = None,
+    ) -> dict:
+        """Upload *path*, resuming a saved session when there is one.
+
+        Args:
+            init_url: ``...?uploadType=resumable`` endpoint.
+            metadata: JSON body of the session request (file / video resource).
+            method: ``POST`` to create, ``PATCH``/``PUT`` to replace.
+            state_file: Session sidecar (default ``<path>.upload.json``).
+            on_progress: ``callback(bytes_acknowledged, total_bytes)``.
+            source: Set when *path* is still being written; the upload
+                follows the writer and its session is not persisted
+                (a partial file has no stable identity to resume against).
+
+        Returns:
+            The API's response body for the finished upload.
+
+        Raises:
+            UploadError: Non-retryable rejection, or ``max_retries``
+                consecutive transient failures (the session is kept).
+        """
+        state_file = Path(state_file) if state_file else session_file(path)
+        if source is not None:
+            size, saved = source.wait_size(), None
+        else:
+            size, saved = os.path.getsize(path), pending_upload(path, state_file)
+        uri = saved["uri"] if saved and saved.get("init_url") == init_url else None
+        if saved and uri:
+            print(f"      Resuming upload session for {os.path.basename(path)}")
+        failures = 0
+        restarted = False
+
+        with open(path, "rb") as f:
+            while True:
+                try:
+                    if uri is None:
+                        uri = self._start(init_url, method, metadata, mime_type, size)
+                        if source is None:
+                            state_file.write_text(json.dumps({
+                                **_identity(path), "uri": uri, "init_url": init_url,
+                                "created_at": time.time(),
+                            }))
+                        offset, done = 0, None
+                    else:
+                        offset, done = self._query(uri, size)
+                    while done is None:
+                        if on_progress:
+                            on_progress(offset, size)
+                        offset, done = self._put_chunk(uri, f, offset, size, source)
+                        failures = 0
+                    state_file.unlink(missing_ok=True)
+                    if on_progress:
+                        on_progress(size, size)
+                    return done
+                except _SessionExpired:
+                    state_file.unlink(missing_ok=True)
+                    if restarted:
+                        raise UploadError("Upload session expired twice")
+                    print("      Upload session expired, starting a new one")
+                    uri, restarted = None, True
+                except _Transient as e:
+                    failures += 1
+                    if failures > self.max_retries:
+                        kept = f"session kept in {state_file.name} to resume" if source is None else "not resumable"
+                        raise UploadError(f"Upload failed after {self.max_retries} retries ({e}); {kept}")
+                    wait = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (failures - 1))
+                    wait *= random.uniform(0.5, 1.0)
+                    print(f"      Transient upload error ({e}), retry {failures}/{self.max_retries} in {wait:.1f}s...")
+                    self.sleep(wait)
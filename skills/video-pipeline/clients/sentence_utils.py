@@ -7,7 +7,11 @@ from typing import List, Dict, Optional
 
 
 def get_audio_duration(audio_url: str) -> Optional[float]:
-    """Fetch audio file and return duration in seconds.
+    """Return the duration of a remote audio file in seconds.
+
+    Reads only the MP3/WAV header via an HTTP Range request (a few KB)
+    instead of downloading the whole file.  Falls back to a full download
+    + mutagen only if the header cannot be parsed.
 
     Args:
         audio_url: URL to an audio file (mp3, wav, etc.)
@@ -15,6 +19,15 @@ def get_audio_duration(audio_url: str) -> Optional[float]:
     Returns:
         Duration in seconds, or None if unable to determine
     """
+    try:
+        from audio_sync.audio_metadata import probe_duration
+
+        duration = probe_duration(audio_url)
+        if duration:
+            return duration
+    except Exception as e:
+        print(f"    Warning: Header probe failed ({e}), downloading full file...")
+
     try:
         from mutagen.mp3 import MP3
         from mutagen import MutagenError
@@ -74,6 +87,32 @@ def split_into_sentences(text: str) -> List[str]:
     return sentences
 
 
+def chunk_sentences(text: str, max_chars: int = 500) -> List[str]:
+    """Group consecutive sentences into chunks of at most ``max_chars``.
+
+    Chunks only break at sentence boundaries; a single sentence longer
+    than ``max_chars`` becomes a chunk of its own.
+
+    Args:
+        text: The full scene narration text
+        max_chars: Target maximum chunk length in characters
+
+    Returns:
+        List of chunk texts, in order
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in split_into_sentences(text):
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 def estimate_sentence_duration(sentence: str, words_per_minute: float = 173) -> float:
     """Estimate how long a sentence takes to speak.
     
@@ -0,0 +1,213 @@
+"""
+Reusable sound effect library.
+
+Sound prompts recur across videos ("distant thunder rumble", "cash register
+ding"), but every one used to be generated afresh on Kie.ai.
+:class:`SfxLibrary` keeps every generated effect — its MP3, prompt,
+duration, loop flag and public Drive URL — and answers "is there already
+an effect close enough to this prompt?" with an offline TF-IDF index:
+
+* prompts are tokenized into lower-cased words (stop words dropped, plural
+  ``s`` stripped) plus word bigrams, so "cash register ding" and "a cash
+  register dings" share all their features;
+* each query is scored against every stored prompt by cosine similarity
+  of TF-IDF vectors (smoothed IDF over the library itself), filtered to
+  the same loop flag and a compatible duration;
+* a match at or above the threshold (``SFX_MATCH_THRESHOLD``) is reused.
+
+Usage stats (``uses``, ``last_used``, ``videos``) are kept per effect.  The
+index is a JSON file guarded by an ``flock``, like the voice cache.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import math
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+DEFAULT_LIBRARY_DIR = Path(__file__).resolve().parent.parent / "sfx_library"
+DEFAULT_MATCH_THRESHOLD = 0.75
+
+# Durations within this fraction of the requested one are interchangeable
+DURATION_TOLERANCE = 0.25
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    "a an the of in on at to from into onto over under by for with and or "
+    "its it is are as some very".split()
+)
+
+
+def tokenize(prompt: str) -> list[str]:
+    """Word and bigram features of a sound prompt."""
+    words = []
+    for word in _TOKEN.findall((prompt or "").lower()):
+        if word in _STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def tfidf_scores(query: str, documents: list[list[str]]) -> list[float]:
+    """Cosine similarity of *query* to each tokenized document (TF-IDF weights)."""
+    n = len(documents)
+    df: Counter[str] = Counter()
+    for tokens in documents:
+        df.update(set(tokens))
+
+    def vector(tokens: list[str]) -> dict[str, float]:
+        tf = Counter(tokens)
+        vec = {t: c * (math.log((1 + n) / (1 + df[t])) + 1) for t, c in tf.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        return {t: v / norm for t, v in vec.items()}
+
+    q = vector(tokenize(query))
+    scores = []
+    for tokens in documents:
+        d = vector(tokens)
+        scores.append(sum(w * d.get(t, 0.0) for t, w in q.items()))
+    return scores
+
+
+class SfxLibrary:
+    """Local index of generated sound effects, searchable by prompt."""
+
+    __slots__ = ("root", "threshold")
+
+    def __init__(self, root: str | Path | None = None, threshold: float | None = None) -> None:
+        self.root = Path(root or os.getenv("SFX_LIBRARY_DIR") or DEFAULT_LIBRARY_DIR)
+        if threshold is None:
+            threshold = float(os.getenv("SFX_MATCH_THRESHOLD", DEFAULT_MATCH_THRESHOLD))
+        self.threshold = threshold
+
+    # -- state -----------------------------------------------------------------
+
+    @contextmanager
+    def _index(self) -> Iterator[dict[str, Any]]:
+        """Locked read-modify-write of ``index.json``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            path = self.root / "index.json"
+            try:
+                index = json.loads(path.read_text())
+            except (OSError, ValueError):
+                index = {}
+            index.setdefault("effects", {})
+            yield index
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(index, indent=1, sort_keys=True))
+            tmp.replace(path)
+
+    def _object(self, effect_id: str) -> Path:
+        return self.root / "objects" / f"{effect_id}.mp3"
+
+    # -- lookups ---------------------------------------------------------------
+
+    def find(
+        self,
+        prompt: str,
+        duration: Optional[float] = None,
+        loop: bool = False,
+    ) -> Optional[dict[str, Any]]:
+        """
+        The closest stored effect for *prompt*, if it clears the threshold.
+
+        Returns:
+            A copy of the effect entry plus ``id`` and ``score``, or None
+        """
+        with self._index() as index:
+            candidates = [
+                (effect_id, effect) for effect_id, effect in index["effects"].items()
+                if bool(effect.get("loop")) == bool(loop)
+                and (duration is None or effect.get("duration") is None
+                     or abs(effect["duration"] - duration) <= DURATION_TOLERANCE * duration)
+            ]
+        if not candidates:
+            return None
+        scores = tfidf_scores(prompt, [tokenize(effect["prompt"]) for _, effect in candidates])
+        best = max(range(len(candidates)), key=scores.__getitem__)
+        if scores[best] < self.threshold:
+            return None
+        effect_id, effect = candidates[best]
+        return {**effect, "id": effect_id, "score": round(scores[best], 4)}
+
+    def read(self, effect_id: str) -> Optional[bytes]:
+        """The stored MP3 of an effect, or None if the local copy is gone."""
+        try:
+            return self._object(effect_id).read_bytes()
+        except OSError:
+            return None
+
+    def stats(self) -> dict[str, Any]:
+        """Library size and how often its effects have been reused."""
+        with self._index() as index:
+            effects = index["effects"].values()
+            return {
+                "effects": len(effects),
+                "reuses": sum(effect.get("uses", 0) for effect in effects),
+            }
+
+    # -- updates ---------------------------------------------------------------
+
+    def add(
+        self,
+        prompt: str,
+        content: bytes,
+        duration: Optional[float] = None,
+        loop: bool = False,
+        drive_file_id: Optional[str] = None,
+        drive_url: Optional[str] = None,
+        video_title: Optional[str] = None,
+    ) -> str:
+        """Store a freshly generated effect; returns its ID (content SHA-256)."""
+        effect_id = hashlib.sha256(content).hexdigest()
+        path = self._object(effect_id)
+        if not path.is_file():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(content)
+            tmp.replace(path)
+        with self._index() as index:
+            index["effects"][effect_id] = {
+                "prompt": prompt,
+                "duration": duration,
+                "loop": loop,
+                "bytes": len(content),
+                "drive_file_id": drive_file_id,
+                "drive_url": drive_url,
+                "created": time.time(),
+                "last_used": time.time(),
+                "uses": 0,
+                "videos": [video_title] if video_title else [],
+            }
+        return effect_id
+
+    def set_drive_url(self, effect_id: str, drive_file_id: str, drive_url: str) -> None:
+        """Remember a (new) public Drive copy of an effect."""
+        with self._index() as index:
+            effect = index["effects"].get(effect_id)
+            if effect:
+                effect["drive_file_id"] = drive_file_id
+                effect["drive_url"] = drive_url
+
+    def record_use(self, effect_id: str, video_title: Optional[str] = None) -> None:
+        """Count one reuse of an effect."""
+        with self._index() as index:
+            effect = index["effects"].get(effect_id)
+            if not effect:
+                return
+            effect["uses"] = effect.get("uses", 0) + 1
+            effect["last_used"] = time.time()
+            if video_title and video_title not in effect.setdefault("videos", []):
+                effect["videos"].append(video_title)
@@ -20,12 +20,41 @@ class SoundClient:
     # Cost estimate per generation (approximate)
     ESTIMATED_COST_PER_GENERATION = 0.05
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Seconds before the first status poll, and between polls
+    FIRST_POLL_DELAY = 3.0
+    POLL_INTERVAL = 3.0
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.api_key = api_key or os.getenv("KIE_AI_API_KEY")
         if not self.api_key:
             raise ValueError("KIE_AI_API_KEY not found in environment")
         self.generation_count = 0
         self.estimated_total_cost = 0.0
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Pooled client shared by every request on the running event loop.
+
+        Task creation, every poll and every download reuse its connections
+        instead of opening a fresh client (and TLS handshake) per request.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(transport=self._transport, timeout=60.0)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client of the running loop, if any."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
 
     async def generate_sound_effect(
         self,
@@ -83,48 +112,47 @@ class SoundClient:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self.CREATE_TASK_URL,
-                        headers=headers,
-                        json=payload,
-                        timeout=60.0,
-                    )
-
-                    if response.status_code in (500, 502, 503, 504):
-                        wait = 2 ** (attempt + 1)
-                        print(f"    Server error {response.status_code}, retrying in {wait}s (attempt {attempt + 1}/{max_retries})")
-                        await asyncio.sleep(wait)
-                        continue
-
-                    if response.status_code != 200:
-                        print(f"    SFX API error: HTTP {response.status_code}")
-                        print(f"    Response: {response.text[:500]}")
-                        return None
-
-                    task_data = response.json()
-                    task_id = task_data.get("data", {}).get("taskId")
-
-                    if not task_id:
-                        api_msg = task_data.get("msg") or task_data.get("message") or "unknown"
-                        print(f"    No task ID in response: {api_msg}")
-                        return None
-
-                    print(f"    SFX task created: {task_id}")
-
-                    # Poll for completion
-                    await asyncio.sleep(3)
-                    result_url = await self._poll_for_completion(task_id)
-
-                    if result_url:
-                        self.generation_count += 1
-                        self.estimated_total_cost += self.ESTIMATED_COST_PER_GENERATION
-                        print(f"    SFX complete (total: {self.generation_count}, ~${self.estimated_total_cost:.2f})")
-                        return result_url
-
-                    print(f"    SFX generation failed for task {task_id}")
+                response = await self._http().post(
+                    self.CREATE_TASK_URL,
+                    headers=headers,
+                    json=payload,
+                    timeout=60.0,
+                )
+
+                if response.status_code in (500, 502, 503, 504):
+                    wait = 2 ** (attempt + 1)
+                    print(f"    Server error {response.status_code}, retrying in {wait}s (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait)
+                    continue
+
+                if response.status_code != 200:
+                    print(f"    SFX API error: HTTP {response.status_code}")
+                    print(f"    Response: {response.text[:500]}")
+                    return None
+
+                task_data = response.json()
+                task_id = task_data.get("data", {}).get("taskId")
+
+                if not task_id:
+                    api_msg = task_data.get("msg") or task_data.get("message") or "unknown"
+                    print(f"    No task ID in response: {api_msg}")
                     return None
 
+                print(f"    SFX task created: {task_id}")
+
+                # Poll for completion
+                await asyncio.sleep(self.FIRST_POLL_DELAY)
+                result_url = await self._poll_for_completion(task_id)
+
+                if result_url:
+                    self.generation_count += 1
+                    self.estimated_total_cost += self.ESTIMATED_COST_PER_GENERATION
+                    print(f"    SFX complete (total: {self.generation_count}, ~${self.estimated_total_cost:.2f})")
+                    return result_url
+
+                print(f"    SFX generation failed for task {task_id}")
+                return None
+
             except httpx.TimeoutException:
                 wait = 2 ** (attempt + 1)
                 print(f"    Timeout, retrying in {wait}s (attempt {attempt + 1}/{max_retries})")
@@ -143,14 +171,14 @@ class SoundClient:
         self,
         task_id: str,
         max_attempts: int = 40,
-        poll_interval: float = 3.0,
+        poll_interval: Optional[float] = None,
     ) -> Optional[str]:
         """Poll for sound effect generation completion.
 
         Args:
             task_id: Task ID to poll
             max_attempts: Maximum polling attempts (40 * 3s = 120s timeout)
-            poll_interval: Seconds between polls
+            poll_interval: Seconds between polls (default ``POLL_INTERVAL``)
 
         Returns:
             URL of the generated audio, or None if failed/timeout
@@ -158,18 +186,19 @@ class SoundClient:
         headers = {
             "Authorization": f"Bearer {self.api_key}",
         }
+        if poll_interval is None:
+            poll_interval = self.POLL_INTERVAL
 
         for attempt in range(max_attempts):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        self.RECORD_INFO_URL,
-                        headers=headers,
-                        params={"taskId": task_id},
-                        timeout=30.0,
-                    )
-                    response.raise_for_status()
-                    data = response.json().get("data", {})
+                response = await self._http().get(
+                    self.RECORD_INFO_URL,
+                    headers=headers,
+                    params={"taskId": task_id},
+                    timeout=30.0,
+                )
+                response.raise_for_status()
+                data = response.json().get("data", {})
 
                 task_state = data.get("state", "")
                 task_status = data.get("status")
@@ -218,7 +247,6 @@ class SoundClient:
         Returns:
             Audio content as bytes
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(audio_url, timeout=60.0)
-            response.raise_for_status()
-            return response.content
+        response = await self._http().get(audio_url, timeout=60.0)
+        response.raise_for_status()
+        return response.content
@@ -0,0 +1,202 @@
+"""
+Voice synthesis cache.
+
+Re-scripting a video or ``!retry`` on the voice step used to pay for a
+new Wavespeed/ElevenLabs render of every scene, even when its text was
+unchanged.  :class:`VoiceCache` maps a render key — normalized text,
+voice ID, similarity and stability (:func:`voice_key`) — to the MP3 that
+was produced for it:
+
+* the audio lives in a local content-addressed store
+  (``voice_cache/objects/<sha256>.mp3``), so identical audio is kept once;
+* each entry also remembers the Drive file it was uploaded as, so audio
+  evicted locally (or cached on another machine) can be fetched back
+  from Drive — verified against its SHA-256, because a later upload of
+  the same ``Scene N.mp3`` replaces that file's content;
+* the local store is bounded (``VOICE_CACHE_MAX_MB``); the least
+  recently used audio is deleted first, and its entry kept if Drive has
+  a copy.
+
+The index is a JSON file guarded by an ``flock``, like the render queue,
+so the Slack bot and the standalone runners can share one cache.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import time
+import unicodedata
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "voice_cache"
+DEFAULT_MAX_MB = 2048
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """NFC, straight quotes, collapsed whitespace — what the voice actually reads."""
+    text = unicodedata.normalize("NFC", text or "")
+    text = text.translate({0x2018: "'", 0x2019: "'", 0x201C: '"', 0x201D: '"'})
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def voice_key(text: str, voice_id: str, similarity: float, stability: float) -> str:
+    """Cache key of one synthesis request."""
+    payload = json.dumps(
+        [normalize_text(text), voice_id, round(float(similarity), 4), round(float(stability), 4)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class VoiceCache:
+    """Local, size-bounded store of synthesized voice MP3s."""
+
+    __slots__ = ("root", "max_bytes")
+
+    def __init__(self, root: str | Path | None = None, max_mb: float | None = None) -> None:
+        self.root = Path(root or os.getenv("VOICE_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        if max_mb is None:
+            max_mb = float(os.getenv("VOICE_CACHE_MAX_MB", DEFAULT_MAX_MB))
+        self.max_bytes = int(max_mb * 1024 * 1024)
+
+    # -- state -----------------------------------------------------------------
+
+    @contextmanager
+    def _index(self) -> Iterator[dict[str, Any]]:
+        """Locked read-modify-write of ``index.json``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            path = self.root / "index.json"
+            try:
+                index = json.loads(path.read_text())
+            except (OSError, ValueError):
+                index = {}
+            index.setdefault("entries", {})
+            yield index
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(index, indent=1, sort_keys=True))
+            tmp.replace(path)
+
+    def _object(self, sha256: str) -> Path:
+        return self.root / "objects" / f"{sha256}.mp3"
+
+    # -- lookups ---------------------------------------------------------------
+
+    def get(
+        self,
+        key: str,
+        fetch_drive: Optional[Callable[[str], bytes]] = None,
+    ) -> Optional[bytes]:
+        """
+        The cached MP3 for *key*, or None.
+
+        Args:
+            fetch_drive: ``download(file_id) -> bytes``; used when the local
+                copy is gone but the entry has a Drive file.  The download
+                is only accepted if it still hashes to the cached audio.
+        """
+        with self._index() as index:
+            entry = index["entries"].get(key)
+            if entry is None:
+                return None
+            entry["last_used"] = time.time()
+            sha256, drive_file_id = entry["sha256"], entry.get("drive_file_id")
+        try:
+            return self._object(sha256).read_bytes()
+        except OSError:
+            pass
+        if not (fetch_drive and drive_file_id):
+            return None
+        try:
+            content = fetch_drive(drive_file_id)
+        except Exception as e:
+            print(f"    ⚠️ Cached voice not fetchable from Drive ({e})")
+            return None
+        if hashlib.sha256(content).hexdigest() != sha256:
+            return None  # that Drive file was overwritten since
+        self._store(sha256, content)
+        return content
+
+    def entry(self, key: str) -> Optional[dict[str, Any]]:
+        """The index entry for *key* (``sha256``, ``bytes``, ``drive_file_id``, ...)."""
+        with self._index() as index:
+            entry = index["entries"].get(key)
+            return dict(entry) if entry else None
+
+    # -- updates ---------------------------------------------------------------
+
+    def _store(self, sha256: str, content: bytes) -> None:
+        path = self._object(sha256)
+        if path.is_file():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(content)
+        tmp.replace(path)
+
+    def put(
+        self,
+        key: str,
+        content: bytes,
+        audio_url: Optional[str] = None,
+        chunks: Optional[list[dict[str, Any]]] = None,
+    ) -> str:
+        """
+        Store *content* under *key*; returns its SHA-256.
+
+        Args:
+            chunks: Chunk spans of a stitched voice over, kept so a reuse
+                can hand them to the audio sync like a fresh synthesis.
+        """
+        sha256 = hashlib.sha256(content).hexdigest()
+        self._store(sha256, content)
+        with self._index() as index:
+            index["entries"][key] = {
+                "sha256": sha256,
+                "bytes": len(content),
+                "audio_url": audio_url,
+                "chunks": chunks,
+                "drive_file_id": None,
+                "created": time.time(),
+                "last_used": time.time(),
+            }
+            self._evict(index)
+        return sha256
+
+    def set_drive_file(self, key: str, file_id: str) -> None:
+        """Remember the Drive copy of *key*'s audio."""
+        with self._index() as index:
+            entry = index["entries"].get(key)
+            if entry:
+                entry["drive_file_id"] = file_id
+
+    def _evict(self, index: dict[str, Any]) -> None:
+        """
+        Delete least recently used local audio until the store fits ``max_bytes``.
+
+        Entries with a Drive copy stay in the index (:meth:`get` fetches
+        them back); the others are dropped with their audio.
+        """
+        objects: dict[str, dict[str, float]] = {}
+        for entry in index["entries"].values():
+            obj = objects.setdefault(entry["sha256"], {"bytes": entry["bytes"], "last_used": 0.0})
+            obj["last_used"] = max(obj["last_used"], entry["last_used"])
+        local = {sha: obj for sha, obj in objects.items() if self._object(sha).is_file()}
+        total = sum(obj["bytes"] for obj in local.values())
+        for sha, obj in sorted(local.items(), key=lambda kv: kv[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            self._object(sha).unlink(missing_ok=True)
+            total -= obj["bytes"]
+            for key, entry in list(index["entries"].items()):
+                if entry["sha256"] == sha and not entry.get("drive_file_id"):
+                    del index["entries"][key]
@@ -931,34 +931,105 @@ class VideoPipeline:
         if not scripts:
             return {"error": f"No scripts found for: {self.video_title}"}
         
-        voice_count = 0
+        # CHECK: Is voice already done? (resume after a crash or !retry)
+        pending = {}
         for script in scripts:
-            scene_number = script.get("scene", 0)
-            
-            # CHECK: Is voice already done?
             if script.get("Script Status") == "Finished":
-                print(f"  Check: Scene {scene_number} voice already done, skipping.")
+                print(f"  Check: Scene {script.get('scene', 0)} voice already done, skipping.")
                 continue
-                
-            scene_text = script.get("Scene text", "")
-            
-            print(f"  Generating voice for scene {scene_number}...")
-            
-            # Generate voice
-            audio_url = await self.elevenlabs.generate_and_wait(scene_text)
-            
-            if audio_url:
-                # Download audio
-                audio_content = await self.elevenlabs.download_audio(audio_url)
-                
-                # Upload to Google Drive
-                filename = f"Scene {scene_number}.mp3"
-                self.google.upload_audio(audio_content, filename, self.project_folder_id)
-                
-                # Update Airtable
-                self.airtable.mark_script_finished(script["id"], audio_url)
-                voice_count += 1
-        
+            pending[script["id"]] = script
+
+        # Scenes synthesize concurrently (ElevenLabsClient.synthesize_many,
+        # long scenes in sentence chunks stitched back together); each one
+        # is uploaded to Drive and checkpointed in Airtable as soon as it's
+        # ready, while the others still render.
+        # The Drive and Airtable clients are synchronous and the Drive one
+        # isn't thread-safe, so checkpoints run one at a time off the loop.
+        # Chunk offsets of stitched scenes go to the audio sync's timing dir.
+        import hashlib
+        from audio_sync.voice_chunks import record_voice_chunks
+
+        timing_dir = Path(__file__).parent / "timing" / (self.current_idea_id or "unknown")
+        voice_count = 0
+        reused_count = 0
+        checkpoint_lock = asyncio.Lock()
+
+        async def checkpoint(
+            record_id: str,
+            audio_content: bytes,
+            audio_url: Optional[str],
+            chunks: Optional[list] = None,
+        ) -> dict:
+            """Upload one scene's voice to Drive and mark its script Finished."""
+            nonlocal voice_count
+            script = pending[record_id]
+            filename = f"Scene {script.get('scene', 0)}.mp3"
+            async with checkpoint_lock:
+                if chunks and len(chunks) > 1:
+                    record_voice_chunks(
+                        timing_dir, script.get("scene", 0),
+                        hashlib.sha256(audio_content).hexdigest(), chunks,
+                    )
+                drive_file = await asyncio.to_thread(
+                    self.google.upload_audio, audio_content, filename, self.project_folder_id,
+                )
+                if audio_url is None:
+                    # Cached or stitched audio has no live Wavespeed URL,
+                    # so Airtable links the Drive copy instead
+                    audio_url = await asyncio.to_thread(self.google.make_file_public, drive_file["id"])
+                await asyncio.to_thread(self.airtable.mark_script_finished, record_id, audio_url)
+            voice_count += 1
+            return drive_file
+
+        # CHECK: Was this exact text already voiced? (re-script, !retry)
+        for record_id in list(pending):
+            script = pending[record_id]
+            scene_number = script.get("scene", 0)
+            text = script.get("Scene text", "")
+            cached = await asyncio.to_thread(
+                self.elevenlabs.cached_audio, text, fetch_drive=self.google.download_file,
+            )
+            if cached is None:
+                continue
+            entry = self.elevenlabs.cache.entry(self.elevenlabs.cache_key(text)) or {}
+            try:
+                await checkpoint(record_id, cached, None, entry.get("chunks"))
+            except Exception as e:
+                print(f"  ⚠️ Scene {scene_number}: reusing cached voice failed ({e}), regenerating")
+                continue
+            reused_count += 1
+            del pending[record_id]
+            print(f"  ♻️ Scene {scene_number} voice reused from cache")
+
+        async def save_voice(record_id: str, voice: Optional[dict]) -> None:
+            script = pending[record_id]
+            scene_number = script.get("scene", 0)
+            if not voice:
+                print(f"  ❌ Scene {scene_number}: voice generation failed")
+                return
+            try:
+                key = await asyncio.to_thread(
+                    self.elevenlabs.remember, script.get("Scene text", ""), voice["content"],
+                    voice["audio_url"], chunks=voice["chunks"],
+                )
+                # Upload to Google Drive and update Airtable
+                drive_file = await checkpoint(
+                    record_id, voice["content"], voice["audio_url"], voice["chunks"],
+                )
+                await asyncio.to_thread(self.elevenlabs.cache.set_drive_file, key, drive_file["id"])
+            except Exception as e:
+                print(f"  ❌ Scene {scene_number}: saving voice failed ({e})")
+                return
+            print(f"  ✅ Scene {scene_number} voice saved ({voice_count - reused_count}/{len(pending)})")
+
+        if pending:
+            print(f"  Generating voice for {len(pending)} scene(s), "
+                  f"{self.elevenlabs.max_concurrent} at a time...")
+            await self.elevenlabs.synthesize_many(
+                {record_id: script.get("Scene text", "") for record_id, script in pending.items()},
+                on_ready=save_voice,
+            )
+
         # UPDATE STATUS to Ready For Image Prompts
         # Sound design runs AFTER images exist (needs Image Prompt + Sentence Text)
         self.airtable.update_idea_status(self.current_idea_id, self.STATUS_READY_IMAGE_PROMPTS)
@@ -970,6 +1041,7 @@ class VideoPipeline:
             "bot": "Voice Bot",
             "video_title": self.video_title,
             "voice_count": voice_count,
+            "reused_count": reused_count,
             "new_status": self.STATUS_READY_IMAGE_PROMPTS,
         }
 
@@ -2597,10 +2669,12 @@ class VideoPipeline:
 
         REQUIRES: Ideas status = "Ready To Render"
         UPDATES TO: "Done" when complete
+
+        Every render goes through the shared render queue (render/jobqueue.py):
+        once the queue admits the video, its assets are prepared in its own
+        job directory and rendered.
         """
-        import subprocess
-        import re
-        from pathlib import Path
+        from render.jobqueue import RenderQueue
 
         if not self.current_idea:
             idea = self.get_idea_by_status(self.STATUS_READY_TO_RENDER)
@@ -2608,6 +2682,63 @@ class VideoPipeline:
                 return {"error": "No idea with status 'Ready To Render'"}
             self._load_idea(idea)
 
+        video_id = self.current_idea_id or "unknown"
+        queue = RenderQueue()
+        entry = queue.enqueue(video_id, self.video_title, self.video_config.video_length_minutes * 60)
+        if entry.get("held_by"):
+            # Another live process (a second `render`, a re-run bot) already
+            # has this video; rendering it again would overwrite its job dir.
+            print(f"  ⏭️ '{self.video_title}' is already in the render queue "
+                  f"(process {entry['held_by']}) — not starting a second render")
+            return {"error": f"Already queued/rendering in process {entry['held_by']}",
+                    "bot": "Render Bot", "video_title": self.video_title}
+        ok = False
+        try:
+            result = await self._render_queued_idea(queue, video_id)
+            ok = not result.get("error")
+            return result
+        finally:
+            queue.finish(video_id, ok)
+
+    async def _render_queued_idea(self, queue, video_id: str) -> dict:
+        """Body of :meth:`run_render_bot` once the video is in the render queue."""
+        import subprocess
+        import re
+        from pathlib import Path
+        from clients.resumable_upload import pending_upload
+        from render.jobqueue import format_entry, job_dir
+        from render.props import diff_props, format_diff, load_rendered, reusable, save_rendered, write_props
+
+        remotion_dir = Path(__file__).parent.parent.parent / "remotion-video"
+        clean = re.sub(r'[^\w\s-]', '', self.video_title)
+        safe_name = re.sub(r'[-\s]+', '_', clean)[:50]
+        output_file = remotion_dir / "out" / f"{safe_name}.mp4"
+
+        # A previous run rendered this video but its Drive upload was cut
+        # off (crash, bot restart): the MP4 and its resumable session are
+        # still on disk, so finish the upload instead of rendering again.
+        if self.project_folder_id and pending_upload(str(output_file)):
+            print(f"\n☁️ RENDER BOT: Resuming interrupted Drive upload of '{self.video_title}'")
+            self.slack.notify(
+                f"☁️ *Resuming upload:* _{self.video_title}_\n"
+                f"Rendered video already on disk, continuing the interrupted Drive upload..."
+            )
+            return self._upload_final_video(output_file, safe_name, self.project_folder_id)
+
+        # Wait for the render queue before touching any assets: FIFO, at
+        # most MAX_PARALLEL_RENDERS at once, and a second render only if
+        # free RAM / load allow it. Downloads, image regeneration and
+        # normalize_assets' process pool count against the same budget as
+        # the render itself.
+        if not queue.try_start(video_id):
+            entry = queue.position(video_id)
+            print(f"  ⏳ Waiting in render queue: {format_entry(entry)}")
+            self.slack.notify(f"⏳ *Render queued:* {format_entry(entry)}")
+            await queue.wait_turn(
+                video_id,
+                on_wait=lambda e: self.slack.notify(f"⏳ *Render queue:* {format_entry(e)}"),
+            )
+
         print(f"\n🎬 RENDER BOT: Processing '{self.video_title}'")
         self.slack.notify(
             f"🎬 *Render starting:* _{self.video_title}_\n"
@@ -2617,32 +2748,37 @@ class VideoPipeline:
         # CLEAN PUBLIC/ DIR — prevents asset contamination between renders
         # Each video needs its own Scene_XX_XX.png files; stale files from
         # a previous render would produce wrong visuals or WRONG AUDIO.
-        remotion_dir = Path(__file__).parent.parent.parent / "remotion-video"
-        public_dir = remotion_dir / "public"
+        # The public dir is per video (jobs/{video_id}/public, passed to
+        # Remotion as --public-dir) so a queued render never touches the
+        # assets of one that is running.
+        # Exception: after a successful render the job dir keeps a snapshot
+        # of the props and the Drive checksum of every asset it downloaded.
+        # Those assets stay; the download below replaces only the ones whose
+        # checksum changed and prunes the ones no longer in Drive.  The
+        # snapshot is consumed here and rewritten only on success, so a
+        # failed render falls back to a full clean next time.
+        job = job_dir(video_id, remotion_dir)
+        public_dir = job / "public"
+        rendered = load_rendered(job, consume=True)
+        previous_sources = rendered["sources"] if rendered else {}
         if public_dir.exists():
             import glob as glob_mod
-            stale_audio = glob_mod.glob(str(public_dir / "Scene *.mp3"))
-            stale_images = glob_mod.glob(str(public_dir / "Scene_*.png"))
-            stale_videos = glob_mod.glob(str(public_dir / "Scene_*.mp4"))
             stale_config = glob_mod.glob(str(public_dir / "render_config.json"))
-            stale_sfx = glob_mod.glob(str(public_dir / "sfx" / "*.mp3"))
-            removed = 0
-            for f in stale_audio + stale_images + stale_videos + stale_config + stale_sfx:
+            stale = list(stale_config)
+            if not rendered:
+                stale += glob_mod.glob(str(public_dir / "Scene *.mp3"))
+                stale += glob_mod.glob(str(public_dir / "Scene_*.png"))
+                stale += glob_mod.glob(str(public_dir / "Scene_*.jpg"))
+                stale += glob_mod.glob(str(public_dir / "Scene_*.webp"))
+                stale += glob_mod.glob(str(public_dir / "Scene_*.mp4"))
+                stale += glob_mod.glob(str(public_dir / "asset_manifest.json"))
+                stale += glob_mod.glob(str(public_dir / "sfx" / "*.mp3"))
+            for f in stale:
                 os.remove(f)
-                removed += 1
-            if removed:
-                print(f"  🧹 Cleaned {removed} stale assets from public/")
-
-        # CLEAN CAPTION FILES — audio_sync still writes these for legacy
-        # compatibility. Remove stale ones to avoid confusion between renders.
-        captions_dir = remotion_dir / "src" / "captions"
-        if captions_dir.exists():
-            import glob as glob_mod
-            stale_captions = glob_mod.glob(str(captions_dir / "Scene *.json"))
-            for f in stale_captions:
-                os.remove(f)
-            if stale_captions:
-                print(f"  🧹 Cleaned {len(stale_captions)} stale caption files")
+            if len(stale) > len(stale_config):
+                print(f"  🧹 Cleaned {len(stale)} stale assets from public/")
+            elif rendered:
+                print(f"  ♻️ Keeping assets from the last render ({len(previous_sources)} files, checked against Drive)")
 
         # PRE-FLIGHT CHECK: Regenerate any missing/pending images before render
         # This prevents render failures due to missing image files
@@ -2693,50 +2829,60 @@ class VideoPipeline:
         # Export props
         props = await self.package_for_remotion()
 
-        props_file = remotion_dir / "props.json"
-        public_dir.mkdir(exist_ok=True)
-
-        with open(props_file, "w") as f:
-            json.dump(props, f, indent=2)
-        print(f"  📦 Props saved to: {props_file}")
+        props_file = job_dir(video_id, remotion_dir) / "props.json"
+        public_dir.mkdir(parents=True, exist_ok=True)
 
-        # Use the Whisper-based render_config.json generated by audio_sync.
+        # Use the Whisper-based timeline generated by audio_sync.
         # It contains accurate per-image durations, ken_burns, and transition
         # data.  Do NOT regenerate from Airtable — that was the old path that
         # produced corrupted timing (empty ken_burns, lossy durations).
-        import shutil
+        from audio_sync.timeline import load_render_config, read_timeline, verify_timeline_ref
         pipeline_dir = Path(__file__).parent
         video_id = self.current_idea_id or "unknown"
-        audio_sync_config = pipeline_dir / "timing" / video_id / "render_config.json"
-        rc_path = public_dir / "render_config.json"
+        timing_dir = pipeline_dir / "timing" / video_id
 
-        if audio_sync_config.exists():
-            shutil.copy2(audio_sync_config, rc_path)
-            rc_data = json.loads(rc_path.read_text())
+        rc_data, timeline_info = load_render_config(timing_dir)
+        if rc_data:
             rc_scene_count = len(rc_data.get("scenes", []))
             rc_total = rc_data.get("total_duration_seconds", 0)
-            print(f"  📋 render_config.json (from audio_sync): "
+            source = "timeline" if timeline_info else "render_config.json"
+            print(f"  📋 Render config ({source} from audio_sync): "
                   f"{rc_scene_count} images, {rc_total:.1f}s total")
 
             # Embed render_config in props so Remotion reads it via
             # getInputProps() instead of the static JSON import.  The static
             # import gets baked into the webpack bundle and can go stale when
             # Remotion's .remotion/ cache persists across different videos.
+            # Remotion needs it synchronously at composition time, so it stays
+            # embedded; the timeline reference lets us detect a re-sync that
+            # lands between packaging and render.
             props["renderConfig"] = rc_data
-            with open(props_file, "w") as f:
-                json.dump(props, f, indent=2)
-            print(f"  📦 Props updated with embedded renderConfig")
+            if timeline_info:
+                props["timeline"] = timeline_info
         else:
             raise RuntimeError(
-                f"render_config.json not found at {audio_sync_config}. "
+                f"No timeline or render_config.json in {timing_dir}. "
                 f"Audio sync must run before rendering. "
                 f"Re-run the pipeline from the image prompts stage."
             )
 
         # Download assets from ALL matching Drive folders to public/
         # First file wins — if Scene 1.mp3 is in folder A, we skip it in folder B
+        # A file kept from the last render is reused when its Drive md5 is
+        # unchanged (normalization may have renamed it: Scene_01_01.png → .jpg).
+        from render.assets import load_asset_manifest
+        kept_assets = load_asset_manifest(public_dir).get("assets", {})
+
+        def _on_disk(name: str) -> bool:
+            entry = kept_assets.get(name)
+            return (public_dir / name).exists() or bool(
+                entry and "error" not in entry and (public_dir / entry["output"]).exists()
+            )
+
         print(f"  ⬇️ Downloading assets from Google Drive...")
+        sources: dict[str, str | None] = {}  # public/ file → Drive md5
         download_ok = 0
+        download_reused = 0
         download_fail = 0
         failed_assets = []
 
@@ -2754,15 +2900,22 @@ class VideoPipeline:
                     continue
 
                 dest = public_dir / fname
-                if dest.exists():
+                if fname in sources:
                     # Already downloaded from a previous folder
                     continue
+                md5 = df.get("md5Checksum")
+                if reusable(fname, md5, previous_sources) and _on_disk(fname):
+                    sources[fname] = md5
+                    download_ok += 1
+                    download_reused += 1
+                    continue
 
                 try:
                     content = self.google.download_file(fid)
                     if len(content) < 1000:
                         raise ValueError(f"File too small ({len(content)} bytes)")
                     dest.write_bytes(content)
+                    sources[fname] = md5
                     print(f"    ✅ {fname} ({len(content) // 1024} KB)")
                     download_ok += 1
                 except Exception as e:
@@ -2771,7 +2924,8 @@ class VideoPipeline:
                     download_fail += 1
 
         # Validate downloads — abort if critical assets are missing
-        print(f"  📊 Downloads: {download_ok} OK, {download_fail} failed")
+        print(f"  📊 Downloads: {download_ok} OK ({download_reused} unchanged since last render), "
+              f"{download_fail} failed")
         if download_fail > 0:
             fail_list = "\n".join(f"  • {a}" for a in failed_assets[:10])
             extra = f"\n  ... and {len(failed_assets) - 10} more" if len(failed_assets) > 10 else ""
@@ -2801,11 +2955,13 @@ class VideoPipeline:
         # so we can download them directly instead of relying on
         # Airtable CDN URLs which expire after 2 hours.
         drive_sfx_map: dict[str, str] = {}  # filename → Drive file ID
+        drive_sfx_md5: dict[str, str] = {}  # filename → Drive md5
         for folder_id, _desc in asset_folders:
             drive_files = self.google.list_files_in_folder(folder_id)
             for df in drive_files:
                 if df["name"].startswith("sfx_") and df["name"].endswith(".mp3"):
                     drive_sfx_map[df["name"]] = df["id"]
+                    drive_sfx_md5[df["name"]] = df.get("md5Checksum")
 
         # Download per-image SFX files (4-strategy fallback)
         sfx_dir = public_dir / "sfx"
@@ -2821,7 +2977,10 @@ class VideoPipeline:
                 sfx_total += 1
                 filename = sfx_path.removeprefix("sfx/")
                 dest = sfx_dir / filename
-                if dest.exists() and dest.stat().st_size > 100:
+                md5 = drive_sfx_md5.get(filename)
+                if (reusable(sfx_path, md5, previous_sources)
+                        and dest.exists() and dest.stat().st_size > 100):
+                    sources[sfx_path] = md5
                     sfx_count += 1
                     continue
 
@@ -2884,6 +3043,7 @@ class VideoPipeline:
                         print(f"    ⚠️ CDN download failed for {filename}: {e}")
 
                 if downloaded:
+                    sources[sfx_path] = md5 if filename in drive_sfx_map else None
                     sfx_count += 1
                 else:
                     print(f"    ❌ {filename}: all download strategies failed")
@@ -2910,12 +3070,63 @@ class VideoPipeline:
         if sfx_removed:
             print(f"  ⚠️ Removed {sfx_removed} SFX references (files not on disk)")
 
-        # Re-save props.json — the SFX download loop may have removed sfxUrl
-        # keys and the verification above may have removed sfx props for
-        # files that failed to download.  Without this re-save, Remotion reads
-        # the stale props.json that still references missing SFX files → 404.
-        with open(props_file, "w") as f:
-            json.dump(props, f, indent=2)
+        # Prune assets kept from the last render that this one didn't
+        # claim (gone from Drive, or no longer referenced).
+        keep = set(sources) | {
+            entry["output"] for name, entry in kept_assets.items() if name in sources
+        }
+        pruned = [
+            f for f in [*public_dir.glob("Scene*"), *sfx_dir.glob("*.mp3")]
+            if f.is_file() and str(f.relative_to(public_dir)) not in keep
+        ]
+        for f in pruned:
+            f.unlink()
+        if pruned:
+            print(f"  🧹 Removed {len(pruned)} assets not in this render")
+
+        # Normalize stills to output resolution + Ken Burns overscan (JPEG)
+        # and clips to constant-frame-rate H.264, so the headless browser
+        # isn't decoding 4K PNGs on every frame. Renamed stills reach
+        # Main.tsx through props["assetFiles"].
+        from render.assets import asset_file_map, normalize_assets, summarize
+        asset_manifest = normalize_assets(
+            public_dir, rc_data.get("resolution"), rc_data.get("fps") or 24,
+        )
+        props["assetFiles"] = asset_file_map(asset_manifest)
+        asset_stats = summarize(asset_manifest)
+        print(f"  🗜️ Normalized {asset_stats['normalized']} assets "
+              f"({asset_stats['bytes_in'] // (1024 * 1024)} MB → "
+              f"{asset_stats['bytes_out'] // (1024 * 1024)} MB)"
+              + (f", {asset_stats['failed']} left as-is" if asset_stats["failed"] else ""))
+
+        # Measure every voice over and SFX (ebur128 in a process pool,
+        # cached by content hash) and record it in the timeline; the audio
+        # mix applies the derived normalizing gains. A timeline that changed
+        # since it was loaded is left alone — the check before the render
+        # aborts on it.
+        from audio_sync.loudness import analyze_assets, asset_gains
+        from audio_sync.timeline import write_timeline_loudness
+        loudness = analyze_assets(public_dir)
+        loudness_gains = asset_gains(loudness)
+        if timeline_info and verify_timeline_ref(timeline_info):
+            try:
+                timeline_info = write_timeline_loudness(timeline_info["path"], loudness)
+                props["timeline"] = timeline_info
+            except (OSError, ValueError) as e:
+                print(f"  ⚠️ Could not record loudness in the timeline: {e}")
+        print(f"  🎚️ Loudness: {len(loudness)} audio assets measured, "
+              f"{len(loudness_gains)} get a normalizing gain")
+        # Words for ffmpeg captions and the sync's single narration track,
+        # which the audio mix cuts scenes from while it matches Scene N.mp3
+        timeline_data = read_timeline(timeline_info["path"]) if timeline_info else {}
+
+        # Save props.json once, compactly, after the SFX download loop and
+        # verification above have removed sfxUrl keys and sfx props for
+        # files that failed to download (otherwise Remotion 404s on them).
+        write_props(props_file, props)
+        print(f"  📦 Props saved to: {props_file} ({props_file.stat().st_size:,} bytes)")
+        props_diff = diff_props(rendered["props"] if rendered else None, props)
+        print(f"  🔀 Props vs last render: {format_diff(props_diff)}")
 
         # Verify every scene has its audio file (Remotion will 404 without it)
         # Use actual scene numbers from props — NOT sequential range(1, N+1)
@@ -2988,16 +3199,10 @@ class VideoPipeline:
         self.slack.notify(
             f"⬇️ *Assets ready:* _{self.video_title}_\n"
             f"{scene_count} scenes, all audio verified.{sound_info}\n"
+            f"🔀 {format_diff(props_diff)}\n"
             f"Starting Remotion render now..."
         )
 
-        # Sanitize filename
-        def sanitize(title):
-            clean = re.sub(r'[^\w\s-]', '', title)
-            return re.sub(r'[-\s]+', '_', clean)[:50]
-        
-        safe_name = sanitize(self.video_title)
-        output_file = remotion_dir / "out" / f"{safe_name}.mp4"
         output_file.parent.mkdir(exist_ok=True)
         
         # Ensure node_modules are installed
@@ -3012,115 +3217,218 @@ class VideoPipeline:
                 )
                 return {"error": "npm install failed", "bot": "Render Bot"}
 
-        # Clear Remotion's webpack bundle cache to guarantee fresh data.
-        # The static import of render_config.json gets baked into the cached
-        # bundle; without clearing, a previous video's caption text persists.
-        remotion_cache = remotion_dir / ".remotion"
-        if remotion_cache.exists():
-            shutil.rmtree(remotion_cache, ignore_errors=True)
-            print(f"  🧹 Cleared Remotion bundle cache")
-
-        # Render (optimized for KVM4: 4 vCPU / 16GB RAM)
+        # Render data only arrives via --props (renderConfig.ts dropped the
+        # static import that used to bake a previous video's captions into
+        # the bundle), so render_chunked renders every job from one webpack
+        # bundle per composition version (render/bundle.py) instead of
+        # bundling per job.
+
+        # The embedded renderConfig must still match the timeline on disk —
+        # an audio sync that finished mid-download would otherwise render
+        # with stale timing.
+        if timeline_info and not verify_timeline_ref(timeline_info):
+            print(f"  ❌ Timeline changed since props were built: {timeline_info['path']}")
+            self.slack.notify(
+                f"❌ *Render FAILED:* _{self.video_title}_\n"
+                f"Timeline changed during asset download (audio sync re-ran). Re-run render."
+            )
+            return {"error": "Timeline checksum mismatch", "bot": "Render Bot"}
+
+        # Render (optimized for KVM4: 4 vCPU / 16GB RAM) one scene per job.
+        # Finished scenes persist in out/chunks/{video_id}, so a crash at 95%
+        # only re-renders the missing ranges on retry, and every scene is
+        # cached in out/scene_cache by a fingerprint of its assets, timing
+        # and the composition code — fixing three images re-renders three
+        # scenes, not the video.
         import time as _time
-        print(f"  🎥 Rendering video (concurrency=3, estimated 45-60 minutes)...")
-        render_cmd = [
-            "npx", "remotion", "render",
-            "Main", str(output_file),
-            "--props", str(props_file),
-            "--concurrency=3",
-            "--gl=swangle",
-            "--timeout=180000",
-            "--offthreadvideo-cache-size-in-bytes=1073741824",
-        ]
+        from render import (
+            RenderError, RenderTelemetry, SceneCache, composition_version, needs_remotion,
+            premix_audio_bed, render_chunked, render_ffmpeg, resolve_render_engine,
+            scene_fingerprints,
+        )
+        from render.config import AUDIO_BED_DIR, AUDIO_PREMIX, TELEMETRY_DIR, TELEMETRY_FILE
+        from render.telemetry import append_record, format_summary
 
-        # Stream render output to track progress and send Slack updates
-        print(f"  🎯 Render cmd: {' '.join(str(c) for c in render_cmd)}")
+        # Engine per video: the Idea's "Render Engine" field, else RENDER_ENGINE.
+        # The ffmpeg fast path handles stills + Ken Burns + crossfades in
+        # minutes; anything it can't draw (clips) goes through Remotion.
+        try:
+            engine = resolve_render_engine(self.current_idea.get("Render Engine"))
+        except ValueError as e:
+            print(f"  ⚠️ {e} — using Remotion")
+            engine = "remotion"
+        if engine == "ffmpeg":
+            reason = needs_remotion(rc_data, props, public_dir)
+            if reason:
+                print(f"  ⚠️ ffmpeg engine can't render this video ({reason}) — using Remotion")
+                engine = "remotion"
+
+        # Refine the queue's ETA inputs now that length and engine are known
+        queue.update(video_id, video_seconds=rc_data.get("total_duration_seconds") or 0, engine=engine)
+
+        if engine == "ffmpeg":
+            print(f"  ⚡ Rendering video with ffmpeg (estimated 5-15 minutes)...")
+        else:
+            fingerprints = scene_fingerprints(
+                rc_data, public_dir, composition_version(remotion_dir), props,
+            )
+            # Narration + SFX pre-mixed with ffmpeg (render/audio_bed.py):
+            # the chunks render muted and Remotion's audio pass is skipped.
+            # If the mix fails, Remotion mixes the audio as before.
+            audio_bed = None
+            if AUDIO_PREMIX:
+                try:
+                    bed = premix_audio_bed(
+                        public_dir, rc_data, remotion_dir / AUDIO_BED_DIR / f"{video_id}.aac",
+                        props=props, gains=loudness_gains,
+                        narration=timeline_data.get("narration"),
+                    )
+                    audio_bed = bed["output"]
+                    status = "reused" if bed["reused"] else f"mixed in {bed['elapsed']:.1f}s"
+                    print(f"  🔊 Audio bed: {bed['sources']} tracks {status}")
+                except RenderError as e:
+                    print(f"  ⚠️ Audio pre-mix failed ({e}) — Remotion will mix the audio")
+            print(f"  🎥 Rendering video in chunks (estimated 45-60 minutes)...")
+        # Per-chunk fps / peak RSS / CPU, one line per render in
+        # remotion-video/out/telemetry/renders.jsonl
+        telemetry = RenderTelemetry(rc_data, engine=engine, label=video_id,
+                                    props=props, public_dir=public_dir)
+        telemetry_file = remotion_dir / TELEMETRY_DIR / TELEMETRY_FILE
         render_start = _time.time()
-        last_update_frame = 0  # Track last frame count we reported
-        last_update_time = render_start
+        progress_state = {"frame": 0, "time": render_start}
         FRAME_UPDATE_INTERVAL = 5000  # Send update every N frames
         TIME_UPDATE_INTERVAL = 300   # Or every 5 minutes
-        last_error_line = ""
 
-        process = subprocess.Popen(
-            render_cmd, cwd=remotion_dir,
-            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-            text=True, bufsize=1,
-        )
-
-        for line in process.stdout:
-            line = line.strip()
-            if not line:
-                continue
-            print(f"    {line}")
-
-            # Parse Remotion frame progress: "Rendered 500/28800"
-            frame_match = re.search(r'Rendered\s+(\d+)/(\d+)', line)
-            if frame_match:
-                current_frame = int(frame_match.group(1))
-                total_frames = int(frame_match.group(2))
-                current_pct = (current_frame / total_frames * 100) if total_frames > 0 else 0
-                now = _time.time()
-                elapsed = now - render_start
-                elapsed_min = int(elapsed / 60)
-                frames_since_update = current_frame - last_update_frame
-                time_since_update = now - last_update_time
-
-                # Send Slack update every 5000 frames OR every 5 minutes
-                if frames_since_update >= FRAME_UPDATE_INTERVAL or time_since_update >= TIME_UPDATE_INTERVAL:
-                    # Estimate remaining time
-                    if current_pct > 0:
-                        total_est = elapsed / (current_pct / 100)
-                        remaining_min = int((total_est - elapsed) / 60)
-                        eta_str = f"~{remaining_min} min remaining"
-                    else:
-                        eta_str = "estimating..."
-
-                    progress_bar = "█" * int(current_pct // 10) + "░" * (10 - int(current_pct // 10))
-                    self.slack.notify(
-                        f"🎬 *Render progress:* _{self.video_title}_\n"
-                        f"`{progress_bar}` *{current_pct:.1f}%* — frame {current_frame}/{total_frames} — {elapsed_min} min elapsed, {eta_str}"
-                    )
-                    last_update_frame = current_frame
-                    last_update_time = now
-
-            # Capture error lines for failure reporting
-            if "error" in line.lower() or "Error" in line:
-                last_error_line = line
+        def _on_progress(current_frame: int, total_frames: int) -> None:
+            current_pct = (current_frame / total_frames * 100) if total_frames > 0 else 0
+            now = _time.time()
+            elapsed = now - render_start
+            elapsed_min = int(elapsed / 60)
+            frames_since_update = current_frame - progress_state["frame"]
+            time_since_update = now - progress_state["time"]
+
+            # Send Slack update every 5000 frames OR every 5 minutes
+            if frames_since_update >= FRAME_UPDATE_INTERVAL or time_since_update >= TIME_UPDATE_INTERVAL:
+                # Estimate remaining time
+                if current_pct > 0:
+                    total_est = elapsed / (current_pct / 100)
+                    remaining_min = int((total_est - elapsed) / 60)
+                    eta_str = f"~{remaining_min} min remaining"
+                else:
+                    eta_str = "estimating..."
 
-        returncode = process.wait()
-        total_min = int((_time.time() - render_start) / 60)
+                progress_bar = "█" * int(current_pct // 10) + "░" * (10 - int(current_pct // 10))
+                self.slack.notify(
+                    f"🎬 *Render progress:* _{self.video_title}_\n"
+                    f"`{progress_bar}` *{current_pct:.1f}%* — frame {current_frame}/{total_frames} — {elapsed_min} min elapsed, {eta_str}"
+                )
+                progress_state["frame"] = current_frame
+                progress_state["time"] = now
 
-        if returncode != 0:
-            print(f"  ❌ Render failed")
-            error_detail = f"\n`{last_error_line}`" if last_error_line else ""
+        try:
+            if engine == "ffmpeg":
+                render_stats = render_ffmpeg(
+                    public_dir, output_file, rc_data,
+                    work_dir=remotion_dir / "out" / "ffmpeg" / video_id,
+                    props=props,
+                    words=timeline_data.get("words"),
+                    on_progress=_on_progress,
+                    telemetry=telemetry,
+                    gains=loudness_gains,
+                    narration=timeline_data.get("narration"),
+                )
+            else:
+                render_stats = render_chunked(
+                    remotion_dir, props_file, output_file, rc_data,
+                    work_dir=remotion_dir / "out" / "chunks" / video_id,
+                    on_progress=_on_progress,
+                    cache=SceneCache(remotion_dir / "out" / "scene_cache"),
+                    fingerprints=fingerprints,
+                    public_dir=public_dir,
+                    telemetry=telemetry,
+                    audio_file=audio_bed,
+                )
+        except RenderError as e:
+            total_min = int((_time.time() - render_start) / 60)
+            append_record(telemetry_file, telemetry.summary(
+                ok=False, video_id=video_id, title=self.video_title, error=str(e),
+            ))
+            print(f"  ❌ Render failed: {e}")
+            error_detail = f"\n`{e.detail}`" if e.detail else ""
             self.slack.notify(
                 f"❌ *Render FAILED:* _{self.video_title}_\n"
-                f"Remotion exited with code {returncode} after {total_min} min.{error_detail}"
+                f"{e} after {total_min} min.{error_detail}\n"
+                f"Re-run render to resume from the finished chunks."
             )
             return {"error": "Render failed", "bot": "Render Bot"}
 
+        total_min = int((_time.time() - render_start) / 60)
+        print(f"  🧩 {render_stats['rendered']} scenes rendered, "
+              f"{render_stats['cached']} from cache, {render_stats['reused']} resumed "
+              f"({render_stats['parallel']} parallel)")
+        telemetry_record = telemetry.summary(
+            ok=True, video_id=video_id, title=self.video_title,
+            **{k: render_stats[k] for k in ("chunks", "rendered", "reused", "cached", "parallel")},
+        )
+        append_record(telemetry_file, telemetry_record)
+        print(f"  📈 {format_summary(telemetry_record)}")
+
         if not output_file.exists():
             print(f"  ❌ Output not found")
             self.slack.notify(
                 f"❌ *Render FAILED:* _{self.video_title}_\n"
-                f"Remotion finished but output file not found at {output_file}"
+                f"{engine.capitalize()} finished but output file not found at {output_file}"
             )
             return {"error": "Output file missing", "bot": "Render Bot"}
 
         file_size_mb = output_file.stat().st_size / (1024 * 1024)
         print(f"  ✅ Rendered: {output_file} ({file_size_mb:.0f} MB)")
+        save_rendered(job, props, sources)
 
         # Upload to Drive
         print("  ☁️ Uploading to Google Drive...")
         self.slack.notify(
             f"✅ *Render complete:* _{self.video_title}_ ({file_size_mb:.0f} MB, {total_min} min)\n"
+            f"📈 {format_summary(telemetry_record)}\n"
             f"Uploading to Google Drive..."
         )
-        with open(output_file, "rb") as f:
-            video_content = f.read()
-        
-        drive_file = self.google.upload_video(video_content, f"{safe_name}.mp4", folder_id)
+        return self._upload_final_video(output_file, safe_name, folder_id)
+
+    def _upload_final_video(self, output_file, safe_name: str, folder_id: str) -> dict:
+        """Stream the rendered MP4 to Drive (resumable) and mark the idea Rendered.
+
+        The upload reads the file chunk by chunk — never the whole video in
+        memory — and keeps its session next to the MP4, so an interrupted
+        upload resumes from the last acknowledged byte on the next run.
+        """
+        from clients.resumable_upload import UploadError
+
+        size_mb = output_file.stat().st_size / (1024 * 1024)
+        reported = {"log": -10, "slack": 0}
+
+        def _on_progress(done: int, total: int) -> None:
+            pct = int(done * 100 / total) if total else 100
+            if pct >= reported["log"] + 10:
+                reported["log"] = pct - pct % 10
+                print(f"      Uploaded {pct}% ({done / (1024 * 1024):.0f}/{size_mb:.0f} MB)")
+            if pct < 100 and pct >= reported["slack"] + 25:
+                reported["slack"] = pct - pct % 25
+                self.slack.notify(
+                    f"☁️ *Drive upload:* _{self.video_title}_ — {pct}% "
+                    f"({done / (1024 * 1024):.0f}/{size_mb:.0f} MB)"
+                )
+
+        try:
+            drive_file = self.google.upload_large_file(
+                str(output_file), f"{safe_name}.mp4", folder_id, on_progress=_on_progress,
+            )
+        except UploadError as e:
+            print(f"  ❌ Drive upload failed: {e}")
+            self.slack.notify(
+                f"❌ *Drive upload FAILED:* _{self.video_title}_\n{e}\n"
+                f"The rendered video is kept — re-run render to resume the upload."
+            )
+            return {"error": "Drive upload failed", "bot": "Render Bot"}
         drive_url = f"https://drive.google.com/file/d/{drive_file['id']}/view"
 
         # Update Airtable — store in both legacy and new field names
@@ -3146,7 +3454,9 @@ class VideoPipeline:
             "video_url": drive_url
         }
 
-    async def run_audio_sync(self, audio_path: str = None, scene_list: list = None) -> dict:
+    async def run_audio_sync(
+        self, audio_path: str = None, scene_list: list = None, incremental: bool = True,
+    ) -> dict:
         """Calculate per-image durations by matching Sentence Text to audio.
 
         For each scene:
@@ -3155,13 +3465,30 @@ class VideoPipeline:
         3. Walk through each image's Sentence Text sequentially
         4. Duration = how long it takes to say that sentence
         5. Write duration to image's Airtable record immediately
+
+        With ``incremental=True`` (default) each scene is fingerprinted by
+        its audio hash + ordered Sentence Text list. Scenes whose
+        fingerprint matches ``timing/{id}/sync_state.json`` reuse their
+        stored durations (no transcription, no Airtable writes); the render
+        config is still rebuilt from every scene's current image rows.
         """
         from pathlib import Path as _Path
         from audio_sync.transcriber import transcribe
+        from audio_sync.audio_metadata import probe_duration
         from audio_sync.transition_engine import assign_transitions
         from audio_sync.ken_burns_calculator import assign_ken_burns
+        from audio_sync.incremental import (
+            audio_content_hash, scene_fingerprint, load_sync_state,
+            new_sync_state, save_sync_state, get_clean_scene, record_scene,
+            retime_images,
+        )
+        from audio_sync.narration import NARRATION_FILE, concat_narration
+        from audio_sync.silence import snap_to_silence
+        from audio_sync.timeline import TIMELINE_FILE, TimelineWriter, read_timeline
+        from audio_sync.voice_chunks import (
+            anchor_words_to_chunks, load_voice_chunks, words_from_chunks,
+        )
         from collections import defaultdict
-        import subprocess as _sp
 
         if not self.current_idea:
             return {"error": "No current idea loaded"}
@@ -3206,7 +3533,13 @@ class VideoPipeline:
                 ]
                 for df in scene_mp3s:
                     local_path = audio_dir / df["name"]
-                    if not local_path.exists():
+                    # Re-download when Drive has a different file (e.g. the
+                    # scene's voice was regenerated). Size alone misses a
+                    # same-length CBR re-encode, so compare Drive's MD5.
+                    drive_md5 = df.get("md5Checksum")
+                    if not local_path.exists() or (
+                        drive_md5 and drive_md5 != audio_content_hash(local_path, "md5")
+                    ):
                         content = self.google.download_file(df["id"])
                         if len(content) < 500:
                             continue
@@ -3245,290 +3578,320 @@ class VideoPipeline:
         # (Airtable records in scenes_images are stale after Step 3 writes)
         image_durations: dict[tuple[int, int], float] = {}  # (scene_num, img_index) -> seconds
 
-        for scene_num in scene_numbers:
-            images = scenes_images[scene_num]
-            audio_file = scene_audio_paths.get(scene_num)
-
-            if not audio_file or not audio_file.exists():
-                print(f"    Scene {scene_num}: ⚠️ no audio, skipping")
-                continue
+        sync_state = load_sync_state(timing_dir) if incremental else new_sync_state()
+        resynced_scenes: list[int] = []
+        reused_scenes: list[int] = []
 
-            # Transcribe this scene's audio with Whisper
-            cache_dir = timing_dir / f"scene_{scene_num}"
-            cache_dir.mkdir(parents=True, exist_ok=True)
+        # Word timings of unchanged scenes are carried over from the
+        # previous timeline; the new one is written to a .tmp file and only
+        # replaces it on close (an exception discards it).
+        previous_words: dict[int, list] = {}
+        if incremental and (timing_dir / TIMELINE_FILE).exists():
             try:
-                words = transcribe(str(audio_file), cache_dir=cache_dir)
-            except Exception as e:
-                print(f"    Scene {scene_num}: ⚠️ Whisper failed ({e}), skipping")
-                continue
-
-            if not words:
-                print(f"    Scene {scene_num}: ⚠️ no words transcribed")
-                continue
+                previous_words = read_timeline(timing_dir / TIMELINE_FILE)["words"]
+            except (OSError, ValueError):
+                previous_words = {}
+        with TimelineWriter(timing_dir / TIMELINE_FILE) as timeline:
+            for scene_num in scene_numbers:
+                images = scenes_images[scene_num]
+                audio_file = scene_audio_paths.get(scene_num)
+
+                if not audio_file or not audio_file.exists():
+                    print(f"    Scene {scene_num}: ⚠️ no audio, skipping")
+                    continue
 
-            # Validate Whisper timestamps against actual audio duration.
-            # The Whisper API word-level timestamps can drift significantly
-            # from the real audio timeline (sometimes 2x). Use ffprobe as
-            # ground truth and scale timestamps when they diverge.
-            whisper_dur = words[-1].end
-            actual_dur = None
-            try:
-                probe = _sp.run(
-                    ["ffprobe", "-v", "quiet", "-show_entries",
-                     "format=duration", "-of",
-                     "default=noprint_wrappers=1:nokey=1",
-                     str(audio_file)],
-                    capture_output=True, text=True, timeout=10,
-                )
-                if probe.returncode == 0 and probe.stdout.strip():
-                    actual_dur = float(probe.stdout.strip())
-            except Exception:
-                pass
+                audio_hash = audio_content_hash(audio_file)
+                fingerprint = scene_fingerprint(audio_hash, images)
+                clean = get_clean_scene(sync_state, scene_num, fingerprint) if incremental else None
+                if clean:
+                    scene_total = 0.0
+                    for entry in clean["images"]:
+                        image_durations[(scene_num, entry["image_index"])] = entry["duration"]
+                        scene_total += entry["duration"]
+                    total_duration += scene_total
+                    scene_durations[scene_num] = scene_total
+                    reused_scenes.append(scene_num)
+                    if scene_num in previous_words:
+                        timeline.add_scene_words(scene_num, previous_words[scene_num])
+                    print(f"    Scene {scene_num}: unchanged — reusing {len(clean['images'])} durations ({scene_total:.1f}s)")
+                    continue
 
-            # Fallback to mutagen if ffprobe unavailable
-            if actual_dur is None:
+                # Transcribe this scene's audio with Whisper
+                cache_dir = timing_dir / f"scene_{scene_num}"
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                # Chunk offsets the voice bot recorded for this exact (stitched) audio
+                voice_chunks = load_voice_chunks(timing_dir, scene_num, audio_hash)
                 try:
-                    from mutagen.mp3 import MP3
-                    actual_dur = MP3(str(audio_file)).info.length
-                except Exception:
-                    pass
-
-            if actual_dur and whisper_dur > 0:
-                drift = abs(actual_dur - whisper_dur) / actual_dur
-                if drift > 0.10:
-                    scale = actual_dur / whisper_dur
-                    print(f"    Scene {scene_num}: ⚠️ Whisper duration drift — "
-                          f"audio={actual_dur:.2f}s, whisper={whisper_dur:.2f}s, "
-                          f"scaling by {scale:.3f}")
-                    for w in words:
-                        w.start *= scale
-                        w.end *= scale
-
-            scene_audio_dur = words[-1].end
-            print(f"    Scene {scene_num}: {len(words)} words, {scene_audio_dur:.1f}s — {len(images)} images")
-
-            # ── Write Remotion caption file ──
-            # Remotion's transcripts.ts reads word-level timestamps from
-            # src/captions/Scene N.json (compiled into the bundle at render
-            # time). Write drift-corrected words so karaoke timing and
-            # scene durations are consistent with render_config.
-            captions_dir = _Path(__file__).parent.parent.parent / "remotion-video" / "src" / "captions"
-            captions_dir.mkdir(parents=True, exist_ok=True)
-            caption_path = captions_dir / f"Scene {scene_num}.json"
-            caption_data = {
-                "text": " ".join(w.word.strip() for w in words),
-                "segments": [{
-                    "id": 0,
-                    "start": words[0].start,
-                    "end": words[-1].end,
-                    "text": " ".join(w.word.strip() for w in words),
-                    "words": [
-                        {"word": w.word, "start": round(w.start, 4),
-                         "end": round(w.end, 4), "probability": 1.0}
-                        for w in words
-                    ],
-                }],
-                "language": "en",
-            }
-            try:
-                with open(caption_path, "w") as _f:
-                    json.dump(caption_data, _f, indent=2)
-                print(f"    Scene {scene_num}: wrote {len(words)} words to {caption_path.name}")
-            except Exception as e:
-                print(f"    Scene {scene_num}: ⚠️ caption write failed ({e})")
-
-            # ── Proportional word-count mapping ──
-            # Each image's Sentence Text covers a portion of the scene
-            # narration. Allocate Whisper words proportionally based on
-            # each sentence's word count, then read durations straight
-            # from the Whisper timestamps. No fuzzy matching needed —
-            # both the sentence texts and Whisper words are in order.
-            img_entries = []  # (record, img_index, sentence, word_count)
-            total_sentence_words = 0
-            for img_idx, img in enumerate(images):
-                sentence = img.get("Sentence Text", "") or ""
-                img_index = img.get("Image Index", img_idx + 1)
-                if not sentence.strip():
-                    print(f"      Image {img_index}: (no sentence text, skipping)")
-                    continue
-                wc = len(sentence.split())
-                if wc == 0:
+                    words = transcribe(str(audio_file), cache_dir=cache_dir)
+                except Exception as e:
+                    if not voice_chunks:
+                        print(f"    Scene {scene_num}: ⚠️ Whisper failed ({e}), skipping")
+                        continue
+                    print(f"    Scene {scene_num}: ⚠️ Whisper failed ({e}), estimating from voice chunks")
+                    words = words_from_chunks(voice_chunks)
+
+                if not words:
+                    print(f"    Scene {scene_num}: ⚠️ no words transcribed")
                     continue
-                img_entries.append((img, img_index, sentence, wc))
-                total_sentence_words += wc
 
-            if not img_entries:
-                print(f"    Scene {scene_num}: no images with sentence text")
-                continue
-
-            total_whisper = len(words)
-            scene_total = 0.0
-
-            # Pass 1: find each image's start index in the Whisper words
-            cumulative = 0
-            start_indices = []
-            for _img, _idx, _sent, wc in img_entries:
-                frac = cumulative / total_sentence_words
-                w_start = int(round(frac * total_whisper))
-                w_start = max(0, min(w_start, total_whisper - 1))
-                start_indices.append(w_start)
-                cumulative += wc
-
-            # Pass 2: duration = gap between consecutive start times.
-            # This naturally includes inter-sentence pauses in the
-            # narrator's delivery, giving each image its full display
-            # window (speech + following pause).
-            scene_raw: list[dict] = []
-            for entry_idx, (img, img_index, sentence, wc) in enumerate(img_entries):
-                start_time = words[start_indices[entry_idx]].start
-
-                if entry_idx < len(img_entries) - 1:
-                    end_time = words[start_indices[entry_idx + 1]].start
-                else:
-                    end_time = words[-1].end
-
-                dur = round(end_time - start_time, 2)
-                dur = max(dur, 1.0)
-
-                scene_raw.append({
-                    "record_id": img["id"],
-                    "image_index": img_index,
-                    "sentence_text": sentence,
-                    "duration": dur,
-                    "display_start": round(start_time, 4),
-                    "display_end": round(end_time, 4),
-                    "word_count": wc,
-                })
-
-            # Write Whisper-calculated durations to Airtable and cache.
-            # No merging — each image keeps its own duration. If a concept
-            # is too short, that's a signal to fix concept grouping, not
-            # something audio_sync should mask by deleting images.
-            for entry in scene_raw:
-                record_id = entry["record_id"]
-                img_index = entry["image_index"]
-                dur = entry["duration"]
-                sentence = entry["sentence_text"]
-                wc = entry["word_count"]
+                # Validate Whisper timestamps against actual audio duration.
+                # The Whisper API word-level timestamps can drift significantly
+                # from the real audio timeline (sometimes 2x). Read the MP3
+                # header (Xing/VBRI frame count) as ground truth and scale
+                # timestamps when they diverge.
+                whisper_dur = words[-1].end
+                actual_dur = probe_duration(audio_file)
 
-                image_durations[(scene_num, img_index)] = dur
+                # Fallback to mutagen if the header could not be parsed
+                if actual_dur is None:
+                    try:
+                        from mutagen.mp3 import MP3
+                        actual_dur = MP3(str(audio_file)).info.length
+                    except Exception:
+                        pass
 
-                try:
-                    self.airtable.images_table.update(
-                        record_id, {"Duration (s)": dur}, typecast=True,
-                    )
-                    duration_updates += 1
-                except Exception as e:
-                    print(f"      Image {img_index}: ⚠️ Airtable write failed ({e})")
-
-                total_duration += dur
-                scene_total += dur
-                print(f"      Image {img_index}: {dur:.2f}s ({wc}w) — \"{sentence[:50]}...\"")
-
-            scene_durations[scene_num] = scene_total
-
-
-        # ── Step 4: Build per-IMAGE render config ──
-        # Each image gets its own entry with sentence_text so Remotion can
-        # match words to images precisely. Entries are grouped by scene_number.
-        print(f"  Step 4/4: Writing per-image render config...")
-
-        from audio_sync.render_config_writer import build_render_config, write_render_config
-
-        running_time = 0.0
-        timed_images = []
-        for scene_num in scene_numbers:
-            images = scenes_images[scene_num]
-            for img_idx, img in enumerate(images):
-                sentence = img.get("Sentence Text", "") or ""
-                img_index = img.get("Image Index", img_idx + 1)
-
-                # Look up the enforced duration calculated in Step 3.
-                # The local scenes_images dict is stale (loaded before Step 3),
-                # so we use the image_durations cache instead.
-                dur = image_durations.get((scene_num, img_index), 0)
-                if dur <= 0:
-                    # Image was absorbed by duration enforcement (merged with
-                    # neighbor) — skip it so render_config.json doesn't include
-                    # a phantom entry.
+                if actual_dur and whisper_dur > 0:
+                    drift = abs(actual_dur - whisper_dur) / actual_dur
+                    if drift > 0.10:
+                        scale = actual_dur / whisper_dur
+                        print(f"    Scene {scene_num}: ⚠️ Whisper duration drift — "
+                              f"audio={actual_dur:.2f}s, whisper={whisper_dur:.2f}s, "
+                              f"scaling by {scale:.3f}")
+                        for w in words:
+                            w.start *= scale
+                            w.end *= scale
+
+                # Pin chunk boundaries of a stitched voice over to their known
+                # offsets, so drift can't accumulate across chunks.
+                if voice_chunks:
+                    words = anchor_words_to_chunks(words, voice_chunks)
+
+                scene_audio_dur = words[-1].end
+                print(f"    Scene {scene_num}: {len(words)} words, {scene_audio_dur:.1f}s — {len(images)} images")
+
+                # Stream this scene's drift-corrected words into the timeline
+                # as soon as they're final (replaces per-scene caption JSON).
+                timeline.add_scene_words(scene_num, words)
+
+                # ── Proportional word-count mapping ──
+                # Each image's Sentence Text covers a portion of the scene
+                # narration. Allocate Whisper words proportionally based on
+                # each sentence's word count, then read durations straight
+                # from the Whisper timestamps. No fuzzy matching needed —
+                # both the sentence texts and Whisper words are in order.
+                img_entries = []  # (record, img_index, sentence, word_count)
+                total_sentence_words = 0
+                for img_idx, img in enumerate(images):
+                    sentence = img.get("Sentence Text", "") or ""
+                    img_index = img.get("Image Index", img_idx + 1)
+                    if not sentence.strip():
+                        print(f"      Image {img_index}: (no sentence text, skipping)")
+                        continue
+                    wc = len(sentence.split())
+                    if wc == 0:
+                        continue
+                    img_entries.append((img, img_index, sentence, wc))
+                    total_sentence_words += wc
+
+                if not img_entries:
+                    print(f"    Scene {scene_num}: no images with sentence text")
                     continue
-                dur = float(dur)
-
-                # Use actual composition from image record (Shot Type)
-                composition = img.get("Shot Type", "") or "wide"
-
-                timed_images.append({
-                    "scene_number": scene_num,
-                    "image_index": img_index,
-                    "sentence_text": sentence,
-                    "start_time": round(running_time, 4),
-                    "end_time": round(running_time + dur, 4),
-                    "duration": round(dur, 4),
-                    "display_start": round(running_time, 4),
-                    "display_end": round(running_time + dur, 4),
-                    "display_duration": round(dur, 4),
-                    "alignment_method": "sentence_match",
-                    "style": "",
-                    "composition": composition,
-                })
-                running_time += dur
-
-        timed_images = assign_transitions(timed_images)
-        timed_images = assign_ken_burns(timed_images)
-
-        # Concat scene audio for the full-video audio path
-        concat_path = timing_dir / "narration_concat.mp3"
-        sorted_audio = sorted(scene_audio_paths.items())
-        list_file = timing_dir / "concat_list.txt"
-        with open(list_file, "w") as f:
-            for _, sa in sorted_audio:
-                f.write(f"file '{sa}'\n")
-        try:
-            _sp.run(
-                ["ffmpeg", "-y", "-f", "concat", "-safe", "0",
-                 "-i", str(list_file), "-c", "copy", str(concat_path)],
-                capture_output=True, check=True,
-            )
-        except Exception:
-            concat_path = sorted_audio[0][1] if sorted_audio else _Path("")
 
-        remotion_dir = _Path(__file__).parent.parent.parent / "remotion-video"
-        image_dir = str(remotion_dir / "public")
-
-        config = build_render_config(
-            video_id=video_id,
-            audio_path=str(concat_path),
-            scenes=timed_images,
-            image_dir=image_dir,
-        )
+                total_whisper = len(words)
+                scene_total = 0.0
+
+                # Pass 1: find each image's start index in the Whisper words
+                cumulative = 0
+                start_indices = []
+                for _img, _idx, _sent, wc in img_entries:
+                    frac = cumulative / total_sentence_words
+                    w_start = int(round(frac * total_whisper))
+                    w_start = max(0, min(w_start, total_whisper - 1))
+                    start_indices.append(w_start)
+                    cumulative += wc
+
+                # Boundaries between images move into the nearest pause of the
+                # scene's audio (energy envelope, cached per audio hash), so a cut
+                # never lands mid-word or mid-breath when Whisper's times drift.
+                starts = [words[w].start for w in start_indices]
+                try:
+                    starts[1:] = snap_to_silence(audio_file, audio_hash, starts[1:])
+                except RuntimeError as e:
+                    print(f"    Scene {scene_num}: ⚠️ silence analysis failed ({e}), using word times")
+
+                # Pass 2: duration = gap between consecutive start times.
+                # This naturally includes inter-sentence pauses in the
+                # narrator's delivery, giving each image its full display
+                # window (speech + following pause).
+                scene_raw: list[dict] = []
+                for entry_idx, (img, img_index, sentence, wc) in enumerate(img_entries):
+                    start_time = starts[entry_idx]
+
+                    if entry_idx < len(img_entries) - 1:
+                        end_time = starts[entry_idx + 1]
+                    else:
+                        end_time = words[-1].end
+
+                    dur = round(end_time - start_time, 2)
+                    dur = max(dur, 1.0)
+
+                    scene_raw.append({
+                        "record_id": img["id"],
+                        "image_index": img_index,
+                        "sentence_text": sentence,
+                        "duration": dur,
+                        "display_start": round(start_time, 4),
+                        "display_end": round(end_time, 4),
+                        "word_count": wc,
+                    })
+
+                # Write Whisper-calculated durations to Airtable and cache.
+                # No merging — each image keeps its own duration. If a concept
+                # is too short, that's a signal to fix concept grouping, not
+                # something audio_sync should mask by deleting images.
+                for entry in scene_raw:
+                    record_id = entry["record_id"]
+                    img_index = entry["image_index"]
+                    dur = entry["duration"]
+                    sentence = entry["sentence_text"]
+                    wc = entry["word_count"]
+
+                    image_durations[(scene_num, img_index)] = dur
 
-        # Write to timing directory
-        write_render_config(config, timing_dir / "render_config.json")
+                    try:
+                        self.airtable.images_table.update(
+                            record_id, {"Duration (s)": dur}, typecast=True,
+                        )
+                        duration_updates += 1
+                    except Exception as e:
+                        print(f"      Image {img_index}: ⚠️ Airtable write failed ({e})")
+
+                    total_duration += dur
+                    scene_total += dur
+                    print(f"      Image {img_index}: {dur:.2f}s ({wc}w) — \"{sentence[:50]}...\"")
+
+                scene_durations[scene_num] = scene_total
+                record_scene(sync_state, scene_num, fingerprint, scene_raw)
+                resynced_scenes.append(scene_num)
+
+            save_sync_state(sync_state, timing_dir)
+            if incremental and reused_scenes:
+                print(f"  Incremental: re-synced {len(resynced_scenes)} scene(s), "
+                      f"reused {len(reused_scenes)}")
+
+            # ── Step 4: Build per-IMAGE render config ──
+            # Each image gets its own entry with sentence_text so Remotion can
+            # match words to images precisely. Entries are grouped by scene_number.
+            print(f"  Step 4/4: Writing per-image render config...")
+
+            from audio_sync.render_config_writer import build_render_config, write_render_config
+
+            scene_timed: dict[int, list[dict]] = {}
+            for scene_num in scene_numbers:
+                images = scenes_images[scene_num]
+                for img_idx, img in enumerate(images):
+                    sentence = img.get("Sentence Text", "") or ""
+                    img_index = img.get("Image Index", img_idx + 1)
+
+                    # Look up the enforced duration calculated in Step 3.
+                    # The local scenes_images dict is stale (loaded before Step 3),
+                    # so we use the image_durations cache instead.
+                    dur = image_durations.get((scene_num, img_index), 0)
+                    if dur <= 0:
+                        # Image was absorbed by duration enforcement (merged with
+                        # neighbor) — skip it so render_config.json doesn't include
+                        # a phantom entry.
+                        continue
+                    dur = float(dur)
+
+                    # Use actual composition from image record (Shot Type)
+                    composition = img.get("Shot Type", "") or "wide"
+
+                    scene_timed.setdefault(scene_num, []).append({
+                        "scene_number": scene_num,
+                        "image_index": img_index,
+                        "sentence_text": sentence,
+                        "duration": dur,
+                        "style": "",
+                        "composition": composition,
+                    })
+
+            # One lossless narration track with every scene's sample offset,
+            # recorded in the timeline — the render's audio mix cuts the
+            # scenes from it instead of opening each Scene N.mp3. Reused
+            # while no scene's audio changed.
+            concat_path = timing_dir / NARRATION_FILE
+            try:
+                narration = concat_narration(scene_audio_paths, concat_path)
+                timeline.write_narration(narration)
+                print(f"  Narration track: {len(narration['scenes'])} scenes, "
+                      f"{narration['samples'] / narration['sample_rate']:.1f}s")
+            except RuntimeError as e:
+                print(f"  ⚠️ Narration track failed ({e}) — render mixes the scene files")
+                concat_path = sorted(scene_audio_paths.items())[0][1]
+
+            remotion_dir = _Path(__file__).parent.parent.parent / "remotion-video"
+            image_dir = str(remotion_dir / "public")
+
+            # Every scene is rebuilt from scene_timed, so edits that the scene
+            # fingerprint does not cover (Shot Type) still reach the render;
+            # incremental sync only saves the transcription and Airtable writes.
+            timed_images = retime_images(
+                [img for sn in scene_numbers for img in scene_timed.get(sn, [])]
+            )
+            timed_images = assign_transitions(timed_images)
+            timed_images = assign_ken_burns(timed_images)
+            config = build_render_config(
+                video_id=video_id,
+                audio_path=str(concat_path),
+                scenes=timed_images,
+                image_dir=image_dir,
+            )
 
-        # Also copy to remotion-video/public/ so Remotion can read it at render time
+            try:
+                timeline.write_config(config)
+                timeline_info = timeline.close()
+            except OSError as e:
+                print(f"  ⚠️ Timeline write failed ({e}) — writing render_config.json instead")
+                timeline.abort()
+                timeline_info = None
+
+        # The timeline is the render config; render_config.json is only
+        # written when it could not be, and the old timeline is removed so
+        # load_render_config() doesn't prefer it over the fresh JSON.
         remotion_public = remotion_dir / "public"
-        remotion_public.mkdir(parents=True, exist_ok=True)
-        write_render_config(config, remotion_public / "render_config.json")
+        config_paths = [timing_dir / "render_config.json", remotion_public / "render_config.json"]
+        if timeline_info:
+            print(f"  Timeline: {timeline_info['path']} ({timeline_info['bytes']:,} bytes)")
+            for path in config_paths:
+                path.unlink(missing_ok=True)
+        else:
+            (timing_dir / TIMELINE_FILE).unlink(missing_ok=True)
+            remotion_public.mkdir(parents=True, exist_ok=True)
+            for path in config_paths:
+                write_render_config(config, path)
+                print(f"  Render config: {path}")
 
-        avg_dur = total_duration / max(duration_updates, 1)
+        avg_dur = total_duration / max(len(image_durations), 1)
         print(f"\n  ✅ {duration_updates} image durations written to Airtable")
         print(f"  Avg image duration: {avg_dur:.1f}s")
         print(f"  Total duration: {total_duration:.1f}s")
-        print(f"  Render config: {timing_dir / 'render_config.json'}")
-        print(f"  Remotion config: {remotion_public / 'render_config.json'}")
-        print(f"  Per-image entries: {len(timed_images)}")
+        print(f"  Per-image entries: {len(config['scenes'])}")
 
         return {
             "bot": "Audio Sync",
             "video_title": self.video_title,
             "timing_dir": str(timing_dir),
-            "render_config_path": str(timing_dir / "render_config.json"),
-            "remotion_config_path": str(remotion_public / "render_config.json"),
+            "render_config_path": None if timeline_info else str(config_paths[0]),
+            "remotion_config_path": None if timeline_info else str(config_paths[1]),
             "total_duration": total_duration,
             "scene_count": len(scene_numbers),
-            "image_count": duration_updates,
+            "image_count": sum(len(entries) for entries in scene_timed.values()),
             "avg_duration": round(avg_dur, 2),
             "alignment_quality": "sentence_match",
+            "resynced_scenes": resynced_scenes,
+            "reused_scenes": reused_scenes,
+            "timeline": timeline_info,
         }
 
     async def run_youtube_upload_bot(self) -> dict:
@@ -3688,107 +4051,14 @@ class VideoPipeline:
         2. Drive Image URL (static) from Google Drive
         3. NEVER use Airtable attachment URLs (they expire)
         """
-        # Get all scripts for current video
-        scripts = self.airtable.get_scripts_by_title(self.video_title)
+        from render.props import build_props
 
-        # Get all images for current video
+        scripts = self.airtable.get_scripts_by_title(self.video_title)
         images = self.airtable.get_all_images_for_video(self.video_title)
-
-        # Build Remotion props structure
-        scenes = []
-        for script in scripts:
-            scene_number = script.get("scene", 0)
-            scene_images = [
-                img for img in images
-                if img.get("Scene") == scene_number
-            ]
-
-            # Sort images by index
-            sorted_images = sorted(scene_images, key=lambda x: x.get("Image Index", 0))
-
-            processed_images = []
-            for img in sorted_images:
-                # Check for video clip first (animation pipeline output)
-                video_clip_url = img.get("Video Clip URL")  # Direct Drive URL for video
-                video_attachments = img.get("Video", [])
-
-                # Prefer video clip over static image
-                if video_clip_url:
-                    media_url = video_clip_url
-                    media_type = "video"
-                elif video_attachments:
-                    # Fallback to Video attachment field
-                    media_url = video_attachments[0].get("url", "") if video_attachments else ""
-                    media_type = "video"
-                else:
-                    # Fallback to static image (Drive URL preferred)
-                    media_url = img.get("Drive Image URL") or (
-                        img.get("Image", [{}])[0].get("url", "") if img.get("Image") else ""
-                    )
-                    media_type = "image"
-
-                # Build base asset
-                asset = {
-                    "index": img.get("Image Index", 0),
-                    "url": media_url,
-                    "type": media_type,  # "image" or "video"
-                    "segmentText": img.get("Sentence Text", ""),
-                    "duration": img.get("Duration (s)", 8.0),
-                    "isHeroShot": img.get("Hero Shot", False),
-                    "videoDuration": img.get("Video Duration", 6),
-                }
-
-                # =============================================================
-                # TIMING RECONCILIATION LAYER
-                # Handles mismatch between voiceover duration and clip duration
-                # =============================================================
-                voiceover_duration = asset["duration"]  # from audio timing
-                clip_duration = asset["videoDuration"] if media_type == "video" else None
-
-                if clip_duration is None:
-                    # Static image — use voiceover duration directly (existing behavior)
-                    asset["renderDuration"] = voiceover_duration
-                    asset["playbackRate"] = 1.0
-                elif abs(voiceover_duration - clip_duration) <= 1.5:
-                    # Close enough — adjust playback speed slightly
-                    asset["renderDuration"] = voiceover_duration
-                    asset["playbackRate"] = clip_duration / voiceover_duration if voiceover_duration > 0 else 1.0
-                elif voiceover_duration > clip_duration + 1.5:
-                    # Big gap — hold last frame (or flag for hero shot upgrade)
-                    asset["renderDuration"] = voiceover_duration
-                    asset["playbackRate"] = 1.0
-                    asset["holdLastFrame"] = voiceover_duration - clip_duration
-                else:
-                    # Clip is longer than needed — trim end
-                    asset["renderDuration"] = voiceover_duration
-                    asset["playbackRate"] = 1.0
-                    asset["trimEnd"] = clip_duration - voiceover_duration
-
-                # Per-image sound effect (new image-level system)
-                sfx_attachment = img.get("Sound Effect")
-                if sfx_attachment and isinstance(sfx_attachment, list) and sfx_attachment:
-                    sfx_url = sfx_attachment[0].get("url", "")
-                    if sfx_url:
-                        sfx_filename = f"sfx_{scene_number}_{img.get('Image Index', 0)}.mp3"
-                        asset["sfx"] = f"sfx/{sfx_filename}"
-                        asset["sfxVolume"] = img.get("Sound Volume", 0.15)
-                        asset["sfxUrl"] = sfx_url  # For download during render
-
-                processed_images.append(asset)
-
-            scenes.append({
-                "sceneNumber": scene_number,
-                "text": script.get("Scene text", ""),
-                "voiceUrl": script.get("Voice Over", [{}])[0].get("url", "") if script.get("Voice Over") else "",
-                "images": processed_images,
-            })
-
-        props = {
-            "videoTitle": self.video_title,
-            "folderId": self.project_folder_id,
-            "docId": self.google_doc_id,
-            "scenes": scenes,
-        }
+        props = build_props(
+            self.video_title, scripts, images,
+            folder_id=self.project_folder_id, doc_id=self.google_doc_id,
+        )
 
         return props
 
@@ -4517,9 +4787,13 @@ async def main():
         props = await pipeline.package_for_remotion()
 
         # Write to JSON file in remotion folder
+        from render.props import diff_props, format_diff, load_props, write_props
         output_path = remotion_dir / "props.json"
-        with open(output_path, "w") as f:
-            json.dump(props, f, indent=2)
+        previous = load_props(output_path)
+        if not write_props(output_path, props):
+            print("   props.json unchanged")
+        elif previous is not None:
+            print(f"   Changes: {format_diff(diff_props(previous, props))}")
 
         print(f"\n✅ Remotion export complete!")
         print(f"   Props: {output_path}")
@@ -145,7 +145,8 @@ async def handle_help(message, say):
 - `sync` / `timing` - Run audio sync (Whisper alignment) to calculate scene durations
 - `end images` / `run end images` - Generate end image prompts and images
 - `thumbnail` / `run thumbnail` - Generate thumbnail for idea with "Ready For Thumbnail" status
-- `render` / `run render` - Render videos only (skips other stages, one at a time)
+- `render` / `run render` - Render videos only (skips other stages, runs them through the render queue)
+- `render queue` / `renders` - Show running and waiting renders with ETAs
 - `upload` / `run upload` - Upload a rendered video to YouTube as an unlisted draft
 
 *Animation Pipeline*
@@ -465,6 +466,17 @@ async def handle_queue(message, say):
         await say(f":x: Error checking queue: {e}")
 
 
+@app.message(re.compile(r"^render queue$", re.IGNORECASE))
+@app.message(re.compile(r"^renders$", re.IGNORECASE))
+async def handle_render_queue(message, say):
+    """Show the render queue: running, waiting and orphaned jobs with ETAs."""
+    try:
+        from render.jobqueue import RenderQueue, format_queue
+        await say(format_queue(RenderQueue().snapshot()))
+    except Exception as e:
+        await say(f":x: Error checking render queue: {e}")
+
+
 @app.message(re.compile(r"^skip$", re.IGNORECASE))
 async def handle_skip(message, say):
     """Skip the current pipeline step — advance status to the next stage."""
@@ -1007,13 +1019,13 @@ async def handle_thumbnail(message, say):
 @app.message(re.compile(r"run render", re.IGNORECASE))
 @app.message(re.compile(r"^render$", re.IGNORECASE))
 async def handle_render(message, say):
-    """Render all videos at 'Ready To Render' one at a time."""
+    """Render all videos at 'Ready To Render' through the render queue."""
     global current_process
     if current_process:
         await say(f":x: Already running `{current_task_name}`. Use `stop` to cancel it first.")
         return
 
-    await say(":clapper: Starting render bot — will process videos one at a time...")
+    await say(":clapper: Starting render bot — videos go through the render queue (`render queue` to check)...")
 
     try:
         # Render can take 60-90 min per video, set timeout to 4 hours
@@ -2141,6 +2153,7 @@ Available commands (return one of these EXACTLY):
 - "sync" — run audio sync / Whisper alignment / calculate timing
 - "thumbnail" — generate a thumbnail
 - "render" — render the video
+- "render queue" — show running and waiting renders with ETAs
 - "upload" — upload a rendered video to YouTube as unlisted draft
 - "animate" — run animation pipeline
 - "analytics" — sync YouTube performance metrics (views, CTR, retention) to Airtable
@@ -2273,6 +2286,7 @@ async def handle_fallback(event, say):
         "sync": handle_audio_sync,
         "thumbnail": handle_thumbnail,
         "render": handle_render,
+        "render queue": handle_render_queue,
         "upload": handle_upload,
         "analytics": handle_analytics,
         "animate": handle_animate,
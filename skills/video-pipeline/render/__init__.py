@@ -0,0 +1,61 @@
+"""Render orchestration for the Remotion composition.
+
+Splits the timeline into scene-aligned frame-range chunks, renders them
+as independent (parallel where RAM allows) resumable Remotion jobs, and
+stitches them with a lossless stream-copy concat.  Scene segments are
+cached by content fingerprint so a re-render only redoes changed scenes.
+Before any of that, :func:`normalize_assets` shrinks stills and clips in
+``public/`` to what the composition actually draws.  Videos made only of
+stills can skip Remotion entirely: :func:`render_ffmpeg` compiles the
+render config into ffmpeg filter graphs.  Renders from every entry point
+share one :class:`RenderQueue`, which gives each video its own job
+directory and admits a second concurrent render only when RAM and CPU
+allow.  :class:`RenderTelemetry` records fps, memory and CPU per chunk;
+``python -m render.benchmark`` renders a fixed fixture to track them
+across commits.  :func:`build_props` assembles the composition's props and
+:func:`diff_props` compares them with the last successful render.
+Remotion jobs render from one webpack bundle per composition version
+(:func:`prepare_bundle`) instead of bundling the entry point each time,
+and take their audio from a bed pre-mixed with ffmpeg
+(:func:`premix_audio_bed`) instead of a Remotion audio pass.
+"""
+
+from .assets import asset_file_map, normalize_assets
+from .audio_bed import premix_audio_bed
+from .bundle import BundleError, prepare_bundle
+from .cache import SceneCache, composition_version, scene_fingerprints
+from .chunks import plan_chunks, scene_frame_layout, total_frames
+from .ffmpeg_renderer import needs_remotion, render_ffmpeg, resolve_render_engine
+from .jobqueue import RenderQueue, format_queue, job_dir
+from .orchestrator import RenderError, render_chunked
+from .props import build_props, diff_props, write_props
+from .resources import available_memory_bytes, parallel_render_jobs
+from .telemetry import RenderTelemetry
+
+__all__ = [
+    "asset_file_map",
+    "normalize_assets",
+    "premix_audio_bed",
+    "BundleError",
+    "prepare_bundle",
+    "SceneCache",
+    "composition_version",
+    "scene_fingerprints",
+    "plan_chunks",
+    "scene_frame_layout",
+    "total_frames",
+    "needs_remotion",
+    "render_ffmpeg",
+    "resolve_render_engine",
+    "RenderQueue",
+    "format_queue",
+    "job_dir",
+    "RenderError",
+    "render_chunked",
+    "build_props",
+    "diff_props",
+    "write_props",
+    "available_memory_bytes",
+    "parallel_render_jobs",
+    "RenderTelemetry",
+]
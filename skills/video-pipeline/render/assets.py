@@ -0,0 +1,257 @@
+"""
+Pre-render asset normalization.
+
+Kie.ai stills arrive as multi-megabyte PNGs and Veo clips at arbitrary
+size and frame rate.  Headless Chrome (software GL under swangle) decodes
+every ``<Img>`` at full size, so before rendering each asset in
+``public/`` is brought to what the composition actually draws:
+
+* stills → output resolution × :data:`KEN_BURNS_OVERSCAN` (cover-fit,
+  centre-cropped, never upscaled), re-encoded as JPEG/WebP under a new
+  name (``Scene_01_01.png`` → ``Scene_01_01.jpg``);
+* clips → output resolution at constant ``fps`` H.264, replaced in place.
+
+Work runs in a process pool.  Results go to ``public/asset_manifest.json``;
+:func:`asset_file_map` turns it into the ``assetFiles`` rename map that
+``Main.tsx`` reads from the props.  A failed asset keeps its original file
+— normalization is an optimization, never a reason to abort a render.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .config import (
+    ASSET_MANIFEST_FILE,
+    CLIP_CODEC_ARGS,
+    DEFAULT_FPS,
+    KEN_BURNS_OVERSCAN,
+    NORMALIZED_IMAGE_FORMAT,
+    NORMALIZED_IMAGE_QUALITY,
+)
+from .orchestrator import file_sha256
+from .resources import cpu_count
+
+_EXTENSIONS = {"JPEG": ".jpg", "WEBP": ".webp"}
+
+
+def image_target_size(
+    resolution: dict[str, int] | None,
+    overscan: float = KEN_BURNS_OVERSCAN,
+) -> tuple[int, int]:
+    """Still size for *resolution* with Ken Burns headroom (even numbers)."""
+    width = (resolution or {}).get("width") or 1920
+    height = (resolution or {}).get("height") or 1080
+    return (
+        int(round(width * overscan / 2)) * 2,
+        int(round(height * overscan / 2)) * 2,
+    )
+
+
+def cover_box(src: tuple[int, int], target: tuple[int, int]) -> tuple[tuple[int, int], tuple[int, int, int, int]]:
+    """
+    Resize size and centre crop box that cover-fit *src* onto *target*.
+
+    Mirrors CSS ``object-fit: cover``.  Sources smaller than the target
+    are only cropped to its aspect ratio, never enlarged.
+
+    Returns:
+        ``((resized_w, resized_h), (left, top, right, bottom))``
+    """
+    sw, sh = src
+    tw, th = target
+    scale = min(1.0, max(tw / sw, th / sh))
+    rw, rh = max(1, round(sw * scale)), max(1, round(sh * scale))
+    # Crop to the target aspect within the resized frame.
+    aspect = tw / th
+    cw, ch = (rw, min(rh, round(rw / aspect))) if rw / rh <= aspect else (min(rw, round(rh * aspect)), rh)
+    left, top = (rw - cw) // 2, (rh - ch) // 2
+    return (rw, rh), (left, top, left + cw, top + ch)
+
+
+# ---------------------------------------------------------------------------
+# Workers (top-level so they pickle into the process pool)
+# ---------------------------------------------------------------------------
+
+def normalize_image(job: dict[str, Any]) -> dict[str, Any]:
+    """Resize/re-encode one still. Removes the source on success."""
+    from PIL import Image
+
+    src, dest = Path(job["source"]), Path(job["output"])
+    tmp = dest.with_name(dest.name + ".tmp")
+    with Image.open(src) as img:
+        img.draft("RGB", tuple(job["size"]))  # cheap JPEG pre-shrink
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        size, box = cover_box(img.size, tuple(job["size"]))
+        if size != img.size:
+            img = img.resize(size, Image.LANCZOS)
+        if box != (0, 0, *size):
+            img = img.crop(box)
+        img.save(tmp, format=job["format"], quality=job["quality"], optimize=True)
+        out_size = img.size
+    tmp.replace(dest)
+    if src != dest:
+        src.unlink(missing_ok=True)
+    return {"width": out_size[0], "height": out_size[1]}
+
+
+def normalize_clip(job: dict[str, Any]) -> dict[str, Any]:
+    """Transcode one clip to constant frame rate at output size, in place."""
+    src = Path(job["source"])
+    tmp = src.with_name(src.stem + ".norm.mp4")
+    w, h = job["size"]
+    vf = f"scale={w}:{h}:force_original_aspect_ratio=increase,crop={w}:{h},fps={job['fps']}"
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", "-i", str(src), "-vf", vf,
+           *CLIP_CODEC_ARGS, str(tmp)]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not installed")
+    if result.returncode != 0:
+        tmp.unlink(missing_ok=True)
+        raise RuntimeError(result.stderr.strip()[-300:] or f"ffmpeg exited {result.returncode}")
+    tmp.replace(src)
+    return {"width": w, "height": h, "fps": job["fps"]}
+
+
+def _run(job: dict[str, Any]) -> dict[str, Any]:
+    bytes_in = Path(job["source"]).stat().st_size
+    try:
+        worker = normalize_image if job["kind"] == "image" else normalize_clip
+        info = worker(job)
+    except Exception as e:
+        return {**job, "error": str(e)}
+    out = Path(job["output"])
+    return {**job, **info, "bytes_in": bytes_in, "bytes_out": out.stat().st_size,
+            "output_sha256": file_sha256(out)}
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+def load_asset_manifest(public_dir: str | Path) -> dict[str, Any]:
+    try:
+        return json.loads((Path(public_dir) / ASSET_MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def asset_file_map(manifest: dict[str, Any]) -> dict[str, str]:
+    """``{original_name: normalized_name}`` for assets that were renamed."""
+    return {
+        name: Path(entry["output"]).name
+        for name, entry in manifest.get("assets", {}).items()
+        if "error" not in entry and Path(entry["output"]).name != name
+    }
+
+
+def _already_normalized(entry: dict[str, Any] | None, path: Path, settings: dict[str, Any]) -> bool:
+    return bool(
+        entry and "error" not in entry
+        and entry.get("settings") == settings
+        and path.is_file()
+        and entry.get("output_sha256") == file_sha256(path)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def normalize_assets(
+    public_dir: str | Path,
+    resolution: dict[str, int] | None = None,
+    fps: int = DEFAULT_FPS,
+    *,
+    image_format: str = NORMALIZED_IMAGE_FORMAT,
+    quality: int = NORMALIZED_IMAGE_QUALITY,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Normalize every ``Scene_XX_YY`` still and clip in *public_dir*.
+
+    Args:
+        public_dir: ``remotion-video/public`` after the asset download.
+        resolution: ``{"width", "height"}`` from the render config.
+        fps: Composition frame rate (clips are resampled to it).
+        workers: Process pool size; ``None`` = one per CPU, ``1`` = inline.
+
+    Returns:
+        The manifest ``{version, assets: {name: entry}}``, also written to
+        ``public/asset_manifest.json``.  Entries carry ``output``,
+        ``bytes_in``/``bytes_out`` and ``width``/``height``, or ``error``.
+    """
+    public_dir = Path(public_dir)
+    image_format = image_format.upper()
+    if image_format not in _EXTENSIONS:
+        raise ValueError(f"Unsupported image format {image_format!r} (use JPEG or WEBP)")
+
+    try:
+        import PIL  # noqa: F401
+        has_pil = True
+    except ImportError:
+        print("  ⚠️ Pillow not installed, stills left as-is (pip install Pillow)")
+        has_pil = False
+
+    still_size = image_target_size(resolution)
+    clip_size = image_target_size(resolution, overscan=1.0)
+    image_settings = {"size": list(still_size), "format": image_format, "quality": quality}
+    clip_settings = {"size": list(clip_size), "fps": fps}
+
+    manifest = load_asset_manifest(public_dir)
+    # Entries whose output is gone (public/ was cleaned) are stale.
+    assets: dict[str, Any] = {
+        name: entry for name, entry in manifest.get("assets", {}).items()
+        if (public_dir / entry.get("output", "")).is_file()
+    }
+    jobs = []
+    if has_pil:
+        for src in sorted(public_dir.glob("Scene_*.png")):
+            dest = src.with_suffix(_EXTENSIONS[image_format])
+            jobs.append({"kind": "image", "name": src.name, "source": str(src),
+                         "output": str(dest), "settings": image_settings, **image_settings})
+    for src in sorted(public_dir.glob("Scene_*.mp4")):
+        if _already_normalized(assets.get(src.name), src, clip_settings):
+            continue
+        jobs.append({"kind": "clip", "name": src.name, "source": str(src),
+                     "output": str(src), "settings": clip_settings, **clip_settings})
+
+    if jobs:
+        workers = max(1, min(workers or cpu_count(), len(jobs)))
+        if workers == 1:
+            results = [_run(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_run, jobs))
+        for result in results:
+            entry = {k: result[k] for k in ("kind", "output", "settings")}
+            for key in ("width", "height", "bytes_in", "bytes_out", "output_sha256", "error"):
+                if key in result:
+                    entry[key] = result[key]
+            entry["output"] = Path(entry["output"]).name
+            assets[result["name"]] = entry
+
+    manifest = {"version": 1, "assets": assets}
+    path = public_dir / ASSET_MANIFEST_FILE
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    tmp.replace(path)
+    return manifest
+
+
+def summarize(manifest: dict[str, Any]) -> dict[str, int]:
+    """Counts and byte totals for log lines."""
+    entries = list(manifest.get("assets", {}).values())
+    ok = [e for e in entries if "error" not in e]
+    return {
+        "normalized": len(ok),
+        "failed": len(entries) - len(ok),
+        "bytes_in": sum(e.get("bytes_in", 0) for e in ok),
+        "bytes_out": sum(e.get("bytes_out", 0) for e in ok),
+    }
@@ -0,0 +1,322 @@
+"""
+Pre-mixed audio bed for Remotion renders.
+
+A Remotion render's audio-only pass (``--codec=aac``) mixes every
+``Scene N.mp3`` and per-image SFX inside the headless browser — dozens of
+``<Audio>`` tracks decoded and resampled frame by frame.  This module
+builds the same mix offline with one ffmpeg process, from the render
+config's frame grid, so :func:`~render.orchestrator.render_chunked` only
+renders muted video chunks and muxes the bed in:
+
+* narration starts at its scene's first frame (as ``Main.tsx`` places it)
+  — cut by sample out of the video's single narration track
+  (:mod:`audio_sync.narration`) when the timeline has one that matches
+  the ``Scene N.mp3`` files, so ffmpeg opens one file instead of N;
+* per-image SFX start at their image, trimmed to it and faded as in
+  ``Scene.tsx``;
+* scene-level ``sound_layers`` (legacy Sound Map) span their
+  ``start_segment``..``end_segment`` images with their own volume, fades
+  and looping;
+* every track gets its loudness-normalizing gain, if the video's assets
+  were analyzed (:mod:`audio_sync.loudness`).
+
+The finished track is kept next to a key over the filter graph and every
+input's size and mtime; an unchanged video reuses it instead of mixing
+again.  The ffmpeg engine mixes its audio with the same filter graph.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from .chunks import total_frames
+from .config import AUDIO_BITRATE, DEFAULT_FPS, SFX_FADE_SECONDS
+from .orchestrator import RenderError, file_sha256
+
+
+def bed_sources(
+    plan: list[dict[str, Any]],
+    fps: int,
+    public_dir: Path,
+    sfx: dict[tuple[int, int], dict[str, Any]],
+    sound_layers: dict[int, list[dict[str, Any]]] | None = None,
+    gains: dict[str, float] | None = None,
+    narration: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Every track of the mix, placed on the video timeline.
+
+    Args:
+        plan: :func:`~render.ffmpeg_renderer.build_scene_plan` output.
+        fps: Frame rate of the plan.
+        public_dir: Where ``Scene N.mp3`` and ``sfx/`` live.
+        sfx: ``{(scene_number, image_index): {sfx, sfxVolume}}`` from the
+            props' images.
+        sound_layers: ``{scene_number: [layer]}`` from the props' scenes
+            (``file``, ``start_segment``, ``end_segment``, ``volume``,
+            ``loop``, ``fade_in``, ``fade_out``).
+        gains: ``{asset: dB}`` loudness-normalizing gains
+            (:func:`audio_sync.loudness.asset_gains`), applied on top of
+            each track's volume.
+        narration: The timeline's narration record, checked by
+            :func:`matching_narration`; its scenes are cut from the one
+            track instead of their ``Scene N.mp3``.
+
+    Returns:
+        ``[{file, start, length, volume, loop, fade_in, fade_out}]`` —
+        ``length`` is ``None`` for narration (played whole, unfaded);
+        ``volume`` is ``None`` for unity gain.  Narration cut from the
+        track also has ``segment``: ``(first sample, end sample)``.
+    """
+    sound_layers = sound_layers or {}
+    gains = gains or {}
+    segments = {
+        entry["scene_number"]: (entry["offset_samples"], entry["offset_samples"] + entry["samples"])
+        for entry in (narration or {}).get("scenes", [])
+    }
+
+    def _gain(name: str) -> float:
+        return 10 ** (gains.get(name, 0.0) / 20)
+
+    sources: list[dict[str, Any]] = []
+    for scene in plan:
+        scene_start = scene["start_frame"] / fps
+        voice = f"Scene {scene['scene_number']}.mp3"
+        source = {
+            "file": public_dir / voice,
+            "start": scene_start, "length": None,
+            "volume": round(_gain(voice), 4) if voice in gains else None,
+            "loop": False, "fade_in": 0.0, "fade_out": 0.0,
+        }
+        if scene["scene_number"] in segments:
+            source["file"] = Path(narration["file"])
+            source["segment"] = segments[scene["scene_number"]]
+        sources.append(source)
+        images = scene["images"]
+        for img in images:
+            effect = sfx.get((scene["scene_number"], img["image_index"]))
+            if effect:
+                sources.append({
+                    "file": public_dir / effect["sfx"],
+                    "start": scene_start + img["start"], "length": img["duration"],
+                    "volume": round(effect.get("sfxVolume", 0.15) * _gain(effect["sfx"]), 4),
+                    "loop": False,
+                    "fade_in": SFX_FADE_SECONDS, "fade_out": SFX_FADE_SECONDS,
+                })
+        for layer in sound_layers.get(scene["scene_number"], []):
+            # Segments are 1-based image positions within the scene
+            first = min(max(int(layer.get("start_segment", 1)), 1), len(images))
+            last = min(max(int(layer.get("end_segment", first)), first), len(images))
+            start = images[first - 1]["start"]
+            end = images[last - 1]["start"] + images[last - 1]["duration"]
+            sources.append({
+                "file": public_dir / layer["file"],
+                "start": scene_start + start, "length": end - start,
+                "volume": round(layer.get("volume", 0.1) * _gain(layer["file"]), 4),
+                "loop": bool(layer.get("loop")),
+                "fade_in": layer.get("fade_in", 0.5), "fade_out": layer.get("fade_out", 0.5),
+            })
+    return sources
+
+
+def bed_filter_script(sources: list[dict[str, Any]], total_seconds: float) -> tuple[list[str], str]:
+    """
+    Inputs and ``-filter_complex_script`` body mixing *sources* into ``[mix]``.
+
+    Sources cut from the same file by ``segment`` share one input, split
+    with ``asplit``.
+    """
+    inputs: list[str] = []
+    graph: list[str] = []
+    labels: list[str] = []
+    streams: list[str] = []
+    shared: dict[str, list[int]] = {}
+    for k, source in enumerate(sources):
+        if "segment" in source and str(source["file"]) in shared:
+            shared[str(source["file"])].append(k)
+            streams.append(f"[s{k}]")
+            continue
+        if "segment" in source:
+            shared[str(source["file"])] = [k]
+        if source["loop"]:
+            inputs += ["-stream_loop", "-1"]
+        inputs += ["-i", str(source["file"])]
+        streams.append(f"[{inputs.count('-i') - 1}:a]")
+    for users in shared.values():
+        if len(users) > 1:
+            graph.append(
+                f"{streams[users[0]]}asplit={len(users)}{''.join(f'[s{k}]' for k in users)}"
+            )
+            streams[users[0]] = f"[s{users[0]}]"
+
+    for k, source in enumerate(sources):
+        chain = ""
+        if "segment" in source:
+            first, end = source["segment"]
+            chain = f"atrim=start_sample={first}:end_sample={end},asetpts=PTS-STARTPTS,"
+        length = source["length"]
+        if length is not None:
+            fade_in = min(source["fade_in"], length / 2)
+            fade_out = min(source["fade_out"], length / 2)
+            chain += f"atrim=0:{length:.4f},"
+            if fade_in > 0:
+                chain += f"afade=t=in:d={fade_in:.4f},"
+            if fade_out > 0:
+                chain += f"afade=t=out:st={length - fade_out:.4f}:d={fade_out:.4f},"
+            chain += f"volume={source['volume']:g},"
+        elif source["volume"] is not None:
+            chain += f"volume={source['volume']:g},"
+        ms = int(round(source["start"] * 1000))
+        graph.append(f"{streams[k]}{chain}adelay={ms}:all=1[a{k}]")
+        labels.append(f"[a{k}]")
+    graph.append(
+        f"{''.join(labels)}amix=inputs={len(labels)}:duration=longest:normalize=0,"
+        f"apad,atrim=0:{total_seconds:.4f}[mix]"
+    )
+    return inputs, ";\n".join(graph)
+
+
+def props_sfx(props: dict[str, Any], public_dir: Path) -> dict[tuple[int, int], dict[str, Any]]:
+    """Per-image SFX of the props whose files are on disk."""
+    return {
+        (scene.get("sceneNumber"), img.get("index")): img
+        for scene in props.get("scenes", [])
+        for img in scene.get("images", [])
+        if img.get("sfx") and (public_dir / img["sfx"]).is_file()
+    }
+
+
+def props_sound_layers(props: dict[str, Any], public_dir: Path) -> dict[int, list[dict[str, Any]]]:
+    """Scene-level sound layers of the props whose files are on disk."""
+    layers: dict[int, list[dict[str, Any]]] = {}
+    for scene in props.get("scenes", []):
+        found = [
+            layer for layer in scene.get("sound_layers") or []
+            if layer.get("file") and (public_dir / layer["file"]).is_file()
+        ]
+        if found:
+            layers[scene.get("sceneNumber")] = found
+    return layers
+
+
+def matching_narration(
+    narration: dict[str, Any] | None,
+    public_dir: Path,
+    plan: list[dict[str, Any]],
+) -> dict[str, Any] | None:
+    """
+    *narration* if it can stand in for the plan's ``Scene N.mp3`` files.
+
+    The track must be on disk at its recorded size and hold every scene
+    of the plan, each cut from the same bytes as the ``Scene N.mp3`` in
+    *public_dir* — a voice over regenerated since the sync falls back to
+    the per-scene files.
+    """
+    if not narration:
+        return None
+    track = Path(narration.get("file", ""))
+    if not track.is_file() or track.stat().st_size != narration.get("bytes"):
+        return None
+    scenes = {entry["scene_number"]: entry for entry in narration.get("scenes", [])}
+    for scene in plan:
+        entry = scenes.get(scene["scene_number"])
+        voice = public_dir / f"Scene {scene['scene_number']}.mp3"
+        if not entry or not voice.is_file() or file_sha256(voice) != entry["sha256"]:
+            return None
+    return narration
+
+
+def _bed_key(inputs: list[str], script: str) -> str:
+    """Hash of the mix and the size/mtime of every input file."""
+    files = [inputs[i + 1] for i, arg in enumerate(inputs) if arg == "-i"]
+    stats = []
+    for name in files:
+        st = Path(name).stat()
+        stats.append([name, st.st_size, st.st_mtime_ns])
+    payload = json.dumps({"script": script, "inputs": stats, "bitrate": AUDIO_BITRATE})
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def premix_audio_bed(
+    public_dir: str | Path,
+    render_config: dict[str, Any],
+    output_file: str | Path,
+    *,
+    props: dict[str, Any] | None = None,
+    fps: int | None = None,
+    gains: dict[str, float] | None = None,
+    narration: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Mix the whole video's audio into *output_file* (AAC) with ffmpeg.
+
+    Args:
+        public_dir: ``remotion-video/public`` with the narration and SFX.
+        render_config: The render config the video is rendered from.
+        output_file: The bed, e.g. ``out/audio_bed/{video_id}.aac``; a
+            ``.json`` key file is kept next to it.
+        props: The Remotion props — supplies ``assetFiles``, per-image
+            SFX and scene ``sound_layers``.
+        gains: ``{asset: dB}`` loudness-normalizing gains, e.g. from the
+            timeline's loudness record.
+        narration: The timeline's narration record; used when it matches
+            the ``Scene N.mp3`` files (:func:`matching_narration`).
+
+    Returns:
+        ``{output, sources, reused, elapsed}``
+
+    Raises:
+        RenderError: ffmpeg is missing or failed, or a scene's narration
+            is missing.
+    """
+    from .ffmpeg_renderer import _run_ffmpeg, build_scene_plan
+
+    public_dir = Path(public_dir).resolve()
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    props = props or {}
+    fps = fps or render_config.get("fps") or DEFAULT_FPS
+    start = time.time()
+
+    plan = build_scene_plan(render_config, fps, public_dir, props.get("assetFiles"))
+    sources = bed_sources(
+        plan, fps, public_dir, props_sfx(props, public_dir), props_sound_layers(props, public_dir),
+        gains, matching_narration(narration, public_dir, plan),
+    )
+    missing = [s["file"].name for s in sources if not s["file"].is_file()]
+    if missing:
+        raise RenderError(f"{len(missing)} narration file(s) missing", ", ".join(missing[:5]))
+
+    inputs, script = bed_filter_script(sources, total_frames(render_config, fps) / fps)
+    key = _bed_key(inputs, script)
+    key_file = output_file.with_suffix(".json")
+    try:
+        reusable = output_file.is_file() and json.loads(key_file.read_text()).get("key") == key
+    except (OSError, ValueError):
+        reusable = False
+    if reusable:
+        return {"output": str(output_file), "sources": len(sources), "reused": True,
+                "elapsed": time.time() - start}
+
+    work_dir = output_file.parent
+    part = output_file.with_name(output_file.stem + ".part" + output_file.suffix)
+    filter_file = work_dir / f"{output_file.stem}.filter"
+    filter_file.write_text(script)
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", *inputs,
+           "-filter_complex_script", filter_file.name, "-map", "[mix]",
+           "-c:a", "aac", "-b:a", AUDIO_BITRATE, part.name]
+    try:
+        code, err = _run_ffmpeg(cmd, work_dir)
+    finally:
+        filter_file.unlink(missing_ok=True)
+    if code != 0 or not part.is_file():
+        part.unlink(missing_ok=True)
+        raise RenderError(f"audio bed mix failed (ffmpeg exited {code})", err)
+    part.replace(output_file)
+    key_file.write_text(json.dumps({"key": key, "sources": len(sources)}))
+    return {"output": str(output_file), "sources": len(sources), "reused": False,
+            "elapsed": time.time() - start}
@@ -0,0 +1,262 @@
+"""
+Benchmark: render a fixed synthetic video through the real render path.
+
+Usage:
+    python -m render.benchmark                   # Remotion, chunked
+    python -m render.benchmark --engine ffmpeg
+    python -m render.benchmark --raw-assets      # skip normalization
+    python -m render.benchmark --check           # exit 1 on an fps regression
+
+The fixture (``render/fixtures/benchmark_render_config.json``) is a
+60 s, six-scene video covering every scene type the telemetry reports:
+plain stills, transition-heavy scenes (0.8 s fades on 1.5 s sentences,
+dips to black) and clip scenes.  Assets are generated deterministically
+at Kie.ai / Veo sizes (2752×1536 PNG stills, 720p30 clips, a tone per
+scene), so a run measures the composition, ``remotion.config.ts`` and the
+asset pipeline, not the network.  Needs ffmpeg, Pillow and the Remotion
+project's ``node_modules``.
+
+Each run appends its telemetry record (tagged with the git commit and
+composition hash) to ``remotion-video/out/telemetry/benchmarks.jsonl`` and
+is compared with the previous run on the same host, engine and asset mode.
+The ffmpeg engine can't draw clips, so its runs render those entries as
+stills.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from .assets import asset_file_map, normalize_assets, summarize
+from .cache import composition_version
+from .config import BENCHMARK_FILE, BENCHMARK_REGRESSION_PCT, TELEMETRY_DIR
+from .ffmpeg_renderer import render_ffmpeg
+from .jobqueue import REMOTION_DIR
+from .orchestrator import file_sha256, render_chunked
+from .telemetry import RenderTelemetry, append_record, format_summary, load_records
+
+FIXTURE = Path(__file__).parent / "fixtures" / "benchmark_render_config.json"
+STILL_SIZE = (2752, 1536)
+CLIP_SIZE = (1280, 720)
+
+
+def load_fixture(path: str | Path = FIXTURE) -> dict[str, Any]:
+    return json.loads(Path(path).read_text())
+
+
+# ---------------------------------------------------------------------------
+# Synthetic assets
+# ---------------------------------------------------------------------------
+
+def _ffmpeg(*args: str) -> None:
+    try:
+        result = subprocess.run(["ffmpeg", "-y", "-loglevel", "error", *args],
+                                capture_output=True, text=True)
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not installed")
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip()[-300:])
+
+
+def _still(path: Path, seed: int) -> None:
+    """Gradient + noise: compresses like a photo, not like a flat fill."""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    w, h = STILL_SIZE
+    base = Image.linear_gradient("L").resize((w, h)).convert("RGB")
+    tint = Image.new("RGB", (w, h), tuple(rng.randrange(40, 220) for _ in range(3)))
+    noise = Image.effect_noise((w, h), 48).convert("RGB")
+    Image.blend(Image.blend(base, tint, 0.5), noise, 0.2).save(path)
+
+
+def build_assets(public_dir: str | Path, config: dict[str, Any]) -> dict[str, str]:
+    """
+    Write the fixture's stills, clips and scene audio into *public_dir*.
+
+    Returns:
+        ``assetFiles`` entries for the clips (``Scene_XX_YY.png`` →
+        ``Scene_XX_YY.mp4``) — Main.tsx draws a clip when the name it
+        resolves ends in ``.mp4``.
+    """
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        raise RuntimeError("Pillow not installed (pip install Pillow)")
+    public_dir = Path(public_dir)
+    public_dir.mkdir(parents=True, exist_ok=True)
+    clips = {}
+    scene_seconds: dict[int, float] = {}
+    for i, entry in enumerate(config["scenes"]):
+        sn, idx = entry["scene_number"], entry["image_index"]
+        scene_seconds[sn] = scene_seconds.get(sn, 0) + entry["display_duration"]
+        name = f"Scene_{sn:02d}_{idx:02d}"
+        if entry.get("type") == "video":
+            w, h = CLIP_SIZE
+            _ffmpeg("-f", "lavfi", "-i", f"testsrc2=size={w}x{h}:rate=30",
+                    "-t", str(entry["display_duration"]), "-pix_fmt", "yuv420p",
+                    "-c:v", "libx264", "-preset", "veryfast", str(public_dir / f"{name}.mp4"))
+            clips[f"{name}.png"] = f"{name}.mp4"
+        else:
+            _still(public_dir / f"{name}.png", seed=i)
+    for sn, seconds in scene_seconds.items():
+        _ffmpeg("-f", "lavfi", "-i", f"sine=frequency={180 + 20 * sn}:duration={seconds}",
+                "-c:a", "libmp3lame", "-b:a", "128k", str(public_dir / f"Scene {sn}.mp3"))
+    return clips
+
+
+def build_props(config: dict[str, Any], asset_files: dict[str, str]) -> dict[str, Any]:
+    by_scene: dict[int, list[dict[str, Any]]] = {}
+    for entry in config["scenes"]:
+        by_scene.setdefault(entry["scene_number"], []).append(
+            {"index": entry["image_index"], "segmentText": entry.get("sentence_text", "")}
+        )
+    return {
+        "videoTitle": "Render benchmark",
+        "renderConfig": config,
+        "assetFiles": asset_files,
+        "scenes": [{"sceneNumber": sn, "images": imgs} for sn, imgs in sorted(by_scene.items())],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Run / compare
+# ---------------------------------------------------------------------------
+
+def _git_commit(cwd: Path) -> str:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=cwd,
+                                capture_output=True, text=True)
+    except FileNotFoundError:
+        return ""
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def run(
+    engine: str = "remotion",
+    remotion_dir: str | Path = REMOTION_DIR,
+    *,
+    raw_assets: bool = False,
+    max_parallel: int | None = None,
+    keep: bool = False,
+) -> dict[str, Any]:
+    """Render the fixture once and return its telemetry record."""
+    remotion_dir = Path(remotion_dir)
+    config = load_fixture()
+    if engine == "ffmpeg":
+        # The fast path has no clip support: its runs draw stills there.
+        for entry in config["scenes"]:
+            if entry.get("type") == "video":
+                entry["type"] = "image"
+                entry.pop("video_clip_path", None)
+    work = remotion_dir / "out" / "benchmark"
+    shutil.rmtree(work, ignore_errors=True)
+    public_dir = work / "public"
+
+    print("  🧪 Generating fixture assets...")
+    asset_files = build_assets(public_dir, config)
+    asset_bytes_in = sum(p.stat().st_size for p in public_dir.iterdir() if p.is_file())
+    normalize_seconds = 0.0
+    if not raw_assets:
+        t0 = time.time()
+        manifest = normalize_assets(public_dir, config["resolution"], config["fps"])
+        normalize_seconds = time.time() - t0
+        asset_files.update(asset_file_map(manifest))
+        stats = summarize(manifest)
+        print(f"  🗜️ Normalized {stats['normalized']} assets in {normalize_seconds:.1f}s")
+    asset_bytes = sum(p.stat().st_size for p in public_dir.iterdir() if p.is_file())
+
+    props_file = work / "props.json"
+    props_file.write_text(json.dumps(build_props(config, asset_files)))
+    telemetry = RenderTelemetry(config, engine=engine, label="benchmark")
+    output = work / "benchmark.mp4"
+    print(f"  🎥 Rendering fixture with {engine}...")
+    if engine == "ffmpeg":
+        stats = render_ffmpeg(public_dir, output, config, work_dir=work / "ffmpeg",
+                              props=build_props(config, asset_files),
+                              max_parallel=max_parallel, telemetry=telemetry)
+    else:
+        stats = render_chunked(remotion_dir, props_file, output, config,
+                               work_dir=work / "chunks", max_parallel=max_parallel,
+                               public_dir=public_dir, telemetry=telemetry)
+
+    record = telemetry.summary(
+        ok=True,
+        benchmark=True,
+        fixture_sha256=file_sha256(FIXTURE),
+        commit=_git_commit(remotion_dir),
+        composition=composition_version(remotion_dir)[:12],
+        raw_assets=raw_assets,
+        asset_bytes_in=asset_bytes_in,
+        asset_bytes=asset_bytes,
+        normalize_seconds=round(normalize_seconds, 2),
+        output_bytes=output.stat().st_size,
+        **{k: stats[k] for k in ("chunks", "parallel")},
+    )
+    if not keep:
+        shutil.rmtree(work, ignore_errors=True)
+    return record
+
+
+def previous(records: list[dict[str, Any]], record: dict[str, Any]) -> dict[str, Any] | None:
+    """Last successful run comparable with *record* (host, engine, fixture, asset mode)."""
+    keys = ("host", "engine", "fixture_sha256", "raw_assets")
+    for old in reversed(records):
+        if old.get("ok") and all(old.get(k) == record.get(k) for k in keys):
+            return old
+    return None
+
+
+def fps_change_pct(old: dict[str, Any], new: dict[str, Any]) -> float | None:
+    if not old.get("fps") or new.get("fps") is None:
+        return None
+    return 100 * (new["fps"] - old["fps"]) / old["fps"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--engine", choices=["remotion", "ffmpeg"], default="remotion")
+    parser.add_argument("--raw-assets", action="store_true",
+                        help="render the full-size PNGs / clips without normalization")
+    parser.add_argument("--parallel", type=int, default=None, help="chunk jobs (default: sized from RAM)")
+    parser.add_argument("--keep", action="store_true", help="keep out/benchmark/ for inspection")
+    parser.add_argument("--check", action="store_true",
+                        help=f"exit 1 if fps dropped more than {BENCHMARK_REGRESSION_PCT:.0f}%%")
+    parser.add_argument("--remotion-dir", type=Path, default=REMOTION_DIR)
+    args = parser.parse_args()
+
+    record = run(args.engine, args.remotion_dir, raw_assets=args.raw_assets,
+                 max_parallel=args.parallel, keep=args.keep)
+    history_file = args.remotion_dir / TELEMETRY_DIR / BENCHMARK_FILE
+    prev = previous(load_records(history_file), record)
+    append_record(history_file, record)
+
+    print(f"\n  📈 {format_summary(record)}")
+    print(f"     {record['rendered_frames']} frames in {record['elapsed']:.1f}s "
+          f"({record['parallel']} parallel), commit {record['commit'] or '?'}")
+    print(f"\n  {'scene type':<18} {'scenes':>6} {'frames':>7} {'seconds':>8} {'fps':>7}")
+    for kind, row in sorted(record["scene_types"].items()):
+        print(f"  {kind:<18} {row['scenes']:>6} {row['frames']:>7} {row['seconds']:>8.1f} "
+              f"{row['fps'] or 0:>7.1f}")
+
+    if prev is None:
+        print("\n  No previous run to compare with.")
+        return
+    change = fps_change_pct(prev, record)
+    print(f"\n  vs {prev.get('commit') or '?'} ({prev['started_at']}): "
+          f"{prev['fps']:.1f} → {record['fps']:.1f} fps ({change:+.1f}%)")
+    if args.check and change is not None and change < -BENCHMARK_REGRESSION_PCT:
+        print(f"  ❌ Render throughput regressed by more than {BENCHMARK_REGRESSION_PCT:.0f}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Pre-built Remotion bundle, shared by every render of the same code.
+
+``npx remotion render src/index.ts ...`` runs webpack before it renders a
+single frame, and the chunked renderer starts one such process per chunk.
+Render data no longer lives in the bundle — ``renderConfig``, the scene
+list and the asset map all arrive through ``--props`` — so the bundle
+only depends on the composition code and can be built once per
+:func:`~render.cache.composition_version` (``src/``, ``remotion.config.ts``,
+``package-lock.json``) under ``remotion-video/out/bundles/<version>/``.
+
+The cached bundle is built with an empty public dir, so no video's assets
+are baked in.  Each render gets a view of it in its work dir
+(:func:`bundle_view`): symlinks to the bundle's files plus ``public`` →
+that job's asset directory, which is what Remotion serves
+``staticFile()`` from when it is handed a bundle directory.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from .config import BUNDLE_CACHE_DIR, BUNDLE_CACHE_KEEP, BUNDLE_TIMEOUT_SECONDS
+
+VIEW_DIRNAME = "bundle"
+
+
+class BundleError(RuntimeError):
+    """``npx remotion bundle`` failed."""
+
+
+def _prune(cache_dir: Path, keep: int) -> None:
+    bundles = sorted(
+        (p for p in cache_dir.iterdir() if p.is_dir() and (p / "index.html").is_file()),
+        key=lambda p: p.stat().st_mtime, reverse=True,
+    )
+    for old in bundles[keep:]:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def ensure_bundle(
+    remotion_dir: str | Path,
+    cache_dir: str | Path | None = None,
+    *,
+    keep: int = BUNDLE_CACHE_KEEP,
+    timeout: float = BUNDLE_TIMEOUT_SECONDS,
+) -> Path:
+    """
+    The bundle for the current composition code, building it if needed.
+
+    Concurrent callers (two queued renders) wait on a lock instead of
+    bundling twice.
+
+    Raises:
+        BundleError: The bundle step failed or ran past *timeout*.
+    """
+    from .cache import composition_version
+
+    remotion_dir = Path(remotion_dir)
+    cache_dir = Path(cache_dir) if cache_dir else remotion_dir / BUNDLE_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    bundle = cache_dir / composition_version(remotion_dir)[:16]
+
+    with open(cache_dir / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if (bundle / "index.html").is_file():
+            os.utime(bundle)  # most recently used, for pruning
+            return bundle
+
+        print(f"  📦 Bundling Remotion composition ({bundle.name})...")
+        tmp = Path(tempfile.mkdtemp(prefix=f"{bundle.name}.", dir=cache_dir))
+        empty_public = tmp / "empty-public"
+        empty_public.mkdir()
+        out = tmp / "out"
+        cmd = ["npx", "remotion", "bundle", f"--out-dir={out}", f"--public-dir={empty_public}"]
+        try:
+            result = subprocess.run(cmd, cwd=remotion_dir, capture_output=True, text=True,
+                                    timeout=timeout)
+        except FileNotFoundError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise BundleError("npx not found")
+        except subprocess.TimeoutExpired:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise BundleError(f"remotion bundle timed out after {timeout:.0f}s")
+        if result.returncode != 0 or not (out / "index.html").is_file():
+            shutil.rmtree(tmp, ignore_errors=True)
+            tail = (result.stderr or result.stdout).strip()[-300:]
+            raise BundleError(f"remotion bundle exited {result.returncode}: {tail}")
+        shutil.rmtree(out / "public", ignore_errors=True)
+        shutil.rmtree(bundle, ignore_errors=True)  # leftover of an interrupted build
+        out.replace(bundle)
+        shutil.rmtree(tmp, ignore_errors=True)
+        _prune(cache_dir, keep)
+    return bundle
+
+
+def bundle_view(bundle: str | Path, public_dir: str | Path, work_dir: str | Path) -> Path:
+    """
+    ``<work_dir>/bundle``: *bundle*'s files with ``public`` → *public_dir*.
+
+    Symlinks only, rebuilt on every call; pass the returned directory to
+    ``npx remotion render`` as the serve URL.
+    """
+    bundle = Path(bundle).resolve()
+    view = Path(work_dir) / VIEW_DIRNAME
+    shutil.rmtree(view, ignore_errors=True)
+    view.mkdir(parents=True)
+    for entry in bundle.iterdir():
+        if entry.name != "public":
+            (view / entry.name).symlink_to(entry)
+    (view / "public").symlink_to(Path(public_dir).resolve(), target_is_directory=True)
+    return view
+
+
+def prepare_bundle(remotion_dir: str | Path, public_dir: str | Path | None, work_dir: str | Path) -> Path | None:
+    """
+    Serve URL for one render, or None to render from the entry point.
+
+    Bundling is an optimization: if it fails the render still runs, with
+    each job bundling for itself as before.
+    """
+    remotion_dir = Path(remotion_dir)
+    try:
+        bundle = ensure_bundle(remotion_dir)
+    except BundleError as e:
+        print(f"  ⚠️ Pre-bundling failed, rendering from the entry point: {e}")
+        return None
+    return bundle_view(bundle, public_dir or remotion_dir / "public", work_dir)
@@ -0,0 +1,230 @@
+"""
+Scene-level render cache.
+
+Every scene's muted video segment is keyed by a fingerprint of everything
+that reaches its pixels:
+
+* its ``renderConfig`` entries (Ken Burns, transitions, sentence text,
+  narration times) with ``display_*`` and ``narration_*`` made relative
+  to the scene start, so a longer scene 3 doesn't invalidate scenes 4..N;
+* the bytes of its ``Scene_XX_YY`` images / clips and ``Scene N.mp3``;
+* the visual fields of its props scene (audio-only keys dropped);
+* its frame count, fps, resolution and render flags;
+* the composition code version (:func:`composition_version`).
+
+``Main.tsx`` places scenes in non-overlapping Sequences, so a segment
+rendered at one timeline position is valid at any other.  Segments live
+content-addressed under the cache directory and are hard-linked in and
+out of the per-video work directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+from .chunks import scene_frame_layout
+from .config import (
+    AUDIO_ONLY_PROPS_KEYS,
+    COMPOSITION_SOURCES,
+    DEFAULT_COMPOSITION,
+    DEFAULT_FPS,
+    REMOTION_RENDER_FLAGS,
+    SCENE_CACHE_MAX_GB,
+)
+from .orchestrator import file_sha256
+
+# Legacy caption JSON under src/ is no longer read by the composition.
+_IGNORED_SOURCE_DIRS = {"captions", "node_modules", "__pycache__"}
+_MEDIA_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".mp4"}
+
+
+def _digest(payload: Any) -> str:
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def composition_version(remotion_dir: str | Path) -> str:
+    """SHA-256 over the composition sources (paths and contents)."""
+    remotion_dir = Path(remotion_dir)
+    h = hashlib.sha256()
+    for rel in COMPOSITION_SOURCES:
+        root = remotion_dir / rel
+        if root.is_file():
+            files = [root]
+        elif root.is_dir():
+            files = sorted(
+                p for p in root.rglob("*")
+                if p.is_file() and not _IGNORED_SOURCE_DIRS & set(p.relative_to(root).parts)
+            )
+        else:
+            continue
+        for path in files:
+            h.update(path.relative_to(remotion_dir).as_posix().encode() + b"\0")
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+def _relative_entries(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    entries = sorted(entries, key=lambda e: (e.get("display_start", 0), e.get("image_index", 0)))
+    offset = entries[0].get("display_start", 0) if entries else 0
+    out = []
+    for entry in entries:
+        rel = {k: v for k, v in entry.items() if k != "image_path"}
+        for key in ("display_start", "display_end", "narration_start", "narration_end"):
+            if key in rel:
+                rel[key] = round(rel[key] - offset, 4)
+        out.append(rel)
+    return out
+
+
+def _visual_props(scene: dict[str, Any] | None) -> dict[str, Any] | None:
+    if scene is None:
+        return None
+    visual = {k: v for k, v in scene.items() if k not in AUDIO_ONLY_PROPS_KEYS and k != "images"}
+    visual["images"] = [
+        {k: v for k, v in img.items() if k not in AUDIO_ONLY_PROPS_KEYS}
+        for img in scene.get("images", [])
+    ]
+    return visual
+
+
+def _scene_files(public_dir: Path, scene_number: int) -> list[tuple[str, str]]:
+    media = sorted(
+        p for p in public_dir.glob(f"Scene_{scene_number:02d}_*")
+        if p.suffix.lower() in _MEDIA_SUFFIXES
+    )
+    audio = public_dir / f"Scene {scene_number}.mp3"
+    if audio.is_file():
+        media.append(audio)
+    return [(p.name, file_sha256(p)) for p in media]
+
+
+def scene_fingerprints(
+    render_config: dict[str, Any],
+    public_dir: str | Path,
+    code_version: str,
+    props: dict[str, Any] | None = None,
+    fps: int | None = None,
+) -> dict[int, str]:
+    """
+    Fingerprint of every scene in the frame layout.
+
+    Args:
+        render_config: The config embedded in the props.
+        public_dir: ``remotion-video/public`` with the downloaded assets.
+        code_version: :func:`composition_version` of the Remotion project.
+        props: The full props (its ``scenes`` list supplies the fallback
+            segment text and clip playback fields).
+        fps: Defaults to ``render_config["fps"]``.
+
+    Returns:
+        ``{scene_number: sha256_hex}``
+    """
+    public_dir = Path(public_dir)
+    fps = fps or render_config.get("fps") or DEFAULT_FPS
+    by_scene: dict[int, list[dict[str, Any]]] = {}
+    for entry in render_config.get("scenes", []):
+        by_scene.setdefault(entry.get("scene_number", 0), []).append(entry)
+    props_scenes = {s.get("sceneNumber"): s for s in (props or {}).get("scenes", [])}
+    common = {
+        "code": code_version,
+        "fps": fps,
+        "resolution": render_config.get("resolution"),
+        "flags": REMOTION_RENDER_FLAGS,
+    }
+
+    fingerprints = {}
+    for span in scene_frame_layout(render_config, fps):
+        sn = span["scene_number"]
+        fingerprints[sn] = _digest({
+            **common,
+            "frames": span["duration_frames"],
+            "entries": _relative_entries(by_scene.get(sn, [])),
+            "files": _scene_files(public_dir, sn),
+            "props": _visual_props(props_scenes.get(sn)),
+        })
+    return fingerprints
+
+
+def chunk_key(
+    chunk: dict[str, Any],
+    fingerprints: dict[int, str],
+    composition: str = DEFAULT_COMPOSITION,
+) -> str | None:
+    """Cache key of a chunk, or ``None`` if any of its scenes is unknown."""
+    if not chunk["scenes"] or any(sn not in fingerprints for sn in chunk["scenes"]):
+        return None
+    return _digest({
+        "composition": composition,
+        "scenes": [fingerprints[sn] for sn in chunk["scenes"]],
+        # The final chunk also carries Root.tsx's rounding tail.
+        "frames": chunk["end_frame"] - chunk["start_frame"] + 1,
+    })
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+class SceneCache:
+    """Content-addressed store of rendered segments (``<key[:2]>/<key>.mp4``)."""
+
+    __slots__ = ("root", "max_bytes")
+
+    def __init__(self, root: str | Path, max_gb: float = SCENE_CACHE_MAX_GB) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_gb * 1024 ** 3)
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.mp4"
+
+    def restore(self, key: str, dest: Path) -> bool:
+        """Link the cached segment for *key* to *dest*. False on a miss."""
+        path = self.path_for(key)
+        if not path.is_file():
+            return False
+        _link_or_copy(path, dest)
+        os.utime(path)  # LRU recency
+        return True
+
+    def store(self, key: str, src: Path) -> None:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        _link_or_copy(src, tmp)
+        tmp.replace(path)
+
+    def prune(self) -> int:
+        """Drop least-recently-used segments above ``max_bytes``. Returns count removed."""
+        if not self.root.is_dir():
+            return 0
+        entries = []
+        for path in self.root.glob("*/*.mp4"):
+            st = path.stat()
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,96 @@
+"""
+Frame layout and chunk planning for the ``Main`` composition.
+
+:func:`scene_frame_layout` reproduces ``Main.tsx``'s Sequence placement
+(each scene lasts ``ceil((Σ display_duration + 1 s) × fps)`` frames, in
+ascending scene-number order) and :func:`total_frames` reproduces
+``Root.tsx``'s ``durationInFrames``.  Chunks are whole scenes grouped to
+roughly ``CHUNK_TARGET_SECONDS`` so that every cut lands on a scene
+boundary — never mid-crossfade.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .config import CHUNK_TARGET_SECONDS, DEFAULT_FPS, SCENE_END_BUFFER_SECONDS
+
+
+def scene_frame_layout(
+    config: dict[str, Any],
+    fps: int = DEFAULT_FPS,
+) -> list[dict[str, Any]]:
+    """
+    Frame span of every scene as placed by ``Main.tsx``.
+
+    Returns:
+        ``[{scene_number, start_frame, duration_frames}, ...]`` in render
+        order.  Scenes with no positive duration are skipped, exactly as
+        Main.tsx skips them.
+    """
+    durations: dict[int, float] = {}
+    for entry in config.get("scenes", []):
+        sn = entry.get("scene_number", 0)
+        durations[sn] = durations.get(sn, 0) + entry.get("display_duration", 0)
+
+    layout = []
+    cursor = 0
+    for sn in sorted(durations):
+        if durations[sn] <= 0:
+            continue
+        frames = math.ceil((durations[sn] + SCENE_END_BUFFER_SECONDS) * fps)
+        layout.append({"scene_number": sn, "start_frame": cursor, "duration_frames": frames})
+        cursor += frames
+    return layout
+
+
+def total_frames(config: dict[str, Any], fps: int = DEFAULT_FPS) -> int:
+    """``durationInFrames`` of the ``Main`` composition (Root.tsx)."""
+    scene_numbers = {e.get("scene_number", 0) for e in config.get("scenes", [])}
+    scene_count = len(scene_numbers) or 20
+    total = config.get("total_duration_seconds") or 0
+    if total > 0:
+        return math.ceil((total + scene_count * SCENE_END_BUFFER_SECONDS) * fps)
+    summed = sum(s["duration_frames"] for s in scene_frame_layout(config, fps))
+    return summed or math.ceil(25 * 60 * fps)
+
+
+def plan_chunks(
+    config: dict[str, Any],
+    fps: int = DEFAULT_FPS,
+    target_seconds: float = CHUNK_TARGET_SECONDS,
+) -> list[dict[str, Any]]:
+    """
+    Split the timeline into scene-aligned frame ranges.
+
+    Returns:
+        ``[{index, start_frame, end_frame, scenes}, ...]`` where
+        ``end_frame`` is inclusive (Remotion ``--frames=start-end``).  The
+        ranges are contiguous and together cover ``0 .. total_frames - 1``.
+    """
+    total = total_frames(config, fps)
+    target = max(1, int(target_seconds * fps))
+
+    chunks: list[dict[str, Any]] = []
+    current: list[int] = []
+    start = 0
+    for scene in scene_frame_layout(config, fps):
+        if scene["start_frame"] >= total:
+            break
+        current.append(scene["scene_number"])
+        end = scene["start_frame"] + scene["duration_frames"]
+        if end - start >= target:
+            chunks.append({"start_frame": start, "end_frame": min(end, total) - 1, "scenes": current})
+            current, start = [], end
+    if start < total:
+        if current or not chunks:
+            chunks.append({"start_frame": start, "end_frame": total - 1, "scenes": current})
+        else:
+            # Trailing frames past the last scene (Root rounds up) join
+            # the final chunk rather than becoming an empty one.
+            chunks[-1]["end_frame"] = total - 1
+
+    for i, chunk in enumerate(chunks):
+        chunk["index"] = i
+    return chunks
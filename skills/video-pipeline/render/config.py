@@ -0,0 +1,240 @@
+"""
+Configuration constants for the render orchestrator.
+
+Frame-layout constants mirror ``remotion-video/src/Root.tsx`` and
+``Main.tsx`` — keep them in sync or chunk boundaries will drift from the
+composition's scene Sequences.
+"""
+
+# ---------------------------------------------------------------------------
+# Composition layout (must match remotion-video/src)
+# ---------------------------------------------------------------------------
+DEFAULT_FPS: int = 24
+"""Root.tsx ``FPS``."""
+
+SCENE_END_BUFFER_SECONDS: float = 1.0
+"""Main.tsx / Root.tsx trail-off buffer appended to every scene."""
+
+DEFAULT_COMPOSITION: str = "Main"
+"""Remotion composition id rendered by the pipeline."""
+
+# ---------------------------------------------------------------------------
+# Chunking
+# ---------------------------------------------------------------------------
+CHUNK_TARGET_SECONDS: float = 120.0
+"""Chunks are whole scenes grouped until they reach ~2 minutes.  Small
+enough that a crash loses little work, large enough that per-chunk
+browser start-up (~10 s) stays negligible."""
+
+# ---------------------------------------------------------------------------
+# Resources (KVM4: 4 vCPU / 16 GB RAM)
+# ---------------------------------------------------------------------------
+REMOTION_CONCURRENCY: int = 3
+"""Browser tabs per Remotion job (``--concurrency``)."""
+
+RAM_PER_RENDER_JOB_GB: float = 4.0
+"""Peak RSS of one ``npx remotion render`` job at concurrency 3 with the
+1 GB OffthreadVideo cache."""
+
+MAX_PARALLEL_CHUNKS: int = 2
+"""Upper bound on simultaneous chunk jobs regardless of free RAM."""
+
+REMOTION_RENDER_FLAGS: list[str] = [
+    "--gl=swangle",
+    "--timeout=180000",
+    "--offthreadvideo-cache-size-in-bytes=1073741824",
+]
+"""Flags shared by every render job."""
+
+# ---------------------------------------------------------------------------
+# Scene render cache
+# ---------------------------------------------------------------------------
+SCENE_CACHE_MAX_GB: float = 20.0
+"""Cached scene segments are pruned least-recently-used beyond this size."""
+
+COMPOSITION_SOURCES: tuple[str, ...] = ("src", "remotion.config.ts", "package-lock.json")
+"""Paths (relative to ``remotion-video``) whose contents define the
+composition code version.  Any edit invalidates every cached segment."""
+
+AUDIO_ONLY_PROPS_KEYS: frozenset[str] = frozenset(
+    {"url", "voiceUrl", "sfx", "sfxUrl", "sfxVolume"}
+)
+"""Props fields that never reach a muted video segment — left out of the
+scene fingerprint so a new SFX or re-uploaded URL doesn't re-render."""
+
+# ---------------------------------------------------------------------------
+# Pre-built Remotion bundle
+# ---------------------------------------------------------------------------
+REMOTION_PREBUNDLE: bool = True
+"""Render from a webpack bundle built once per composition version
+instead of letting every ``npx remotion render`` job bundle the entry
+point itself.  ``False`` restores per-job bundling."""
+
+BUNDLE_CACHE_DIR: str = "out/bundles"
+"""Under ``remotion-video/``: one bundle per composition version."""
+
+BUNDLE_CACHE_KEEP: int = 3
+"""Bundles kept (most recently used first); older code revisions are
+deleted after a new bundle is built."""
+
+BUNDLE_TIMEOUT_SECONDS: int = 600
+"""Give up on ``npx remotion bundle`` after this long and render from the
+entry point; the bundle lock is held meanwhile, so a hung bundler would
+otherwise stall every queued render."""
+
+# ---------------------------------------------------------------------------
+# Pre-mixed audio bed
+# ---------------------------------------------------------------------------
+AUDIO_PREMIX: bool = True
+"""Mix narration and SFX into one track with ffmpeg before a Remotion
+render (:mod:`render.audio_bed`) instead of running Remotion's audio-only
+pass, which mixes every track in the headless browser.  ``False``
+restores the Remotion audio pass."""
+
+AUDIO_BED_DIR: str = "out/audio_bed"
+"""Under ``remotion-video/``: one pre-mixed track per video, reused while
+its inputs and mix are unchanged."""
+
+# ---------------------------------------------------------------------------
+# Asset normalization (before render)
+# ---------------------------------------------------------------------------
+KEN_BURNS_OVERSCAN: float = 1.25
+"""Largest ``scale()`` Scene.tsx's DynamicImage applies.  Images are
+resized to output resolution × this so the zoom never upsamples."""
+
+NORMALIZED_IMAGE_FORMAT: str = "JPEG"
+"""``JPEG`` (fastest decode in headless Chrome) or ``WEBP`` (smaller)."""
+
+NORMALIZED_IMAGE_QUALITY: int = 90
+"""Encoder quality for normalized stills — visually lossless at 1080p."""
+
+CLIP_CODEC_ARGS: list[str] = [
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
+    "-pix_fmt", "yuv420p", "-g", "24", "-an", "-movflags", "+faststart",
+]
+"""Render-friendly clip encode: H.264 with a keyframe every second so
+OffthreadVideo seeks are cheap; audio is dropped (clips play muted)."""
+
+ASSET_MANIFEST_FILE: str = "asset_manifest.json"
+"""Written to ``public/`` — one entry per normalized asset."""
+
+# ---------------------------------------------------------------------------
+# Props
+# ---------------------------------------------------------------------------
+PROPS_VOLATILE_KEYS: tuple[str, ...] = ("sfxUrl", "voiceUrl")
+"""Airtable attachment URLs, re-signed on every read.  Ignored when diffing
+props — the files behind them are tracked by Drive checksum instead."""
+
+RENDERED_PROPS_FILE: str = "props.rendered.json"
+"""Written to the job dir after a successful render: the props plus the
+Drive checksum of every downloaded asset.  The next render of the same
+video diffs against it and keeps unchanged downloads."""
+
+# ---------------------------------------------------------------------------
+# Render engine selection
+# ---------------------------------------------------------------------------
+# "remotion" — the React composition (clips, custom components, all effects).
+# "ffmpeg"   — render/ffmpeg_renderer.py compiles the render config straight
+#              into an ffmpeg filter graph; still images only.
+# Per video via the Idea's "Render Engine" field, else the RENDER_ENGINE env var.
+RENDER_ENGINES: tuple[str, ...] = ("remotion", "ffmpeg")
+DEFAULT_RENDER_ENGINE: str = "remotion"
+
+# ---------------------------------------------------------------------------
+# ffmpeg fast path
+# ---------------------------------------------------------------------------
+FFMPEG_VIDEO_ARGS: list[str] = [
+    "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p",
+]
+"""Identical for every scene segment so the stream-copy concat is valid."""
+
+FFMPEG_THREADS_PER_JOB: int = 2
+"""x264 threads per scene job; jobs run in parallel up to CPUs / this."""
+
+ZOOMPAN_SUPERSAMPLE: int = 2
+"""zoompan crops on whole pixels; working at 2× output size keeps slow
+pans from stepping visibly."""
+
+PAN_BASE_ZOOM: float = 1.1
+"""Zoom held during pan/tilt presets (which carry no scale) so the
+offset never reveals the frame edge."""
+
+SCENE_FADE_SECONDS: float = 0.4
+"""Fade from/to black at scene edges — Scene.tsx's FADE_FRAMES."""
+
+SFX_FADE_SECONDS: float = 0.3
+"""Per-image SFX fade in/out — Scene.tsx's SFX_FADE_FRAMES."""
+
+AUDIO_BITRATE: str = "192k"
+
+CAPTION_MAX_WORDS: int = 7
+"""Words per karaoke caption line (a line also breaks on . ! ? and pauses)."""
+
+CAPTION_BREAK_GAP_SECONDS: float = 0.6
+"""Silence between words that starts a new caption line."""
+
+CAPTION_FONT: str = "Arial"
+CAPTION_FONT_SCALE: float = 0.055
+"""Caption font size as a fraction of the output height."""
+
+# ---------------------------------------------------------------------------
+# Render queue
+# ---------------------------------------------------------------------------
+RENDER_JOBS_DIRNAME: str = "jobs"
+"""Per-video working dirs live in ``remotion-video/jobs/{video_id}/``
+(own ``public/`` and ``props.json``) so concurrent renders never share
+assets."""
+
+RENDER_QUEUE_FILE: str = "render_queue.json"
+"""Persisted queue state in ``remotion-video/jobs/`` (survives bot restarts)."""
+
+MAX_PARALLEL_RENDERS: int = 2
+"""Whole-video renders admitted at once (KVM4: 16 GB RAM, 4 GB per job)."""
+
+RENDER_RAM_HEADROOM_GB: float = 1.0
+"""Free RAM kept back on top of ``RAM_PER_RENDER_JOB_GB`` before a second
+render is admitted — swap thrash is what OOM-killed parallel renders."""
+
+RENDER_MAX_LOAD_PER_CPU: float = 0.75
+"""A second render waits while the 1-minute load average exceeds this
+fraction of the CPUs."""
+
+RENDER_ORPHAN_TTL_SECONDS: float = 6 * 3600
+"""How long a job whose process died keeps its place (so a restarted bot
+can resume it from its chunks).  After that the job is dropped from the
+queue and its working dir deleted."""
+
+RENDER_QUEUE_POLL_SECONDS: float = 30.0
+"""How often a waiting job re-checks admission."""
+
+RENDER_QUEUE_NOTIFY_SECONDS: float = 900.0
+"""Slack position/ETA update interval while a job waits."""
+
+RENDER_SECONDS_PER_VIDEO_SECOND: dict[str, float] = {"remotion": 3.0, "ffmpeg": 0.4}
+"""Default render speed for ETAs until the queue has its own history."""
+
+# ---------------------------------------------------------------------------
+# Telemetry
+# ---------------------------------------------------------------------------
+TELEMETRY_DIR: str = "out/telemetry"
+"""Under ``remotion-video/``: one JSON line per render (``renders.jsonl``)
+and per benchmark run (``benchmarks.jsonl``)."""
+
+TELEMETRY_FILE: str = "renders.jsonl"
+BENCHMARK_FILE: str = "benchmarks.jsonl"
+
+TELEMETRY_SAMPLE_SECONDS: float = 2.0
+"""How often the render's process trees are sampled (RSS, CPU, frames)."""
+
+TELEMETRY_TIMELINE_POINTS: int = 240
+"""Fps-over-time samples kept per record (evenly thinned) so an hour-long
+render stays a few KB."""
+
+TRANSITION_HEAVY_FRACTION: float = 0.25
+"""A scene counts as transition-heavy when ``transition_in`` durations
+cover at least this share of its display time (dips to black, 0.8 s style
+fades on short sentences)."""
+
+BENCHMARK_REGRESSION_PCT: float = 10.0
+"""``python -m render.benchmark --check`` fails when fps drops by more than
+this against the previous run on the same host and engine."""
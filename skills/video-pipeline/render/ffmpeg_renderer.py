@@ -0,0 +1,543 @@
+"""
+ffmpeg fast-path render engine.
+
+Most videos are still images with Ken Burns moves, crossfades and
+narration + SFX — all of it already computed by ``audio_sync`` into the
+render config.  This engine compiles that config straight into ffmpeg
+filter graphs instead of screenshotting a headless browser:
+
+* one muted H.264 segment per scene (``zoompan`` per image, ``xfade``
+  between images, fades at the scene edges, karaoke captions burned in
+  from an ASS file), scenes rendered in parallel;
+* one audio pass (``adelay`` + ``amix`` of every ``Scene N.mp3``,
+  per-image SFX and scene sound layers — :mod:`render.audio_bed`);
+* the same stream-copy concat as the Remotion path.
+
+Scene placement reuses :func:`~render.chunks.plan_chunks` so the timeline
+lines up frame-for-frame with ``Main.tsx``.  Videos with clips (video
+props images or ``Scene_XX_YY.mp4`` assets) need Remotion — see
+:func:`needs_remotion`.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from .audio_bed import (
+    bed_filter_script,
+    bed_sources,
+    matching_narration,
+    props_sfx,
+    props_sound_layers,
+)
+from .chunks import plan_chunks, total_frames
+from .config import (
+    AUDIO_BITRATE,
+    CAPTION_BREAK_GAP_SECONDS,
+    CAPTION_FONT,
+    CAPTION_FONT_SCALE,
+    CAPTION_MAX_WORDS,
+    DEFAULT_FPS,
+    DEFAULT_RENDER_ENGINE,
+    FFMPEG_THREADS_PER_JOB,
+    FFMPEG_VIDEO_ARGS,
+    PAN_BASE_ZOOM,
+    RENDER_ENGINES,
+    SCENE_FADE_SECONDS,
+    ZOOMPAN_SUPERSAMPLE,
+)
+from .orchestrator import RenderError, concat_chunks
+from .resources import cpu_count
+
+if TYPE_CHECKING:
+    from .telemetry import RenderTelemetry
+
+AUDIO_FILE = "audio.aac"
+
+_XFADE = {"crossfade": "fade", "dip_to_black": "fadeblack", "fade_to_black": "fadeblack"}
+_BLACK_EDGES = {"fade_from_black", "fade_to_black", "dip_to_black"}
+_LINE_END = re.compile(r"[.!?…]['\"”’)]*$")
+
+
+def resolve_render_engine(name: str | None = None) -> str:
+    """Explicit *name* (the Idea's field), else ``RENDER_ENGINE``, else the default."""
+    resolved = (name or os.environ.get("RENDER_ENGINE") or DEFAULT_RENDER_ENGINE).strip().lower()
+    if resolved not in RENDER_ENGINES:
+        raise ValueError(
+            f"Unknown render engine '{resolved}'. Choose one of: {', '.join(RENDER_ENGINES)}"
+        )
+    return resolved
+
+
+_CLIP_FILE = re.compile(r"^Scene_(\d+)_(\d+)\.mp4$")
+
+
+def clip_scenes(
+    render_config: dict[str, Any],
+    props: dict[str, Any] | None = None,
+    public_dir: str | Path | None = None,
+) -> set[int]:
+    """
+    Scene numbers that show at least one video clip.
+
+    ``audio_sync`` writes every render-config entry as a still
+    (``Scene_XX_YY.png``), so clips are also looked for where they really
+    arrive: props images with ``"type": "video"`` and ``Scene_XX_YY.mp4``
+    files in *public_dir* for an image slot the config has.
+    """
+    entries = render_config.get("scenes", [])
+    scenes = {e.get("scene_number", 0) for e in entries if e.get("type") == "video"}
+    for scene in (props or {}).get("scenes", []):
+        if any(img.get("type") == "video" for img in scene.get("images", [])):
+            scenes.add(scene.get("sceneNumber"))
+    if public_dir is not None and Path(public_dir).is_dir():
+        slots = {(e.get("scene_number", 0), e.get("image_index", 0)) for e in entries}
+        for path in Path(public_dir).glob("Scene_*.mp4"):
+            match = _CLIP_FILE.match(path.name)
+            if match and (int(match.group(1)), int(match.group(2))) in slots:
+                scenes.add(int(match.group(1)))
+    return scenes
+
+
+def needs_remotion(
+    render_config: dict[str, Any],
+    props: dict[str, Any] | None = None,
+    public_dir: str | Path | None = None,
+) -> str | None:
+    """Why this video can't take the fast path, or ``None`` if it can."""
+    if not render_config.get("scenes"):
+        return "render config has no scenes"
+    clips = clip_scenes(render_config, props, public_dir)
+    if clips:
+        return f"video clips in {len(clips)} scene(s)"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Plan
+# ---------------------------------------------------------------------------
+
+def build_scene_plan(
+    render_config: dict[str, Any],
+    fps: int,
+    public_dir: Path,
+    asset_files: dict[str, str] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Per-scene segments on ``Main.tsx``'s frame grid.
+
+    Returns:
+        ``[{scene_number, index, start_frame, frames, images: [{file,
+        start, duration, ken_burns, transition_in, transition_out}]}]`` —
+        image times relative to the scene start; the last image also
+        covers the scene's trail-off buffer.
+    """
+    asset_files = asset_files or {}
+    by_scene: dict[int, list[dict[str, Any]]] = {}
+    for entry in render_config.get("scenes", []):
+        by_scene.setdefault(entry.get("scene_number", 0), []).append(entry)
+
+    plan = []
+    for chunk in plan_chunks(render_config, fps, 0):
+        if not chunk["scenes"]:
+            continue
+        sn = chunk["scenes"][0]
+        entries = sorted(by_scene[sn], key=lambda e: (e.get("display_start", 0), e.get("image_index", 0)))
+        entries = [e for e in entries if e.get("display_duration", 0) > 0]
+        frames = chunk["end_frame"] - chunk["start_frame"] + 1
+        offset = entries[0].get("display_start", 0)
+        # Narration times are on the video timeline too; captions want
+        # them relative to the scene's own audio.
+        narration_offset = min(e.get("narration_start", 0.0) for e in entries)
+        images = []
+        for entry in entries:
+            name = Path(entry.get("image_path", "")).name
+            images.append({
+                "file": str(public_dir / asset_files.get(name, name)),
+                "start": round(entry.get("display_start", 0) - offset, 4),
+                "duration": entry["display_duration"],
+                "ken_burns": entry.get("ken_burns") or {},
+                "transition_in": entry.get("transition_in") or {},
+                "transition_out": entry.get("transition_out") or {},
+                "sentence_text": entry.get("sentence_text", ""),
+                "narration_start": round(entry.get("narration_start", 0.0) - narration_offset, 4),
+                "narration_end": round(entry.get("narration_end", 0.0) - narration_offset, 4),
+                "image_index": entry.get("image_index", 0),
+            })
+        images[-1]["duration"] = frames / fps - images[-1]["start"]
+        plan.append({
+            "scene_number": sn,
+            "index": chunk["index"],
+            "start_frame": chunk["start_frame"],
+            "frames": frames,
+            "images": images,
+        })
+    return plan
+
+
+# ---------------------------------------------------------------------------
+# Captions (ASS karaoke)
+# ---------------------------------------------------------------------------
+
+def scene_words(scene: dict[str, Any], words: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
+    """
+    Word timings for a scene, relative to its narration.
+
+    Uses the Whisper words from the timeline when given; otherwise spreads
+    each image's ``sentence_text`` evenly over its narration span, as
+    ``transcripts.ts`` does.
+    """
+    if words:
+        return [w for w in words if w.get("word", "").strip()]
+    out = []
+    for img in scene["images"]:
+        tokens = img["sentence_text"].split()
+        if not tokens:
+            continue
+        start, end = img["narration_start"], img["narration_end"]
+        step = (end - start) / len(tokens) if end > start else 0.01
+        for i, token in enumerate(tokens):
+            out.append({"word": token, "start": start + i * step, "end": start + (i + 1) * step})
+    return out
+
+
+def _ass_time(seconds: float) -> str:
+    cs = max(0, int(round(seconds * 100)))
+    return f"{cs // 360000}:{cs // 6000 % 60:02d}:{cs // 100 % 60:02d}.{cs % 100:02d}"
+
+
+def _ass_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("{", "(").replace("}", ")")
+
+
+def caption_lines(words: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Group words into caption lines (max words, sentence ends, pauses)."""
+    lines: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    for word in words:
+        if current and (
+            len(current) >= CAPTION_MAX_WORDS
+            or word["start"] - current[-1]["end"] > CAPTION_BREAK_GAP_SECONDS
+        ):
+            lines.append(current)
+            current = []
+        current.append(word)
+        if _LINE_END.search(word["word"].strip()):
+            lines.append(current)
+            current = []
+    if current:
+        lines.append(current)
+    return lines
+
+
+def build_ass(words: list[dict[str, Any]], width: int, height: int) -> str:
+    """ASS subtitle document with one ``\\k`` karaoke line per caption."""
+    size = int(height * CAPTION_FONT_SCALE)
+    header = (
+        "[Script Info]\nScriptType: v4.00+\n"
+        f"PlayResX: {width}\nPlayResY: {height}\nWrapStyle: 0\n\n"
+        "[V4+ Styles]\n"
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, "
+        "BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, "
+        "BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n"
+        f"Style: Karaoke,{CAPTION_FONT},{size},&H0000D7FF,&H00FFFFFF,&H00000000,&H80000000,"
+        f"-1,0,0,0,100,100,0,0,1,{max(2, size // 20)},0,2,"
+        f"{width // 10},{width // 10},{int(height * 0.08)},1\n\n"
+        "[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+    )
+    events = []
+    for line in caption_lines(words):
+        parts = []
+        for i, word in enumerate(line):
+            until = line[i + 1]["start"] if i + 1 < len(line) else word["end"]
+            cs = max(1, int(round((until - word["start"]) * 100)))
+            parts.append(f"{{\\k{cs}}}{_ass_escape(word['word'].strip())}")
+        events.append(
+            f"Dialogue: 0,{_ass_time(line[0]['start'])},{_ass_time(line[-1]['end'])},"
+            f"Karaoke,,0,0,0,,{' '.join(parts)}"
+        )
+    return header + "\n".join(events) + ("\n" if events else "")
+
+
+# ---------------------------------------------------------------------------
+# Filter graphs
+# ---------------------------------------------------------------------------
+
+def _lerp(start: float, end: float, n: int) -> str:
+    if start == end:
+        return f"{start:g}"
+    return f"({start:g}+({end - start:g})*on/{n})"
+
+
+def _zoompan(kb: dict[str, Any], frames: int, width: int, height: int, fps: int) -> str:
+    ss = ZOOMPAN_SUPERSAMPLE
+    has_scale = "start_scale" in kb or "end_scale" in kb
+    zs = kb.get("start_scale", 1.0) if has_scale else PAN_BASE_ZOOM
+    ze = kb.get("end_scale", zs) if has_scale else PAN_BASE_ZOOM
+    n = max(1, frames - 1)
+    dx = _lerp(kb.get("start_x_offset", 0) * ss, kb.get("end_x_offset", 0) * ss, n)
+    dy = _lerp(kb.get("start_y_offset", 0) * ss, kb.get("end_y_offset", 0) * ss, n)
+    return (
+        f"scale={width * ss}:{height * ss}:force_original_aspect_ratio=increase,"
+        f"crop={width * ss}:{height * ss},"
+        f"zoompan=z='{_lerp(zs, ze, n)}'"
+        f":x='iw/2-iw/zoom/2+{dx}':y='ih/2-ih/zoom/2+{dy}'"
+        f":d=1:s={width}x{height}:fps={fps}"
+    )
+
+
+def scene_command(
+    scene: dict[str, Any],
+    output: Path,
+    width: int,
+    height: int,
+    fps: int,
+    captions_file: str | None = None,
+) -> list[str]:
+    """ffmpeg command rendering one scene segment (video only)."""
+    images = scene["images"]
+    duration = scene["frames"] / fps
+    inputs: list[str] = []
+    graph: list[str] = []
+
+    overlaps = []
+    for i, img in enumerate(images):
+        if i + 1 < len(images):
+            out = img["transition_out"]
+            fade = min(float(out.get("duration") or SCENE_FADE_SECONDS),
+                       img["duration"] / 2, images[i + 1]["duration"] / 2)
+        else:
+            fade = 0.0
+        overlaps.append(fade)
+        length = img["duration"] + fade
+        frames = max(1, round(length * fps))
+        inputs += ["-loop", "1", "-framerate", str(fps), "-t", f"{length:.4f}", "-i", img["file"]]
+        graph.append(f"[{i}:v]{_zoompan(img['ken_burns'], frames, width, height, fps)},"
+                     f"setsar=1,format=yuv420p[v{i}]")
+
+    last = "v0"
+    for i in range(1, len(images)):
+        kind = _XFADE.get(images[i - 1]["transition_out"].get("type"), "fade")
+        graph.append(
+            f"[{last}][v{i}]xfade=transition={kind}:duration={overlaps[i - 1]:.4f}"
+            f":offset={images[i]['start']:.4f}[x{i}]"
+        )
+        last = f"x{i}"
+
+    first_in = images[0]["transition_in"]
+    fade_in = float(first_in.get("duration") or SCENE_FADE_SECONDS) \
+        if first_in.get("type") in _BLACK_EDGES else SCENE_FADE_SECONDS
+    fade_out = SCENE_FADE_SECONDS
+    edges = (
+        f"fade=t=in:st=0:d={min(fade_in, duration / 2):.4f},"
+        f"fade=t=out:st={max(0.0, duration - fade_out):.4f}:d={min(fade_out, duration / 2):.4f}"
+    )
+    if captions_file:
+        edges += f",subtitles=filename={captions_file}"
+    graph.append(f"[{last}]{edges}[out]")
+
+    return [
+        "ffmpeg", "-y", "-loglevel", "error", *inputs,
+        "-filter_complex", ";".join(graph),
+        "-map", "[out]", "-frames:v", str(scene["frames"]), "-r", str(fps), "-an",
+        *FFMPEG_VIDEO_ARGS, "-threads", str(FFMPEG_THREADS_PER_JOB),
+        str(output),
+    ]
+
+
+def audio_filter_script(
+    plan: list[dict[str, Any]],
+    fps: int,
+    public_dir: Path,
+    sfx: dict[tuple[int, int], dict[str, Any]],
+    total_seconds: float,
+    sound_layers: dict[int, list[dict[str, Any]]] | None = None,
+    gains: dict[str, float] | None = None,
+    narration: dict[str, Any] | None = None,
+) -> tuple[list[str], str]:
+    """
+    Inputs and ``-filter_complex_script`` body for the whole-video mix.
+
+    Narration ``Scene N.mp3`` starts at its scene's first frame; each SFX
+    at its image, faded and trimmed to the image as in ``Scene.tsx`` —
+    the same graph as the Remotion path's :mod:`~render.audio_bed`.
+    """
+    sources = bed_sources(
+        plan, fps, public_dir, sfx, sound_layers, gains,
+        matching_narration(narration, public_dir, plan),
+    )
+    return bed_filter_script(sources, total_seconds)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def _run_ffmpeg(cmd: list[str], cwd: Path) -> tuple[int, str]:
+    try:
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    except FileNotFoundError as exc:
+        raise RenderError("ffmpeg not installed — cannot use the ffmpeg render engine") from exc
+    return result.returncode, result.stderr.strip()[-500:]
+
+
+def render_ffmpeg(
+    public_dir: str | Path,
+    output_file: str | Path,
+    render_config: dict[str, Any],
+    *,
+    work_dir: str | Path,
+    props: dict[str, Any] | None = None,
+    words: dict[int, list[dict[str, Any]]] | None = None,
+    captions: bool = True,
+    fps: int | None = None,
+    max_parallel: int | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+    keep_chunks: bool = False,
+    telemetry: RenderTelemetry | None = None,
+    gains: dict[str, float] | None = None,
+    narration: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Render the video with ffmpeg alone.
+
+    Args:
+        public_dir: ``remotion-video/public`` with the (normalized) assets.
+        output_file: Final MP4.
+        render_config: The render config (stills only — check
+            :func:`needs_remotion` first).
+        work_dir: Scratch directory for segments, captions and the mix.
+        props: The Remotion props — supplies ``assetFiles`` and per-image
+            SFX.
+        words: ``{scene_number: [{word, start, end}]}`` Whisper words from
+            the timeline; captions fall back to sentence text without it.
+        captions: Burn karaoke captions in.
+        max_parallel: Simultaneous scene jobs; ``None`` = CPUs /
+            ``FFMPEG_THREADS_PER_JOB``.
+        on_progress: ``callback(frames_done, total_frames)`` per finished scene.
+        telemetry: Records per-scene time, memory and CPU.
+        gains: ``{asset: dB}`` loudness-normalizing gains for the mix.
+        narration: The timeline's narration record — the mix cuts the
+            scenes from its one track when it matches ``Scene N.mp3``.
+
+    Returns:
+        ``{output, total_frames, chunks, rendered, reused, cached,
+        parallel, elapsed, engine}`` (same keys as
+        :func:`~render.orchestrator.render_chunked`).
+
+    Raises:
+        RenderError: ffmpeg is missing or a job failed.
+    """
+    public_dir = Path(public_dir).resolve()
+    output_file = Path(output_file)
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    props = props or {}
+    fps = fps or render_config.get("fps") or DEFAULT_FPS
+    resolution = render_config.get("resolution") or {}
+    width, height = resolution.get("width") or 1920, resolution.get("height") or 1080
+
+    reason = needs_remotion(render_config, props, public_dir)
+    if reason:
+        raise RenderError(f"ffmpeg engine can't render this video: {reason}")
+
+    plan = build_scene_plan(render_config, fps, public_dir, props.get("assetFiles"))
+    frames_total = total_frames(render_config, fps)
+    missing = [img["file"] for s in plan for img in s["images"] if not Path(img["file"]).is_file()]
+    if missing:
+        raise RenderError(f"{len(missing)} image(s) missing", ", ".join(Path(m).name for m in missing[:5]))
+
+    sfx = props_sfx(props, public_dir)
+    sound_layers = props_sound_layers(props, public_dir)
+
+    parallel = max_parallel or max(1, cpu_count() // FFMPEG_THREADS_PER_JOB)
+    print(f"  ⚡ ffmpeg engine: {len(plan)} scenes ({frames_total} frames), {parallel} in parallel")
+
+    lock = threading.Lock()
+    done_frames = {"n": 0}
+    failures: list[tuple[str, int, str]] = []
+
+    def _scene_job(scene: dict[str, Any]) -> None:
+        name = f"scene_{scene['index']:03d}"
+        captions_file = None
+        if captions:
+            ass = build_ass(scene_words(scene, (words or {}).get(scene["scene_number"])), width, height)
+            (work_dir / f"{name}.ass").write_text(ass, encoding="utf-8")
+            captions_file = f"{name}.ass"  # relative: cwd=work_dir avoids filter escaping
+        cmd = scene_command(scene, Path(f"{name}.mp4"), width, height, fps, captions_file)
+        if telemetry:
+            span = {"start_frame": scene["start_frame"], "scenes": [scene["scene_number"]],
+                    "end_frame": scene["start_frame"] + scene["frames"] - 1}
+            telemetry.job_started(name, span, marker=f"{name}.mp4", cwd=work_dir)
+        code, err = _run_ffmpeg(cmd, work_dir)
+        if telemetry:
+            telemetry.job_finished(name, code == 0)
+        with lock:
+            if code != 0:
+                failures.append((f"scene {scene['scene_number']}", code, err))
+                return
+            done_frames["n"] += scene["frames"]
+            if on_progress:
+                on_progress(min(done_frames["n"], frames_total), frames_total)
+
+    def _audio_job() -> None:
+        inputs, script = audio_filter_script(
+            plan, fps, public_dir, sfx, frames_total / fps, sound_layers, gains, narration,
+        )
+        (work_dir / "audio.filter").write_text(script)
+        cmd = ["ffmpeg", "-y", "-loglevel", "error", *inputs,
+               "-filter_complex_script", "audio.filter", "-map", "[mix]",
+               "-c:a", "aac", "-b:a", AUDIO_BITRATE, AUDIO_FILE]
+        if telemetry:
+            telemetry.job_started(AUDIO_FILE, None, marker="audio.filter", cwd=work_dir)
+        code, err = _run_ffmpeg(cmd, work_dir)
+        if telemetry:
+            telemetry.job_finished(AUDIO_FILE, code == 0)
+        if code != 0:
+            with lock:
+                failures.append(("audio", code, err))
+
+    start = time.time()
+    if telemetry:
+        telemetry.start()
+    try:
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            futures = [pool.submit(_audio_job)] + [pool.submit(_scene_job, s) for s in plan]
+            for future in futures:
+                future.result()
+    finally:
+        if telemetry:
+            telemetry.stop()
+
+    if failures:
+        label, code, err = failures[0]
+        raise RenderError(f"{len(failures)} ffmpeg job(s) failed ({label} exited {code})", err)
+
+    segments = [work_dir / f"scene_{s['index']:03d}.mp4" for s in plan]
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    concat_chunks([p.resolve() for p in segments], work_dir / AUDIO_FILE, output_file)
+
+    if not keep_chunks:
+        for path in work_dir.iterdir():
+            if path.name.startswith("scene_") or path.name in (AUDIO_FILE, "audio.filter"):
+                path.unlink(missing_ok=True)
+
+    return {
+        "output": str(output_file),
+        "total_frames": frames_total,
+        "chunks": len(plan),
+        "rendered": len(plan),
+        "reused": 0,
+        "cached": 0,
+        "parallel": parallel,
+        "elapsed": time.time() - start,
+        "engine": "ffmpeg",
+    }
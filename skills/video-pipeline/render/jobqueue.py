@@ -0,0 +1,327 @@
+"""
+Render job queue with resource-aware admission.
+
+Renders are started from three places (``run_next_step``, the Slack
+``render`` command via ``run_render_bot.py``, and ``render_video.py``),
+often in different processes.  They coordinate through one JSON state
+file, guarded by an ``flock``:
+
+* every job has its own working directory (:func:`job_dir`) — no more
+  shared ``public/`` wiped under a running render;
+* jobs are admitted first-in first-out, up to ``MAX_PARALLEL_RENDERS``,
+  and a second job only when free RAM and the load average allow it
+  (the first job is always admitted — it's the sequential fallback);
+* the state survives restarts: a job whose process died keeps its place
+  in line and is picked up again when the video is re-queued, resuming
+  from its finished chunks — for ``RENDER_ORPHAN_TTL_SECONDS``, after
+  which the job and its working dir are reclaimed;
+* :meth:`RenderQueue.snapshot` gives each job's position and ETA, using
+  the measured speed of past renders.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import json
+import os
+import shutil
+import socket
+import statistics
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from .config import (
+    MAX_PARALLEL_RENDERS,
+    RAM_PER_RENDER_JOB_GB,
+    RENDER_JOBS_DIRNAME,
+    RENDER_MAX_LOAD_PER_CPU,
+    RENDER_ORPHAN_TTL_SECONDS,
+    RENDER_QUEUE_FILE,
+    RENDER_QUEUE_NOTIFY_SECONDS,
+    RENDER_QUEUE_POLL_SECONDS,
+    RENDER_RAM_HEADROOM_GB,
+    RENDER_SECONDS_PER_VIDEO_SECOND,
+)
+from .resources import available_memory_bytes, cpu_count
+
+_GB = 1024 ** 3
+_HISTORY = 20
+
+REMOTION_DIR = Path(__file__).resolve().parent.parent.parent.parent / "remotion-video"
+
+
+def job_dir(video_id: str, remotion_dir: str | Path = REMOTION_DIR) -> Path:
+    """Isolated working directory of one video's render."""
+    return Path(remotion_dir) / RENDER_JOBS_DIRNAME / video_id
+
+
+def _process_alive(job: dict[str, Any]) -> bool:
+    if job.get("host") != socket.gethostname():
+        return True  # can't check another machine; assume alive
+    try:
+        os.kill(job["pid"], 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def resources_allow_another(
+    ram_per_job_gb: float = RAM_PER_RENDER_JOB_GB,
+    headroom_gb: float = RENDER_RAM_HEADROOM_GB,
+    max_load_per_cpu: float = RENDER_MAX_LOAD_PER_CPU,
+) -> bool:
+    """Measured free RAM and load leave room for one more render."""
+    avail = available_memory_bytes()
+    if avail is not None and avail < (ram_per_job_gb + headroom_gb) * _GB:
+        return False
+    try:
+        load = os.getloadavg()[0]
+    except OSError:
+        return True
+    return load <= cpu_count() * max_load_per_cpu
+
+
+class RenderQueue:
+    """File-backed FIFO of render jobs shared across processes."""
+
+    __slots__ = ("path", "max_parallel", "orphan_ttl", "_admit")
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_parallel: int = MAX_PARALLEL_RENDERS,
+        admit: Callable[[], bool] = resources_allow_another,
+        orphan_ttl: float = RENDER_ORPHAN_TTL_SECONDS,
+    ) -> None:
+        self.path = Path(path) if path else REMOTION_DIR / RENDER_JOBS_DIRNAME / RENDER_QUEUE_FILE
+        self.max_parallel = max_parallel
+        self.orphan_ttl = orphan_ttl
+        self._admit = admit
+
+    # -- state ---------------------------------------------------------------
+
+    @contextmanager
+    def _state(self) -> Iterator[dict[str, Any]]:
+        """Locked read-modify-write of the queue file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                state = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                state = {}
+            state.setdefault("jobs", [])
+            state.setdefault("history", [])
+            self._reap(state)
+            yield state
+            tmp = self.path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(state, indent=2))
+            tmp.replace(self.path)
+
+    def _reap(self, state: dict[str, Any]) -> None:
+        """Drop jobs orphaned longer than ``orphan_ttl`` and their working dirs."""
+        now = time.time()
+        for job in list(state["jobs"]):
+            if _process_alive(job):
+                job.pop("orphaned_at", None)
+                continue
+            job.setdefault("orphaned_at", now)
+            if now - job["orphaned_at"] >= self.orphan_ttl:
+                state["jobs"].remove(job)
+                shutil.rmtree(self.path.parent / job["id"], ignore_errors=True)
+                print(f"  🧹 Reclaimed orphaned render job {job['id']} ({job.get('title', '')})")
+
+    @staticmethod
+    def _find(state: dict[str, Any], job_id: str) -> dict[str, Any] | None:
+        return next((j for j in state["jobs"] if j["id"] == job_id), None)
+
+    @staticmethod
+    def _rate(state: dict[str, Any], engine: str) -> float:
+        rates = [h["elapsed"] / h["video_seconds"] for h in state["history"]
+                 if h.get("engine") == engine and h.get("video_seconds")]
+        if rates:
+            return statistics.median(rates)
+        return RENDER_SECONDS_PER_VIDEO_SECOND.get(engine, RENDER_SECONDS_PER_VIDEO_SECOND["remotion"])
+
+    # -- lifecycle -------------------------------------------------------------
+
+    def enqueue(
+        self,
+        job_id: str,
+        title: str,
+        video_seconds: float = 0.0,
+        engine: str = "remotion",
+    ) -> dict[str, Any]:
+        """
+        Add a job (or re-claim it after a restart, keeping its place).
+
+        A job another live process already holds (queued or running) is
+        left as it is, so the video is never rendered twice into the
+        same job directory; only orphaned jobs are re-claimed.
+
+        Returns:
+            This job's :meth:`snapshot` entry (``position``, ``eta_start``,
+            ``eta_done``) — with ``held_by`` (that process's pid) when
+            another process holds the job.
+        """
+        with self._state() as state:
+            job = self._find(state, job_id)
+            if job is not None and _process_alive(job) and (
+                job.get("pid") != os.getpid() or job.get("host") != socket.gethostname()
+            ):
+                return {**self._entry(state, job_id), "held_by": job.get("pid")}
+            if job is None:
+                job = {"id": job_id, "enqueued_at": time.time()}
+                state["jobs"].append(job)
+            job.update({
+                "title": title,
+                "status": "queued",
+                "video_seconds": video_seconds or job.get("video_seconds", 0.0),
+                "engine": engine,
+                "pid": os.getpid(),
+                "host": socket.gethostname(),
+                "started_at": None,
+            })
+            job.pop("orphaned_at", None)
+            return self._entry(state, job_id)
+
+    def update(self, job_id: str, **fields: Any) -> None:
+        """Refine a job's estimate inputs (``video_seconds``, ``engine``)."""
+        with self._state() as state:
+            job = self._find(state, job_id)
+            if job:
+                job.update(fields)
+
+    def try_start(self, job_id: str) -> bool:
+        """Mark *job_id* running if it's next in line and resources allow."""
+        with self._state() as state:
+            job = self._find(state, job_id)
+            if job is None:
+                raise KeyError(f"render job {job_id} is not queued")
+            if job["status"] == "running":
+                return True
+            live = [j for j in state["jobs"] if _process_alive(j)]
+            running = [j for j in live if j["status"] == "running"]
+            waiting = sorted((j for j in live if j["status"] == "queued"), key=lambda j: j["enqueued_at"])
+            if not waiting or waiting[0]["id"] != job_id:
+                return False
+            if len(running) >= self.max_parallel:
+                return False
+            if running and not self._admit():
+                return False
+            job["status"] = "running"
+            job["started_at"] = time.time()
+            return True
+
+    def finish(self, job_id: str, ok: bool) -> None:
+        """Drop the job; successful runs feed the ETA history."""
+        with self._state() as state:
+            job = self._find(state, job_id)
+            if job is None:
+                return
+            state["jobs"].remove(job)
+            if ok and job.get("started_at") and job.get("video_seconds"):
+                state["history"].append({
+                    "engine": job.get("engine", "remotion"),
+                    "video_seconds": job["video_seconds"],
+                    "elapsed": time.time() - job["started_at"],
+                })
+                state["history"] = state["history"][-_HISTORY:]
+
+    # -- reporting -------------------------------------------------------------
+
+    def _entry(self, state: dict[str, Any], job_id: str) -> dict[str, Any]:
+        return next(e for e in self._plan(state) if e["id"] == job_id)
+
+    def _plan(self, state: dict[str, Any]) -> list[dict[str, Any]]:
+        now = time.time()
+        slots: list[float] = []
+        entries = []
+        live = [j for j in state["jobs"] if _process_alive(j)]
+        for job in sorted(live, key=lambda j: (j["status"] != "running", j["enqueued_at"])):
+            est = job.get("video_seconds", 0) * self._rate(state, job.get("engine", "remotion"))
+            if job["status"] == "running":
+                start = job["started_at"]
+                slots.append(max(now, start + est))
+                position = 0
+            else:
+                if len(slots) < self.max_parallel:
+                    start = now
+                else:
+                    slots.sort()
+                    start = slots.pop(0)
+                slots.append(start + est)
+                position = sum(1 for e in entries if e["position"]) + 1
+            entries.append({
+                "id": job["id"],
+                "title": job.get("title", job["id"]),
+                "status": job["status"],
+                "engine": job.get("engine", "remotion"),
+                "position": position,
+                "eta_start": start,
+                "eta_done": start + est,
+            })
+        for job in state["jobs"]:
+            if job not in live:
+                entries.append({
+                    "id": job["id"], "title": job.get("title", job["id"]),
+                    "status": "orphaned", "engine": job.get("engine", "remotion"),
+                    "position": None, "eta_start": None, "eta_done": None,
+                })
+        return entries
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Running jobs (position 0), then the line, then orphaned jobs."""
+        with self._state() as state:
+            return self._plan(state)
+
+    def position(self, job_id: str) -> dict[str, Any] | None:
+        return next((e for e in self.snapshot() if e["id"] == job_id), None)
+
+    async def wait_turn(
+        self,
+        job_id: str,
+        on_wait: Callable[[dict[str, Any]], None] | None = None,
+        poll_seconds: float = RENDER_QUEUE_POLL_SECONDS,
+        notify_seconds: float = RENDER_QUEUE_NOTIFY_SECONDS,
+    ) -> None:
+        """Sleep until :meth:`try_start` admits *job_id*."""
+        last_notice = time.time()
+        while not self.try_start(job_id):
+            if on_wait and time.time() - last_notice >= notify_seconds:
+                entry = self.position(job_id)
+                if entry:
+                    on_wait(entry)
+                last_notice = time.time()
+            await asyncio.sleep(poll_seconds)
+
+
+def _minutes(ts: float | None, now: float) -> str:
+    if ts is None:
+        return "?"
+    mins = max(0, int(round((ts - now) / 60)))
+    return "now" if mins == 0 else f"~{mins} min"
+
+
+def format_entry(entry: dict[str, Any], now: float | None = None) -> str:
+    """One Slack line for a queue entry."""
+    now = now or time.time()
+    if entry["status"] == "running":
+        return f"▶️ _{entry['title']}_ ({entry['engine']}) — rendering, done in {_minutes(entry['eta_done'], now)}"
+    if entry["status"] == "orphaned":
+        return f"💤 _{entry['title']}_ — process gone; re-run `render` to resume"
+    return (f"⏳ #{entry['position']} _{entry['title']}_ ({entry['engine']}) — "
+            f"starts {_minutes(entry['eta_start'], now)}, done {_minutes(entry['eta_done'], now)}")
+
+
+def format_queue(entries: list[dict[str, Any]]) -> str:
+    """Slack summary of the whole queue."""
+    if not entries:
+        return "🎬 Render queue is empty."
+    now = time.time()
+    return "🎬 *Render queue*\n" + "\n".join(format_entry(e, now) for e in entries)
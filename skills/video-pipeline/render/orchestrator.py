@@ -0,0 +1,401 @@
+"""
+Chunked, resumable Remotion render.
+
+Instead of one ``npx remotion render Main`` over the whole timeline, the
+video is rendered as scene-aligned frame ranges (``--frames=a-b --muted``)
+plus one audio-only pass (``--codec=aac``) — or a bed pre-mixed with
+ffmpeg (:mod:`render.audio_bed`) — then stitched with an ffmpeg
+stream-copy concat — no re-encode.
+
+Every finished chunk is renamed from ``*.part.mp4`` into place and recorded
+in ``manifest.json`` in the work directory.  A retry with the same
+``props.json`` re-renders only the chunks that are missing; a changed
+``props.json`` (different video, new timing) invalidates them all.
+
+With a :class:`~render.cache.SceneCache` and per-scene fingerprints,
+chunks are single scenes and any scene whose fingerprint already has a
+cached segment is linked in instead of rendered — fixing three images
+re-renders three scenes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from .chunks import plan_chunks, total_frames
+from .config import (
+    CHUNK_TARGET_SECONDS,
+    DEFAULT_COMPOSITION,
+    DEFAULT_FPS,
+    REMOTION_CONCURRENCY,
+    REMOTION_PREBUNDLE,
+    REMOTION_RENDER_FLAGS,
+)
+from .resources import parallel_render_jobs
+
+if TYPE_CHECKING:
+    from .cache import SceneCache
+    from .telemetry import RenderTelemetry
+
+MANIFEST_FILE = "manifest.json"
+AUDIO_FILE = "audio.aac"
+
+_PROGRESS_RE = re.compile(r"Rendered\s+(\d+)/(\d+)")
+
+
+class RenderError(RuntimeError):
+    """A render job or the final concat failed."""
+
+    def __init__(self, message: str, detail: str = "") -> None:
+        super().__init__(message)
+        self.detail = detail
+
+
+def file_sha256(path: str | Path) -> str:
+    """SHA-256 of a file, streamed."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def chunk_filename(chunk: dict[str, Any]) -> str:
+    return f"chunk_{chunk['index']:03d}_{chunk['start_frame']}-{chunk['end_frame']}.mp4"
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+def load_manifest(work_dir: Path) -> dict[str, Any]:
+    try:
+        return json.loads((work_dir / MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(work_dir: Path, manifest: dict[str, Any]) -> None:
+    path = work_dir / MANIFEST_FILE
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    tmp.replace(path)
+
+
+def reusable_chunks(
+    manifest: dict[str, Any],
+    props_sha: str,
+    chunks: list[dict[str, Any]],
+    work_dir: Path,
+) -> set[str]:
+    """Filenames of chunks finished by a previous run with identical props."""
+    if manifest.get("props_sha256") != props_sha:
+        return set()
+    planned = {chunk_filename(c) for c in chunks} | {AUDIO_FILE}
+    return {
+        name for name in manifest.get("done", [])
+        if name in planned and (work_dir / name).is_file()
+    }
+
+
+# ---------------------------------------------------------------------------
+# Jobs
+# ---------------------------------------------------------------------------
+
+def build_chunk_command(
+    composition: str,
+    output: Path,
+    props_file: Path,
+    chunk: dict[str, Any] | None,
+    concurrency: int = REMOTION_CONCURRENCY,
+    public_dir: Path | None = None,
+    serve_url: Path | None = None,
+) -> list[str]:
+    """
+    ``npx remotion render`` for one frame range, or audio only if *chunk* is None.
+
+    With *serve_url* (a pre-built bundle, see :mod:`render.bundle`) the job
+    skips webpack; its assets come from the bundle's ``public`` link, so
+    *public_dir* is not passed.
+    """
+    cmd = ["npx", "remotion", "render"]
+    if serve_url is not None:
+        cmd.append(str(serve_url))
+    cmd += [composition, str(output), "--props", str(props_file)]
+    if public_dir is not None and serve_url is None:
+        cmd.append(f"--public-dir={public_dir}")
+    if chunk is None:
+        cmd.append("--codec=aac")
+    else:
+        cmd += [f"--frames={chunk['start_frame']}-{chunk['end_frame']}", "--muted"]
+    cmd.append(f"--concurrency={concurrency}")
+    return cmd + REMOTION_RENDER_FLAGS
+
+
+def _run_job(
+    cmd: list[str],
+    cwd: Path,
+    on_frames: Callable[[int], None] | None,
+    label: str,
+) -> tuple[int, str]:
+    """Run one Remotion process, streaming its output. Returns (code, last error line)."""
+    last_error = ""
+    process = subprocess.Popen(
+        cmd, cwd=cwd,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, bufsize=1,
+    )
+    for line in process.stdout:
+        line = line.strip()
+        if not line:
+            continue
+        match = _PROGRESS_RE.search(line)
+        if match:
+            if on_frames:
+                on_frames(int(match.group(1)))
+        else:
+            print(f"    [{label}] {line}")
+        if "error" in line.lower():
+            last_error = line
+    return process.wait(), last_error
+
+
+def concat_chunks(chunk_files: list[Path], audio_file: Path, output_file: Path) -> None:
+    """Stream-copy concat of the video chunks, muxed with the audio pass."""
+    list_file = output_file.with_suffix(".concat.txt")
+    with open(list_file, "w") as f:
+        for path in chunk_files:
+            f.write(f"file '{path}'\n")
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "concat", "-safe", "0", "-i", str(list_file),
+        "-i", str(audio_file),
+        "-map", "0:v:0", "-map", "1:a:0",
+        "-c", "copy", "-movflags", "+faststart",
+        str(output_file),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError as exc:
+        raise RenderError("ffmpeg not installed — cannot stitch chunks") from exc
+    finally:
+        list_file.unlink(missing_ok=True)
+    if result.returncode != 0:
+        raise RenderError("ffmpeg concat failed", result.stderr.strip()[-500:])
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def render_chunked(
+    remotion_dir: str | Path,
+    props_file: str | Path,
+    output_file: str | Path,
+    render_config: dict[str, Any],
+    *,
+    work_dir: str | Path,
+    composition: str = DEFAULT_COMPOSITION,
+    fps: int | None = None,
+    chunk_seconds: float = CHUNK_TARGET_SECONDS,
+    max_parallel: int | None = None,
+    concurrency: int = REMOTION_CONCURRENCY,
+    on_progress: Callable[[int, int], None] | None = None,
+    keep_chunks: bool = False,
+    cache: SceneCache | None = None,
+    fingerprints: dict[int, str] | None = None,
+    public_dir: str | Path | None = None,
+    telemetry: RenderTelemetry | None = None,
+    prebundle: bool = REMOTION_PREBUNDLE,
+    audio_file: str | Path | None = None,
+) -> dict[str, Any]:
+    """
+    Render *composition* in scene-aligned chunks and stitch them.
+
+    Args:
+        remotion_dir: The ``remotion-video`` project.
+        props_file: ``props.json`` passed to every job.
+        output_file: Final MP4.
+        render_config: The render config embedded in the props (used
+            for the frame layout).
+        work_dir: Per-video directory where chunks and the manifest live
+            across retries.
+        max_parallel: Simultaneous chunk jobs; ``None`` sizes it from free
+            RAM / CPUs (:func:`parallel_render_jobs`).  ``1`` renders the
+            chunks sequentially (still resumable).
+        on_progress: ``callback(frames_done, total_frames)`` — called from
+            worker threads.
+        keep_chunks: Keep the chunk files after a successful stitch.
+        cache: Scene segment cache.  Requires *fingerprints*; chunking
+            becomes one scene per chunk (*chunk_seconds* is ignored).
+        fingerprints: ``{scene_number: fingerprint}`` from
+            :func:`~render.cache.scene_fingerprints`.
+        public_dir: Per-job asset directory (``--public-dir``); ``None``
+            uses the project's ``public/``.
+        telemetry: Records per-chunk fps, memory and CPU while the jobs
+            run; read it with :meth:`RenderTelemetry.summary` afterwards.
+        prebundle: Render every job from the cached bundle of the current
+            composition code (:func:`~render.bundle.prepare_bundle`)
+            instead of bundling per job.
+        audio_file: Pre-mixed audio track
+            (:func:`~render.audio_bed.premix_audio_bed`) muxed in instead
+            of running Remotion's audio-only pass.  Left in place.
+
+    Returns:
+        ``{output, total_frames, chunks, rendered, reused, cached,
+        parallel, elapsed}`` — ``reused`` counts chunks from a previous
+        attempt in *work_dir*, ``cached`` those linked from *cache*.
+
+    Raises:
+        RenderError: Any chunk failed (finished chunks are kept for the
+            retry) or the concat failed.
+    """
+    remotion_dir = Path(remotion_dir)
+    props_file = Path(props_file)
+    output_file = Path(output_file)
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    fps = fps or render_config.get("fps") or DEFAULT_FPS
+
+    if cache is not None and fingerprints is None:
+        raise ValueError("cache requires per-scene fingerprints")
+    if cache is not None:
+        from .cache import chunk_key
+        chunk_seconds = 0
+    chunks = plan_chunks(render_config, fps, chunk_seconds)
+    frames_total = total_frames(render_config, fps)
+    props_sha = file_sha256(props_file)
+    keys = {
+        chunk_filename(c): chunk_key(c, fingerprints, composition)
+        for c in chunks
+    } if cache is not None else {}
+
+    done = reusable_chunks(load_manifest(work_dir), props_sha, chunks, work_dir)
+    reused = len(done - {AUDIO_FILE})
+    cached = 0
+    for name, key in keys.items():
+        if key and name not in done and cache.restore(key, work_dir / name):
+            done.add(name)
+            cached += 1
+    manifest = {
+        "props_sha256": props_sha,
+        "composition": composition,
+        "fps": fps,
+        "total_frames": frames_total,
+        "chunks": [{**c, "file": chunk_filename(c)} for c in chunks],
+        "done": sorted(done),
+    }
+    save_manifest(work_dir, manifest)
+
+    parallel = max_parallel or parallel_render_jobs(concurrency)
+    pending = [c for c in chunks if chunk_filename(c) not in done]
+    serve_url = None
+    audio_pending = audio_file is None and AUDIO_FILE not in done
+    if prebundle and (pending or audio_pending):
+        from .bundle import prepare_bundle
+        serve_url = prepare_bundle(remotion_dir, public_dir, work_dir)
+    print(f"  🧩 {len(chunks)} chunks ({frames_total} frames), "
+          f"{reused} reused, {cached} cached, {len(pending)} to render, "
+          f"{parallel} in parallel")
+
+    lock = threading.Lock()
+    frames_done = {
+        chunk_filename(c): c["end_frame"] - c["start_frame"] + 1
+        for c in chunks if chunk_filename(c) in done
+    }
+    failures: list[tuple[str, int, str]] = []
+
+    def _report() -> None:
+        if on_progress:
+            on_progress(min(sum(frames_done.values()), frames_total), frames_total)
+
+    def _job(chunk: dict[str, Any] | None) -> None:
+        name = AUDIO_FILE if chunk is None else chunk_filename(chunk)
+        final = work_dir / name
+        part = final.with_name(final.stem + ".part" + final.suffix)
+        label = "audio" if chunk is None else f"chunk {chunk['index']}"
+
+        def _on_frames(n: int) -> None:
+            with lock:
+                frames_done[name] = n
+                _report()
+            if telemetry:
+                telemetry.job_frames(name, n)
+
+        cmd = build_chunk_command(
+            composition, part, props_file, chunk, concurrency,
+            Path(public_dir).resolve() if public_dir else None,
+            serve_url=serve_url,
+        )
+        if telemetry:
+            telemetry.job_started(name, chunk, marker=str(part))
+        code, last_error = _run_job(cmd, remotion_dir, None if chunk is None else _on_frames, label)
+        if telemetry:
+            telemetry.job_finished(name, code == 0 and part.is_file())
+        with lock:
+            if code == 0 and part.is_file():
+                part.replace(final)
+                if keys.get(name):
+                    cache.store(keys[name], final)
+                manifest["done"] = sorted(set(manifest["done"]) | {name})
+                save_manifest(work_dir, manifest)
+                if chunk is not None:
+                    frames_done[name] = chunk["end_frame"] - chunk["start_frame"] + 1
+                    _report()
+            else:
+                part.unlink(missing_ok=True)
+                failures.append((label, code, last_error))
+
+    start = time.time()
+    jobs: list[dict[str, Any] | None] = list(pending)
+    if audio_pending:
+        jobs.insert(0, None)
+    _report()
+    if jobs:
+        if telemetry:
+            telemetry.start()
+        try:
+            with ThreadPoolExecutor(max_workers=parallel) as pool:
+                list(pool.map(_job, jobs))
+        finally:
+            if telemetry:
+                telemetry.stop()
+
+    if failures:
+        label, code, last_error = failures[0]
+        raise RenderError(
+            f"{len(failures)} render job(s) failed ({label} exited {code}); "
+            f"{len(manifest['done'])} finished pieces kept for retry",
+            last_error,
+        )
+
+    chunk_files = [work_dir / chunk_filename(c) for c in chunks]
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    concat_chunks(chunk_files, Path(audio_file) if audio_file else work_dir / AUDIO_FILE, output_file)
+
+    if not keep_chunks:
+        for path in chunk_files + [work_dir / AUDIO_FILE, work_dir / MANIFEST_FILE]:
+            path.unlink(missing_ok=True)
+    if cache is not None:
+        pruned = cache.prune()
+        if pruned:
+            print(f"  🧹 Pruned {pruned} old segments from the scene cache")
+
+    return {
+        "output": str(output_file),
+        "total_frames": frames_total,
+        "chunks": len(chunks),
+        "rendered": len(pending),
+        "reused": reused,
+        "cached": cached,
+        "parallel": parallel,
+        "elapsed": time.time() - start,
+    }
@@ -0,0 +1,313 @@
+"""
+Remotion props: build, serialize, diff.
+
+:func:`build_props` turns the Airtable script and image rows into the
+``scenes`` structure ``Main.tsx`` reads, grouping images by scene in one
+pass (:func:`group_by_scene`) instead of scanning every image per scene.
+:func:`dumps_props` is the single serialization — compact, sorted keys —
+so the same props always produce the same bytes and :func:`write_props`
+can leave an unchanged ``props.json`` untouched.
+
+After a successful render the job dir keeps a snapshot of what was
+rendered (:func:`save_rendered`): the props and the Drive checksum of
+every downloaded asset.  :func:`diff_props` compares the next render's
+props with it, scene by scene, so the render stage can report what
+changed and keep downloads whose source did not.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+from .config import PROPS_VOLATILE_KEYS, RENDERED_PROPS_FILE
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+def group_by_scene(images: Iterable[dict[str, Any]]) -> dict[int, list[dict[str, Any]]]:
+    """``{scene_number: [image rows sorted by Image Index]}`` in one pass."""
+    by_scene: dict[int, list[dict[str, Any]]] = {}
+    for img in images:
+        by_scene.setdefault(img.get("Scene"), []).append(img)
+    for rows in by_scene.values():
+        rows.sort(key=lambda x: x.get("Image Index", 0))
+    return by_scene
+
+
+def _attachment_url(value: Any) -> str:
+    return value[0].get("url", "") if isinstance(value, list) and value else ""
+
+
+def image_asset(img: dict[str, Any], scene_number: int) -> dict[str, Any]:
+    """
+    One image slot of a scene.
+
+    Priority for the media:
+    1. Video Clip URL (animated) from Google Drive
+    2. Drive Image URL (static) from Google Drive
+    3. NEVER use Airtable attachment URLs when a Drive URL exists (they expire)
+    """
+    # Check for video clip first (animation pipeline output)
+    video_clip_url = img.get("Video Clip URL")  # Direct Drive URL for video
+    video_attachments = img.get("Video", [])
+
+    # Prefer video clip over static image
+    if video_clip_url:
+        media_url = video_clip_url
+        media_type = "video"
+    elif video_attachments:
+        # Fallback to Video attachment field
+        media_url = _attachment_url(video_attachments)
+        media_type = "video"
+    else:
+        # Fallback to static image (Drive URL preferred)
+        media_url = img.get("Drive Image URL") or _attachment_url(img.get("Image"))
+        media_type = "image"
+
+    asset = {
+        "index": img.get("Image Index", 0),
+        "url": media_url,
+        "type": media_type,  # "image" or "video"
+        "segmentText": img.get("Sentence Text", ""),
+        "duration": img.get("Duration (s)", 8.0),
+        "isHeroShot": img.get("Hero Shot", False),
+        "videoDuration": img.get("Video Duration", 6),
+    }
+
+    # =============================================================
+    # TIMING RECONCILIATION LAYER
+    # Handles mismatch between voiceover duration and clip duration
+    # =============================================================
+    voiceover_duration = asset["duration"]  # from audio timing
+    clip_duration = asset["videoDuration"] if media_type == "video" else None
+
+    if clip_duration is None:
+        # Static image — use voiceover duration directly (existing behavior)
+        asset["renderDuration"] = voiceover_duration
+        asset["playbackRate"] = 1.0
+    elif abs(voiceover_duration - clip_duration) <= 1.5:
+        # Close enough — adjust playback speed slightly
+        asset["renderDuration"] = voiceover_duration
+        asset["playbackRate"] = clip_duration / voiceover_duration if voiceover_duration > 0 else 1.0
+    elif voiceover_duration > clip_duration + 1.5:
+        # Big gap — hold last frame (or flag for hero shot upgrade)
+        asset["renderDuration"] = voiceover_duration
+        asset["playbackRate"] = 1.0
+        asset["holdLastFrame"] = voiceover_duration - clip_duration
+    else:
+        # Clip is longer than needed — trim end
+        asset["renderDuration"] = voiceover_duration
+        asset["playbackRate"] = 1.0
+        asset["trimEnd"] = clip_duration - voiceover_duration
+
+    # Per-image sound effect (new image-level system)
+    sfx_url = _attachment_url(img.get("Sound Effect"))
+    if sfx_url:
+        sfx_filename = f"sfx_{scene_number}_{img.get('Image Index', 0)}.mp3"
+        asset["sfx"] = f"sfx/{sfx_filename}"
+        asset["sfxVolume"] = img.get("Sound Volume", 0.15)
+        asset["sfxUrl"] = sfx_url  # For download during render
+
+    return asset
+
+
+def build_props(
+    video_title: str,
+    scripts: list[dict[str, Any]],
+    images: list[dict[str, Any]],
+    *,
+    folder_id: str | None = None,
+    doc_id: str | None = None,
+) -> dict[str, Any]:
+    """Remotion props for one video from its Script and Images rows."""
+    by_scene = group_by_scene(images)
+    scenes = []
+    for script in scripts:
+        scene_number = script.get("scene", 0)
+        scenes.append({
+            "sceneNumber": scene_number,
+            "text": script.get("Scene text", ""),
+            "voiceUrl": _attachment_url(script.get("Voice Over")),
+            "images": [image_asset(img, scene_number) for img in by_scene.get(scene_number, [])],
+        })
+    return {
+        "videoTitle": video_title,
+        "folderId": folder_id,
+        "docId": doc_id,
+        "scenes": scenes,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Serialize
+# ---------------------------------------------------------------------------
+
+def dumps_props(props: dict[str, Any]) -> str:
+    """Compact, key-sorted JSON: equal props always serialize identically."""
+    return json.dumps(props, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+
+
+def write_props(path: str | Path, props: dict[str, Any]) -> bool:
+    """
+    Write *props* to *path* atomically.
+
+    Returns:
+        False when the file already held exactly these props (left
+        untouched, mtime included), True when it was written.
+    """
+    path = Path(path)
+    text = dumps_props(props)
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    return True
+
+
+def load_props(path: str | Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Rendered snapshot
+# ---------------------------------------------------------------------------
+
+def save_rendered(job: str | Path, props: dict[str, Any], sources: dict[str, str | None]) -> None:
+    """Record what was just rendered: props + ``{public file: Drive md5}``."""
+    path = Path(job) / RENDERED_PROPS_FILE
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"props": props, "sources": sources},
+                              separators=(",", ":"), sort_keys=True))
+    os.replace(tmp, path)
+
+
+def load_rendered(job: str | Path, consume: bool = False) -> dict[str, Any] | None:
+    """
+    The last successful render's snapshot, or None.
+
+    With *consume* the file is removed: the caller is about to change
+    ``public/`` and must only vouch for it again via :func:`save_rendered`.
+    """
+    path = Path(job) / RENDERED_PROPS_FILE
+    snapshot = load_props(path)
+    if consume:
+        path.unlink(missing_ok=True)
+    if not isinstance(snapshot, dict) or "props" not in snapshot:
+        return None
+    snapshot.setdefault("sources", {})
+    return snapshot
+
+
+def reusable(name: str, md5: str | None, previous: dict[str, str | None]) -> bool:
+    """True when *name* was downloaded last render from the same Drive content."""
+    return bool(md5) and previous.get(name) == md5
+
+
+# ---------------------------------------------------------------------------
+# Diff
+# ---------------------------------------------------------------------------
+
+def _stable(value: Any) -> Any:
+    """*value* without volatile keys (re-signed attachment URLs)."""
+    if isinstance(value, dict):
+        return {k: _stable(v) for k, v in value.items() if k not in PROPS_VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_stable(v) for v in value]
+    return value
+
+
+def _scene_timing(props: dict[str, Any]) -> dict[int, list[Any]]:
+    timing: dict[int, list[Any]] = {}
+    for entry in (props.get("renderConfig") or {}).get("scenes", []):
+        timing.setdefault(entry.get("scene_number"), []).append(entry)
+    return timing
+
+
+def diff_props(old: dict[str, Any] | None, new: dict[str, Any]) -> dict[str, Any]:
+    """
+    What changed between two props, per scene.
+
+    A scene counts as changed when its entry (text, images, SFX), its
+    render-config timing or an ``assetFiles`` rename of one of its images
+    differs.  Volatile keys (:data:`PROPS_VOLATILE_KEYS`) are ignored.
+
+    Returns:
+        ``{first_render, unchanged, scenes_added, scenes_removed,
+        scenes_changed, images_changed: [[scene, index], ...],
+        global_changed: [top-level keys]}``
+    """
+    if old is None:
+        scenes = sorted(s.get("sceneNumber") for s in new.get("scenes", []))
+        return {"first_render": True, "unchanged": False, "scenes_added": scenes,
+                "scenes_removed": [], "scenes_changed": [], "images_changed": [],
+                "global_changed": []}
+
+    old_scenes = {s.get("sceneNumber"): _stable(s) for s in old.get("scenes", [])}
+    new_scenes = {s.get("sceneNumber"): _stable(s) for s in new.get("scenes", [])}
+    old_timing, new_timing = _scene_timing(old), _scene_timing(new)
+    old_files, new_files = old.get("assetFiles") or {}, new.get("assetFiles") or {}
+
+    changed, images_changed = [], []
+    for sn in sorted(set(old_scenes) & set(new_scenes)):
+        a, b = old_scenes[sn], new_scenes[sn]
+        old_images = {img.get("index"): img for img in a.get("images", [])}
+        new_images = {img.get("index"): img for img in b.get("images", [])}
+        for idx in sorted(set(old_images) | set(new_images)):
+            name = f"Scene_{sn:02d}_{idx:02d}.png" if isinstance(sn, int) and isinstance(idx, int) else None
+            if (old_images.get(idx) != new_images.get(idx)
+                    or (name and old_files.get(name) != new_files.get(name))):
+                images_changed.append([sn, idx])
+        if (a != b or old_timing.get(sn) != new_timing.get(sn)
+                or any(s == sn for s, _ in images_changed)):
+            changed.append(sn)
+
+    keys = (set(old) | set(new)) - {"scenes", "renderConfig", "assetFiles", "timeline"}
+    global_changed = sorted(k for k in keys if _stable(old.get(k)) != _stable(new.get(k)))
+    old_rc = {k: v for k, v in (old.get("renderConfig") or {}).items() if k != "scenes"}
+    new_rc = {k: v for k, v in (new.get("renderConfig") or {}).items() if k != "scenes"}
+    if old_rc != new_rc:
+        global_changed.append("renderConfig")
+
+    added = sorted(set(new_scenes) - set(old_scenes))
+    removed = sorted(set(old_scenes) - set(new_scenes))
+    return {
+        "first_render": False,
+        "unchanged": not (added or removed or changed or global_changed),
+        "scenes_added": added,
+        "scenes_removed": removed,
+        "scenes_changed": changed,
+        "images_changed": images_changed,
+        "global_changed": global_changed,
+    }
+
+
+def format_diff(diff: dict[str, Any]) -> str:
+    """One log line for a :func:`diff_props` result."""
+    if diff["first_render"]:
+        return f"first render ({len(diff['scenes_added'])} scenes)"
+    if diff["unchanged"]:
+        return "unchanged since last render"
+    parts = []
+    if diff["scenes_changed"]:
+        parts.append(f"scenes changed: {', '.join(map(str, diff['scenes_changed']))} "
+                     f"({len(diff['images_changed'])} images)")
+    if diff["scenes_added"]:
+        parts.append(f"added: {', '.join(map(str, diff['scenes_added']))}")
+    if diff["scenes_removed"]:
+        parts.append(f"removed: {', '.join(map(str, diff['scenes_removed']))}")
+    if diff["global_changed"]:
+        parts.append(f"also: {', '.join(diff['global_changed'])}")
+    return "; ".join(parts)
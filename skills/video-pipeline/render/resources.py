@@ -0,0 +1,55 @@
+"""
+Host resource probes used to size parallel render work.
+
+Reads ``/proc`` directly (no psutil dependency); on platforms without it
+the probes fall back to ``os.sysconf`` / conservative defaults.
+"""
+
+from __future__ import annotations
+
+import os
+
+from .config import MAX_PARALLEL_CHUNKS, RAM_PER_RENDER_JOB_GB, REMOTION_CONCURRENCY
+
+_GB = 1024 ** 3
+
+
+def available_memory_bytes() -> int | None:
+    """``MemAvailable`` from /proc/meminfo (falls back to free pages)."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def cpu_count() -> int:
+    """CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def parallel_render_jobs(
+    concurrency: int = REMOTION_CONCURRENCY,
+    ram_per_job_gb: float = RAM_PER_RENDER_JOB_GB,
+    max_jobs: int = MAX_PARALLEL_CHUNKS,
+) -> int:
+    """
+    How many Remotion jobs can run side by side right now.
+
+    Bounded by free RAM (``ram_per_job_gb`` each), by CPUs (each job uses
+    ``concurrency`` tabs) and by *max_jobs*.  Always at least 1 — a single
+    job is the sequential, resumable fallback.
+    """
+    by_cpu = max(1, cpu_count() // max(1, concurrency))
+    avail = available_memory_bytes()
+    by_ram = int(avail // (ram_per_job_gb * _GB)) if avail else 1
+    return max(1, min(by_cpu, by_ram, max_jobs))
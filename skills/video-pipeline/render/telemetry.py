@@ -0,0 +1,420 @@
+"""
+Render performance telemetry.
+
+A :class:`RenderTelemetry` is handed to :func:`~render.render_chunked` or
+:func:`~render.render_ffmpeg` and records, per render and per chunk:
+
+* frames rendered and fps over time (from the ``Rendered N/M`` progress
+  the orchestrator already parses, or per finished ffmpeg scene);
+* peak resident memory and CPU time of each job's process tree
+  (``npx remotion`` + its Chrome tabs / ffmpeg), sampled from ``/proc``
+  every ``TELEMETRY_SAMPLE_SECONDS`` — no psutil;
+* render seconds per scene type: ``image``, ``video`` (has clips) or
+  ``transition_heavy`` (:func:`scene_types`).
+
+Job process trees are told apart by a marker in their command line (the
+chunk's output path), so several renders in one Python process — the
+threaded ``run_render_bot.py`` — don't mix.  :meth:`RenderTelemetry.summary`
+returns one JSON-ready record; :func:`append_record` stores it as a line of
+``remotion-video/out/telemetry/renders.jsonl``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .chunks import scene_frame_layout, total_frames
+from .config import (
+    DEFAULT_FPS,
+    TELEMETRY_SAMPLE_SECONDS,
+    TELEMETRY_TIMELINE_POINTS,
+    TRANSITION_HEAVY_FRACTION,
+)
+from .resources import cpu_count
+
+try:
+    _CLK_TCK = os.sysconf("SC_CLK_TCK")
+    _PAGE = os.sysconf("SC_PAGE_SIZE")
+except (ValueError, OSError, AttributeError):
+    _CLK_TCK, _PAGE = 100, 4096
+
+
+def scene_types(
+    render_config: dict[str, Any],
+    props: dict[str, Any] | None = None,
+    public_dir: str | Path | None = None,
+) -> dict[int, str]:
+    """
+    ``{scene_number: "image" | "video" | "transition_heavy"}``.
+
+    Clips are found by :func:`~render.ffmpeg_renderer.clip_scenes` from
+    *props* and *public_dir* as well as the config.
+    """
+    from .ffmpeg_renderer import clip_scenes
+
+    clips = clip_scenes(render_config, props, public_dir)
+    by_scene: dict[int, list[dict[str, Any]]] = {}
+    for entry in render_config.get("scenes", []):
+        by_scene.setdefault(entry.get("scene_number", 0), []).append(entry)
+    types = {}
+    for sn, entries in by_scene.items():
+        shown = sum(e.get("display_duration", 0) for e in entries)
+        in_transition = sum((e.get("transition_in") or {}).get("duration", 0) for e in entries)
+        if sn in clips:
+            types[sn] = "video"
+        elif shown > 0 and in_transition / shown >= TRANSITION_HEAVY_FRACTION:
+            types[sn] = "transition_heavy"
+        else:
+            types[sn] = "image"
+    return types
+
+
+# ---------------------------------------------------------------------------
+# /proc sampling
+# ---------------------------------------------------------------------------
+
+def _read_proc() -> dict[int, tuple[int, int, int]]:
+    """``{pid: (ppid, cpu_ticks, rss_bytes)}`` for every visible process."""
+    procs = {}
+    try:
+        pids = [int(p) for p in os.listdir("/proc") if p.isdigit()]
+    except OSError:
+        return procs
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                stat = f.read()
+            with open(f"/proc/{pid}/statm") as f:
+                rss_pages = int(f.read().split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        # comm may contain spaces/parens; fields resume after the last ')'
+        fields = stat[stat.rfind(")") + 2:].split()
+        try:
+            procs[pid] = (int(fields[1]), int(fields[11]) + int(fields[12]), rss_pages * _PAGE)
+        except (ValueError, IndexError):
+            continue
+    return procs
+
+
+def _cmdline(pid: int) -> str:
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return f.read().replace(b"\0", b" ").decode(errors="replace")
+    except OSError:
+        return ""
+
+
+def _cwd(pid: int) -> str:
+    try:
+        return os.readlink(f"/proc/{pid}/cwd")
+    except OSError:
+        return ""
+
+
+def _subtree(root: int, children: dict[int, list[int]]) -> list[int]:
+    pids, stack = [], [root]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, ()))
+    return pids
+
+
+def _thin(points: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
+    if len(points) <= limit:
+        return points
+    step = len(points) / limit
+    return [points[int(i * step)] for i in range(limit - 1)] + [points[-1]]
+
+
+# ---------------------------------------------------------------------------
+# Collector
+# ---------------------------------------------------------------------------
+
+class RenderTelemetry:
+    """Collects per-job and whole-render metrics while a render runs."""
+
+    __slots__ = (
+        "engine", "label", "fps", "sample_seconds", "frames_total", "_layout",
+        "_types", "_jobs", "_timeline", "_lock", "_stop", "_thread",
+        "_started", "_ended",
+    )
+
+    def __init__(
+        self,
+        render_config: dict[str, Any],
+        fps: int | None = None,
+        *,
+        engine: str = "remotion",
+        label: str = "",
+        sample_seconds: float = TELEMETRY_SAMPLE_SECONDS,
+        props: dict[str, Any] | None = None,
+        public_dir: str | Path | None = None,
+    ) -> None:
+        self.engine = engine
+        self.label = label
+        self.fps = fps or render_config.get("fps") or DEFAULT_FPS
+        self.sample_seconds = sample_seconds
+        self.frames_total = total_frames(render_config, self.fps)
+        self._layout = scene_frame_layout(render_config, self.fps)
+        self._types = scene_types(render_config, props, public_dir)
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._timeline: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started: float | None = None
+        self._ended: float | None = None
+
+    # -- lifecycle -------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background sampler (idempotent)."""
+        if self._thread is not None:
+            return
+        self._started = time.time()
+        self._sample()
+        self._thread = threading.Thread(target=self._sample_loop, name="render-telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None or self._ended is not None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=self.sample_seconds + 5)
+        self._sample()
+        self._ended = time.time()
+
+    # -- job hooks (called from the renderers' worker threads) -----------------
+
+    def job_started(
+        self,
+        name: str,
+        span: dict[str, Any] | None,
+        marker: str = "",
+        cwd: str | Path | None = None,
+    ) -> None:
+        """
+        Register a job.
+
+        Args:
+            name: Chunk file name (unique within the render).
+            span: ``{start_frame, end_frame, scenes}`` of a video job;
+                ``None`` for the audio pass.
+            marker: Substring of the job's command line that identifies
+                its process tree.
+            cwd: Also require the process's working directory (for
+                commands with relative output paths).
+        """
+        with self._lock:
+            self._jobs[name] = {
+                "name": name,
+                "kind": "audio" if span is None else "video",
+                "scenes": list(span.get("scenes", [])) if span else [],
+                "start_frame": span["start_frame"] if span else None,
+                "end_frame": span["end_frame"] if span else None,
+                "marker": marker,
+                "cwd": str(Path(cwd).resolve()) if cwd else None,
+                "started": time.time(),
+                "ended": None,
+                "frames": 0,
+                "peak_rss": 0,
+                "cpu_ticks": {},
+                "ok": None,
+            }
+
+    def job_frames(self, name: str, frames: int) -> None:
+        """Frames finished so far by job *name*."""
+        with self._lock:
+            job = self._jobs.get(name)
+            if job:
+                job["frames"] = max(job["frames"], frames)
+
+    def job_finished(self, name: str, ok: bool) -> None:
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None:
+                return
+            job["ended"] = time.time()
+            job["ok"] = ok
+            if ok and job["kind"] == "video":
+                job["frames"] = job["end_frame"] - job["start_frame"] + 1
+
+    # -- sampling --------------------------------------------------------------
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.sample_seconds):
+            self._sample()
+
+    def _sample(self) -> None:
+        procs = _read_proc()
+        children: dict[int, list[int]] = {}
+        for pid, (ppid, _, _) in procs.items():
+            children.setdefault(ppid, []).append(pid)
+        roots = children.get(os.getpid(), [])
+        now = time.time()
+        with self._lock:
+            active = [j for j in self._jobs.values() if j["ended"] is None and j["marker"]]
+            rss = 0
+            for root in roots:
+                cmdline = _cmdline(root)
+                job = next((j for j in active if j["marker"] in cmdline), None)
+                if job is None or (job["cwd"] and _cwd(root) != job["cwd"]):
+                    continue
+                tree = _subtree(root, children)
+                tree_rss = sum(procs[p][2] for p in tree if p in procs)
+                job["peak_rss"] = max(job["peak_rss"], tree_rss)
+                # Per-pid high-water marks: ticks of exited processes stay counted
+                for p in tree:
+                    if p in procs:
+                        job["cpu_ticks"][p] = max(job["cpu_ticks"].get(p, 0), procs[p][1])
+                rss += tree_rss
+            self._timeline.append({
+                "t": round(now - (self._started or now), 2),
+                "frames": sum(j["frames"] for j in self._jobs.values()),
+                "rss": rss,
+                "cpu_ticks": sum(sum(j["cpu_ticks"].values()) for j in self._jobs.values()),
+            })
+
+    # -- report ----------------------------------------------------------------
+
+    def _scene_seconds(self, jobs: list[dict[str, Any]]) -> dict[str, dict[str, float]]:
+        """Render time per scene type, chunk time split by frames."""
+        spans = {s["scene_number"]: s for s in self._layout}
+        out: dict[str, dict[str, float]] = {}
+        for job in jobs:
+            if job["kind"] != "video" or not job["ok"]:
+                continue
+            elapsed = job["ended"] - job["started"]
+            size = job["end_frame"] - job["start_frame"] + 1
+            for sn in job["scenes"]:
+                span = spans.get(sn)
+                if span is None:
+                    continue
+                lo = max(span["start_frame"], job["start_frame"])
+                hi = min(span["start_frame"] + span["duration_frames"] - 1, job["end_frame"])
+                frames = max(0, hi - lo + 1)
+                bucket = out.setdefault(self._types.get(sn, "image"),
+                                        {"scenes": 0, "frames": 0, "seconds": 0.0})
+                bucket["scenes"] += 1
+                bucket["frames"] += frames
+                bucket["seconds"] += elapsed * frames / size
+        for bucket in out.values():
+            bucket["seconds"] = round(bucket["seconds"], 2)
+            bucket["fps"] = round(bucket["frames"] / bucket["seconds"], 2) if bucket["seconds"] else None
+        return out
+
+    def summary(self, ok: bool | None = None, **extra: Any) -> dict[str, Any]:
+        """
+        JSON-ready record of the render so far.
+
+        Args:
+            ok: Overall outcome (``None`` while running).
+            **extra: Merged in (render stats, video id, commit, ...).
+        """
+        with self._lock:
+            jobs = [dict(j) for j in self._jobs.values()]
+            timeline = list(self._timeline)
+        start = self._started or time.time()
+        end = self._ended or time.time()
+        elapsed = end - start
+        cpus = cpu_count()
+
+        chunks = []
+        for job in sorted(jobs, key=lambda j: (j["kind"] != "audio", j["start_frame"] or 0)):
+            seconds = (job["ended"] or end) - job["started"]
+            cpu_s = sum(job["cpu_ticks"].values()) / _CLK_TCK
+            chunks.append({
+                "name": job["name"],
+                "kind": job["kind"],
+                "scenes": job["scenes"],
+                "frames": job["frames"],
+                "seconds": round(seconds, 2),
+                "fps": round(job["frames"] / seconds, 2) if job["kind"] == "video" and seconds > 0 else None,
+                "peak_rss_bytes": job["peak_rss"],
+                "cpu_seconds": round(cpu_s, 1),
+                "ok": job["ok"],
+            })
+
+        points = []
+        for prev, cur in zip(timeline, timeline[1:]):
+            dt = cur["t"] - prev["t"]
+            if dt <= 0:
+                continue
+            points.append({
+                "t": cur["t"],
+                "fps": round(max(0, cur["frames"] - prev["frames"]) / dt, 2),
+                "rss_bytes": cur["rss"],
+                "cpu_pct": round(100 * max(0, cur["cpu_ticks"] - prev["cpu_ticks"])
+                                 / _CLK_TCK / dt / cpus, 1),
+            })
+
+        rendered = sum(c["frames"] for c in chunks if c["kind"] == "video")
+        cpu_seconds = sum(c["cpu_seconds"] for c in chunks)
+        record = {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(start)),
+            "label": self.label,
+            "engine": self.engine,
+            "host": socket.gethostname(),
+            "cpus": cpus,
+            "ok": ok,
+            "fps_target": self.fps,
+            "total_frames": self.frames_total,
+            "rendered_frames": rendered,
+            "elapsed": round(elapsed, 2),
+            "fps": round(rendered / elapsed, 2) if elapsed > 0 else None,
+            "peak_rss_bytes": max((p["rss_bytes"] for p in points), default=0),
+            "peak_job_rss_bytes": max((c["peak_rss_bytes"] for c in chunks), default=0),
+            "cpu_seconds": round(cpu_seconds, 1),
+            "cpu_pct": round(100 * cpu_seconds / elapsed / cpus, 1) if elapsed > 0 else None,
+            "scene_types": self._scene_seconds(jobs),
+            "chunks": chunks,
+            "timeline": _thin(points, TELEMETRY_TIMELINE_POINTS),
+        }
+        record.update(extra)
+        return record
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def append_record(path: str | Path, record: dict[str, Any]) -> None:
+    """Append *record* as one JSON line."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def load_records(path: str | Path) -> list[dict[str, Any]]:
+    """All records in a telemetry file (unreadable lines skipped)."""
+    records = []
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return records
+
+
+def format_summary(record: dict[str, Any]) -> str:
+    """One log/Slack line: fps, peak memory, CPU, slowest scene type."""
+    gb = (record.get("peak_rss_bytes") or record.get("peak_job_rss_bytes") or 0) / 1024 ** 3
+    parts = [f"{record.get('fps') or 0:.1f} fps", f"peak {gb:.1f} GB RSS",
+             f"CPU {record.get('cpu_pct') or 0:.0f}%"]
+    per_type = {k: v["fps"] for k, v in record.get("scene_types", {}).items() if v.get("fps")}
+    if per_type:
+        parts.append(", ".join(f"{k} {v:.1f} fps" for k, v in sorted(per_type.items())))
+    return " · ".join(parts)
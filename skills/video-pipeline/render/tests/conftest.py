@@ -0,0 +1,18 @@
+"""Shared fixtures for the render tests."""
+
+import pytest
+
+from render import bundle as bundle_mod
+
+
+@pytest.fixture(autouse=True)
+def no_prebundle(monkeypatch):
+    """
+    Render from the entry point unless a test opts into bundling.
+
+    ``render_chunked`` pre-bundles by default, which would run the real
+    ``npx remotion bundle`` (network, minutes) under the fake-Remotion
+    tests.  test_bundle.py imports :func:`prepare_bundle` directly and
+    fakes ``subprocess.run`` instead.
+    """
+    monkeypatch.setattr(bundle_mod, "prepare_bundle", lambda *args, **kwargs: None)
@@ -0,0 +1,106 @@
+"""Tests for render.assets — pre-render still/clip normalization (no ffmpeg)."""
+
+import json
+
+import pytest
+
+from render import assets
+from render.assets import (
+    asset_file_map,
+    cover_box,
+    image_target_size,
+    normalize_assets,
+    summarize,
+)
+from render.config import ASSET_MANIFEST_FILE
+
+Image = pytest.importorskip("PIL.Image")
+
+_RES = {"width": 640, "height": 360}
+
+
+def _png(path, size=(2048, 1152), mode="RGB"):
+    Image.new(mode, size, (200, 40, 40, 255)[: len(mode)]).save(path, format="PNG")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Geometry
+# ---------------------------------------------------------------------------
+
+class TestGeometry:
+    def test_target_includes_overscan(self):
+        assert image_target_size({"width": 1920, "height": 1080}) == (2400, 1350)
+        assert image_target_size(None, overscan=1.0) == (1920, 1080)
+
+    def test_cover_downscale_and_crop(self):
+        size, box = cover_box((4000, 3000), (2400, 1350))
+        assert size == (2400, 1800)
+        assert box == (0, 225, 2400, 1575)
+
+    def test_never_upscales(self):
+        size, box = cover_box((1200, 675), (2400, 1350))
+        assert size == (1200, 675)
+        assert box == (0, 0, 1200, 675)
+
+
+# ---------------------------------------------------------------------------
+# normalize_assets
+# ---------------------------------------------------------------------------
+
+class TestNormalizeAssets:
+    def test_stills_become_jpeg_at_target(self, tmp_path):
+        _png(tmp_path / "Scene_01_01.png")
+        _png(tmp_path / "Scene_01_02.png", size=(800, 800), mode="RGBA")
+        manifest = normalize_assets(tmp_path, _RES, workers=1)
+
+        with Image.open(tmp_path / "Scene_01_01.jpg") as img:
+            assert img.format == "JPEG"
+            assert img.size == (800, 450)
+        with Image.open(tmp_path / "Scene_01_02.jpg") as img:
+            assert img.size == (800, 450)  # square source cropped to 16:9
+        assert not list(tmp_path.glob("Scene_*.png"))
+        assert asset_file_map(manifest) == {
+            "Scene_01_01.png": "Scene_01_01.jpg",
+            "Scene_01_02.png": "Scene_01_02.jpg",
+        }
+        stats = summarize(manifest)
+        assert stats["normalized"] == 2
+        assert stats["bytes_out"] < stats["bytes_in"]
+
+    def test_manifest_survives_rerun(self, tmp_path):
+        _png(tmp_path / "Scene_01_01.png")
+        normalize_assets(tmp_path, _RES, workers=1)
+        manifest = normalize_assets(tmp_path, _RES, workers=1)
+        assert asset_file_map(manifest) == {"Scene_01_01.png": "Scene_01_01.jpg"}
+        on_disk = json.loads((tmp_path / ASSET_MANIFEST_FILE).read_text())
+        assert on_disk == manifest
+
+    def test_webp(self, tmp_path):
+        _png(tmp_path / "Scene_02_01.png")
+        normalize_assets(tmp_path, _RES, image_format="webp", workers=1)
+        assert (tmp_path / "Scene_02_01.webp").exists()
+
+    def test_process_pool(self, tmp_path):
+        for i in range(1, 4):
+            _png(tmp_path / f"Scene_01_{i:02d}.png", size=(1000, 600))
+        manifest = normalize_assets(tmp_path, _RES, workers=2)
+        assert summarize(manifest)["normalized"] == 3
+
+    def test_failed_clip_keeps_original(self, tmp_path, monkeypatch):
+        clip = tmp_path / "Scene_03_01.mp4"
+        clip.write_bytes(b"not really a video")
+
+        def _broken(job):
+            raise RuntimeError("ffmpeg not installed")
+
+        monkeypatch.setattr(assets, "normalize_clip", _broken)
+        manifest = normalize_assets(tmp_path, _RES, workers=1)
+        assert clip.read_bytes() == b"not really a video"
+        assert manifest["assets"]["Scene_03_01.mp4"]["error"] == "ffmpeg not installed"
+        assert summarize(manifest)["failed"] == 1
+        assert asset_file_map(manifest) == {}
+
+    def test_rejects_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            normalize_assets(tmp_path, _RES, image_format="gif")
@@ -0,0 +1,170 @@
+"""Tests for render.audio_bed — the ffmpeg pre-mix of narration and SFX (no ffmpeg)."""
+
+import pytest
+
+from render import ffmpeg_renderer
+from render.audio_bed import bed_filter_script, bed_sources, matching_narration, premix_audio_bed
+from render.ffmpeg_renderer import build_scene_plan
+from render.orchestrator import RenderError, file_sha256
+
+
+def _config():
+    scenes, t = [], 0.0
+    for sn in (1, 2):
+        for idx, dur in ((1, 4.0), (2, 6.0)):
+            scenes.append({
+                "scene_number": sn, "image_index": idx, "type": "image",
+                "image_path": f"/x/Scene_{sn:02d}_{idx:02d}.png",
+                "display_start": t, "display_end": t + dur, "display_duration": dur,
+            })
+            t += dur
+    return {"fps": 24, "total_duration_seconds": t, "scenes": scenes}
+
+
+@pytest.fixture
+def public(tmp_path):
+    public = tmp_path / "public"
+    (public / "sfx").mkdir(parents=True)
+    for sn in (1, 2):
+        (public / f"Scene {sn}.mp3").write_bytes(b"mp3")
+    (public / "sfx" / "sfx_2_1.mp3").write_bytes(b"sfx")
+    (public / "sfx" / "rain.mp3").write_bytes(b"rain")
+    return public
+
+
+_PROPS = {"scenes": [
+    {"sceneNumber": 1, "images": [{"index": 2, "sfx": "sfx/missing.mp3"}],
+     "sound_layers": [{"file": "sfx/rain.mp3", "start_segment": 1, "end_segment": 2,
+                       "volume": 0.05, "loop": True, "fade_in": 1.0, "fade_out": 2.0}]},
+    {"sceneNumber": 2, "images": [{"index": 1, "sfx": "sfx/sfx_2_1.mp3", "sfxVolume": 0.2}]},
+]}
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    commands = []
+
+    def _run(cmd, cwd):
+        commands.append(cmd)
+        (cwd / cmd[-1]).write_bytes(b"aac")
+        return 0, ""
+
+    monkeypatch.setattr(ffmpeg_renderer, "_run_ffmpeg", _run)
+    return commands
+
+
+# ---------------------------------------------------------------------------
+# Sources / graph
+# ---------------------------------------------------------------------------
+
+class TestSources:
+    def test_layers_span_their_segments_and_loop(self, public):
+        plan = build_scene_plan(_config(), 24, public)
+        layers = {1: _PROPS["scenes"][0]["sound_layers"]}
+        sources = bed_sources(plan, 24, public, {}, layers)
+        rain = sources[1]
+        assert rain["start"] == 0.0
+        assert rain["length"] == pytest.approx(plan[0]["frames"] / 24)  # both images
+        assert rain["loop"]
+
+        inputs, script = bed_filter_script(sources, 30.0)
+        assert inputs[inputs.index("-stream_loop") + 3].endswith("rain.mp3")
+        assert "afade=t=in:d=1.0000" in script
+        assert "volume=0.05" in script
+        assert script.endswith("apad,atrim=0:30.0000[mix]")
+
+    def test_narration_unfaded(self, public):
+        plan = build_scene_plan(_config(), 24, public)
+        _, script = bed_filter_script(bed_sources(plan, 24, public, {}), 22.0)
+        assert "afade" not in script
+        assert "amix=inputs=2" in script
+
+    def test_gains_scale_volumes(self, public):
+        plan = build_scene_plan(_config(), 24, public)
+        sfx = {(2, 1): {"sfx": "sfx/sfx_2_1.mp3", "sfxVolume": 0.2}}
+        sources = bed_sources(plan, 24, public, sfx, gains={"Scene 1.mp3": 6.0, "sfx/sfx_2_1.mp3": -6.0})
+        assert sources[0]["volume"] == pytest.approx(1.9953)
+        assert sources[1]["volume"] is None  # Scene 2 narration: no gain
+        assert sources[2]["volume"] == pytest.approx(0.1002)
+        _, script = bed_filter_script(sources, 22.0)
+        assert script.startswith("[0:a]volume=1.9953,adelay=0:all=1[a0]")
+
+
+# ---------------------------------------------------------------------------
+# Narration track
+# ---------------------------------------------------------------------------
+
+def _narration(tmp_path, public):
+    track = tmp_path / "narration.wav"
+    track.write_bytes(b"RIFF" + b"\0" * 96)
+    return {
+        "file": str(track), "bytes": 100, "sample_rate": 44100, "samples": 441000,
+        "scenes": [
+            {"scene_number": sn, "sha256": file_sha256(public / f"Scene {sn}.mp3"),
+             "offset_samples": offset, "samples": samples}
+            for sn, offset, samples in ((1, 0, 220500), (2, 220500, 220500))
+        ],
+    }
+
+
+class TestNarrationTrack:
+    def test_scenes_cut_from_one_input(self, tmp_path, public):
+        plan = build_scene_plan(_config(), 24, public)
+        narration = matching_narration(_narration(tmp_path, public), public, plan)
+        sources = bed_sources(plan, 24, public, {}, gains={"Scene 2.mp3": 6.0}, narration=narration)
+        inputs, script = bed_filter_script(sources, 22.0)
+        assert inputs == ["-i", str(tmp_path / "narration.wav")]
+        lines = script.split(";\n")
+        assert lines[0] == "[0:a]asplit=2[s0][s1]"
+        assert lines[1] == "[s0]atrim=start_sample=0:end_sample=220500,asetpts=PTS-STARTPTS,adelay=0:all=1[a0]"
+        assert lines[2] == ("[s1]atrim=start_sample=220500:end_sample=441000,"
+                            "asetpts=PTS-STARTPTS,volume=1.9953,adelay=11000:all=1[a1]")
+
+    def test_stale_track_falls_back_to_scene_files(self, tmp_path, public):
+        plan = build_scene_plan(_config(), 24, public)
+        narration = _narration(tmp_path, public)
+        assert matching_narration(narration, public, plan) is narration
+        (public / "Scene 2.mp3").write_bytes(b"regenerated")
+        assert matching_narration(narration, public, plan) is None
+        assert matching_narration({**narration, "bytes": 5}, public, plan) is None
+        assert matching_narration(None, public, plan) is None
+
+
+# ---------------------------------------------------------------------------
+# Pre-mix
+# ---------------------------------------------------------------------------
+
+class TestPremix:
+    def test_mixes_once_then_reuses(self, tmp_path, public, fake_ffmpeg):
+        out = tmp_path / "bed" / "vid.aac"
+        first = premix_audio_bed(public, _config(), out, props=_PROPS)
+        assert not first["reused"]
+        assert first["sources"] == 4  # 2 narrations, rain, sfx_2_1 (missing SFX dropped)
+        assert out.read_bytes() == b"aac"
+        assert not list(out.parent.glob("*.filter"))
+
+        second = premix_audio_bed(public, _config(), out, props=_PROPS)
+        assert second["reused"] and len(fake_ffmpeg) == 1
+
+        # A replaced SFX changes the inputs' key
+        (public / "sfx" / "sfx_2_1.mp3").write_bytes(b"new sfx")
+        assert not premix_audio_bed(public, _config(), out, props=_PROPS)["reused"]
+
+    def test_narration_track_used(self, tmp_path, public, fake_ffmpeg):
+        out = tmp_path / "bed" / "vid.aac"
+        premix_audio_bed(public, _config(), out, narration=_narration(tmp_path, public))
+        cmd = fake_ffmpeg[0]
+        assert cmd.count("-i") == 1 and cmd[cmd.index("-i") + 1].endswith("narration.wav")
+
+    def test_missing_narration(self, tmp_path, public, fake_ffmpeg):
+        (public / "Scene 2.mp3").unlink()
+        with pytest.raises(RenderError) as exc:
+            premix_audio_bed(public, _config(), tmp_path / "bed.aac")
+        assert exc.value.detail == "Scene 2.mp3"
+        assert not fake_ffmpeg
+
+    def test_ffmpeg_failure_keeps_no_partial(self, tmp_path, public, monkeypatch):
+        monkeypatch.setattr(ffmpeg_renderer, "_run_ffmpeg", lambda cmd, cwd: (1, "Invalid filter"))
+        with pytest.raises(RenderError, match="audio bed"):
+            premix_audio_bed(public, _config(), tmp_path / "bed.aac")
+        assert not list(tmp_path.glob("bed*"))
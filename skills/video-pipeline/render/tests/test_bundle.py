@@ -0,0 +1,96 @@
+"""Tests for render.bundle — cached Remotion bundle per composition version."""
+
+import subprocess
+
+import pytest
+
+from render import bundle as bundle_mod
+from render.bundle import BundleError, bundle_view, ensure_bundle, prepare_bundle
+from render.orchestrator import build_chunk_command
+
+
+@pytest.fixture
+def project(tmp_path):
+    remotion = tmp_path / "remotion-video"
+    (remotion / "src").mkdir(parents=True)
+    (remotion / "src" / "Main.tsx").write_text("export const Main = () => null;")
+    (remotion / "package-lock.json").write_text("{}")
+    return remotion
+
+
+@pytest.fixture
+def fake_bundler(monkeypatch):
+    """``npx remotion bundle`` that writes index.html + a bundle.js."""
+    calls = []
+
+    def _run(cmd, cwd, **kwargs):
+        calls.append(cmd)
+        out = next(c.split("=", 1)[1] for c in cmd if c.startswith("--out-dir="))
+        from pathlib import Path
+        Path(out).mkdir(parents=True)
+        (Path(out) / "index.html").write_text("<html/>")
+        (Path(out) / "bundle.js").write_text("//")
+        (Path(out) / "public").mkdir()
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(bundle_mod.subprocess, "run", _run)
+    return calls
+
+
+class TestEnsureBundle:
+    def test_built_once_per_code_version(self, project, fake_bundler):
+        first = ensure_bundle(project)
+        assert ensure_bundle(project) == first
+        assert len(fake_bundler) == 1
+        assert (first / "index.html").is_file()
+        assert not (first / "public").exists()  # no assets baked in
+
+        (project / "src" / "Main.tsx").write_text("export const Main = () => <div/>;")
+        second = ensure_bundle(project)
+        assert second != first
+        assert len(fake_bundler) == 2
+
+    def test_prunes_old_versions(self, project, fake_bundler):
+        for i in range(3):
+            (project / "package-lock.json").write_text(f'{{"v": {i}}}')
+            ensure_bundle(project, keep=2)
+        bundles = [p for p in (project / "out" / "bundles").iterdir() if p.is_dir()]
+        assert len(bundles) == 2
+
+    def test_failure_falls_back_to_entry_point(self, project, tmp_path, monkeypatch):
+        monkeypatch.setattr(bundle_mod.subprocess, "run",
+                            lambda cmd, cwd, **kw: subprocess.CompletedProcess(cmd, 1, "", "boom"))
+        with pytest.raises(BundleError, match="boom"):
+            ensure_bundle(project)
+        assert prepare_bundle(project, None, tmp_path / "work") is None
+        assert [p.name for p in (project / "out" / "bundles").iterdir()] == [".lock"]
+
+    def test_timeout_falls_back_to_entry_point(self, project, tmp_path, monkeypatch):
+        def _hang(cmd, cwd, timeout, **kwargs):
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        monkeypatch.setattr(bundle_mod.subprocess, "run", _hang)
+        with pytest.raises(BundleError, match="timed out"):
+            ensure_bundle(project, timeout=1)
+        assert prepare_bundle(project, None, tmp_path / "work") is None
+        # The lock is released: the next caller is not blocked
+        assert [p.name for p in (project / "out" / "bundles").iterdir()] == [".lock"]
+
+
+class TestView:
+    def test_view_links_job_public_dir(self, project, tmp_path, fake_bundler):
+        public = tmp_path / "jobs" / "rec1" / "public"
+        public.mkdir(parents=True)
+        (public / "Scene 1.mp3").write_bytes(b"x")
+        view = bundle_view(ensure_bundle(project), public, tmp_path / "work")
+        assert (view / "index.html").read_text() == "<html/>"
+        assert (view / "public" / "Scene 1.mp3").read_bytes() == b"x"
+        # Rebuilt, not appended to, on the next render
+        assert bundle_view(ensure_bundle(project), public, tmp_path / "work") == view
+
+    def test_command_uses_serve_url(self, tmp_path):
+        cmd = build_chunk_command("Main", tmp_path / "c.mp4", tmp_path / "p.json",
+                                  {"start_frame": 0, "end_frame": 9},
+                                  public_dir=tmp_path / "public", serve_url=tmp_path / "bundle")
+        assert cmd[3:6] == [str(tmp_path / "bundle"), "Main", str(tmp_path / "c.mp4")]
+        assert not any(c.startswith("--public-dir") for c in cmd)
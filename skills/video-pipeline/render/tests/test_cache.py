@@ -0,0 +1,196 @@
+"""Tests for render.cache — scene fingerprints and the segment cache (no Remotion)."""
+
+import copy
+import json
+import os
+
+import pytest
+
+from render import orchestrator
+from render.cache import SceneCache, composition_version, scene_fingerprints
+from render.orchestrator import render_chunked
+
+
+def _config(durations=(10.0, 12.0, 8.0)):
+    scenes, t = [], 0.0
+    for sn, dur in enumerate(durations, start=1):
+        for idx in (1, 2):
+            scenes.append({
+                "scene_number": sn, "image_index": idx, "image_path": f"/tmp/{sn}_{idx}.png",
+                "display_start": t, "display_end": t + dur / 2, "display_duration": dur / 2,
+                "narration_start": t, "narration_end": t + dur / 2,
+                "sentence_text": f"scene {sn} sentence {idx}",
+                "ken_burns": {"direction": "in"}, "transition_in": {}, "transition_out": {},
+            })
+            t += dur / 2
+    return {"fps": 24, "total_duration_seconds": t, "resolution": {"width": 1920, "height": 1080},
+            "scenes": scenes}
+
+
+def _props():
+    return {"scenes": [
+        {"sceneNumber": sn, "voiceUrl": "https://x/v.mp3",
+         "images": [{"index": 1, "segmentText": "s", "url": "https://x/a.png",
+                     "sfx": f"sfx/sfx_{sn}_1.mp3", "sfxVolume": 0.15}]}
+        for sn in (1, 2, 3)
+    ]}
+
+
+@pytest.fixture
+def public(tmp_path):
+    public = tmp_path / "public"
+    public.mkdir()
+    for sn in (1, 2, 3):
+        (public / f"Scene {sn}.mp3").write_bytes(f"audio {sn}".encode())
+        for idx in (1, 2):
+            (public / f"Scene_{sn:02d}_{idx:02d}.png").write_bytes(f"img {sn} {idx}".encode())
+    return public
+
+
+def _fps(public, config=None, props=None, code="v1"):
+    return scene_fingerprints(config or _config(), public, code, props or _props())
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+class TestSceneFingerprints:
+    def test_stable(self, public):
+        assert _fps(public) == _fps(public)
+        assert len(set(_fps(public).values())) == 3
+
+    def test_image_change_only_invalidates_its_scene(self, public):
+        before = _fps(public)
+        (public / "Scene_02_01.png").write_bytes(b"fixed image")
+        after = _fps(public)
+        assert [sn for sn in before if before[sn] != after[sn]] == [2]
+
+    def test_longer_scene_keeps_later_scenes(self, public):
+        before = _fps(public)
+        after = _fps(public, config=_config((10.0, 15.0, 8.0)))
+        assert before[1] == after[1]
+        assert before[2] != after[2]
+        assert before[3] == after[3]
+
+    def test_ken_burns_change(self, public):
+        config = _config()
+        config["scenes"][0]["ken_burns"] = {"direction": "out"}
+        changed = _fps(public, config=config)
+        assert changed[1] != _fps(public)[1]
+
+    def test_audio_only_props_ignored(self, public):
+        props = _props()
+        for scene in props["scenes"]:
+            scene["voiceUrl"] = "https://y/other.mp3"
+            scene["images"][0].update(sfx="sfx/new.mp3", sfxVolume=0.5, url="https://y/b.png")
+        assert _fps(public, props=props) == _fps(public)
+
+    def test_code_version_invalidates_all(self, public):
+        before, after = _fps(public), _fps(public, code="v2")
+        assert all(before[sn] != after[sn] for sn in before)
+
+
+class TestCompositionVersion:
+    def test_tracks_sources_but_not_captions(self, tmp_path):
+        (tmp_path / "src" / "captions").mkdir(parents=True)
+        (tmp_path / "src" / "Scene.tsx").write_text("export const A = 1;")
+        base = composition_version(tmp_path)
+
+        (tmp_path / "src" / "captions" / "Scene 1.json").write_text("[]")
+        assert composition_version(tmp_path) == base
+
+        (tmp_path / "src" / "Scene.tsx").write_text("export const A = 2;")
+        assert composition_version(tmp_path) != base
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class TestSceneCache:
+    def test_store_and_restore(self, tmp_path):
+        cache = SceneCache(tmp_path / "cache")
+        src = tmp_path / "seg.mp4"
+        src.write_bytes(b"segment")
+        cache.store("ab" * 32, src)
+
+        dest = tmp_path / "restored.mp4"
+        assert cache.restore("ab" * 32, dest)
+        assert dest.read_bytes() == b"segment"
+        assert not cache.restore("cd" * 32, tmp_path / "miss.mp4")
+
+    def test_prune_drops_least_recently_used(self, tmp_path):
+        cache = SceneCache(tmp_path / "cache", max_gb=15 / 1024 ** 3)
+        for i, key in enumerate(("aa" * 32, "bb" * 32, "cc" * 32)):
+            src = tmp_path / f"{i}.mp4"
+            src.write_bytes(b"x" * 10)
+            cache.store(key, src)
+            os.utime(cache.path_for(key), (1000 + i, 1000 + i))
+        assert cache.prune() == 2
+        assert cache.path_for("cc" * 32).exists()
+        assert not cache.path_for("aa" * 32).exists()
+
+
+# ---------------------------------------------------------------------------
+# render_chunked with a cache
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def fake_remotion(monkeypatch):
+    calls = []
+
+    def _run_job(cmd, cwd, on_frames, label):
+        calls.append(label)
+        with open(cmd[4], "wb") as f:
+            f.write(label.encode())
+        return 0, ""
+
+    def _concat(chunk_files, audio_file, output_file):
+        output_file.write_bytes(b"|".join(p.read_bytes() for p in chunk_files))
+
+    monkeypatch.setattr(orchestrator, "_run_job", _run_job)
+    monkeypatch.setattr(orchestrator, "concat_chunks", _concat)
+    return calls
+
+
+class TestCachedRender:
+    def _render(self, tmp_path, public, config, props):
+        props_file = tmp_path / "props.json"
+        props_file.write_text(json.dumps({**props, "renderConfig": config}))
+        return render_chunked(
+            tmp_path, props_file, tmp_path / "out.mp4", config,
+            work_dir=tmp_path / "work", max_parallel=1,
+            cache=SceneCache(tmp_path / "cache"),
+            fingerprints=scene_fingerprints(config, public, "v1", props),
+        )
+
+    def test_only_changed_scenes_rerender(self, tmp_path, public, fake_remotion):
+        config, props = _config(), _props()
+        stats = self._render(tmp_path, public, config, props)
+        assert stats["chunks"] == 3
+        assert stats["cached"] == 0
+
+        fake_remotion.clear()
+        (public / "Scene_02_02.png").write_bytes(b"fixed image")
+        props = copy.deepcopy(props)
+        props["scenes"][0]["images"][0]["sfx"] = "sfx/other.mp3"
+        stats = self._render(tmp_path, public, config, props)
+        assert sorted(fake_remotion) == ["audio", "chunk 1"]
+        assert stats["cached"] == 2
+        assert stats["rendered"] == 1
+        assert (tmp_path / "out.mp4").read_bytes() == b"chunk 0|chunk 1|chunk 2"
+
+    def test_longer_first_scene_keeps_later_scenes_cached(self, tmp_path, public, fake_remotion):
+        props = _props()
+        self._render(tmp_path, public, _config(), props)
+
+        fake_remotion.clear()
+        stats = self._render(tmp_path, public, _config((14.0, 12.0, 8.0)), props)
+        assert sorted(fake_remotion) == ["audio", "chunk 0"]
+        assert stats["cached"] == 2 and stats["rendered"] == 1
+
+    def test_cache_requires_fingerprints(self, tmp_path):
+        with pytest.raises(ValueError):
+            render_chunked(tmp_path, tmp_path / "p.json", tmp_path / "o.mp4", _config(),
+                           work_dir=tmp_path / "work", cache=SceneCache(tmp_path / "c"))
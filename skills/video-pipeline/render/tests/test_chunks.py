@@ -0,0 +1,75 @@
+"""Tests for render.chunks — Main.tsx frame layout and chunk planning."""
+
+import math
+
+from render.chunks import plan_chunks, scene_frame_layout, total_frames
+
+
+def _config(scene_durations, fps=24):
+    scenes = []
+    t = 0.0
+    for sn, durs in scene_durations.items():
+        for i, d in enumerate(durs):
+            scenes.append({
+                "scene_number": sn, "image_index": i + 1,
+                "display_start": t, "display_end": t + d, "display_duration": d,
+            })
+            t += d
+    return {"fps": fps, "total_duration_seconds": t, "scenes": scenes}
+
+
+# ---------------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------------
+
+class TestLayout:
+    def test_matches_main_tsx(self):
+        layout = scene_frame_layout(_config({1: [10.0, 5.5], 2: [20.0]}))
+        assert layout == [
+            {"scene_number": 1, "start_frame": 0, "duration_frames": math.ceil(16.5 * 24)},
+            {"scene_number": 2, "start_frame": 396, "duration_frames": 21 * 24},
+        ]
+
+    def test_scene_order_is_numeric(self):
+        layout = scene_frame_layout(_config({10: [3.0], 2: [3.0]}))
+        assert [s["scene_number"] for s in layout] == [2, 10]
+
+    def test_total_frames_matches_root_tsx(self):
+        config = _config({1: [10.0], 2: [20.05]})
+        assert total_frames(config) == math.ceil((30.05 + 2) * 24)
+
+    def test_empty_config_uses_fallback(self):
+        assert total_frames({"scenes": []}) == 25 * 60 * 24
+
+
+# ---------------------------------------------------------------------------
+# Chunk planning
+# ---------------------------------------------------------------------------
+
+class TestPlanChunks:
+    def test_contiguous_and_covering(self):
+        config = _config({sn: [30.0, 25.0] for sn in range(1, 21)})
+        chunks = plan_chunks(config, target_seconds=120.0)
+        assert chunks[0]["start_frame"] == 0
+        assert chunks[-1]["end_frame"] == total_frames(config) - 1
+        for a, b in zip(chunks, chunks[1:]):
+            assert b["start_frame"] == a["end_frame"] + 1
+        assert [c["index"] for c in chunks] == list(range(len(chunks)))
+
+    def test_cuts_on_scene_boundaries(self):
+        config = _config({sn: [40.0] for sn in range(1, 11)})
+        starts = {s["start_frame"] for s in scene_frame_layout(config)}
+        for chunk in plan_chunks(config, target_seconds=100.0):
+            assert chunk["start_frame"] in starts
+
+    def test_every_scene_in_exactly_one_chunk(self):
+        config = _config({sn: [12.0] for sn in range(1, 15)})
+        chunks = plan_chunks(config, target_seconds=60.0)
+        assigned = [sn for c in chunks for sn in c["scenes"]]
+        assert assigned == list(range(1, 15))
+
+    def test_short_video_single_chunk(self):
+        config = _config({1: [5.0], 2: [5.0]})
+        chunks = plan_chunks(config, target_seconds=120.0)
+        assert len(chunks) == 1
+        assert chunks[0]["scenes"] == [1, 2]
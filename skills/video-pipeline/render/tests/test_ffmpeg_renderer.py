@@ -0,0 +1,233 @@
+"""Tests for render.ffmpeg_renderer — filter-graph compiler (no ffmpeg)."""
+
+import pytest
+
+from render import ffmpeg_renderer
+from render.chunks import scene_frame_layout, total_frames
+from render.ffmpeg_renderer import (
+    AUDIO_FILE,
+    audio_filter_script,
+    build_ass,
+    build_scene_plan,
+    caption_lines,
+    needs_remotion,
+    render_ffmpeg,
+    resolve_render_engine,
+    scene_command,
+    scene_words,
+)
+from render.orchestrator import RenderError
+
+
+def _config():
+    scenes, t = [], 0.0
+    for sn in (1, 2):
+        for idx, dur in ((1, 4.0), (2, 6.0)):
+            scenes.append({
+                "scene_number": sn, "image_index": idx, "type": "image",
+                "image_path": f"/x/Scene_{sn:02d}_{idx:02d}.png",
+                "display_start": t, "display_end": t + dur, "display_duration": dur,
+                "narration_start": 0.0 if idx == 1 else 4.0,
+                "narration_end": 4.0 if idx == 1 else 10.0,
+                "sentence_text": "Money moves fast." if idx == 1 else "Then it stops",
+                "ken_burns": {"direction": "slow_zoom_in", "start_scale": 1.0, "end_scale": 1.15},
+                "transition_in": {"type": "fade_from_black" if (sn, idx) == (1, 1) else "crossfade",
+                                  "duration": 1.0 if (sn, idx) == (1, 1) else 0.4},
+                "transition_out": {"type": "crossfade", "duration": 0.4},
+            })
+            t += dur
+    return {"fps": 24, "total_duration_seconds": t,
+            "resolution": {"width": 1280, "height": 720}, "scenes": scenes}
+
+
+@pytest.fixture
+def public(tmp_path):
+    public = tmp_path / "public"
+    (public / "sfx").mkdir(parents=True)
+    for sn in (1, 2):
+        (public / f"Scene {sn}.mp3").write_bytes(b"mp3")
+        for idx in (1, 2):
+            (public / f"Scene_{sn:02d}_{idx:02d}.jpg").write_bytes(b"jpg")
+    (public / "sfx" / "sfx_2_1.mp3").write_bytes(b"sfx")
+    return public
+
+
+_ASSETS = {f"Scene_{sn:02d}_{idx:02d}.png": f"Scene_{sn:02d}_{idx:02d}.jpg"
+           for sn in (1, 2) for idx in (1, 2)}
+
+
+# ---------------------------------------------------------------------------
+# Engine selection
+# ---------------------------------------------------------------------------
+
+class TestEngineSelection:
+    def test_default_and_env(self, monkeypatch):
+        monkeypatch.delenv("RENDER_ENGINE", raising=False)
+        assert resolve_render_engine() == "remotion"
+        monkeypatch.setenv("RENDER_ENGINE", "FFmpeg")
+        assert resolve_render_engine() == "ffmpeg"
+        assert resolve_render_engine("remotion") == "remotion"
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            resolve_render_engine("blender")
+
+    def test_clips_need_remotion(self):
+        config = _config()
+        assert needs_remotion(config) is None
+        config["scenes"][1]["type"] = "video"
+        assert "1 scene" in needs_remotion(config)
+
+    def test_clips_found_in_props_and_public(self, public):
+        # audio_sync writes every entry as a still; clips only show up in
+        # the props and as Scene_XX_YY.mp4 assets
+        config = _config()
+        props = {"scenes": [{"sceneNumber": 2, "images": [{"index": 1, "type": "video"}]}]}
+        assert "1 scene" in needs_remotion(config, props)
+        (public / "Scene_01_02.mp4").write_bytes(b"mp4")
+        (public / "Scene_09_01.mp4").write_bytes(b"mp4")  # not in this video
+        assert "2 scene" in needs_remotion(config, props, public)
+        with pytest.raises(RenderError, match="clips"):
+            render_ffmpeg(public, public / "out.mp4", config, work_dir=public / "work", props=props)
+
+
+# ---------------------------------------------------------------------------
+# Plan / graphs
+# ---------------------------------------------------------------------------
+
+class TestScenePlan:
+    def test_matches_main_frame_grid(self, public):
+        config = _config()
+        plan = build_scene_plan(config, 24, public, _ASSETS)
+        layout = scene_frame_layout(config, 24)
+        assert [s["start_frame"] for s in plan] == [s["start_frame"] for s in layout]
+        assert sum(s["frames"] for s in plan) == total_frames(config, 24)
+        scene2 = plan[1]
+        assert scene2["images"][0]["start"] == 0.0
+        assert scene2["images"][1]["start"] == 4.0
+        assert scene2["images"][0]["file"].endswith("Scene_02_01.jpg")
+        # Last image covers the 1 s trail-off buffer
+        assert scene2["images"][-1]["duration"] == pytest.approx(scene2["frames"] / 24 - 4.0)
+
+    def test_scene_command(self, public):
+        scene = build_scene_plan(_config(), 24, public, _ASSETS)[0]
+        cmd = scene_command(scene, public / "s.mp4", 1280, 720, 24, "scene_000.ass")
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph.count("zoompan=") == 2
+        assert "xfade=transition=fade:duration=0.4000:offset=4.0000" in graph
+        assert "fade=t=in:st=0:d=1.0000" in graph
+        assert graph.endswith("subtitles=filename=scene_000.ass[out]")
+        assert cmd[cmd.index("-frames:v") + 1] == str(scene["frames"])
+        assert "-an" in cmd
+
+    def test_pan_uses_base_zoom(self, public):
+        config = _config()
+        for entry in config["scenes"]:
+            entry["ken_burns"] = {"start_x_offset": -40, "end_x_offset": 40}
+        scene = build_scene_plan(config, 24, public, _ASSETS)[0]
+        cmd = scene_command(scene, public / "s.mp4", 1280, 720, 24)
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert "zoompan=z='1.1'" in graph
+        assert "subtitles" not in graph
+
+    def test_audio_script_places_narration_and_sfx(self, public):
+        plan = build_scene_plan(_config(), 24, public, _ASSETS)
+        sfx = {(2, 1): {"sfx": "sfx/sfx_2_1.mp3", "sfxVolume": 0.2}}
+        inputs, script = audio_filter_script(plan, 24, public, sfx, 30.0)
+        assert inputs.count("-i") == 3
+        scene2_ms = int(round(plan[1]["start_frame"] / 24 * 1000))
+        assert f"adelay={scene2_ms}:all=1" in script
+        assert "volume=0.2" in script
+        assert "amix=inputs=3" in script
+
+
+# ---------------------------------------------------------------------------
+# Captions
+# ---------------------------------------------------------------------------
+
+class TestCaptions:
+    def test_fallback_words_from_sentences(self, public):
+        scene = build_scene_plan(_config(), 24, public, _ASSETS)[0]
+        words = scene_words(scene)
+        assert [w["word"] for w in words] == ["Money", "moves", "fast.", "Then", "it", "stops"]
+        assert words[3]["start"] == pytest.approx(4.0)
+
+    def test_fallback_words_relative_to_scene(self, public):
+        # Narration times on the video timeline: scene 2 starts at 10 s
+        config = _config()
+        for entry in config["scenes"]:
+            entry["narration_start"] = entry["display_start"]
+            entry["narration_end"] = entry["display_end"]
+        scene = build_scene_plan(config, 24, public, _ASSETS)[1]
+        words = scene_words(scene)
+        assert words[0]["start"] == pytest.approx(0.0)
+        assert words[3]["start"] == pytest.approx(4.0)
+        assert words[-1]["end"] == pytest.approx(10.0)
+
+    def test_timeline_words_preferred(self, public):
+        scene = build_scene_plan(_config(), 24, public, _ASSETS)[0]
+        words = [{"word": "Hi", "start": 0.1, "end": 0.4}, {"word": " ", "start": 0.4, "end": 0.5}]
+        assert scene_words(scene, words) == words[:1]
+
+    def test_lines_break_on_sentence_and_pause(self):
+        words = [{"word": w, "start": s, "end": s + 0.2} for w, s in
+                 [("One", 0.0), ("two.", 0.3), ("Three", 0.6), ("four", 2.0)]]
+        assert [[w["word"] for w in line] for line in caption_lines(words)] == [
+            ["One", "two."], ["Three"], ["four"],
+        ]
+
+    def test_ass_karaoke(self):
+        words = [{"word": "Hello", "start": 1.0, "end": 1.4},
+                 {"word": "{world}", "start": 1.5, "end": 2.0}]
+        ass = build_ass(words, 1920, 1080)
+        assert "PlayResX: 1920" in ass
+        assert "Dialogue: 0,0:00:01.00,0:00:02.00,Karaoke,,0,0,0,,{\\k50}Hello {\\k50}(world)" in ass
+
+
+# ---------------------------------------------------------------------------
+# render_ffmpeg
+# ---------------------------------------------------------------------------
+
+class TestRenderFfmpeg:
+    def test_renders_scenes_and_audio_then_concats(self, tmp_path, public, monkeypatch):
+        commands, concat = [], {}
+
+        def _run(cmd, cwd):
+            commands.append(cmd)
+            (cwd / cmd[-1]).write_bytes(b"x")
+            return 0, ""
+
+        def _concat(files, audio, output):
+            concat["files"] = [f.name for f in files]
+            concat["audio"] = audio.name
+            output.write_bytes(b"video")
+
+        monkeypatch.setattr(ffmpeg_renderer, "_run_ffmpeg", _run)
+        monkeypatch.setattr(ffmpeg_renderer, "concat_chunks", _concat)
+        progress = []
+        props = {"assetFiles": _ASSETS, "scenes": [
+            {"sceneNumber": 2, "images": [{"index": 1, "sfx": "sfx/sfx_2_1.mp3", "sfxVolume": 0.2}]},
+        ]}
+        stats = render_ffmpeg(public, tmp_path / "out.mp4", _config(), work_dir=tmp_path / "work",
+                              props=props, max_parallel=2,
+                              on_progress=lambda d, t: progress.append((d, t)))
+        assert stats["engine"] == "ffmpeg"
+        assert stats["rendered"] == 2
+        assert len(commands) == 3
+        assert concat == {"files": ["scene_000.mp4", "scene_001.mp4"], "audio": AUDIO_FILE}
+        assert progress[-1][0] == progress[-1][1]
+        assert not list((tmp_path / "work").glob("scene_*"))
+
+    def test_missing_image(self, tmp_path, public):
+        (public / "Scene_01_02.jpg").unlink()
+        with pytest.raises(RenderError) as exc:
+            render_ffmpeg(public, tmp_path / "out.mp4", _config(), work_dir=tmp_path / "w",
+                          props={"assetFiles": _ASSETS})
+        assert "Scene_01_02.jpg" in exc.value.detail
+
+    def test_job_failure(self, tmp_path, public, monkeypatch):
+        monkeypatch.setattr(ffmpeg_renderer, "_run_ffmpeg", lambda cmd, cwd: (1, "Invalid filter"))
+        with pytest.raises(RenderError) as exc:
+            render_ffmpeg(public, tmp_path / "out.mp4", _config(), work_dir=tmp_path / "w",
+                          props={"assetFiles": _ASSETS}, max_parallel=1)
+        assert exc.value.detail == "Invalid filter"
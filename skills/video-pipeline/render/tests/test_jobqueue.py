@@ -0,0 +1,185 @@
+"""Tests for render.jobqueue — file-backed FIFO with admission control."""
+
+import asyncio
+import json
+import time
+
+from render import jobqueue
+from render.jobqueue import RenderQueue, format_entry, format_queue, job_dir
+
+
+def _queue(tmp_path, **kwargs):
+    kwargs.setdefault("admit", lambda: True)
+    return RenderQueue(tmp_path / "jobs" / "render_queue.json", **kwargs)
+
+
+def _dead(queue, job_id):
+    state = json.loads(queue.path.read_text())
+    for job in state["jobs"]:
+        if job["id"] == job_id:
+            job["host"], job["pid"] = jobqueue.socket.gethostname(), 2 ** 22 + 7
+    queue.path.write_text(json.dumps(state))
+
+
+# ---------------------------------------------------------------------------
+# Admission
+# ---------------------------------------------------------------------------
+
+class TestAdmission:
+    def test_fifo(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=1)
+        queue.enqueue("a", "A", 600)
+        queue.enqueue("b", "B", 600)
+        assert not queue.try_start("b")
+        assert queue.try_start("a")
+        assert not queue.try_start("b")
+        queue.finish("a", ok=True)
+        assert queue.try_start("b")
+
+    def test_max_parallel(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=2)
+        for job_id in "abc":
+            queue.enqueue(job_id, job_id.upper(), 600)
+        assert queue.try_start("a")
+        assert queue.try_start("b")
+        assert not queue.try_start("c")
+
+    def test_second_job_needs_resources(self, tmp_path):
+        free = {"ok": False}
+        queue = _queue(tmp_path, max_parallel=2, admit=lambda: free["ok"])
+        queue.enqueue("a", "A", 600)
+        queue.enqueue("b", "B", 600)
+        # The first job never waits on resources (sequential fallback)
+        assert queue.try_start("a")
+        assert not queue.try_start("b")
+        free["ok"] = True
+        assert queue.try_start("b")
+
+    def test_wait_turn(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=1)
+        queue.enqueue("a", "A", 600)
+        queue.enqueue("b", "B", 600)
+        queue.try_start("a")
+        notices = []
+
+        async def _run():
+            async def _finish_a():
+                await asyncio.sleep(0.05)
+                queue.finish("a", ok=True)
+            await asyncio.gather(
+                queue.wait_turn("b", on_wait=notices.append, poll_seconds=0.01, notify_seconds=0),
+                _finish_a(),
+            )
+
+        asyncio.get_event_loop().run_until_complete(_run())
+        assert queue.snapshot()[0]["status"] == "running"
+        assert notices and notices[0]["position"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+class TestPersistence:
+    def test_reclaim_keeps_place(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=1)
+        queue.enqueue("a", "A", 600)
+        queue.enqueue("b", "B", 600)
+        # A fresh process re-queues "a" after a restart: still first in line
+        again = _queue(tmp_path, max_parallel=1)
+        again.enqueue("a", "A", 600)
+        assert not again.try_start("b")
+        assert again.try_start("a")
+
+    def test_dead_process_is_orphaned(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=1)
+        queue.enqueue("a", "A", 600)
+        queue.try_start("a")
+        queue.enqueue("b", "B", 600)
+        _dead(queue, "a")
+        # A crashed render neither holds a slot nor blocks the line
+        assert queue.try_start("b")
+        statuses = {e["id"]: e["status"] for e in queue.snapshot()}
+        assert statuses == {"a": "orphaned", "b": "running"}
+
+    def test_orphan_reclaimed_after_ttl(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=1, orphan_ttl=3600)
+        queue.enqueue("a", "A", 600)
+        queue.try_start("a")
+        work = job_dir("a", tmp_path)
+        (work / "public").mkdir(parents=True)
+        _dead(queue, "a")
+        assert [e["status"] for e in queue.snapshot()] == ["orphaned"]
+
+        state = json.loads(queue.path.read_text())
+        state["jobs"][0]["orphaned_at"] -= 3600
+        queue.path.write_text(json.dumps(state))
+        assert queue.snapshot() == []
+        assert not work.exists()
+
+    def test_requeued_orphan_is_not_reclaimed(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=1, orphan_ttl=3600)
+        queue.enqueue("a", "A", 600)
+        _dead(queue, "a")
+        queue.snapshot()
+        queue.enqueue("a", "A", 600)  # the restarted bot claims it again
+        assert "orphaned_at" not in json.loads(queue.path.read_text())["jobs"][0]
+
+    def test_running_job_of_live_process_not_taken_over(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=1)
+        queue.enqueue("a", "A", 600)
+        queue.try_start("a")
+        state = json.loads(queue.path.read_text())
+        state["jobs"][0]["pid"] = jobqueue.os.getppid()  # another live process
+        queue.path.write_text(json.dumps(state))
+
+        entry = queue.enqueue("a", "A again", 900)  # a second `render` command
+        assert entry["held_by"] == jobqueue.os.getppid()
+        job = json.loads(queue.path.read_text())["jobs"][0]
+        assert job["status"] == "running" and job["started_at"] and job["title"] == "A"
+
+    def test_job_dir(self, tmp_path):
+        assert job_dir("rec123", tmp_path) == tmp_path / "jobs" / "rec123"
+
+
+# ---------------------------------------------------------------------------
+# ETA / formatting
+# ---------------------------------------------------------------------------
+
+class TestEta:
+    def test_uses_history(self, tmp_path, monkeypatch):
+        queue = _queue(tmp_path, max_parallel=1)
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(jobqueue.time, "time", lambda: clock["now"])
+        queue.enqueue("a", "A", 100)
+        queue.try_start("a")
+        clock["now"] += 500  # 5 s of render per video second
+        queue.finish("a", ok=True)
+
+        queue.enqueue("b", "B", 60)
+        queue.enqueue("c", "C", 60)
+        queue.try_start("b")
+        running, waiting = queue.snapshot()
+        assert running["eta_done"] == clock["now"] + 300
+        assert waiting["position"] == 1
+        assert waiting["eta_start"] == running["eta_done"]
+        assert waiting["eta_done"] == running["eta_done"] + 300
+
+    def test_failed_runs_not_in_history(self, tmp_path):
+        queue = _queue(tmp_path)
+        queue.enqueue("a", "A", 100)
+        queue.try_start("a")
+        queue.finish("a", ok=False)
+        assert json.loads(queue.path.read_text())["history"] == []
+
+    def test_format(self, tmp_path):
+        queue = _queue(tmp_path, max_parallel=1)
+        assert format_queue(queue.snapshot()) == "🎬 Render queue is empty."
+        queue.enqueue("a", "Gold Crash", 600)
+        queue.enqueue("b", "Oil Shock", 600)
+        queue.try_start("a")
+        text = format_queue(queue.snapshot())
+        assert "▶️ _Gold Crash_" in text
+        assert "⏳ #1 _Oil Shock_" in text
+        orphan = {"title": "X", "status": "orphaned", "engine": "remotion"}
+        assert "re-run `render`" in format_entry(orphan, time.time())
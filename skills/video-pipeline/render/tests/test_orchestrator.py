@@ -0,0 +1,121 @@
+"""Tests for render.orchestrator — resumable chunked renders (no Remotion)."""
+
+import json
+
+import pytest
+
+from render import orchestrator
+from render.orchestrator import AUDIO_FILE, RenderError, build_chunk_command, render_chunked
+
+
+def _config():
+    scenes = [
+        {"scene_number": sn, "image_index": 1, "display_duration": 60.0}
+        for sn in range(1, 7)
+    ]
+    return {"fps": 24, "total_duration_seconds": 360.0, "scenes": scenes}
+
+
+@pytest.fixture
+def fake_remotion(monkeypatch):
+    """Replace Remotion and ffmpeg with file writers; record every job."""
+    calls = []
+    fail = set()
+
+    def _run_job(cmd, cwd, on_frames, label):
+        calls.append(label)
+        if label in fail:
+            return 1, "Error: browser crashed"
+        out = cmd[4]
+        with open(out, "wb") as f:
+            f.write(label.encode())
+        if on_frames:
+            on_frames(10)
+        return 0, ""
+
+    def _concat(chunk_files, audio_file, output_file):
+        output_file.write_bytes(b"".join(p.read_bytes() for p in chunk_files))
+
+    monkeypatch.setattr(orchestrator, "_run_job", _run_job)
+    monkeypatch.setattr(orchestrator, "concat_chunks", _concat)
+    return calls, fail
+
+
+@pytest.fixture
+def props(tmp_path):
+    path = tmp_path / "props.json"
+    path.write_text(json.dumps({"renderConfig": _config()}))
+    return path
+
+
+class TestCommand:
+    def test_chunk_command_is_muted_frame_range(self, tmp_path):
+        cmd = build_chunk_command("Main", tmp_path / "c.mp4", tmp_path / "p.json",
+                                  {"start_frame": 0, "end_frame": 99})
+        assert "--frames=0-99" in cmd
+        assert "--muted" in cmd
+
+    def test_audio_command(self, tmp_path):
+        cmd = build_chunk_command("Main", tmp_path / "a.aac", tmp_path / "p.json", None)
+        assert "--codec=aac" in cmd
+        assert not any(c.startswith("--frames") for c in cmd)
+
+
+class TestRenderChunked:
+    def test_renders_all_and_stitches(self, tmp_path, props, fake_remotion):
+        calls, _ = fake_remotion
+        progress = []
+        stats = render_chunked(
+            tmp_path, props, tmp_path / "out.mp4", _config(),
+            work_dir=tmp_path / "work", chunk_seconds=120.0, max_parallel=2,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+        assert stats["chunks"] == 3
+        assert stats["rendered"] == 3
+        assert "audio" in calls
+        assert (tmp_path / "out.mp4").read_bytes() == b"chunk 0chunk 1chunk 2"
+        assert progress[-1][0] == progress[-1][1]
+        # Chunks cleaned up after a successful stitch
+        assert not any((tmp_path / "work").glob("chunk_*.mp4"))
+
+    def test_premixed_audio_skips_audio_pass(self, tmp_path, props, fake_remotion, monkeypatch):
+        calls, _ = fake_remotion
+        muxed = {}
+        monkeypatch.setattr(orchestrator, "concat_chunks",
+                            lambda files, audio, out: muxed.setdefault("audio", audio))
+        bed = tmp_path / "bed.aac"
+        bed.write_bytes(b"aac")
+        render_chunked(tmp_path, props, tmp_path / "out.mp4", _config(),
+                       work_dir=tmp_path / "work", chunk_seconds=120.0, max_parallel=2,
+                       audio_file=bed)
+        assert "audio" not in calls
+        assert muxed["audio"] == bed
+        assert bed.exists()
+
+    def test_retry_only_renders_missing_chunks(self, tmp_path, props, fake_remotion):
+        calls, fail = fake_remotion
+        fail.add("chunk 2")
+        with pytest.raises(RenderError) as exc:
+            render_chunked(tmp_path, props, tmp_path / "out.mp4", _config(),
+                           work_dir=tmp_path / "work", chunk_seconds=120.0, max_parallel=1)
+        assert "browser crashed" in exc.value.detail
+
+        calls.clear()
+        fail.clear()
+        stats = render_chunked(tmp_path, props, tmp_path / "out.mp4", _config(),
+                               work_dir=tmp_path / "work", chunk_seconds=120.0, max_parallel=1)
+        assert calls == ["chunk 2"]
+        assert stats["reused"] == 2
+
+    def test_changed_props_invalidates_chunks(self, tmp_path, props, fake_remotion):
+        calls, _ = fake_remotion
+        work = tmp_path / "work"
+        render_chunked(tmp_path, props, tmp_path / "out.mp4", _config(),
+                       work_dir=work, chunk_seconds=120.0, max_parallel=1, keep_chunks=True)
+        assert (work / AUDIO_FILE).exists()
+
+        props.write_text(json.dumps({"renderConfig": _config(), "videoTitle": "other"}))
+        calls.clear()
+        render_chunked(tmp_path, props, tmp_path / "out.mp4", _config(),
+                       work_dir=work, chunk_seconds=120.0, max_parallel=1)
+        assert sorted(calls) == ["audio", "chunk 0", "chunk 1", "chunk 2"]
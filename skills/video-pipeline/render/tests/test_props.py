@@ -0,0 +1,126 @@
+"""Tests for render.props — build, serialize and diff Remotion props."""
+
+import json
+
+from render.props import (
+    build_props,
+    diff_props,
+    dumps_props,
+    format_diff,
+    group_by_scene,
+    load_rendered,
+    reusable,
+    save_rendered,
+    write_props,
+)
+
+
+def _image(scene, index, **fields):
+    return {"Scene": scene, "Image Index": index, "Sentence Text": f"s{scene}.{index}",
+            "Drive Image URL": f"https://drive/{scene}/{index}", "Duration (s)": 4.0, **fields}
+
+
+def _rows():
+    scripts = [{"scene": 1, "Scene text": "one"}, {"scene": 2, "Scene text": "two",
+               "Voice Over": [{"url": "https://airtable/v2?sig=a"}]}]
+    images = [_image(2, 2), _image(1, 1), _image(2, 1, **{"Sound Effect": [{"url": "https://cdn/x"}]}),
+              _image(3, 1)]
+    return scripts, images
+
+
+def _props():
+    return build_props("Gold", *_rows())
+
+
+# ---------------------------------------------------------------------------
+# Build / serialize
+# ---------------------------------------------------------------------------
+
+class TestBuild:
+    def test_group_by_scene(self):
+        grouped = group_by_scene(_rows()[1])
+        assert [img["Image Index"] for img in grouped[2]] == [1, 2]
+        assert set(grouped) == {1, 2, 3}
+
+    def test_props_shape(self):
+        props = _props()
+        scene2 = props["scenes"][1]
+        assert [s["sceneNumber"] for s in props["scenes"]] == [1, 2]
+        assert [img["index"] for img in scene2["images"]] == [1, 2]
+        assert scene2["voiceUrl"] == "https://airtable/v2?sig=a"
+        assert scene2["images"][0]["sfx"] == "sfx/sfx_2_1.mp3"
+        assert scene2["images"][0]["sfxUrl"] == "https://cdn/x"
+        assert scene2["images"][1]["renderDuration"] == 4.0
+
+    def test_clip_timing(self):
+        props = build_props("T", [{"scene": 1}], [_image(1, 1, **{
+            "Video Clip URL": "https://drive/clip", "Video Duration": 10})])
+        clip = props["scenes"][0]["images"][0]
+        assert clip["type"] == "video"
+        assert clip["trimEnd"] == 6.0
+
+    def test_deterministic_compact(self, tmp_path):
+        props = _props()
+        shuffled = json.loads(json.dumps(props))
+        shuffled["scenes"][0] = dict(reversed(list(shuffled["scenes"][0].items())))
+        assert dumps_props(props) == dumps_props(shuffled)
+        assert "\n" not in dumps_props(props)
+
+        path = tmp_path / "props.json"
+        assert write_props(path, props)
+        mtime = path.stat().st_mtime_ns
+        assert not write_props(path, shuffled)
+        assert path.stat().st_mtime_ns == mtime
+
+
+# ---------------------------------------------------------------------------
+# Diff / snapshot
+# ---------------------------------------------------------------------------
+
+class TestDiff:
+    def test_first_render(self):
+        diff = diff_props(None, _props())
+        assert diff["first_render"] and diff["scenes_added"] == [1, 2]
+        assert format_diff(diff) == "first render (2 scenes)"
+
+    def test_volatile_urls_ignored(self):
+        old, new = _props(), _props()
+        new["scenes"][1]["voiceUrl"] = "https://airtable/v2?sig=b"
+        new["scenes"][1]["images"][0]["sfxUrl"] = "https://cdn/y"
+        assert diff_props(old, new)["unchanged"]
+
+    def test_changed_image_marks_its_scene(self):
+        old, new = _props(), _props()
+        new["scenes"][1]["images"][1]["url"] = "https://drive/2/2-v2"
+        diff = diff_props(old, new)
+        assert diff["scenes_changed"] == [2]
+        assert diff["images_changed"] == [[2, 2]]
+
+    def test_timing_and_renames(self):
+        rc = {"fps": 24, "scenes": [{"scene_number": 1, "display_duration": 4.0},
+                                    {"scene_number": 2, "display_duration": 3.0}]}
+        old = {**_props(), "renderConfig": rc, "assetFiles": {"Scene_02_01.png": "Scene_02_01.jpg"}}
+        new = json.loads(json.dumps(old))
+        new["renderConfig"]["scenes"][0]["display_duration"] = 4.5
+        new["assetFiles"] = {}
+        diff = diff_props(old, new)
+        assert diff["scenes_changed"] == [1, 2]
+        assert diff["images_changed"] == [[2, 1]]
+        assert diff["global_changed"] == []
+
+    def test_added_removed_and_globals(self):
+        old, new = _props(), _props()
+        new["scenes"] = new["scenes"][1:] + [{"sceneNumber": 3, "images": []}]
+        new["videoTitle"] = "Gold 2"
+        diff = diff_props(old, new)
+        assert (diff["scenes_added"], diff["scenes_removed"]) == ([3], [1])
+        assert format_diff(diff) == "added: 3; removed: 1; also: videoTitle"
+
+    def test_snapshot(self, tmp_path):
+        save_rendered(tmp_path, _props(), {"Scene 1.mp3": "abc", "sfx/sfx_2_1.mp3": None})
+        snapshot = load_rendered(tmp_path, consume=True)
+        assert snapshot["props"]["videoTitle"] == "Gold"
+        assert load_rendered(tmp_path) is None
+        assert reusable("Scene 1.mp3", "abc", snapshot["sources"])
+        assert not reusable("Scene 1.mp3", "def", snapshot["sources"])
+        assert not reusable("sfx/sfx_2_1.mp3", None, snapshot["sources"])
@@ -0,0 +1,172 @@
+"""Tests for render.telemetry and the benchmark helpers (no Remotion)."""
+
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+
+from render import orchestrator
+from render.benchmark import build_props, fps_change_pct, load_fixture, previous
+from render.orchestrator import render_chunked
+from render.telemetry import (
+    RenderTelemetry,
+    append_record,
+    format_summary,
+    load_records,
+    scene_types,
+)
+
+
+def _config():
+    """Scene 1: stills, 2: transition-heavy, 3: clip."""
+    scenes, t = [], 0.0
+    for sn, durs, fade, kind in ((1, (5.0, 5.0), 0.4, "image"),
+                                 (2, (1.5, 1.5, 1.5), 0.8, "image"),
+                                 (3, (4.0,), 0.4, "video")):
+        for idx, dur in enumerate(durs, start=1):
+            scenes.append({
+                "scene_number": sn, "image_index": idx, "type": kind,
+                "display_start": t, "display_end": t + dur, "display_duration": dur,
+                "transition_in": {"type": "crossfade", "duration": fade},
+            })
+            t += dur
+    return {"fps": 24, "total_duration_seconds": t, "scenes": scenes}
+
+
+class TestSceneTypes:
+    def test_classification(self):
+        assert scene_types(_config()) == {1: "image", 2: "transition_heavy", 3: "video"}
+
+    def test_clips_from_props_and_public(self, tmp_path):
+        config = _config()
+        for entry in config["scenes"]:
+            entry["type"] = "image"  # what audio_sync actually writes
+        assert scene_types(config)[3] == "image"
+        props = {"scenes": [{"sceneNumber": 3, "images": [{"type": "video"}]}]}
+        assert scene_types(config, props)[3] == "video"
+        (tmp_path / "Scene_01_02.mp4").write_bytes(b"mp4")
+        assert scene_types(config, None, tmp_path)[1] == "video"
+
+    def test_fixture_covers_every_type(self):
+        assert set(scene_types(load_fixture()).values()) == {"image", "transition_heavy", "video"}
+
+
+# ---------------------------------------------------------------------------
+# Collector
+# ---------------------------------------------------------------------------
+
+class TestRenderTelemetry:
+    def test_samples_marked_process_tree(self, tmp_path):
+        telemetry = RenderTelemetry(_config(), sample_seconds=0.05)
+        marker = str(tmp_path / "chunk_000.part.mp4")
+        telemetry.start()
+        telemetry.job_started("chunk_000.mp4", {"start_frame": 0, "end_frame": 263, "scenes": [1]},
+                              marker=marker)
+        # Burns CPU and holds ~40 MB so both show up in /proc
+        child = subprocess.Popen([sys.executable, "-c",
+                                  "import time; b = bytearray(40 << 20); t = time.time()\n"
+                                  "while time.time() - t < 0.4: pass", marker])
+        child.wait()
+        telemetry.job_finished("chunk_000.mp4", ok=True)
+        telemetry.stop()
+
+        record = telemetry.summary(ok=True)
+        chunk = record["chunks"][0]
+        assert chunk["peak_rss_bytes"] > 30 << 20
+        assert chunk["cpu_seconds"] > 0.1
+        assert chunk["frames"] == 264
+        assert record["peak_job_rss_bytes"] == chunk["peak_rss_bytes"]
+        assert record["timeline"]
+
+    def test_unmarked_processes_ignored(self):
+        telemetry = RenderTelemetry(_config(), sample_seconds=0.05)
+        telemetry.start()
+        telemetry.job_started("chunk_000.mp4", {"start_frame": 0, "end_frame": 10, "scenes": [1]},
+                              marker="no-such-marker")
+        subprocess.run([sys.executable, "-c", "import time; time.sleep(0.2)"])
+        telemetry.job_finished("chunk_000.mp4", ok=True)
+        telemetry.stop()
+        assert telemetry.summary()["chunks"][0]["peak_rss_bytes"] == 0
+
+    def test_scene_type_seconds_split_by_frames(self, monkeypatch):
+        clock = {"now": 100.0}
+        monkeypatch.setattr("render.telemetry.time.time", lambda: clock["now"])
+        telemetry = RenderTelemetry(_config())
+        layout = {s["scene_number"]: s for s in telemetry._layout}
+        end = layout[2]["start_frame"] + layout[2]["duration_frames"] - 1
+        telemetry.job_started("a.mp4", {"start_frame": 0, "end_frame": end, "scenes": [1, 2]})
+        clock["now"] += 20.0
+        telemetry.job_finished("a.mp4", ok=True)
+
+        types = telemetry.summary()["scene_types"]
+        frames = {1: layout[1]["duration_frames"], 2: layout[2]["duration_frames"]}
+        assert types["image"]["frames"] == frames[1]
+        assert types["image"]["seconds"] == pytest.approx(20.0 * frames[1] / (end + 1), abs=0.01)
+        assert types["transition_heavy"]["fps"] == pytest.approx((end + 1) / 20.0, abs=0.05)
+        assert "video" not in types
+
+    def test_storage_and_format(self, tmp_path):
+        path = tmp_path / "t" / "renders.jsonl"
+        append_record(path, {"fps": 12.5, "peak_rss_bytes": 3 << 30, "cpu_pct": 80.0,
+                             "scene_types": {"image": {"fps": 14.0}}})
+        with open(path, "a") as f:
+            f.write("not json\n")
+        records = load_records(path)
+        assert len(records) == 1
+        assert format_summary(records[0]) == "12.5 fps · peak 3.0 GB RSS · CPU 80% · image 14.0 fps"
+
+
+# ---------------------------------------------------------------------------
+# render_chunked with telemetry
+# ---------------------------------------------------------------------------
+
+class TestChunkedTelemetry:
+    def test_records_every_job(self, tmp_path, monkeypatch):
+        def _run_job(cmd, cwd, on_frames, label):
+            if on_frames:
+                on_frames(5)
+            with open(cmd[4], "wb") as f:
+                f.write(b"x")
+            return 0, ""
+
+        monkeypatch.setattr(orchestrator, "_run_job", _run_job)
+        monkeypatch.setattr(orchestrator, "concat_chunks", lambda c, a, o: o.write_bytes(b"v"))
+        config = _config()
+        props = tmp_path / "props.json"
+        props.write_text(json.dumps({"renderConfig": config}))
+        telemetry = RenderTelemetry(config)
+        render_chunked(tmp_path, props, tmp_path / "out.mp4", config,
+                       work_dir=tmp_path / "work", chunk_seconds=0, max_parallel=1,
+                       telemetry=telemetry)
+        record = telemetry.summary(ok=True)
+        kinds = [c["kind"] for c in record["chunks"]]
+        assert kinds == ["audio", "video", "video", "video"]
+        assert record["rendered_frames"] == record["total_frames"]
+        assert set(record["scene_types"]) == {"image", "transition_heavy", "video"}
+        assert all(c["ok"] for c in record["chunks"])
+
+
+# ---------------------------------------------------------------------------
+# Benchmark helpers
+# ---------------------------------------------------------------------------
+
+class TestBenchmark:
+    def test_props_from_fixture(self):
+        props = build_props(load_fixture(), {"Scene_03_01.png": "Scene_03_01.mp4"})
+        assert [s["sceneNumber"] for s in props["scenes"]] == [1, 2, 3, 4, 5, 6]
+        assert props["assetFiles"]["Scene_03_01.png"] == "Scene_03_01.mp4"
+        assert props["renderConfig"]["total_duration_seconds"] == pytest.approx(60.5)
+
+    def test_compare_with_matching_previous_run(self):
+        base = {"ok": True, "host": "h", "engine": "remotion", "fixture_sha256": "f", "raw_assets": False}
+        records = [
+            {**base, "fps": 20.0, "started_at": "1"},
+            {**base, "engine": "ffmpeg", "fps": 90.0},
+            {**base, "ok": False, "fps": 1.0},
+        ]
+        new = {**base, "fps": 17.0, "started_at": time.strftime("%Y")}
+        prev = previous(records, new)
+        assert prev["fps"] == 20.0
+        assert fps_change_pct(prev, new) == pytest.approx(-15.0)
@@ -5,6 +5,7 @@ Render a completed video using Remotion and upload to Google Drive.
 Usage: python render_video.py "Video Title"
 """
 
+import asyncio
 import os
 import sys
 import json
@@ -162,6 +163,7 @@ def main():
     
     # Export Remotion props
     print("\n📦 Exporting Remotion props...")
+    from render.props import diff_props, format_diff, group_by_scene, load_props, write_props
     scripts = airtable.get_scripts_by_title(title)
     images = airtable.get_all_images_for_video(title)
     
@@ -182,16 +184,16 @@ def main():
     print(f"  Drive folder: {len(drive_files_list)} files total, {len(sfx_in_drive)} SFX files")
 
     scenes = []
+    images_by_scene = group_by_scene(images)
     for script in scripts:
         scene_number = script.get("scene", 0)
-        scene_images = [img for img in images if img.get("Scene") == scene_number]
 
         # Build sound_layers from Sound Map JSON (if available)
         sound_layers = _build_sound_layers(script, scene_number, sfx_dir, google)
 
         # Build per-image data including SFX
         image_props = []
-        for img in sorted(scene_images, key=lambda x: x.get("Image Index", 0)):
+        for img in images_by_scene.get(scene_number, []):
             img_index = img.get("Image Index", 0)
             img_data: dict = {
                 "index": img_index,
@@ -279,30 +281,33 @@ def main():
     # Embed renderConfig from audio_sync timing directory.
     # Without this, Remotion's renderConfig.ts returns null for all timing
     # functions and scenes fall back to even distribution.
+    from audio_sync.timeline import load_render_config
     pipeline_dir = Path(__file__).parent
     video_id = idea.get("id", "unknown")
-    audio_sync_config = pipeline_dir / "timing" / video_id / "render_config.json"
+    timing_dir = pipeline_dir / "timing" / video_id
     public_dir = remotion_dir / "public"
     public_dir.mkdir(parents=True, exist_ok=True)
 
-    # Check timing dir first, then fall back to public/ (may already be there)
+    # Timeline / render_config in the timing dir first, then fall back to
+    # public/ (may already be there)
     rc_path = public_dir / "render_config.json"
-    if audio_sync_config.exists():
-        import shutil
-        shutil.copy2(audio_sync_config, rc_path)
-        print(f"   renderConfig copied from timing/{video_id}/")
+    rc_data, timeline_info = load_render_config(timing_dir)
+    if rc_data:
+        print(f"   renderConfig loaded from timing/{video_id}/")
     elif rc_path.exists():
         print(f"   renderConfig found in public/ (using existing)")
-
-    if rc_path.exists():
         rc_data = json.loads(rc_path.read_text())
+
+    if rc_data:
         props["renderConfig"] = rc_data
+        if timeline_info:
+            props["timeline"] = timeline_info
         rc_scene_count = len(rc_data.get("scenes", []))
         rc_total = rc_data.get("total_duration_seconds", 0)
         print(f"   renderConfig embedded: {rc_scene_count} images, {rc_total:.1f}s total")
     else:
-        print(f"   Warning: render_config.json not found")
-        print(f"     Checked: {audio_sync_config}")
+        print(f"   Warning: render config not found")
+        print(f"     Checked: {timing_dir}")
         print(f"     Checked: {rc_path}")
         print(f"   Rendering will use fallback timing (no Whisper alignment)")
 
@@ -358,11 +363,42 @@ def main():
     else:
         print(f"     All per-image SFX files present on disk")
 
+    # Normalize stills/clips to the output resolution (render/assets.py);
+    # the manifest keeps the rename map valid across re-runs.
+    from render.assets import asset_file_map, normalize_assets, summarize
+    asset_manifest = normalize_assets(
+        public_dir, (rc_data or {}).get("resolution"), (rc_data or {}).get("fps") or 24,
+    )
+    props["assetFiles"] = asset_file_map(asset_manifest)
+    asset_stats = summarize(asset_manifest)
+    print(f"\n   Normalized assets: {asset_stats['normalized']} "
+          f"({asset_stats['bytes_in'] // (1024 * 1024)} MB → "
+          f"{asset_stats['bytes_out'] // (1024 * 1024)} MB), {asset_stats['failed']} left as-is")
+
+    # Loudness of every voice over and SFX, recorded in the timeline; the
+    # audio mix applies the normalizing gains.
+    from audio_sync.loudness import analyze_assets, asset_gains
+    from audio_sync.timeline import read_timeline, write_timeline_loudness
+    loudness = analyze_assets(public_dir)
+    loudness_gains = asset_gains(loudness)
+    if timeline_info:
+        try:
+            timeline_info = write_timeline_loudness(timeline_info["path"], loudness)
+            props["timeline"] = timeline_info
+        except (OSError, ValueError) as e:
+            print(f"   ⚠️ Could not record loudness in the timeline: {e}")
+    print(f"   Loudness: {len(loudness)} audio assets measured, "
+          f"{len(loudness_gains)} get a normalizing gain")
+    # Caption words and the single narration track the mix cuts scenes from
+    timeline_data = read_timeline(timeline_info["path"]) if timeline_info else {}
+
     # Save props
     props_file = remotion_dir / "props.json"
-    with open(props_file, "w") as f:
-        json.dump(props, f, indent=2)
+    previous_props = load_props(props_file)
+    write_props(props_file, props)
     print(f"   Saved to: {props_file}")
+    if previous_props is not None:
+        print(f"   Changes since last export: {format_diff(diff_props(previous_props, props))}")
     
     # Ensure node_modules are installed
     if not (remotion_dir / "node_modules").exists():
@@ -378,23 +414,89 @@ def main():
     output_file = remotion_dir / "out" / f"{safe_name}.mp4"
     output_file.parent.mkdir(exist_ok=True)
 
-    render_cmd = [
-        "npx", "remotion", "render",
-        "Main",
-        str(output_file),
-        "--props", str(props_file),
-        "--concurrency=3",
-        "--gl=swangle",
-        "--timeout=180000",
-        "--offthreadvideo-cache-size-in-bytes=1073741824",
-    ]
-
-    result = subprocess.run(render_cmd, cwd=remotion_dir, capture_output=False)
-    
-    if result.returncode != 0:
-        print(f"❌ Render failed with code {result.returncode}")
+    # Scene-aligned chunks; finished chunks persist in out/chunks/{video_id}
+    # so re-running this script resumes instead of starting from frame 0.
+    # With a render config, unchanged scenes come from out/scene_cache.
+    from render import (
+        RenderError, RenderQueue, RenderTelemetry, SceneCache, composition_version,
+        needs_remotion, premix_audio_bed, render_chunked, render_ffmpeg, resolve_render_engine,
+        scene_fingerprints,
+    )
+    from render.config import AUDIO_BED_DIR, AUDIO_PREMIX, TELEMETRY_DIR, TELEMETRY_FILE
+    from render.jobqueue import format_entry
+    from render.telemetry import append_record, format_summary
+    # The Idea's "Render Engine" field (or RENDER_ENGINE) picks the engine;
+    # the ffmpeg fast path only takes still-image videos.
+    engine = resolve_render_engine(idea.get("Render Engine"))
+    reason = needs_remotion(rc_data or {}, props, remotion_dir / "public")
+    if engine == "ffmpeg" and reason:
+        print(f"   ffmpeg engine can't render this ({reason}), using Remotion")
+        engine = "remotion"
+    render_kwargs = {}
+    if rc_data and engine == "remotion":
+        render_kwargs = {
+            "cache": SceneCache(remotion_dir / "out" / "scene_cache"),
+            "fingerprints": scene_fingerprints(
+                rc_data, remotion_dir / "public", composition_version(remotion_dir), props,
+            ),
+        }
+    # Narration + SFX pre-mixed with ffmpeg, so the Remotion jobs only
+    # render muted video; on failure Remotion's audio pass mixes instead.
+    if rc_data and engine == "remotion" and AUDIO_PREMIX:
+        try:
+            bed = premix_audio_bed(public_dir, rc_data, remotion_dir / AUDIO_BED_DIR / f"{video_id}.aac",
+                                   props=props, gains=loudness_gains,
+                                   narration=timeline_data.get("narration"))
+            render_kwargs["audio_file"] = bed["output"]
+            status = "reused" if bed["reused"] else f"mixed in {bed['elapsed']:.1f}s"
+            print(f"   Audio bed: {bed['sources']} tracks {status}")
+        except RenderError as e:
+            print(f"   ⚠️ Audio pre-mix failed ({e}), Remotion will mix the audio")
+    # Wait for a slot in the shared render queue so this doesn't start a
+    # second heavy render next to the bot's when RAM/CPU can't take it.
+    queue = RenderQueue()
+    entry = queue.enqueue(video_id, title, (rc_data or {}).get("total_duration_seconds", 0.0), engine)
+    if entry.get("held_by"):
+        print(f"❌ This video is already in the render queue (process {entry['held_by']})")
         return
-    
+    if not queue.try_start(video_id):
+        print(f"   {format_entry(entry)}")
+        asyncio.run(queue.wait_turn(video_id, on_wait=lambda e: print(f"   {format_entry(e)}")))
+    telemetry = RenderTelemetry(rc_data or {}, engine=engine, label=video_id,
+                                props=props, public_dir=remotion_dir / "public")
+    ok = False
+    try:
+        if engine == "ffmpeg":
+            stats = render_ffmpeg(
+                public_dir, output_file, rc_data,
+                work_dir=remotion_dir / "out" / "ffmpeg" / video_id,
+                props=props,
+                words=timeline_data.get("words"),
+                telemetry=telemetry,
+                gains=loudness_gains,
+                narration=timeline_data.get("narration"),
+            )
+        else:
+            stats = render_chunked(
+                remotion_dir, props_file, output_file, rc_data or {},
+                work_dir=remotion_dir / "out" / "chunks" / video_id,
+                telemetry=telemetry,
+                **render_kwargs,
+            )
+        ok = True
+    except RenderError as e:
+        print(f"❌ Render failed: {e}")
+        if e.detail:
+            print(f"   {e.detail}")
+        return
+    finally:
+        queue.finish(video_id, ok)
+        record = telemetry.summary(ok=ok, video_id=video_id, title=title)
+        append_record(remotion_dir / TELEMETRY_DIR / TELEMETRY_FILE, record)
+    print(f"   {stats['rendered']} chunks rendered, {stats['cached']} from cache, "
+          f"{stats['reused']} resumed")
+    print(f"   📈 {format_summary(record)}")
+
     if not output_file.exists():
         print(f"❌ Output file not found: {output_file}")
         return
@@ -402,11 +504,9 @@ def main():
     print(f"✅ Rendered: {output_file}")
     
     # Upload to Drive
+    # Streamed from disk in chunks; an interrupted upload resumes on re-run.
     print("\n☁️ Uploading to Google Drive...")
-    with open(output_file, "rb") as f:
-        video_content = f.read()
-    
-    drive_file = google.upload_video(video_content, f"{safe_name}.mp4", folder_id)
+    drive_file = google.upload_large_file(str(output_file), f"{safe_name}.mp4", folder_id)
     print(f"✅ Uploaded to Drive!")
     
     # Update Airtable with video link
@@ -4,17 +4,20 @@ Minimal audio_sync runner — avoids importing the full pipeline (which
 requires google-auth, slack, etc.).  Uses only pyairtable and audio_sync.
 
 Usage:
-    python3 run_audio_sync.py
+    python3 run_audio_sync.py "Video Title" [--full]
+
+Only scenes whose audio or Sentence Text changed since the last sync are
+re-transcribed and re-written (see audio_sync/incremental.py); ``--full``
+forces every scene to be re-synced.
 
 Reads audio from remotion-video/public/Scene N.mp3 (must be copied there
 first) or from the Desktop source folder.  Writes render_config.json to
-both timing/{video_id}/ and remotion-video/public/.
+both timing/{video_id}/ and remotion-video/public/, and word timings +
+render config to the binary timeline timing/{video_id}/timeline.eftl.
 """
 import asyncio
-import json
 import os
 import sys
-import subprocess
 from collections import defaultdict
 from pathlib import Path
 
@@ -33,15 +36,27 @@ from pyairtable import Api
 from pyairtable.formulas import match
 
 from audio_sync.transcriber import transcribe
+from audio_sync.audio_metadata import probe_duration
 from audio_sync.transition_engine import assign_transitions
 from audio_sync.ken_burns_calculator import assign_ken_burns
 from audio_sync.render_config_writer import build_render_config, write_render_config
+from audio_sync.incremental import (
+    audio_content_hash, scene_fingerprint, load_sync_state, new_sync_state,
+    save_sync_state, get_clean_scene, record_scene, retime_images,
+)
+from audio_sync.narration import NARRATION_FILE, concat_narration
+from audio_sync.silence import snap_to_silence
+from audio_sync.timeline import TIMELINE_FILE, TimelineWriter, read_timeline
+from audio_sync.voice_chunks import anchor_words_to_chunks, load_voice_chunks, words_from_chunks
+
+FULL_SYNC = "--full" in sys.argv[1:]
 
 
 def _get_video_title() -> str:
     """Get video title from CLI args or prompt interactively."""
-    if len(sys.argv) > 1:
-        return " ".join(sys.argv[1:])
+    args = [a for a in sys.argv[1:] if a != "--full"]
+    if args:
+        return " ".join(args)
 
     # No hardcoded default — force explicit selection to prevent
     # audio contamination between videos (the #1 recurring bug).
@@ -175,244 +190,266 @@ async def run():
     total_duration = 0.0
     image_durations: dict[tuple[int, int], float] = {}
 
-    # Airtable table for writing durations
-    api = get_airtable_api()
-    images_table = api.table(AIRTABLE_BASE_ID, AIRTABLE_IMAGES_TABLE_ID)
-
-    for scene_num in scene_numbers:
-        images = scenes_images[scene_num]
-        audio_file = scene_audio_paths.get(scene_num)
-
-        if not audio_file or not audio_file.exists():
-            print(f"    Scene {scene_num}: ⚠️ no audio, skipping")
-            continue
+    incremental = not FULL_SYNC
+    sync_state = load_sync_state(timing_dir) if incremental else new_sync_state()
+    resynced_scenes: list[int] = []
+    reused_scenes: list[int] = []
 
-        # Transcribe
-        cache_dir = timing_dir / f"scene_{scene_num}"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        try:
-            words = transcribe(str(audio_file), cache_dir=cache_dir)
-        except Exception as e:
-            print(f"    Scene {scene_num}: ⚠️ Whisper failed ({e}), skipping")
-            continue
-
-        if not words:
-            print(f"    Scene {scene_num}: ⚠️ no words transcribed")
-            continue
-
-        # Validate timestamps against actual duration
-        whisper_dur = words[-1].end
-        actual_dur = None
+    previous_words: dict[int, list] = {}
+    if incremental and (timing_dir / TIMELINE_FILE).exists():
         try:
-            probe = subprocess.run(
-                ["ffprobe", "-v", "quiet", "-show_entries",
-                 "format=duration", "-of",
-                 "default=noprint_wrappers=1:nokey=1",
-                 str(audio_file)],
-                capture_output=True, text=True, timeout=10,
-            )
-            if probe.returncode == 0 and probe.stdout.strip():
-                actual_dur = float(probe.stdout.strip())
-        except Exception:
-            pass
+            previous_words = read_timeline(timing_dir / TIMELINE_FILE)["words"]
+        except (OSError, ValueError):
+            previous_words = {}
+    with TimelineWriter(timing_dir / TIMELINE_FILE) as timeline:
+        # Airtable table for writing durations
+        api = get_airtable_api()
+        images_table = api.table(AIRTABLE_BASE_ID, AIRTABLE_IMAGES_TABLE_ID)
 
-        if not actual_dur:
-            try:
-                result = subprocess.run(
-                    ["afinfo", str(audio_file)],
-                    capture_output=True, text=True, timeout=10,
-                )
-                for line in result.stdout.splitlines():
-                    if "estimated duration" in line:
-                        actual_dur = float(line.split(":")[1].strip().replace(" sec", ""))
-                        break
-            except Exception:
-                pass
+        for scene_num in scene_numbers:
+            images = scenes_images[scene_num]
+            audio_file = scene_audio_paths.get(scene_num)
 
-        if actual_dur and whisper_dur > 0:
-            drift = abs(actual_dur - whisper_dur) / actual_dur
-            if drift > 0.10:
-                scale = actual_dur / whisper_dur
-                print(f"    Scene {scene_num}: ⚠️ Whisper drift — "
-                      f"audio={actual_dur:.2f}s, whisper={whisper_dur:.2f}s, "
-                      f"scaling by {scale:.3f}")
-                for w in words:
-                    w.start *= scale
-                    w.end *= scale
-
-        scene_audio_dur = words[-1].end
-        print(f"    Scene {scene_num}: {len(words)} words, {scene_audio_dur:.1f}s — {len(images)} images")
-
-        # Write caption file
-        captions_dir = REMOTION_DIR / "src" / "captions"
-        captions_dir.mkdir(parents=True, exist_ok=True)
-        caption_path = captions_dir / f"Scene {scene_num}.json"
-        caption_data = {
-            "text": " ".join(w.word.strip() for w in words),
-            "segments": [{
-                "id": 0,
-                "start": words[0].start,
-                "end": words[-1].end,
-                "text": " ".join(w.word.strip() for w in words),
-                "words": [
-                    {"word": w.word, "start": round(w.start, 4),
-                     "end": round(w.end, 4), "probability": 1.0}
-                    for w in words
-                ],
-            }],
-            "language": "en",
-        }
-        try:
-            with open(caption_path, "w") as f:
-                json.dump(caption_data, f, indent=2)
-        except Exception as e:
-            print(f"    Scene {scene_num}: ⚠️ caption write failed ({e})")
-
-        # Proportional word-count mapping
-        img_entries = []
-        total_sentence_words = 0
-        for img_idx, img in enumerate(images):
-            sentence = img.get("Sentence Text", "") or ""
-            img_index = img.get("Image Index", img_idx + 1)
-            if not sentence.strip():
+            if not audio_file or not audio_file.exists():
+                print(f"    Scene {scene_num}: ⚠️ no audio, skipping")
                 continue
-            wc = len(sentence.split())
-            if wc == 0:
+
+            audio_hash = audio_content_hash(audio_file)
+            fingerprint = scene_fingerprint(audio_hash, images)
+            clean = get_clean_scene(sync_state, scene_num, fingerprint) if incremental else None
+            if clean:
+                scene_total = 0.0
+                for entry in clean["images"]:
+                    image_durations[(scene_num, entry["image_index"])] = entry["duration"]
+                    scene_total += entry["duration"]
+                total_duration += scene_total
+                reused_scenes.append(scene_num)
+                if scene_num in previous_words:
+                    timeline.add_scene_words(scene_num, previous_words[scene_num])
+                print(f"    Scene {scene_num}: unchanged — reusing {len(clean['images'])} durations ({scene_total:.1f}s)")
                 continue
-            img_entries.append((img, img_index, sentence, wc))
-            total_sentence_words += wc
-
-        if not img_entries:
-            print(f"    Scene {scene_num}: no images with sentence text")
-            continue
-
-        total_whisper = len(words)
-        scene_total = 0.0
-
-        cumulative = 0
-        start_indices = []
-        for _img, _idx, _sent, wc in img_entries:
-            frac = cumulative / total_sentence_words
-            w_start = int(round(frac * total_whisper))
-            w_start = max(0, min(w_start, total_whisper - 1))
-            start_indices.append(w_start)
-            cumulative += wc
-
-        scene_raw = []
-        for entry_idx, (img, img_index, sentence, wc) in enumerate(img_entries):
-            start_time = words[start_indices[entry_idx]].start
-            if entry_idx < len(img_entries) - 1:
-                end_time = words[start_indices[entry_idx + 1]].start
-            else:
-                end_time = words[-1].end
-            dur = round(end_time - start_time, 2)
-            dur = max(dur, 1.0)
-            scene_raw.append({
-                "record_id": img["id"],
-                "image_index": img_index,
-                "sentence_text": sentence,
-                "duration": dur,
-                "display_start": round(start_time, 4),
-                "display_end": round(end_time, 4),
-                "word_count": wc,
-            })
-
-        # Write Whisper-calculated durations to Airtable and cache.
-        # No merging — each image keeps its own duration. If a concept
-        # is too short, that's a signal to fix concept grouping, not
-        # something audio_sync should mask by deleting images.
-        for entry in scene_raw:
-            record_id = entry["record_id"]
-            img_index = entry["image_index"]
-            dur = entry["duration"]
-            sentence = entry["sentence_text"]
-            wc = entry["word_count"]
-
-            image_durations[(scene_num, img_index)] = dur
 
+            # Transcribe
+            cache_dir = timing_dir / f"scene_{scene_num}"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Chunk offsets the voice bot recorded for this exact (stitched) audio
+            voice_chunks = load_voice_chunks(timing_dir, scene_num, audio_hash)
             try:
-                images_table.update(record_id, {"Duration (s)": dur}, typecast=True)
-                duration_updates += 1
+                words = transcribe(str(audio_file), cache_dir=cache_dir)
             except Exception as e:
-                print(f"      Image {img_index}: ⚠️ Airtable write failed ({e})")
-
-            total_duration += dur
-            scene_total += dur
-            print(f"      Image {img_index}: {dur:.2f}s ({wc}w) — \"{sentence[:50]}...\"")
-
-    # Step 4: Build render config
-    print("  Step 4/4: Writing per-image render config...")
-
-    running_time = 0.0
-    timed_images = []
-    for scene_num in scene_numbers:
-        images = scenes_images[scene_num]
-        for img_idx, img in enumerate(images):
-            sentence = img.get("Sentence Text", "") or ""
-            img_index = img.get("Image Index", img_idx + 1)
-            dur = image_durations.get((scene_num, img_index), 0)
-            if dur <= 0:
+                if not voice_chunks:
+                    print(f"    Scene {scene_num}: ⚠️ Whisper failed ({e}), skipping")
+                    continue
+                print(f"    Scene {scene_num}: ⚠️ Whisper failed ({e}), estimating from voice chunks")
+                words = words_from_chunks(voice_chunks)
+
+            if not words:
+                print(f"    Scene {scene_num}: ⚠️ no words transcribed")
                 continue
-            dur = float(dur)
-            composition = img.get("Shot Type", "") or "wide"
-
-            timed_images.append({
-                "scene_number": scene_num,
-                "image_index": img_index,
-                "sentence_text": sentence,
-                "start_time": round(running_time, 4),
-                "end_time": round(running_time + dur, 4),
-                "duration": round(dur, 4),
-                "display_start": round(running_time, 4),
-                "display_end": round(running_time + dur, 4),
-                "display_duration": round(dur, 4),
-                "alignment_method": "sentence_match",
-                "style": "",
-                "composition": composition,
-            })
-            running_time += dur
-
-    timed_images = assign_transitions(timed_images)
-    timed_images = assign_ken_burns(timed_images)
-
-    # Concat audio
-    concat_path = timing_dir / "narration_concat.mp3"
-    sorted_audio = sorted(scene_audio_paths.items())
-    list_file = timing_dir / "concat_list.txt"
-    with open(list_file, "w") as f:
-        for _, sa in sorted_audio:
-            f.write(f"file '{sa}'\n")
-    try:
-        subprocess.run(
-            ["ffmpeg", "-y", "-f", "concat", "-safe", "0",
-             "-i", str(list_file), "-c", "copy", str(concat_path)],
-            capture_output=True, check=True,
-        )
-    except Exception:
-        concat_path = sorted_audio[0][1] if sorted_audio else Path("")
-
-    image_dir = str(PUBLIC_DIR)
-    config = build_render_config(
-        video_id=video_id,
-        audio_path=str(concat_path),
-        scenes=timed_images,
-        image_dir=image_dir,
-    )
 
-    # Write to timing/
-    write_render_config(config, timing_dir / "render_config.json")
+            # Validate timestamps against actual duration (read from the MP3
+            # header — no ffprobe subprocess per scene)
+            whisper_dur = words[-1].end
+            actual_dur = probe_duration(audio_file)
+
+            # Fallback to mutagen if the header could not be parsed
+            if actual_dur is None:
+                try:
+                    from mutagen.mp3 import MP3
+                    actual_dur = MP3(str(audio_file)).info.length
+                except Exception:
+                    pass
+
+            if actual_dur and whisper_dur > 0:
+                drift = abs(actual_dur - whisper_dur) / actual_dur
+                if drift > 0.10:
+                    scale = actual_dur / whisper_dur
+                    print(f"    Scene {scene_num}: ⚠️ Whisper drift — "
+                          f"audio={actual_dur:.2f}s, whisper={whisper_dur:.2f}s, "
+                          f"scaling by {scale:.3f}")
+                    for w in words:
+                        w.start *= scale
+                        w.end *= scale
+
+            # Pin chunk boundaries of a stitched voice over to their known
+            # offsets, so drift can't accumulate across chunks.
+            if voice_chunks:
+                words = anchor_words_to_chunks(words, voice_chunks)
+
+            scene_audio_dur = words[-1].end
+            print(f"    Scene {scene_num}: {len(words)} words, {scene_audio_dur:.1f}s — {len(images)} images")
+
+            # Stream words into the timeline as soon as the scene is final
+            timeline.add_scene_words(scene_num, words)
+
+            # Proportional word-count mapping
+            img_entries = []
+            total_sentence_words = 0
+            for img_idx, img in enumerate(images):
+                sentence = img.get("Sentence Text", "") or ""
+                img_index = img.get("Image Index", img_idx + 1)
+                if not sentence.strip():
+                    continue
+                wc = len(sentence.split())
+                if wc == 0:
+                    continue
+                img_entries.append((img, img_index, sentence, wc))
+                total_sentence_words += wc
+
+            if not img_entries:
+                print(f"    Scene {scene_num}: no images with sentence text")
+                continue
 
-    # Write to remotion-video/public/
-    PUBLIC_DIR.mkdir(parents=True, exist_ok=True)
-    write_render_config(config, PUBLIC_DIR / "render_config.json")
+            total_whisper = len(words)
+            scene_total = 0.0
+
+            cumulative = 0
+            start_indices = []
+            for _img, _idx, _sent, wc in img_entries:
+                frac = cumulative / total_sentence_words
+                w_start = int(round(frac * total_whisper))
+                w_start = max(0, min(w_start, total_whisper - 1))
+                start_indices.append(w_start)
+                cumulative += wc
+
+            # Boundaries between images move into the nearest pause of the
+            # scene's audio (energy envelope, cached per audio hash), so a cut
+            # never lands mid-word or mid-breath when Whisper's times drift.
+            starts = [words[w].start for w in start_indices]
+            try:
+                starts[1:] = snap_to_silence(audio_file, audio_hash, starts[1:])
+            except RuntimeError as e:
+                print(f"    Scene {scene_num}: ⚠️ silence analysis failed ({e}), using word times")
+
+            scene_raw = []
+            for entry_idx, (img, img_index, sentence, wc) in enumerate(img_entries):
+                start_time = starts[entry_idx]
+                if entry_idx < len(img_entries) - 1:
+                    end_time = starts[entry_idx + 1]
+                else:
+                    end_time = words[-1].end
+                dur = round(end_time - start_time, 2)
+                dur = max(dur, 1.0)
+                scene_raw.append({
+                    "record_id": img["id"],
+                    "image_index": img_index,
+                    "sentence_text": sentence,
+                    "duration": dur,
+                    "display_start": round(start_time, 4),
+                    "display_end": round(end_time, 4),
+                    "word_count": wc,
+                })
+
+            # Write Whisper-calculated durations to Airtable and cache.
+            # No merging — each image keeps its own duration. If a concept
+            # is too short, that's a signal to fix concept grouping, not
+            # something audio_sync should mask by deleting images.
+            for entry in scene_raw:
+                record_id = entry["record_id"]
+                img_index = entry["image_index"]
+                dur = entry["duration"]
+                sentence = entry["sentence_text"]
+                wc = entry["word_count"]
+
+                image_durations[(scene_num, img_index)] = dur
+
+                try:
+                    images_table.update(record_id, {"Duration (s)": dur}, typecast=True)
+                    duration_updates += 1
+                except Exception as e:
+                    print(f"      Image {img_index}: ⚠️ Airtable write failed ({e})")
+
+                total_duration += dur
+                scene_total += dur
+                print(f"      Image {img_index}: {dur:.2f}s ({wc}w) — \"{sentence[:50]}...\"")
+
+            record_scene(sync_state, scene_num, fingerprint, scene_raw)
+            resynced_scenes.append(scene_num)
+
+        save_sync_state(sync_state, timing_dir)
+        if reused_scenes:
+            print(f"  Incremental: re-synced {len(resynced_scenes)} scene(s), "
+                  f"reused {len(reused_scenes)} (use --full to force)")
+
+        # Step 4: Build render config
+        print("  Step 4/4: Writing per-image render config...")
+
+        scene_timed: dict[int, list[dict]] = {}
+        for scene_num in scene_numbers:
+            images = scenes_images[scene_num]
+            for img_idx, img in enumerate(images):
+                sentence = img.get("Sentence Text", "") or ""
+                img_index = img.get("Image Index", img_idx + 1)
+                dur = image_durations.get((scene_num, img_index), 0)
+                if dur <= 0:
+                    continue
+                dur = float(dur)
+                composition = img.get("Shot Type", "") or "wide"
+
+                scene_timed.setdefault(scene_num, []).append({
+                    "scene_number": scene_num,
+                    "image_index": img_index,
+                    "sentence_text": sentence,
+                    "duration": dur,
+                    "style": "",
+                    "composition": composition,
+                })
+
+        # One lossless narration track with every scene's sample offset,
+        # recorded in the timeline (reused while no scene's audio changed)
+        concat_path = timing_dir / NARRATION_FILE
+        try:
+            narration = concat_narration(scene_audio_paths, concat_path)
+            timeline.write_narration(narration)
+        except (RuntimeError, ValueError) as e:
+            print(f"  ⚠️ Narration track failed ({e}) — render mixes the scene files")
+            concat_path = min(scene_audio_paths.items())[1] if scene_audio_paths else Path("")
+
+        image_dir = str(PUBLIC_DIR)
+        # Rebuilt from every scene so Shot Type edits (not part of the scene
+        # fingerprint) reach the render.
+        timed_images = retime_images(
+            [img for sn in scene_numbers for img in scene_timed.get(sn, [])]
+        )
+        timed_images = assign_transitions(timed_images)
+        timed_images = assign_ken_burns(timed_images)
+        config = build_render_config(
+            video_id=video_id,
+            audio_path=str(concat_path),
+            scenes=timed_images,
+            image_dir=image_dir,
+        )
 
-    avg_dur = total_duration / max(duration_updates, 1)
+        try:
+            timeline.write_config(config)
+            timeline_info = timeline.close()
+        except OSError as e:
+            print(f"  ⚠️ Timeline write failed ({e}) — writing render_config.json instead")
+            timeline.abort()
+            timeline_info = None
+
+    # render_config.json only when the timeline could not be written (and
+    # without the old timeline, which load_render_config() would prefer)
+    config_paths = [timing_dir / "render_config.json", PUBLIC_DIR / "render_config.json"]
+    if timeline_info:
+        for path in config_paths:
+            path.unlink(missing_ok=True)
+    else:
+        (timing_dir / TIMELINE_FILE).unlink(missing_ok=True)
+        PUBLIC_DIR.mkdir(parents=True, exist_ok=True)
+        for path in config_paths:
+            write_render_config(config, path)
+
+    avg_dur = total_duration / max(len(image_durations), 1)
     print(f"\n  ✅ {duration_updates} image durations written to Airtable")
     print(f"  Avg image duration: {avg_dur:.1f}s")
     print(f"  Total duration: {total_duration:.1f}s")
-    print(f"  Render config: {timing_dir / 'render_config.json'}")
-    print(f"  Remotion config: {PUBLIC_DIR / 'render_config.json'}")
-    print(f"  Per-image entries: {len(timed_images)}")
+    if timeline_info:
+        print(f"  Timeline: {timeline_info['path']} ({timeline_info['bytes']:,} bytes)")
+    else:
+        print(f"  Render config: {config_paths[0]}")
+        print(f"  Remotion config: {config_paths[1]}")
+    print(f"  Per-image entries: {len(config['scenes'])}")
 
 
 if __name__ == "__main__":
@@ -4,13 +4,17 @@ Run the Render Bot on an idea marked "Ready To Render" in Airtable.
 Called by: pipeline_control.py (Slack bot)
 Commands: render
 
-Renders video with Remotion, uploads to Google Drive,
-and advances status to "Done".
+Renders every "Ready To Render" video through the render queue
+(back to back, or side by side when RAM/CPU allow), uploads each to
+Google Drive, and advances status to "Done".  At most
+MAX_PARALLEL_RENDERS worker threads, each with its own pipeline, take
+the videos in order; the queue decides when each one may start.
 """
 
 import os
 import sys
 import asyncio
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -18,6 +22,23 @@ from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
 
 from pipeline import VideoPipeline
+from render.config import MAX_PARALLEL_RENDERS
+from render.jobqueue import RenderQueue, format_queue
+
+
+def _render_worker(pending: list, results: dict, lock: threading.Lock) -> None:
+    """Render ideas one after another on this thread's own pipeline instance."""
+    pipeline = VideoPipeline()
+    while True:
+        with lock:
+            if not pending:
+                return
+            index, idea = pending.pop(0)
+        pipeline._load_idea(idea)
+        try:
+            results[index] = asyncio.run(pipeline.run_render_bot())
+        except Exception as e:
+            results[index] = e
 
 
 async def main():
@@ -34,36 +55,46 @@ async def main():
         print("\n❌ No ideas with status 'Ready To Render'")
         sys.exit(1)
 
-    print(f"\n📋 Found {len(ideas)} video(s) to render:")
-    for i, idea in enumerate(ideas, 1):
-        print(f"   {i}. {idea.get('Video Title', 'Untitled')}")
+    # Queue them all in Airtable order (jobs left by a restarted bot keep
+    # their place). Each video renders in its own job directory; the queue
+    # admits as many at once as free RAM / CPU allow.
+    queue = RenderQueue()
+    for idea in ideas:
+        pipeline._load_idea(idea)
+        queue.enqueue(idea["id"], pipeline.video_title, pipeline.video_config.video_length_minutes * 60)
 
-    # Process one at a time, sequentially
-    for i, idea in enumerate(ideas, 1):
+    print(f"\n📋 Found {len(ideas)} video(s) to render:")
+    print(format_queue(queue.snapshot()))
+
+    pending = list(enumerate(ideas))
+    outcomes: dict = {}
+    lock = threading.Lock()
+    await asyncio.gather(*(
+        asyncio.to_thread(_render_worker, pending, outcomes, lock)
+        for _ in range(min(MAX_PARALLEL_RENDERS, len(ideas)))
+    ))
+    results = [outcomes[i] for i in range(len(ideas))]
+
+    failed = 0
+    for idea, result in zip(ideas, results):
         title = idea.get("Video Title", "Untitled")
-        print(f"\n{'=' * 60}")
-        print(f"🎬 RENDERING {i}/{len(ideas)}: {title}")
-        print(f"{'=' * 60}")
-
-        try:
-            pipeline._load_idea(idea)
-            result = await pipeline.run_render_bot()
-
-            if result.get("error"):
-                print(f"\n❌ Render failed for '{title}': {result['error']}")
-                print(f"   Stopping — fix this video before rendering the rest.")
-                sys.exit(1)
-
+        if isinstance(result, BaseException):
+            print(f"\n❌ Error rendering '{title}': {result}")
+            import traceback
+            traceback.print_exception(type(result), result, result.__traceback__)
+            failed += 1
+        elif result.get("error"):
+            print(f"\n❌ Render failed for '{title}': {result['error']}")
+            failed += 1
+        else:
             print(f"\n✅ '{title}' rendered and uploaded!")
             print(f"   🔗 {result.get('video_url', 'N/A')}")
 
-        except Exception as e:
-            print(f"\n❌ Error rendering '{title}': {e}")
-            import traceback
-            traceback.print_exc()
-            sys.exit(1)
-
     print("\n" + "=" * 60)
+    if failed:
+        print(f"❌ {failed} of {len(ideas)} render(s) failed")
+        print("=" * 60)
+        sys.exit(1)
     print(f"✅ ALL {len(ideas)} VIDEO(S) RENDERED!")
     print("=" * 60)
 
@@ -0,0 +1,118 @@
+"""Tests for clients.elevenlabs_client against an in-memory Wavespeed API."""
+
+import asyncio
+import json
+
+import httpx
+
+from clients.elevenlabs_client import ElevenLabsClient
+
+
+class _Wavespeed:
+    """Tasks complete after *polls_needed* status checks; "fail" in the text fails."""
+
+    def __init__(self, polls_needed=2):
+        self.polls_needed = polls_needed
+        self.tasks = {}
+        self.active = 0
+        self.max_active = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            text = json.loads(request.content)["text"]
+            task_id = f"t{len(self.tasks)}"
+            self.tasks[task_id] = {"text": text, "polls": 0}
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            return httpx.Response(200, json={"data": {"urls": {
+                "get": f"https://api.example/predictions/{task_id}"}}})
+        if "/predictions/" in request.url.path:
+            task = self.tasks[request.url.path.rsplit("/", 1)[1]]
+            task["polls"] += 1
+            if task["polls"] < self.polls_needed:
+                return httpx.Response(200, json={"data": {"status": "processing"}})
+            self.active -= 1
+            if "fail" in task["text"]:
+                return httpx.Response(200, json={"data": {"status": "failed"}})
+            return httpx.Response(200, json={"data": {
+                "status": "completed", "outputs": [f"https://cdn.example/{task['text']}.mp3"]}})
+        return httpx.Response(200, content=b"ID3" + request.url.path.encode())
+
+
+def _client(server, **kwargs):
+    client = ElevenLabsClient(api_key="k", transport=httpx.MockTransport(server.handler), **kwargs)
+    client.POLL_INTERVAL = 0.001
+    return client
+
+
+class TestGenerateMany:
+    def test_bounded_concurrency(self):
+        server = _Wavespeed()
+        client = _client(server, max_concurrent=3)
+        texts = {f"rec{i}": f"scene{i}" for i in range(8)}
+        results = asyncio.get_event_loop().run_until_complete(client.generate_many(texts))
+        assert results == {k: f"https://cdn.example/{v}.mp3" for k, v in texts.items()}
+        assert server.max_active == 3
+
+    def test_failures_and_on_ready(self):
+        server = _Wavespeed()
+        client = _client(server)
+        ready = []
+
+        async def on_ready(key, url):
+            ready.append((key, url))
+            if url:
+                assert await client.download_audio(url)
+
+        results = asyncio.get_event_loop().run_until_complete(
+            client.generate_many({"a": "ok", "b": "fail"}, on_ready=on_ready)
+        )
+        assert results == {"a": "https://cdn.example/ok.mp3", "b": None}
+        assert sorted(ready) == sorted(results.items())
+
+    def test_poll_attempts_bounded(self):
+        server = _Wavespeed(polls_needed=100)
+        client = _client(server)
+        client.MAX_POLL_ATTEMPTS = 3
+        assert asyncio.get_event_loop().run_until_complete(client.generate_and_wait("slow")) is None
+        assert server.tasks["t0"]["polls"] == 3
+
+
+class TestSynthesizeMany:
+    def test_long_text_chunked_and_stitched(self, monkeypatch):
+        import audio_sync.stitch
+
+        stitched = []
+
+        def fake_stitch(contents):
+            stitched.append(contents)
+            return b"ID3stitched", [(0.0, 1.0 + i) for i in range(len(contents))]
+
+        monkeypatch.setattr(audio_sync.stitch, "stitch_audio", fake_stitch)
+        server = _Wavespeed()
+        client = _client(server, max_concurrent=2)
+        client.LONG_TEXT_CHARS = 20
+        client.CHUNK_CHARS = 20
+        long_text = "First sentence here. Second one now. Third and last."
+        results = asyncio.get_event_loop().run_until_complete(
+            client.synthesize_many({"long": long_text, "short": "Hi."})
+        )
+
+        assert len(server.tasks) == 4  # three chunks + the short scene, one pool
+        assert stitched and [c[:3] for c in stitched[0]] == [b"ID3"] * 3
+        voice = results["long"]
+        assert voice["content"] == b"ID3stitched" and voice["audio_url"] is None
+        assert [c["text"] for c in voice["chunks"]] == [
+            "First sentence here.", "Second one now.", "Third and last."]
+        assert results["short"]["audio_url"] == "https://cdn.example/Hi..mp3"
+        assert results["short"]["chunks"][0]["text"] == "Hi."
+
+    def test_failed_chunk_fails_the_text(self):
+        server = _Wavespeed()
+        client = _client(server)
+        client.LONG_TEXT_CHARS = 10
+        client.CHUNK_CHARS = 10
+        results = asyncio.get_event_loop().run_until_complete(
+            client.synthesize_many({"k": "This is fine. This will fail."})
+        )
+        assert results == {"k": None}
@@ -0,0 +1,232 @@
+"""Tests for clients.resumable_upload against an in-memory resumable server."""
+
+import json
+import os
+import threading
+import time
+
+import httpx
+import pytest
+
+from clients.resumable_upload import (
+    CHUNK_ALIGN,
+    ResumableUpload,
+    StreamingSource,
+    UploadError,
+    pending_upload,
+    session_file,
+)
+
+INIT_URL = "https://upload.example/files?uploadType=resumable"
+
+
+class _Creds:
+    valid = True
+    token = "t"
+
+
+class _Server:
+    """Minimal resumable-upload endpoint: stores bytes, answers 308 with Range."""
+
+    def __init__(self):
+        self.sessions = {}
+        self.fail = []        # queued failures: status code or "drop"
+        self.starts = 0
+        self.puts = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.headers["authorization"] == "Bearer t"
+        if request.method in ("POST", "PATCH"):
+            self.starts += 1
+            uri = f"https://upload.example/session/{self.starts}"
+            self.sessions[uri] = bytearray()
+            return httpx.Response(200, headers={"location": uri})
+        self.puts += 1
+        if self.fail:
+            failure = self.fail.pop(0)
+            if failure == "drop":
+                raise httpx.ReadError("connection reset", request=request)
+            return httpx.Response(failure)
+        uri = str(request.url)
+        if uri not in self.sessions:
+            return httpx.Response(404)
+        data = self.sessions[uri]
+        spec, total = request.headers["content-range"].split(" ")[1].split("/")
+        if spec != "*":
+            start = int(spec.split("-")[0])
+            assert start == len(data), "chunk must continue at the acknowledged offset"
+            data.extend(request.content)
+        if len(data) == int(total):
+            return httpx.Response(200, json={"id": "file123", "name": "video.mp4"})
+        headers = {"range": f"bytes=0-{len(data) - 1}"} if data else {}
+        return httpx.Response(308, headers=headers)
+
+
+def _uploader(server, **kwargs):
+    client = httpx.Client(transport=httpx.MockTransport(server.handler))
+    return ResumableUpload(_Creds(), chunk_size=CHUNK_ALIGN, client=client,
+                           sleep=lambda s: None, **kwargs)
+
+
+def _state(video):
+    """Sidecar fields matching *video* as it is on disk now."""
+    stat = video.stat()
+    return {"path": os.path.abspath(video), "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns, "created_at": 10 ** 10}
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(os.urandom(CHUNK_ALIGN * 3 + 1000))
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Upload
+# ---------------------------------------------------------------------------
+
+class TestUpload:
+    def test_chunked_with_progress(self, video):
+        server = _Server()
+        progress = []
+        result = _uploader(server).run(INIT_URL, {"name": "video.mp4"}, str(video), "video/mp4",
+                                       on_progress=lambda done, total: progress.append(done))
+        assert result["id"] == "file123"
+        assert bytes(server.sessions[list(server.sessions)[0]]) == video.read_bytes()
+        assert server.puts == 4
+        assert progress == [0, CHUNK_ALIGN, 2 * CHUNK_ALIGN, 3 * CHUNK_ALIGN, video.stat().st_size]
+        assert not session_file(str(video)).exists()
+
+    def test_transient_errors_resync(self, video):
+        server = _Server()
+        server.fail = [503, "drop"]
+        _uploader(server).run(INIT_URL, {}, str(video), "video/mp4")
+        assert bytes(server.sessions[list(server.sessions)[0]]) == video.read_bytes()
+        assert server.starts == 1
+
+    def test_expired_session_restarts(self, video):
+        server = _Server()
+        session_file(str(video)).write_text(json.dumps({
+            **_state(video), "uri": "https://upload.example/session/gone",
+            "init_url": INIT_URL,
+        }))
+        _uploader(server).run(INIT_URL, {}, str(video), "video/mp4")
+        assert server.starts == 1
+        assert bytes(server.sessions["https://upload.example/session/1"]) == video.read_bytes()
+
+    def test_rejection_is_not_retried(self, video):
+        server = _Server()
+        server.fail = [403]
+        with pytest.raises(UploadError, match="403"):
+            _uploader(server).run(INIT_URL, {}, str(video), "video/mp4")
+        assert server.puts == 1
+
+
+# ---------------------------------------------------------------------------
+# Resume across processes
+# ---------------------------------------------------------------------------
+
+class TestResume:
+    def test_gives_up_then_resumes(self, video):
+        server = _Server()
+        uploader = _uploader(server, max_retries=2)
+
+        # First chunk lands, then the connection keeps failing
+        calls = {"n": 0}
+        handler = server.handler
+
+        def flaky(request):
+            if request.method == "PUT":
+                calls["n"] += 1
+                if calls["n"] > 1:
+                    raise httpx.ConnectError("network down", request=request)
+            return handler(request)
+
+        uploader.client = httpx.Client(transport=httpx.MockTransport(flaky))
+        with pytest.raises(UploadError, match="session kept"):
+            uploader.run(INIT_URL, {}, str(video), "video/mp4")
+        state = pending_upload(str(video))
+        assert state and state["uri"] == "https://upload.example/session/1"
+
+        # A fresh uploader (new process) picks the session up at byte 256 KiB
+        progress = []
+        _uploader(server).run(INIT_URL, {}, str(video), "video/mp4",
+                              on_progress=lambda done, total: progress.append(done))
+        assert server.starts == 1
+        assert progress[0] == CHUNK_ALIGN
+        assert bytes(server.sessions[state["uri"]]) == video.read_bytes()
+        assert pending_upload(str(video)) is None
+
+    def test_pending_upload_checks_file_identity(self, video):
+        session_file(str(video)).write_text(json.dumps({**_state(video), "uri": "u"}))
+        assert pending_upload(str(video))["uri"] == "u"
+        video.write_bytes(b"re-rendered")
+        assert pending_upload(str(video)) is None
+
+    def test_pending_upload_expires(self, video):
+        session_file(str(video)).write_text(json.dumps({**_state(video), "created_at": 0}))
+        assert pending_upload(str(video)) is None
+
+
+# ---------------------------------------------------------------------------
+# Upload while the file is still being written
+# ---------------------------------------------------------------------------
+
+def _writer(path, data, source, fail_at=None):
+    """Write *data* in 100 KB steps, reporting each step like a download."""
+    def _run():
+        with open(path, "wb") as f:
+            for start in range(0, len(data), 100_000):
+                if fail_at is not None and start >= fail_at:
+                    source.finish(RuntimeError("drive went away"))
+                    return
+                f.write(data[start:start + 100_000])
+                f.flush()
+                source.advance(min(start + 100_000, len(data)), len(data))
+                time.sleep(0.005)
+        source.finish()
+    thread = threading.Thread(target=_run)
+    thread.start()
+    return thread
+
+
+class TestStreamingSource:
+    def test_upload_follows_writer(self, tmp_path):
+        data = os.urandom(CHUNK_ALIGN * 4 + 123)
+        path = tmp_path / "growing.mp4"
+        server = _Server()
+        source = StreamingSource()
+        seen = []
+        handler = server.handler
+
+        def spy(request):
+            if request.method == "PUT":
+                seen.append(source.done)
+            return handler(request)
+
+        uploader = _uploader(server)
+        uploader.client = httpx.Client(transport=httpx.MockTransport(spy))
+        thread = _writer(path, data, source)
+        uploader.run(INIT_URL, {}, str(path), "video/mp4", source=source)
+        thread.join()
+
+        assert bytes(server.sessions["https://upload.example/session/1"]) == data
+        assert seen[0] is False  # first chunk went out before the file was complete
+        assert not session_file(str(path)).exists()
+
+    def test_writer_failure_stops_upload(self, tmp_path):
+        data = os.urandom(CHUNK_ALIGN * 4)
+        path = tmp_path / "growing.mp4"
+        source = StreamingSource()
+        thread = _writer(path, data, source, fail_at=CHUNK_ALIGN * 2)
+        with pytest.raises(UploadError, match="drive went away"):
+            _uploader(_Server()).run(INIT_URL, {}, str(path), "video/mp4", source=source)
+        thread.join()
+
+    def test_cancel_stops_writer(self):
+        source = StreamingSource()
+        source.advance(10, 100)
+        source.cancel()
+        with pytest.raises(UploadError):
+            source.advance(20, 100)
@@ -0,0 +1,41 @@
+"""Tests for clients.sfx_library — TF-IDF prompt matching and usage stats."""
+
+from clients.sfx_library import SfxLibrary, tfidf_scores, tokenize
+
+
+class TestTokenize:
+    def test_words_and_bigrams(self):
+        assert tokenize("A cash register dings") == ["cash", "register", "ding", "cash register", "register ding"]
+        assert tokenize("glass shattering on concrete")[:3] == ["glass", "shattering", "concrete"]
+
+
+class TestTfidf:
+    def test_closest_document_scores_highest(self):
+        docs = [tokenize(p) for p in (
+            "cash register opening", "thunder crack overhead", "distant thunder rumble",
+        )]
+        scores = tfidf_scores("a distant thunder rumbles", docs)
+        assert scores.index(max(scores)) == 2
+        assert tfidf_scores("cash register opening", docs)[0] > 0.99
+
+
+class TestSfxLibrary:
+    def test_find_respects_threshold_loop_and_duration(self, tmp_path):
+        library = SfxLibrary(tmp_path, threshold=0.6)
+        effect_id = library.add("cash register drawer opening", b"ID3a", 8.0, False, "d1", "https://d/1")
+        library.add("cash register drawer opening", b"ID3b", 8.0, True)
+
+        match = library.find("A cash register drawer opening", 8.0)
+        assert match["id"] == effect_id and match["score"] >= 0.6 and match["loop"] is False
+        assert library.find("cash register drawer opening", 3.0) is None
+        assert library.find("helicopter rotor spinning up", 8.0) is None
+        assert library.read(effect_id) == b"ID3a"
+
+    def test_usage_stats(self, tmp_path):
+        library = SfxLibrary(tmp_path)
+        effect_id = library.add("thunder crack", b"ID3", 8.0, video_title="Video A")
+        library.record_use(effect_id, "Video B")
+        library.record_use(effect_id, "Video B")
+        match = library.find("thunder crack", 8.0)
+        assert match["uses"] == 2 and match["videos"] == ["Video A", "Video B"]
+        assert library.stats() == {"effects": 1, "reuses": 2}
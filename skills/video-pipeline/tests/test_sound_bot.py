@@ -0,0 +1,107 @@
+"""Tests for SoundBot's sliding-window generation pool."""
+
+import asyncio
+
+import bots.sound_bot as sound_bot
+from bots.sound_bot import SoundBot
+from clients.sfx_library import SfxLibrary
+
+
+class _FakeSoundClient:
+    """Image 1 is slow; everything else finishes quickly."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.started = []
+        self.estimated_total_cost = 0.0
+        self.closed = False
+
+    async def generate_sound_effect(self, text, duration_seconds=None, loop=False):
+        self.started.append(text)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.2 if text == "prompt 1" else 0.01)
+        self.active -= 1
+        return None if text == "prompt 3" else f"https://cdn.example/{text}.mp3"
+
+    async def download_audio(self, url):
+        return b"ID3" + url.encode()
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _FakeGoogle:
+    def upload_audio(self, content, name, folder_id):
+        return {"id": name}
+
+    def make_file_public(self, file_id):
+        return f"https://drive.example/{file_id}"
+
+
+class _FakeAirtable:
+    def __init__(self, images):
+        self.images = images
+        self.attached = {}
+
+    def get_all_images_for_video(self, title):
+        return self.images
+
+    def update_image_sound_effect(self, record_id, sound_url, volume=0.15):
+        self.attached[record_id] = sound_url
+
+
+def _bot(count):
+    images = [
+        {"id": f"rec{i}", "Scene": 1, "Image Index": i, "Sound Prompt": f"prompt {i}"}
+        for i in range(1, count + 1)
+    ]
+    bot = SoundBot.__new__(SoundBot)
+    bot.sound_client = _FakeSoundClient()
+    bot.google = _FakeGoogle()
+    bot.airtable = _FakeAirtable(images)
+    bot.slack = None
+    bot.library = None
+    return bot
+
+
+class TestSlidingWindow:
+    def test_slow_task_does_not_stall_the_pool(self):
+        bot = _bot(10)
+        result = asyncio.get_event_loop().run_until_complete(
+            bot.process_video("T", folder_id="f", max_concurrent=3)
+        )
+        client = bot.sound_client
+        # The other two slots drain the queue while image 1 is still running
+        assert client.started[-1] == "prompt 10" and client.max_active == 3
+        assert result["total_generated"] == 9  # prompt 3 failed
+        assert bot.airtable.attached["rec2"] == "https://drive.example/sfx_1_2.mp3"
+        assert "rec3" not in bot.airtable.attached
+        assert client.closed
+
+    def test_budget_enforced_across_workers(self, monkeypatch):
+        monkeypatch.setattr(sound_bot, "MAX_GENERATIONS_PER_VIDEO", 4)
+        bot = _bot(10)
+        result = asyncio.get_event_loop().run_until_complete(
+            bot.process_video("T", folder_id="f", max_concurrent=3)
+        )
+        assert len(bot.sound_client.started) == 4
+        assert result["limit_reached"]
+
+
+class TestLibraryReuse:
+    def test_matches_reused_and_new_effects_added(self, tmp_path):
+        library = SfxLibrary(tmp_path)
+        library.add("Prompt 2", b"ID3old", 8.0, False, "drive-old", "https://drive.example/old")
+        bot = _bot(3)
+        bot.library = library
+        result = asyncio.get_event_loop().run_until_complete(
+            bot.process_video("T", folder_id="f", max_concurrent=2)
+        )
+
+        assert "prompt 2" not in bot.sound_client.started
+        assert bot.airtable.attached["rec2"] == "https://drive.example/old"
+        assert result["reused"] == 1 and result["total_generated"] == 2  # prompt 3 failed
+        assert library.stats() == {"effects": 2, "reuses": 1}
+        assert library.find("prompt 1", 8.0)["drive_url"] == "https://drive.example/sfx_1_1.mp3"
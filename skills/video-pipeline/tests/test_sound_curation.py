@@ -222,3 +222,75 @@ class TestFallbackSelection:
         result = self.bot._fallback_selection(images, min_sounds=3)
         selected = [r for r in result if r["sound"]]
         assert len(selected) == 3
+
+
+class _FakeAnthropic:
+    """Curates even images, answers batches for all but index 3, tracks overlap."""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, prompt, system_prompt="", **kwargs):
+        import asyncio
+
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        indices = [int(line.split()[1].rstrip(":")) for line in prompt.splitlines()
+                   if line.startswith("Image ")]
+        if system_prompt.startswith("You are a cinematic sound designer selecting"):
+            self.calls.append("curate")
+            return json.dumps([{"image_index": i, "sound": i % 2 == 0} for i in indices])
+        if "Return ONLY a JSON array" in system_prompt:
+            self.calls.append("batch")
+            return json.dumps([{"image_index": i, "sound": f"heavy door slam number {i}"}
+                               for i in indices if i != 4])
+        self.calls.append("single")
+        return "single retried sound prompt"
+
+
+class _FakeAirtable:
+    def __init__(self, images):
+        self.images = images
+        self.batches = []
+
+    def get_all_images_for_video(self, title):
+        return self.images
+
+    def update_image_sound_prompts(self, prompts):
+        self.batches.append(dict(prompts))
+        return len(prompts)
+
+
+class TestProcessVideo:
+    """Scenes fan out concurrently; writes are one batch per scene."""
+
+    def test_concurrent_batched(self):
+        import asyncio
+
+        images = [_make_image(s, i) for s in (1, 2, 3) for i in range(1, 7)]
+        images[0]["Sound Prompt"] = "already there"
+        bot = _bot()
+        bot.anthropic = _FakeAnthropic()
+        bot.airtable = _FakeAirtable(images)
+        bot.max_concurrent = 4
+
+        result = asyncio.get_event_loop().run_until_complete(bot.process_video("Title"))
+
+        assert bot.anthropic.max_active > 1
+        assert bot.anthropic.calls.count("curate") == 3
+        assert bot.anthropic.calls.count("batch") == 3
+        assert bot.anthropic.calls.count("single") == 3  # image 4 of each scene
+        assert len(bot.airtable.batches) == 3
+        written = {k: v for batch in bot.airtable.batches for k, v in batch.items()}
+        assert "rec_1_1" not in written
+        assert written["rec_2_1"] == "SKIP"
+        assert written["rec_2_2"] == "heavy door slam number 2"
+        assert written["rec_2_4"] == "single retried sound prompt"
+        assert result["already_existed"] == 1
+        assert result["skipped_by_curation"] == 8
+        assert result["prompts_generated"] == 1 + 9
+        assert result["prompts_failed"] == 0
@@ -0,0 +1,74 @@
+"""Tests for clients.voice_cache."""
+
+import hashlib
+import os
+
+from clients.elevenlabs_client import ElevenLabsClient
+from clients.voice_cache import VoiceCache, normalize_text, voice_key
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+class TestVoiceKey:
+    def test_normalization(self):
+        assert normalize_text("  It’s   a\n“test” ") == "It's a \"test\""
+        assert voice_key("Hello  world", "v", 1.0, 0.5) == voice_key("Hello world\n", "v", 1, 0.5)
+
+    def test_voice_and_settings_matter(self):
+        base = voice_key("Hello", "v", 1.0, 0.5)
+        assert voice_key("Hello", "w", 1.0, 0.5) != base
+        assert voice_key("Hello", "v", 0.9, 0.5) != base
+        assert voice_key("Hello", "v", 1.0, 0.6) != base
+        assert voice_key("Hello.", "v", 1.0, 0.5) != base
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class TestVoiceCache:
+    def test_put_get(self, tmp_path):
+        cache = VoiceCache(tmp_path)
+        assert cache.get("k") is None
+        sha = cache.put("k", b"ID3 audio", "https://cdn.example/a.mp3")
+        assert sha == hashlib.sha256(b"ID3 audio").hexdigest()
+        assert cache.get("k") == b"ID3 audio"
+        assert VoiceCache(tmp_path).entry("k")["audio_url"] == "https://cdn.example/a.mp3"
+
+    def test_drive_fallback_verified(self, tmp_path):
+        cache = VoiceCache(tmp_path)
+        sha = cache.put("k", b"take one")
+        cache.set_drive_file("k", "drive123")
+        os.remove(tmp_path / "objects" / f"{sha}.mp3")
+
+        assert cache.get("k") is None  # no Drive access
+        assert cache.get("k", lambda file_id: b"take two") is None  # overwritten on Drive
+        assert cache.get("k", lambda file_id: b"take one") == b"take one"
+        assert cache.get("k") == b"take one"  # restored locally
+
+    def test_lru_eviction(self, tmp_path):
+        cache = VoiceCache(tmp_path, max_mb=2.5 / 1024)  # 2.5 KB
+        cache.put("a", b"a" * 1024)
+        cache.put("b", b"b" * 1024)
+        cache.set_drive_file("b", "drive-b")
+        cache.get("a")
+        cache.put("c", b"c" * 1024)  # over budget: b is least recently used
+
+        assert cache.get("a") and cache.get("c")
+        assert cache.get("b") is None
+        assert cache.entry("b")["drive_file_id"] == "drive-b"  # kept for Drive fallback
+
+        cache.put("d", b"d" * 1024)  # a is now oldest and has no Drive copy
+        assert cache.entry("a") is None
+
+
+class TestClientCache:
+    def test_remember_then_cached(self, tmp_path):
+        client = ElevenLabsClient(api_key="k", cache=VoiceCache(tmp_path))
+        assert client.cached_audio("Scene one.") is None
+        key = client.remember("Scene one.", b"mp3")
+        assert client.cached_audio(" Scene  one. ") == b"mp3"
+        assert client.cached_audio("Scene one.", voice_id="other") is None
+        assert key == client.cache_key("Scene one.")